@@ -1,5 +1,9 @@
 """
 Alembic 환경 설정
+
+기존 마이그레이션은 MySQL 전용 DDL(월별 파티션, FULLTEXT 인덱스 등)을 포함하므로,
+빈 SQLite DB는 마이그레이션을 재생하지 않고 현재 모델로 스키마를 만든 뒤 head로 stamp합니다.
+이후 마이그레이션은 SQLite에서 batch 모드(테이블 재생성)로 ALTER를 처리합니다.
 """
 
 import sys
@@ -18,8 +22,15 @@ from app.ballance.model.balance import Balance  # noqa: F401
 # 모든 모델을 import하여 metadata에 등록
 from app.coin.model.coin import Coin  # noqa: F401
 from app.common.model.base import Base
+from app.common.model.lease import Lease  # noqa: F401
+from app.common.model.rate_limit import RateLimit  # noqa: F401
 from app.configs.config import settings
+from app.position.model.position import Position, PositionLot  # noqa: F401
 from app.trade.model.trade import Trade  # noqa: F401
+from app.trade.model.trade_reason import TradeReason  # noqa: F401
+from app.trade.model.trade_run import TradeRun  # noqa: F401
+from app.trade.model.trade_search_document import TradeSearchDocument  # noqa: F401
+from app.trade.model.trade_task import TradeTask  # noqa: F401
 
 config = context.config
 
@@ -31,6 +42,7 @@ else:
     # 비동기 드라이버를 동기 드라이버로 변환
     db_url = db_url.replace("mysql+asyncmy", "mysql+pymysql")
     db_url = db_url.replace("mysql+aiomysql", "mysql+pymysql")
+    db_url = db_url.replace("sqlite+aiosqlite", "sqlite")
 config.set_main_option("sqlalchemy.url", db_url)
 
 if config.config_file_name is not None:
@@ -62,10 +74,21 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        is_sqlite = connection.dialect.name == "sqlite"
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            render_as_batch=is_sqlite,
+        )
 
         with context.begin_transaction():
-            context.run_migrations()
+            migration_context = context.get_context()
+            if is_sqlite and migration_context.get_current_revision() is None:
+                target_metadata.create_all(connection)
+                migration_context.stamp(context.script, "heads")
+                connection.commit()
+            else:
+                context.run_migrations()
 
 
 if context.is_offline_mode():
@@ -0,0 +1,56 @@
+"""add_trade_tasks
+
+Revision ID: 36fba425edab
+Revises: 78d167ca3aa3
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "36fba425edab"
+down_revision: Union[str, Sequence[str], None] = "78d167ca3aa3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    코인별 AI 분석/거래 작업 큐 테이블 추가
+    - 워커는 SELECT ... FOR UPDATE SKIP LOCKED로 작업을 점유
+    - claim_expires_at이 지난 RUNNING 작업은 다른 워커가 재시도
+    """
+    op.create_table(
+        "trade_tasks",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("coin_id", sa.BigInteger(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("fee_multiplier", sa.Float(), nullable=False),
+        sa.Column("min_order_amount", sa.Float(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("claimed_by", sa.String(length=100), nullable=True),
+        sa.Column("claim_expires_at", sa.DateTime(), nullable=True),
+        sa.Column("trade_id", sa.BigInteger(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["coin_id"], ["coins.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("idx_trade_tasks_status_id", "trade_tasks", ["status", "id"])
+    op.create_index(
+        "idx_trade_tasks_coin_id_status", "trade_tasks", ["coin_id", "status"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_trade_tasks_coin_id_status", "trade_tasks")
+    op.drop_index("idx_trade_tasks_status_id", "trade_tasks")
+    op.drop_table("trade_tasks")
@@ -0,0 +1,37 @@
+"""add_candle_interval_to_coins
+
+Revision ID: 511eb0d0e1cb
+Revises: 36fba425edab
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "511eb0d0e1cb"
+down_revision: Union[str, Sequence[str], None] = "36fba425edab"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    coins 테이블에 분석 캔들 간격 컬럼 추가 (기존 코인은 일봉)
+    """
+    op.add_column(
+        "coins",
+        sa.Column(
+            "candle_interval", sa.String(20), nullable=False, server_default="day"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("coins", "candle_interval")
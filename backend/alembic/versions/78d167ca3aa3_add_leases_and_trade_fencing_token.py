@@ -0,0 +1,43 @@
+"""add_leases_and_trade_fencing_token
+
+Revision ID: 78d167ca3aa3
+Revises: 5a7839725665
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "78d167ca3aa3"
+down_revision: Union[str, Sequence[str], None] = "5a7839725665"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    lease 기반 분산 락을 위한 테이블 및 컬럼 추가:
+    - leases: 락 이름별 소유자, fencing token, 만료 시각
+    - trades.fencing_token: 거래를 기록한 워커가 보유했던 lease token
+    """
+    op.create_table(
+        "leases",
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("owner", sa.String(length=100), nullable=False),
+        sa.Column("fencing_token", sa.BigInteger(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.add_column("trades", sa.Column("fencing_token", sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("trades", "fencing_token")
+    op.drop_table("leases")
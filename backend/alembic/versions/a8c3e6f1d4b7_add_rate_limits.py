@@ -0,0 +1,43 @@
+"""add_rate_limits
+
+Revision ID: a8c3e6f1d4b7
+Revises: e5b3c7d9f2a1
+Create Date: 2026-10-21 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a8c3e6f1d4b7"
+down_revision: Union[str, Sequence[str], None] = "e5b3c7d9f2a1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    계정 단위 요청 속도 제한 테이블 추가:
+    - rate_limits: 제한 이름별 다음 호출 슬롯 (모든 워커가 행 잠금으로 함께 갱신)
+    """
+    op.create_table(
+        "rate_limits",
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column(
+            "next_slot_at",
+            sa.DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("rate_limits")
@@ -0,0 +1,97 @@
+"""add_trade_search_documents
+
+Revision ID: a8c4e2f7d9b1
+Revises: f3b8d1c6a2e4
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a8c4e2f7d9b1"
+down_revision: Union[str, Sequence[str], None] = "f3b8d1c6a2e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app.common.model.compressed_text의 압축 값 접두사
+COMPRESSED_PREFIX = b"\x00"
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _decode(value):
+    if value is None:
+        return None
+    value = bytes(value)
+    if value.startswith(COMPRESSED_PREFIX):
+        return zlib.decompress(value[len(COMPRESSED_PREFIX) :]).decode("utf-8")
+    return value.decode("utf-8")
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    거래 사유 검색 문서 테이블 추가
+    - trade_reasons는 압축 저장 + 파티션 테이블이라 FULLTEXT 인덱스를 둘 수 없으므로 원문을 별도 테이블에 복사
+    - 기존 trade_reasons를 풀어서 채운 뒤 ngram FULLTEXT 인덱스 생성 (MySQL, 한국어 검색)
+    """
+    op.create_table(
+        "trade_search_documents",
+        sa.Column("trade_id", sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("trade_id"),
+    )
+
+    bind = op.get_bind()
+    documents = sa.table(
+        "trade_search_documents",
+        sa.column("trade_id", sa.BigInteger()),
+        sa.column("content", sa.Text()),
+        sa.column("created_at", sa.DateTime()),
+    )
+    last_trade_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT trade_id, ai_reason, execution_reason, created_at "
+                "FROM trade_reasons WHERE trade_id > :last_trade_id "
+                "ORDER BY trade_id LIMIT :limit"
+            ),
+            {"last_trade_id": last_trade_id, "limit": BACKFILL_BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        values = []
+        for trade_id, ai_reason, execution_reason, created_at in rows:
+            content = "\n".join(
+                filter(None, [_decode(ai_reason), _decode(execution_reason)])
+            )
+            if content:
+                values.append(
+                    {"trade_id": trade_id, "content": content, "created_at": created_at}
+                )
+        if values:
+            bind.execute(documents.insert(), values)
+        last_trade_id = rows[-1][0]
+
+    op.create_index(
+        "idx_trade_search_documents_created_at",
+        "trade_search_documents",
+        ["created_at"],
+    )
+    if bind.dialect.name == "mysql":
+        op.execute(
+            "CREATE FULLTEXT INDEX ft_trade_search_documents_content "
+            "ON trade_search_documents (content) WITH PARSER ngram"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("trade_search_documents")
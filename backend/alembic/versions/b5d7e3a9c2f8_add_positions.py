@@ -0,0 +1,160 @@
+"""add_positions
+
+Revision ID: b5d7e3a9c2f8
+Revises: a8c4e2f7d9b1
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+
+from collections import defaultdict, deque
+from decimal import Decimal
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b5d7e3a9c2f8"
+down_revision: Union[str, Sequence[str], None] = "a8c4e2f7d9b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ZERO = Decimal("0")
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    코인별 포지션 원장 추가
+    - positions: 코인별 보유 수량/취득 원가/실현 손익/누적 수수료
+    - position_lots: FIFO 원가 계산용 매수 로트
+    - 기존 체결 거래(success/partial_success)를 ID 순으로 재생하여 채움
+      (app.position.service.position_ledger와 같은 계산)
+    """
+    op.create_table(
+        "positions",
+        sa.Column("coin_id", sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column("quantity", sa.Numeric(20, 8), nullable=False),
+        sa.Column("cost_basis", sa.Numeric(20, 8), nullable=False),
+        sa.Column("realized_pnl", sa.Numeric(20, 8), nullable=False),
+        sa.Column("fees_paid", sa.Numeric(20, 8), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["coin_id"], ["coins.id"]),
+        sa.PrimaryKeyConstraint("coin_id"),
+    )
+    op.create_table(
+        "position_lots",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("coin_id", sa.BigInteger(), nullable=False),
+        sa.Column("trade_id", sa.BigInteger(), nullable=False),
+        sa.Column("remaining_quantity", sa.Numeric(20, 8), nullable=False),
+        sa.Column("unit_cost", sa.Numeric(20, 8), nullable=False),
+        sa.Column("opened_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["coin_id"], ["coins.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("idx_position_lots_coin_id_id", "position_lots", ["coin_id", "id"])
+
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text(
+            "SELECT t.id, t.coin_id, t.trade_type, t.filled_price, t.filled_volume, "
+            "t.paid_fee, COALESCE(t.filled_at, t.created_at) "
+            "FROM trades t JOIN coins c ON c.id = t.coin_id "
+            "WHERE t.status IN ('success', 'partial_success') "
+            "AND t.trade_type IN ('buy', 'sell') "
+            "AND t.filled_volume > 0 AND t.filled_price IS NOT NULL "
+            "ORDER BY t.id"
+        )
+    ).all()
+    if not rows:
+        return
+
+    positions = {}
+    lots = defaultdict(deque)
+    updated_at = {}
+    for trade_id, coin_id, trade_type, price, volume, fee, at in rows:
+        price, volume, fee = Decimal(price), Decimal(volume), Decimal(fee or 0)
+        position = positions.setdefault(
+            coin_id,
+            {
+                "coin_id": coin_id,
+                "quantity": ZERO,
+                "cost_basis": ZERO,
+                "realized_pnl": ZERO,
+                "fees_paid": ZERO,
+            },
+        )
+        coin_lots = lots[coin_id]
+        if trade_type == "buy":
+            cost = price * volume + fee
+            coin_lots.append([trade_id, volume, cost / volume, at])
+            position["quantity"] += volume
+            position["cost_basis"] += cost
+        else:
+            remaining, cost = volume, ZERO
+            while remaining > 0 and coin_lots:
+                lot = coin_lots[0]
+                take = min(remaining, lot[1])
+                cost += take * lot[2]
+                lot[1] -= take
+                remaining -= take
+                if lot[1] <= 0:
+                    coin_lots.popleft()
+            matched = volume - remaining
+            if matched > 0:
+                proceeds = price * matched - fee * matched / volume
+                position["realized_pnl"] += proceeds - cost
+                position["quantity"] -= matched
+                position["cost_basis"] -= cost
+            if not coin_lots:
+                position["quantity"] = ZERO
+                position["cost_basis"] = ZERO
+        position["fees_paid"] += fee
+        updated_at[coin_id] = at
+
+    positions_table = sa.table(
+        "positions",
+        sa.column("coin_id", sa.BigInteger()),
+        sa.column("quantity", sa.Numeric(20, 8)),
+        sa.column("cost_basis", sa.Numeric(20, 8)),
+        sa.column("realized_pnl", sa.Numeric(20, 8)),
+        sa.column("fees_paid", sa.Numeric(20, 8)),
+        sa.column("updated_at", sa.DateTime()),
+    )
+    lots_table = sa.table(
+        "position_lots",
+        sa.column("coin_id", sa.BigInteger()),
+        sa.column("trade_id", sa.BigInteger()),
+        sa.column("remaining_quantity", sa.Numeric(20, 8)),
+        sa.column("unit_cost", sa.Numeric(20, 8)),
+        sa.column("opened_at", sa.DateTime()),
+    )
+    bind.execute(
+        positions_table.insert(),
+        [
+            {**position, "updated_at": updated_at[coin_id]}
+            for coin_id, position in positions.items()
+        ],
+    )
+    open_lots = [
+        {
+            "coin_id": coin_id,
+            "trade_id": trade_id,
+            "remaining_quantity": quantity,
+            "unit_cost": unit_cost,
+            "opened_at": opened_at,
+        }
+        for coin_id, coin_lots in lots.items()
+        for trade_id, quantity, unit_cost, opened_at in coin_lots
+    ]
+    if open_lots:
+        bind.execute(lots_table.insert(), open_lots)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_position_lots_coin_id_id", table_name="position_lots")
+    op.drop_table("position_lots")
+    op.drop_table("positions")
@@ -0,0 +1,83 @@
+"""add_trade_runs
+
+Revision ID: c3e8f1a2b4d6
+Revises: 511eb0d0e1cb
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e8f1a2b4d6"
+down_revision: Union[str, Sequence[str], None] = "511eb0d0e1cb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    거래 실행(run) 기록 테이블 추가
+    - 시작/종료 시각, 락 획득 시간, 코인 수, 구간별 누적 시간, 외부 API 호출 수
+    - trades, balances, trade_tasks에 실행 ID 연결 (기존 행은 NULL)
+    """
+    op.create_table(
+        "trade_runs",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("trigger", sa.String(length=50), nullable=False),
+        sa.Column("mode", sa.String(length=10), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("duration_ms", sa.Float(), nullable=True),
+        sa.Column("lock_wait_ms", sa.Float(), nullable=False),
+        sa.Column("active_coin_count", sa.Integer(), nullable=False),
+        sa.Column("target_coin_count", sa.Integer(), nullable=False),
+        sa.Column("trade_count", sa.Integer(), nullable=False),
+        sa.Column("ohlcv_ms", sa.Float(), nullable=False),
+        sa.Column("ai_ms", sa.Float(), nullable=False),
+        sa.Column("price_ms", sa.Float(), nullable=False),
+        sa.Column("order_ms", sa.Float(), nullable=False),
+        sa.Column("balance_ms", sa.Float(), nullable=False),
+        sa.Column("db_commit_ms", sa.Float(), nullable=False),
+        sa.Column("upbit_calls", sa.Integer(), nullable=False),
+        sa.Column("openai_calls", sa.Integer(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("idx_trade_runs_started_at", "trade_runs", ["started_at"])
+
+    op.add_column("trades", sa.Column("run_id", sa.BigInteger(), nullable=True))
+    op.create_index("idx_trades_run_id", "trades", ["run_id"])
+    op.create_foreign_key(
+        "fk_trades_run_id", "trades", "trade_runs", ["run_id"], ["id"]
+    )
+
+    op.add_column("balances", sa.Column("run_id", sa.BigInteger(), nullable=True))
+    op.create_index("idx_balances_run_id", "balances", ["run_id"])
+    op.create_foreign_key(
+        "fk_balances_run_id", "balances", "trade_runs", ["run_id"], ["id"]
+    )
+
+    op.add_column("trade_tasks", sa.Column("run_id", sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("trade_tasks", "run_id")
+
+    op.drop_constraint("fk_balances_run_id", "balances", type_="foreignkey")
+    op.drop_index("idx_balances_run_id", "balances")
+    op.drop_column("balances", "run_id")
+
+    op.drop_constraint("fk_trades_run_id", "trades", type_="foreignkey")
+    op.drop_index("idx_trades_run_id", "trades")
+    op.drop_column("trades", "run_id")
+
+    op.drop_index("idx_trade_runs_started_at", "trade_runs")
+    op.drop_table("trade_runs")
@@ -0,0 +1,132 @@
+"""add_trade_decision_stats_columns
+
+Revision ID: c7a1f4d8e2b6
+Revises: b5d7e3a9c2f8
+Create Date: 2026-10-19 23:00:00.000000
+
+"""
+
+import re
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7a1f4d8e2b6"
+down_revision: Union[str, Sequence[str], None] = "b5d7e3a9c2f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app.common.model.compressed_text의 압축 값 접두사
+COMPRESSED_PREFIX = b"\x00"
+BACKFILL_BATCH_SIZE = 1000
+
+CONFIDENCE_PATTERN = re.compile(r"Confidence:? ([0-9.]+)%")
+# 실행 사유 문구 -> 실패 원인 (나중에 덧붙는 체결 확인 결과부터 확인)
+FAILURE_PATTERNS = (
+    ("주문 조회 실패", "order_not_found"),
+    ("주문 취소 (체결 없음)", "order_cancelled"),
+    ("주문 실패:", "order_rejected"),
+    ("quota 초과", "ai_quota"),
+    ("OpenAI API 오류", "ai_api_error"),
+    ("AI 분석 실패", "ai_error"),
+    ("KRW 잔고가", "insufficient_krw"),
+    ("보유 코인이 없습니다", "no_holdings"),
+    ("미만입니다. 매도 불가", "below_min_order"),
+)
+
+
+def _decode(value):
+    if value is None:
+        return None
+    value = bytes(value)
+    if value.startswith(COMPRESSED_PREFIX):
+        return zlib.decompress(value[len(COMPRESSED_PREFIX) :]).decode("utf-8")
+    return value.decode("utf-8")
+
+
+def _failure_category(execution_reason: str) -> str:
+    for pattern, category in FAILURE_PATTERNS:
+        if pattern in execution_reason:
+            return category
+    return "unknown"
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    코인별 결정 통계용 컬럼과 커버링 인덱스 추가
+    - confidence: AI 신뢰도 (기존 거래는 execution_reason의 "Confidence xx.xx%"에서 추출)
+    - failure_category: FAILED 거래의 실패 원인 (기존 거래는 execution_reason 문구로 분류)
+    - idx_trades_decision_stats: GROUP BY 집계를 인덱스만으로 처리
+    """
+    op.add_column("trades", sa.Column("confidence", sa.Numeric(5, 4), nullable=True))
+    op.add_column("trades", sa.Column("failure_category", sa.String(30), nullable=True))
+
+    bind = op.get_bind()
+    update = sa.text(
+        "UPDATE trades SET confidence = :confidence, "
+        "failure_category = :failure_category "
+        "WHERE id = :trade_id AND created_at = :created_at"
+    )
+    last_trade_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT r.trade_id, r.created_at, r.execution_reason, t.status "
+                "FROM trade_reasons r JOIN trades t "
+                "ON t.id = r.trade_id AND t.created_at = r.created_at "
+                "WHERE r.trade_id > :last_trade_id "
+                "ORDER BY r.trade_id LIMIT :limit"
+            ),
+            {"last_trade_id": last_trade_id, "limit": BACKFILL_BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        values = []
+        for trade_id, created_at, execution_reason, status in rows:
+            execution_reason = _decode(execution_reason) or ""
+            match = CONFIDENCE_PATTERN.search(execution_reason)
+            confidence = float(match.group(1)) / 100 if match else None
+            failure_category = (
+                _failure_category(execution_reason) if status == "failed" else None
+            )
+            if confidence is not None or failure_category is not None:
+                values.append(
+                    {
+                        "trade_id": trade_id,
+                        "created_at": created_at,
+                        "confidence": confidence,
+                        "failure_category": failure_category,
+                    }
+                )
+        if values:
+            bind.execute(update, values)
+        last_trade_id = rows[-1][0]
+
+    op.execute(
+        "UPDATE trades SET failure_category = 'unknown' "
+        "WHERE status = 'failed' AND failure_category IS NULL"
+    )
+    op.create_index(
+        "idx_trades_decision_stats",
+        "trades",
+        [
+            "coin_id",
+            "trade_type",
+            "status",
+            "risk_level",
+            "failure_category",
+            "confidence",
+        ],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_trades_decision_stats", "trades")
+    op.drop_column("trades", "failure_category")
+    op.drop_column("trades", "confidence")
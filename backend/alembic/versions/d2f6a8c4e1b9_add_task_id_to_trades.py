@@ -0,0 +1,35 @@
+"""add_task_id_to_trades
+
+Revision ID: d2f6a8c4e1b9
+Revises: c7a1f4d8e2b6
+Create Date: 2026-10-20 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d2f6a8c4e1b9"
+down_revision: Union[str, Sequence[str], None] = "c7a1f4d8e2b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    거래를 기록한 큐 작업 ID 추가 (재시도한 작업이 주문을 중복 접수하지 않도록 확인)
+    - 파티션 테이블이므로 외래 키 없이 인덱스만 추가 (기존 행은 NULL)
+    """
+    op.add_column("trades", sa.Column("task_id", sa.BigInteger(), nullable=True))
+    op.create_index("idx_trades_task_id", "trades", ["task_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_trades_task_id", "trades")
+    op.drop_column("trades", "task_id")
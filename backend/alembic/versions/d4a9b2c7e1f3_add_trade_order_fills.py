@@ -0,0 +1,56 @@
+"""add_trade_order_fills
+
+Revision ID: d4a9b2c7e1f3
+Revises: c3e8f1a2b4d6
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4a9b2c7e1f3"
+down_revision: Union[str, Sequence[str], None] = "c3e8f1a2b4d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    거래에 주문 체결 정보 추가
+    - order_uuid: 접수된 주문 UUID (체결 확인 대상)
+    - filled_price/filled_volume/paid_fee/filled_at: 체결 확인 결과 (기존 행은 NULL)
+    - (status, order_uuid) 인덱스: 체결 확인 대상(PENDING + 주문 UUID 있음) 조회
+    """
+    op.add_column(
+        "trades", sa.Column("order_uuid", sa.String(length=64), nullable=True)
+    )
+    op.add_column(
+        "trades",
+        sa.Column("filled_price", sa.Numeric(precision=20, scale=8), nullable=True),
+    )
+    op.add_column(
+        "trades",
+        sa.Column("filled_volume", sa.Numeric(precision=20, scale=8), nullable=True),
+    )
+    op.add_column(
+        "trades",
+        sa.Column("paid_fee", sa.Numeric(precision=20, scale=8), nullable=True),
+    )
+    op.add_column("trades", sa.Column("filled_at", sa.DateTime(), nullable=True))
+    op.create_index("idx_trades_status_order_uuid", "trades", ["status", "order_uuid"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_trades_status_order_uuid", "trades")
+    op.drop_column("trades", "filled_at")
+    op.drop_column("trades", "paid_fee")
+    op.drop_column("trades", "filled_volume")
+    op.drop_column("trades", "filled_price")
+    op.drop_column("trades", "order_uuid")
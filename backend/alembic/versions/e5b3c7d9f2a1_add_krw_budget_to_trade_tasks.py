@@ -0,0 +1,32 @@
+"""add_krw_budget_to_trade_tasks
+
+Revision ID: e5b3c7d9f2a1
+Revises: d2f6a8c4e1b9
+Create Date: 2026-10-20 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5b3c7d9f2a1"
+down_revision: Union[str, Sequence[str], None] = "d2f6a8c4e1b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    큐 작업별 매수 상한 KRW 추가 (작업 추가 시 KRW 잔고를 대상 코인들에 균등 배분, 기존 작업은 NULL)
+    """
+    op.add_column("trade_tasks", sa.Column("krw_budget", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("trade_tasks", "krw_budget")
@@ -0,0 +1,100 @@
+"""partition_trades_and_balances
+
+Revision ID: e7f2c9a1b3d5
+Revises: d4a9b2c7e1f3
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+
+from datetime import datetime
+from typing import List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7f2c9a1b3d5"
+down_revision: Union[str, Sequence[str], None] = "d4a9b2c7e1f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONED_TABLES = ("trades", "balances")
+# 마이그레이션 시점에 이번 달 이후로 미리 만들어 둘 파티션 개월 수
+PREMAKE_MONTHS = 3
+
+
+def _add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def _partition_definitions(first: datetime, last: datetime) -> List[str]:
+    """first가 속한 월부터 last가 속한 월까지의 월 파티션 + pmax"""
+    month = datetime(first.year, first.month, 1)
+    definitions = []
+    while month <= last:
+        upper = _add_months(month, 1)
+        definitions.append(
+            f"PARTITION p{month:%Y%m} VALUES LESS THAN ('{upper:%Y-%m-%d %H:%M:%S}')"
+        )
+        month = upper
+    definitions.append("PARTITION pmax VALUES LESS THAN (MAXVALUE)")
+    return definitions
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    trades/balances를 created_at 기준 월별 RANGE COLUMNS 파티션으로 변경 (MySQL)
+    - 파티션 테이블은 외래 키를 가질 수 없으므로 coin_id/run_id 외래 키 삭제 (인덱스는 유지)
+    - 모든 유니크 키에 파티션 컬럼이 포함되어야 하므로 기본 키를 (id, created_at)으로 변경
+    - 가장 오래된 행의 월부터 이번 달 + PREMAKE_MONTHS까지 월 파티션 생성, 이후는 pmax
+      (이후 파티션은 partition_maintenance_job이 미리 만듦)
+    - 기존 데이터를 다시 쓰므로 큰 테이블은 점검 시간에 실행
+    """
+    bind = op.get_bind()
+    if bind.dialect.name != "mysql":
+        return
+
+    inspector = sa.inspect(bind)
+    now = datetime.utcnow()
+    for table in PARTITIONED_TABLES:
+        for foreign_key in inspector.get_foreign_keys(table):
+            op.drop_constraint(foreign_key["name"], table, type_="foreignkey")
+
+        op.execute(
+            f"ALTER TABLE {table} DROP PRIMARY KEY, ADD PRIMARY KEY (id, created_at)"
+        )
+
+        first = bind.execute(sa.text(f"SELECT MIN(created_at) FROM {table}")).scalar()
+        definitions = _partition_definitions(
+            first or now, _add_months(datetime(now.year, now.month, 1), PREMAKE_MONTHS)
+        )
+        op.execute(
+            f"ALTER TABLE {table} PARTITION BY RANGE COLUMNS(created_at) "
+            f"({', '.join(definitions)})"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    보관 후 삭제된 파티션의 데이터는 복구되지 않으며,
+    삭제된 코인/실행을 참조하는 행이 있으면 외래 키 생성이 실패합니다.
+    """
+    bind = op.get_bind()
+    if bind.dialect.name != "mysql":
+        return
+
+    for table in PARTITIONED_TABLES:
+        op.execute(f"ALTER TABLE {table} REMOVE PARTITIONING")
+        op.execute(f"ALTER TABLE {table} DROP PRIMARY KEY, ADD PRIMARY KEY (id)")
+
+    op.create_foreign_key("fk_trades_coin_id", "trades", "coins", ["coin_id"], ["id"])
+    op.create_foreign_key(
+        "fk_trades_run_id", "trades", "trade_runs", ["run_id"], ["id"]
+    )
+    op.create_foreign_key(
+        "fk_balances_run_id", "balances", "trade_runs", ["run_id"], ["id"]
+    )
@@ -0,0 +1,113 @@
+"""move_trade_reasons_to_side_table
+
+Revision ID: f3b8d1c6a2e4
+Revises: e7f2c9a1b3d5
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b8d1c6a2e4"
+down_revision: Union[str, Sequence[str], None] = "e7f2c9a1b3d5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app.common.model.compressed_text의 압축 값 접두사
+COMPRESSED_PREFIX = b"\x00"
+
+
+def _blob() -> sa.types.TypeEngine:
+    return sa.LargeBinary().with_variant(mysql.MEDIUMBLOB(), "mysql")
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    trades.ai_reason/execution_reason을 trade_reasons 테이블로 분리
+    - 목록 조회가 수 KB의 사유 없이 좁은 trades 행만 읽도록 함
+    - 사유는 BLOB에 저장 (기존 값은 UTF-8 그대로 옮기고, 이후 긴 사유는 앱에서 zlib 압축)
+    - MySQL에서는 trades와 같은 월별 파티션으로 나눔 (created_at은 거래 생성 시각)
+    """
+    op.create_table(
+        "trade_reasons",
+        sa.Column("trade_id", sa.BigInteger(), autoincrement=False, nullable=False),
+        sa.Column("ai_reason", _blob(), nullable=True),
+        sa.Column("execution_reason", _blob(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("trade_id", "created_at"),
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name == "mysql":
+        # trades의 현재 파티션 구성을 그대로 사용 (이후 partition_maintenance_job이 함께 관리)
+        partitions = bind.execute(
+            sa.text(
+                "SELECT PARTITION_NAME, PARTITION_DESCRIPTION "
+                "FROM information_schema.PARTITIONS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'trades' "
+                "AND PARTITION_NAME IS NOT NULL "
+                "ORDER BY PARTITION_ORDINAL_POSITION"
+            )
+        ).all()
+        if partitions:
+            definitions = ", ".join(
+                f"PARTITION {name} VALUES LESS THAN ({description})"
+                for name, description in partitions
+            )
+            op.execute(
+                "ALTER TABLE trade_reasons PARTITION BY RANGE COLUMNS(created_at) "
+                f"({definitions})"
+            )
+
+    op.execute(
+        "INSERT INTO trade_reasons (trade_id, ai_reason, execution_reason, created_at) "
+        "SELECT id, ai_reason, execution_reason, created_at FROM trades "
+        "WHERE ai_reason IS NOT NULL OR execution_reason IS NOT NULL"
+    )
+    op.drop_column("trades", "execution_reason")
+    op.drop_column("trades", "ai_reason")
+
+
+def _decode(value):
+    if value is None:
+        return None
+    value = bytes(value)
+    if value.startswith(COMPRESSED_PREFIX):
+        return zlib.decompress(value[len(COMPRESSED_PREFIX) :]).decode("utf-8")
+    return value.decode("utf-8")
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    압축된 사유를 풀어 trades로 되돌립니다.
+    """
+    op.add_column("trades", sa.Column("ai_reason", sa.Text(), nullable=True))
+    op.add_column("trades", sa.Column("execution_reason", sa.Text(), nullable=True))
+
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text("SELECT trade_id, ai_reason, execution_reason FROM trade_reasons")
+    )
+    for trade_id, ai_reason, execution_reason in rows.all():
+        bind.execute(
+            sa.text(
+                "UPDATE trades SET ai_reason = :ai_reason, "
+                "execution_reason = :execution_reason WHERE id = :trade_id"
+            ),
+            {
+                "trade_id": trade_id,
+                "ai_reason": _decode(ai_reason),
+                "execution_reason": _decode(execution_reason),
+            },
+        )
+
+    op.drop_table("trade_reasons")
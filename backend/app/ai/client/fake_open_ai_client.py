@@ -0,0 +1,85 @@
+"""
+가짜 OpenAI 클라이언트
+
+OpenAIClient와 같은 인터페이스로 OpenAI API 호출 없이 임의의 결정을 반환합니다.
+지연과 결정 비율을 조절할 수 있어 벤치마크/부하 테스트에 사용합니다.
+"""
+
+import random
+import threading
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from app.ai.client.open_ai_client import OpenAIClient
+from app.ai.dto.ai_analysis_response import AiAnalysisResponse, Decision, RiskLevel
+from app.common.metrics import observe_external_call
+from app.common.tracing import traced
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+
+class FakeOpenAIClient(OpenAIClient):
+    """
+    임의의 AI 결정을 반환하는 OpenAIClient
+
+    여러 스레드에서 동시에 호출해도 호출마다 난수를 한 번에 뽑으므로,
+    같은 시드면 호출 순서대로 같은 결정 목록이 나옵니다.
+
+    @param latency_ms: 호출당 지연 (ms)
+    @param latency_jitter_ms: 호출당 추가 지연의 최대값 (ms, 균등 분포)
+    @param buy_ratio: BUY 결정 비율
+    @param sell_ratio: SELL 결정 비율 (나머지는 HOLD)
+    @param seed: 난수 시드
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        latency_jitter_ms: float = 0.0,
+        buy_ratio: float = 0.3,
+        sell_ratio: float = 0.3,
+        seed: Optional[int] = None,
+    ) -> None:
+        # OpenAI 클라이언트(API 키)는 사용하지 않음
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.buy_ratio = buy_ratio
+        self.sell_ratio = sell_ratio
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        pass
+
+    @traced("openai.get_trading_decision")
+    @observe_external_call("openai")
+    def get_bitcoin_trading_decision(self, df: "DataFrame") -> AiAnalysisResponse:
+        with self._lock:
+            delay_ms = self.latency_ms
+            if self.latency_jitter_ms > 0:
+                delay_ms += self._random.uniform(0, self.latency_jitter_ms)
+            draw = self._random.random()
+            confidence = round(self._random.uniform(0.5, 1.0), 2)
+            risk_level = self._random.choice(
+                [RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH]
+            )
+
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+        if draw < self.buy_ratio:
+            decision = Decision.BUY
+        elif draw < self.buy_ratio + self.sell_ratio:
+            decision = Decision.SELL
+        else:
+            decision = Decision.HOLD
+
+        return AiAnalysisResponse(
+            decision=decision,
+            confidence=confidence,
+            reason=f"가짜 AI 결정 (OHLCV {len(df)}개)",
+            risk_level=risk_level,
+            timestamp=datetime.utcnow(),
+        )
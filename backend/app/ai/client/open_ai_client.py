@@ -1,17 +1,30 @@
 import json
-
-from openai import OpenAI
-from pandas import DataFrame
+from typing import TYPE_CHECKING, Optional
 
 from app.ai.const.constans import BITCOIN_ANALYST_PROMPT, OPEN_AI_MODEL
 from app.ai.dto.ai_analysis_response import AiAnalysisResponse
+from app.common.metrics import observe_external_call
+from app.common.tracing import traced
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
 
 
 class OpenAIClient:
-    def __init__(self) -> None:
-        self.client = OpenAI()
+    def __init__(self, api_key: Optional[str] = None) -> None:
+        # openai SDK는 import 비용이 커서 클라이언트를 처음 만들 때 import
+        from openai import OpenAI
+
+        # api_key가 없으면 OpenAI SDK가 OPENAI_API_KEY 환경변수를 사용
+        self.client = OpenAI(api_key=api_key or None)
+
+    def close(self) -> None:
+        """HTTP 커넥션 풀 정리"""
+        self.client.close()
 
-    def get_bitcoin_trading_decision(self, df: DataFrame) -> AiAnalysisResponse:
+    @traced("openai.get_trading_decision")
+    @observe_external_call("openai")
+    def get_bitcoin_trading_decision(self, df: "DataFrame") -> AiAnalysisResponse:
         response = self.client.chat.completions.create(
             model=OPEN_AI_MODEL,
             messages=[
@@ -0,0 +1,24 @@
+from functools import lru_cache
+
+from app.ai.client.open_ai_client import OpenAIClient
+from app.configs.config import get_settings
+
+
+@lru_cache
+def get_open_ai_client() -> OpenAIClient:
+    """
+    프로세스 단위 OpenAIClient 싱글톤
+
+    OpenAI SDK 클라이언트는 HTTP 커넥션 풀을 가지므로 요청/실행마다 새로 만들지 않고 공유합니다.
+    (처음 사용할 때 생성하고 애플리케이션 종료 시 close_open_ai_client()로 정리)
+
+    @raises OpenAIError: OPENAI_API_KEY가 설정되지 않은 경우
+    """
+    return OpenAIClient(api_key=get_settings().OPENAI_API_KEY)
+
+
+def close_open_ai_client() -> None:
+    """생성된 OpenAIClient의 커넥션 풀을 정리하고 싱글톤 초기화"""
+    if get_open_ai_client.cache_info().currsize:
+        get_open_ai_client().close()
+        get_open_ai_client.cache_clear()
@@ -0,0 +1,165 @@
+"""
+백테스트 결정 소스
+
+캔들 데이터를 받아 캔들마다 BUY/SELL/HOLD 결정을 반환합니다.
+결정은 int8 배열(BUY=1, SELL=-1, HOLD=0)로 표현하며, i번째 결정은
+i번째 캔들의 종가 시점에 내려진 것으로 간주합니다.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+from pandas import DataFrame
+
+from app.ai.dto.ai_analysis_response import Decision
+from app.trade.model.trade import Trade
+
+BUY = 1
+SELL = -1
+HOLD = 0
+
+DECISION_CODES: Dict[str, int] = {
+    Decision.BUY.value: BUY,
+    Decision.SELL.value: SELL,
+    Decision.HOLD.value: HOLD,
+}
+
+# 예: "AI 매수 결정: Confidence 85.00%, ..." / "AI HOLD 결정 (Confidence: 70.00%)"
+CONFIDENCE_PATTERN = re.compile(r"Confidence:?\s*([\d.]+)%")
+
+
+def parse_confidence(execution_reason: Optional[str]) -> Optional[float]:
+    """
+    거래 실행 사유에서 AI 신뢰도 추출
+
+    @param execution_reason: Trade.execution_reason
+    @return: 신뢰도 (0~1), 찾지 못하면 None
+    """
+    if not execution_reason:
+        return None
+    match = CONFIDENCE_PATTERN.search(execution_reason)
+    if match is None:
+        return None
+    return float(match.group(1)) / 100
+
+
+class DecisionSource(ABC):
+    """캔들별 매매 결정 제공자"""
+
+    @abstractmethod
+    def decide(self, coin_name: str, candles: DataFrame) -> np.ndarray:
+        """
+        캔들별 결정 계산
+
+        @param coin_name: 티커 (예: "KRW-BTC")
+        @param candles: OHLCV 데이터 (시간 오름차순, close 컬럼 필수)
+        @return: 캔들 수와 같은 길이의 int8 배열 (BUY=1, SELL=-1, HOLD=0)
+        """
+
+
+class MovingAverageCrossStrategy(DecisionSource):
+    """
+    이동평균 교차 전략
+
+    단기 이동평균이 장기 이동평균을 상향 돌파하면 BUY, 하향 돌파하면 SELL,
+    그 외에는 HOLD를 반환합니다.
+
+    @param short_window: 단기 이동평균 기간
+    @param long_window: 장기 이동평균 기간
+    """
+
+    def __init__(self, short_window: int = 5, long_window: int = 20):
+        if not 0 < short_window < long_window:
+            raise ValueError("short_window는 0보다 크고 long_window보다 작아야 합니다.")
+        self.short_window = short_window
+        self.long_window = long_window
+
+    def decide(self, coin_name: str, candles: DataFrame) -> np.ndarray:
+        close = candles["close"].to_numpy(dtype=np.float64)
+        decisions = np.zeros(len(close), dtype=np.int8)
+        if len(close) <= self.long_window:
+            return decisions
+
+        cumsum = np.concatenate(([0.0], np.cumsum(close)))
+        # i번째 값은 close[i - window + 1 : i + 1]의 평균
+        short_ma = (
+            cumsum[self.short_window :] - cumsum[: -self.short_window]
+        ) / self.short_window
+        long_ma = (
+            cumsum[self.long_window :] - cumsum[: -self.long_window]
+        ) / self.long_window
+        above = short_ma[self.long_window - self.short_window :] > long_ma
+
+        crossed = np.flatnonzero(above[1:] != above[:-1]) + 1
+        candle_index = crossed + self.long_window - 1
+        decisions[candle_index] = np.where(above[crossed], BUY, SELL)
+        return decisions
+
+
+class RecordedDecisionSource(DecisionSource):
+    """
+    기록된 AI 결정 재생
+
+    trades 테이블에 남은 AI 결정을 캔들에 매핑합니다.
+    결정 시각이 속한 캔들에 결정을 배치하며, 한 캔들에 여러 결정이 있으면 마지막 결정을 사용합니다.
+
+    @param decisions: coin_name, decided_at(UTC), decision(buy/sell/hold), confidence 컬럼
+    @param min_confidence: 이 신뢰도 미만의 BUY/SELL은 HOLD로 취급
+    @param candle_utc_offset: 캔들 인덱스의 UTC 대비 시차 (pyupbit 캔들은 KST 기준)
+    """
+
+    def __init__(
+        self,
+        decisions: DataFrame,
+        min_confidence: float = 0.0,
+        candle_utc_offset: timedelta = timedelta(hours=9),
+    ):
+        self.decisions = decisions
+        self.min_confidence = min_confidence
+        self.candle_utc_offset = candle_utc_offset
+
+    @classmethod
+    def from_trades(cls, trades: List[Trade], **kwargs) -> "RecordedDecisionSource":
+        """
+        Trade 목록으로부터 생성
+
+        @param trades: TradeRepository.get_ai_decisions_with_coin() 결과
+        @return: RecordedDecisionSource
+        """
+        rows = [
+            {
+                "coin_name": trade.coin.name,
+                "decided_at": trade.created_at,
+                "decision": trade.trade_type,
+                "confidence": parse_confidence(trade.execution_reason),
+            }
+            for trade in trades
+        ]
+        decisions = DataFrame(
+            rows, columns=["coin_name", "decided_at", "decision", "confidence"]
+        )
+        return cls(decisions, **kwargs)
+
+    def decide(self, coin_name: str, candles: DataFrame) -> np.ndarray:
+        result = np.zeros(len(candles), dtype=np.int8)
+        records = self.decisions[self.decisions["coin_name"] == coin_name]
+        if records.empty or len(candles) == 0:
+            return result
+
+        codes = records["decision"].map(DECISION_CODES).fillna(HOLD).to_numpy(np.int8)
+        confidence = records["confidence"].fillna(1.0).to_numpy(np.float64)
+        codes[confidence < self.min_confidence] = HOLD
+
+        candle_times = candles.index.to_numpy(dtype="datetime64[ns]")
+        decided_at = (records["decided_at"] + self.candle_utc_offset).to_numpy(
+            dtype="datetime64[ns]"
+        )
+        candle_index = np.searchsorted(candle_times, decided_at, side="right") - 1
+        valid = candle_index >= 0
+
+        # records는 시간 오름차순이므로 같은 캔들에 대해서는 나중 값이 남음
+        result[candle_index[valid]] = codes[valid]
+        return result
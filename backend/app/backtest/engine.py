@@ -0,0 +1,371 @@
+"""
+벡터화 백테스트 엔진
+
+과거 OHLCV 데이터를 결정 소스(DecisionSource)로 재생하여 TradeService와 같은 규칙으로
+매매했을 때의 성과를 계산합니다.
+
+매매 규칙 (TradeService._execute_buy / _execute_sell과 동일):
+- 매수: 보유 KRW * fee_multiplier 금액으로 매수, 수량 = (금액 / 가격) * fee_multiplier
+  (금액이 min_order_amount 미만이면 매수 불가)
+- 매도: 보유 수량 전량 매도, 수령액 = 수량 * 가격 * fee_multiplier
+  (수령액이 min_order_amount 미만이거나 보유 수량이 없으면 매도 불가)
+- 체결 가격은 결정이 내려진 캔들의 종가
+
+전량 매수/전량 매도 규칙이므로 코인별 포지션은 "KRW 보유"와 "코인 보유" 두 상태뿐이고,
+매수 후 남는 KRW(1 - fee_multiplier 비율)는 최소 주문 금액 미만으로 보고 추가 매수에 쓰지 않습니다.
+따라서 한 번의 왕복 거래는 KRW 잔고에 곱해지는 계수로 표현되어, 캔들 단위 반복 없이
+상태 전이 지점과 누적곱만으로 자산 곡선을 계산합니다.
+
+코인마다 initial_krw를 균등 분할한 독립 계좌로 시뮬레이션하며,
+포트폴리오 자산은 코인별 자산의 합입니다.
+"""
+
+from dataclasses import dataclass
+from logging import Logger
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from app.backtest.decision_source import BUY, SELL, DecisionSource
+from app.trade.model.enums import TradeType
+
+logger = Logger(__name__)
+
+SECONDS_PER_YEAR = 365 * 24 * 60 * 60
+
+TRADE_COLUMNS = [
+    "coin_name",
+    "timestamp",
+    "trade_type",
+    "price",
+    "amount",
+    "krw_amount",
+]
+
+
+@dataclass
+class BacktestResult:
+    """백테스트 결과"""
+
+    equity: pd.Series  # 포트폴리오 자산 곡선 (KRW)
+    coin_equity: DataFrame  # 코인별 자산 곡선 (KRW)
+    trades: DataFrame  # 체결된 거래 목록
+    drawdown: pd.Series  # 고점 대비 하락률 (0 이하)
+    max_drawdown: float  # 최대 낙폭 (0~1)
+    sharpe: float  # 연환산 샤프 지수 (무위험 수익률 0)
+    total_return: float  # 총 수익률
+
+    def summary(self) -> Dict[str, float]:
+        """주요 지표 요약"""
+        return {
+            "initial_equity": float(self.equity.iloc[0]) if len(self.equity) else 0.0,
+            "final_equity": float(self.equity.iloc[-1]) if len(self.equity) else 0.0,
+            "total_return": self.total_return,
+            "max_drawdown": self.max_drawdown,
+            "sharpe": self.sharpe,
+            "trades": len(self.trades),
+        }
+
+
+class BacktestEngine:
+    """
+    벡터화 백테스트 엔진
+
+    @param fee_multiplier: 수수료 계수 (TradeService.execute와 동일, 기본: 0.9995)
+    @param min_order_amount: 최소 주문 금액 (기본: 5000 KRW)
+    @param initial_krw: 초기 KRW 잔고 (코인 수만큼 균등 분할)
+    """
+
+    def __init__(
+        self,
+        fee_multiplier: float = 0.9995,
+        min_order_amount: float = 5000.0,
+        initial_krw: float = 1_000_000.0,
+    ):
+        self.fee_multiplier = fee_multiplier
+        self.min_order_amount = min_order_amount
+        self.initial_krw = initial_krw
+
+    def run(
+        self, candles: Dict[str, DataFrame], decision_source: DecisionSource
+    ) -> BacktestResult:
+        """
+        백테스트 실행
+
+        @param candles: 티커별 OHLCV 데이터 (시간 오름차순 DatetimeIndex, close 컬럼 필수)
+        @param decision_source: 결정 소스
+        @return: BacktestResult
+        @raises ValueError: 캔들 데이터가 없는 경우
+        """
+        if not candles:
+            raise ValueError("백테스트할 캔들 데이터가 없습니다.")
+
+        coin_krw = self.initial_krw / len(candles)
+        equity_by_coin: Dict[str, pd.Series] = {}
+        trade_frames = []
+
+        for coin_name, df in candles.items():
+            close = df["close"].to_numpy(dtype=np.float64)
+            decisions = np.asarray(decision_source.decide(coin_name, df), dtype=np.int8)
+            if len(decisions) != len(close):
+                raise ValueError(
+                    f"{coin_name}: 결정 수({len(decisions)})와 캔들 수({len(close)})가 다릅니다."
+                )
+
+            equity, trades = self.simulate(close, decisions, coin_krw)
+            equity_by_coin[coin_name] = pd.Series(equity, index=df.index)
+
+            trades.insert(
+                0, "timestamp", df.index[trades.pop("candle_index").to_numpy()]
+            )
+            trades.insert(0, "coin_name", coin_name)
+            trade_frames.append(trades)
+
+        # 코인별 캔들 시각이 달라도 합산할 수 있도록 시각을 합치고 직전 값으로 채움
+        coin_equity = (
+            pd.concat(equity_by_coin, axis=1).sort_index().ffill().fillna(coin_krw)
+        )
+        equity = coin_equity.sum(axis=1)
+
+        trades = (
+            pd.concat(trade_frames, ignore_index=True) if trade_frames else DataFrame()
+        )
+        trades = trades.reindex(columns=TRADE_COLUMNS).sort_values(
+            ["timestamp", "coin_name"], kind="stable", ignore_index=True
+        )
+
+        drawdown = equity / equity.cummax() - 1.0
+        return BacktestResult(
+            equity=equity,
+            coin_equity=coin_equity,
+            trades=trades,
+            drawdown=drawdown,
+            max_drawdown=float(-drawdown.min()) if len(drawdown) else 0.0,
+            sharpe=_sharpe_ratio(equity),
+            total_return=float(equity.iloc[-1] / self.initial_krw - 1.0),
+        )
+
+    def simulate(
+        self, close: np.ndarray, decisions: np.ndarray, initial_krw: float
+    ) -> Tuple[np.ndarray, DataFrame]:
+        """
+        단일 코인 계좌 시뮬레이션
+
+        @param close: 종가 배열
+        @param decisions: 결정 배열 (BUY=1, SELL=-1, HOLD=0)
+        @param initial_krw: 초기 KRW 잔고
+        @return: (캔들별 자산 배열, 거래 목록 DataFrame)
+        """
+        fee = self.fee_multiplier
+        size = len(close)
+
+        buys, sells = _position_transitions(decisions)
+        buys, sells, buy_krw = self._apply_order_limits(
+            close, decisions, buys, sells, initial_krw
+        )
+
+        # 매수 시점 KRW 잔고 K에 대해
+        #   보유 수량 = K * fee / 매수가 * fee, 남은 KRW = K * (1 - fee)
+        #   매도 후 KRW = K * (1 - fee) + 수량 * 매도가 * fee
+        coin_amount = buy_krw * fee * fee / close[buys]
+        residual_krw = buy_krw * (1.0 - fee)
+        sell_krw = (
+            residual_krw[: len(sells)] + coin_amount[: len(sells)] * close[sells] * fee
+        )
+
+        # 각 캔들 시점의 마지막 매수/매도 위치
+        last_buy = _last_event_index(buys, size)
+        last_sell = _last_event_index(sells, size)
+        holding = last_buy > last_sell
+
+        # 매도 이후에는 매도 후 KRW, 첫 매수 전에는 초기 잔고
+        cash_at = np.full(size, initial_krw)
+        cash_at[sells] = sell_krw
+        cash = np.where(last_sell >= 0, cash_at[np.maximum(last_sell, 0)], initial_krw)
+
+        amount_at = np.zeros(size)
+        amount_at[buys] = coin_amount
+        residual_at = np.zeros(size)
+        residual_at[buys] = residual_krw
+        held = np.maximum(last_buy, 0)
+
+        equity = np.where(holding, residual_at[held] + amount_at[held] * close, cash)
+
+        trade_candles = np.concatenate((buys, sells))
+        trades = DataFrame(
+            {
+                "candle_index": trade_candles,
+                "trade_type": np.concatenate(
+                    (
+                        np.full(len(buys), TradeType.BUY.value, dtype=object),
+                        np.full(len(sells), TradeType.SELL.value, dtype=object),
+                    )
+                ),
+                "price": close[trade_candles],
+                "amount": np.concatenate((coin_amount, coin_amount[: len(sells)])),
+                "krw_amount": np.concatenate(
+                    (buy_krw * fee, coin_amount[: len(sells)] * close[sells] * fee)
+                ),
+            }
+        )
+        trades = trades.sort_values("candle_index", kind="stable", ignore_index=True)
+        return equity, trades
+
+    def _apply_order_limits(
+        self,
+        close: np.ndarray,
+        decisions: np.ndarray,
+        buys: np.ndarray,
+        sells: np.ndarray,
+        initial_krw: float,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        최소 주문 금액 조건을 적용하여 체결 가능한 매수/매도만 남김
+
+        모든 상태 전이가 체결된다고 보고 누적곱으로 매수 시점 잔고를 계산한 뒤,
+        처음으로 조건을 위반하는 지점을 찾습니다.
+        - 매수 불가(K * fee < 최소 주문 금액): KRW가 더 늘어날 수 없으므로 이후 거래는 모두 불가
+        - 매도 불가(수령액 < 최소 주문 금액): 코인을 계속 보유하며 이후 SELL 결정마다 매도를 재시도.
+          잔고가 최소 주문 금액 근처인 구간이므로 이후 결정은 순차적으로 처리
+
+        @return: (매수 위치, 매도 위치, 매수 시점 KRW 잔고)
+        """
+        fee = self.fee_multiplier
+        min_amount = self.min_order_amount
+        closed = len(sells)
+
+        # 왕복 거래마다 KRW 잔고에 곱해지는 계수
+        price_ratio = close[sells] / close[buys[:closed]]
+        round_trip = (1.0 - fee) + fee**3 * price_ratio
+        buy_krw = (
+            initial_krw * np.concatenate(([1.0], np.cumprod(round_trip)))[: len(buys)]
+        )
+
+        buy_failed = np.flatnonzero(buy_krw * fee < min_amount)
+        sell_failed = np.flatnonzero(
+            buy_krw[:closed] * fee**3 * price_ratio < min_amount
+        )
+        first_buy_failure = buy_failed[0] if len(buy_failed) else len(buys)
+        first_sell_failure = sell_failed[0] if len(sell_failed) else closed
+
+        if first_buy_failure == len(buys) and first_sell_failure == closed:
+            return buys, sells, buy_krw
+
+        if first_buy_failure <= first_sell_failure:
+            k = first_buy_failure
+            return buys[:k], sells[:k], buy_krw[:k]
+
+        k = first_sell_failure
+        tail_buys, tail_sells, tail_krw = self._simulate_holding_tail(
+            close, decisions, sells[k], buys[k], buy_krw[k]
+        )
+        return (
+            np.concatenate((buys[: k + 1], tail_buys)),
+            np.concatenate((sells[:k], tail_sells)),
+            np.concatenate((buy_krw[: k + 1], tail_krw)),
+        )
+
+    def _simulate_holding_tail(
+        self,
+        close: np.ndarray,
+        decisions: np.ndarray,
+        start: int,
+        buy_at: int,
+        buy_krw: float,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        매도에 실패한 시점부터 남은 결정을 순차 처리
+
+        @param start: 매도에 실패한 캔들 위치
+        @param buy_at: 보유 중인 코인의 매수 위치
+        @param buy_krw: 보유 중인 코인의 매수 시점 KRW 잔고
+        @return: (이후 매수 위치, 이후 매도 위치, 이후 매수 시점 KRW 잔고)
+        """
+        fee = self.fee_multiplier
+        min_amount = self.min_order_amount
+
+        krw = buy_krw * (1.0 - fee)
+        amount = buy_krw * fee * fee / close[buy_at]
+        holding = True
+        buys: List[int] = []
+        sells: List[int] = []
+        krw_at_buy: List[float] = []
+
+        for i in np.flatnonzero(decisions[start:]) + start:
+            price = close[i]
+            if holding and decisions[i] == SELL:
+                proceeds = amount * price * fee
+                if proceeds >= min_amount:
+                    krw += proceeds
+                    holding = False
+                    sells.append(i)
+            elif not holding and decisions[i] == BUY:
+                available = krw * fee
+                if available < min_amount:
+                    break
+                krw_at_buy.append(krw)
+                amount = available / price * fee
+                krw -= available
+                holding = True
+                buys.append(i)
+
+        return (
+            np.asarray(buys, dtype=np.int64),
+            np.asarray(sells, dtype=np.int64),
+            np.asarray(krw_at_buy, dtype=np.float64),
+        )
+
+
+def _position_transitions(decisions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    결정 배열을 포지션 상태 전이 위치로 변환
+
+    보유 중 BUY, 미보유 중 SELL은 체결되지 않으므로(잔고 부족 / 보유 수량 없음)
+    마지막 BUY/SELL 결정을 이어 붙인 상태가 바뀌는 지점만 거래가 됩니다.
+
+    @return: (매수 위치 배열, 매도 위치 배열), 매수와 매도가 번갈아 나타남
+    """
+    size = len(decisions)
+    last_signal = _last_event_index(np.flatnonzero(decisions), size)
+    state = np.where(
+        last_signal >= 0, decisions[np.maximum(last_signal, 0)] == BUY, False
+    ).astype(np.int8)
+    change = np.diff(state, prepend=np.int8(0))
+    return np.flatnonzero(change == 1), np.flatnonzero(change == -1)
+
+
+def _last_event_index(events: np.ndarray, size: int) -> np.ndarray:
+    """
+    각 위치에서 가장 최근 이벤트의 위치 (이벤트가 없었으면 -1)
+
+    @param events: 오름차순 이벤트 위치 배열
+    @param size: 전체 길이
+    """
+    marks = np.full(size, -1, dtype=np.int64)
+    marks[events] = events
+    return np.maximum.accumulate(marks)
+
+
+def _sharpe_ratio(equity: pd.Series) -> float:
+    """
+    기간 수익률로 계산한 연환산 샤프 지수 (무위험 수익률 0)
+
+    연환산 계수는 캔들 간격의 중앙값으로 추정합니다.
+    """
+    if len(equity) < 3:
+        return 0.0
+
+    returns = np.diff(equity.to_numpy()) / equity.to_numpy()[:-1]
+    std = returns.std(ddof=1)
+    if std == 0 or not np.isfinite(std):
+        return 0.0
+
+    step_seconds = np.median(
+        np.diff(equity.index.to_numpy()).astype("timedelta64[s]").astype(np.float64)
+    )
+    if step_seconds <= 0:
+        return 0.0
+    periods_per_year = SECONDS_PER_YEAR / step_seconds
+    return float(returns.mean() / std * np.sqrt(periods_per_year))
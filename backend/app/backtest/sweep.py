@@ -0,0 +1,228 @@
+"""
+백테스트 파라미터 스윕
+
+같은 캔들 데이터로 여러 파라미터 조합의 백테스트를 프로세스 풀에서 병렬 실행합니다.
+캔들 배열은 공유 메모리(multiprocessing.shared_memory)에 한 번만 올리고,
+워커 프로세스는 블록 이름과 위치 정보만 받아 복사 없이 NumPy 배열로 참조합니다.
+(작업마다 캔들 데이터를 pickle로 전달하지 않음)
+"""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from logging import Logger
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from app.backtest.decision_source import (
+    DecisionSource,
+    MovingAverageCrossStrategy,
+    RecordedDecisionSource,
+)
+from app.backtest.engine import BacktestEngine
+
+logger = Logger(__name__)
+
+# BacktestEngine 생성자로 전달되는 파라미터 (나머지는 결정 소스 팩토리로 전달)
+ENGINE_PARAMS = ("fee_multiplier", "min_order_amount", "initial_krw")
+
+# 랭킹 기준별 정렬 방향 (True: 오름차순)
+RANK_ASCENDING = {"max_drawdown": True}
+
+SourceFactory = Callable[[Dict[str, Any], Any], DecisionSource]
+
+
+def moving_average_source(params: Dict[str, Any], context: Any) -> DecisionSource:
+    """short_window/long_window 파라미터로 이동평균 교차 전략 생성"""
+    return MovingAverageCrossStrategy(
+        short_window=params["short_window"], long_window=params["long_window"]
+    )
+
+
+def recorded_source(params: Dict[str, Any], context: Any) -> DecisionSource:
+    """
+    min_confidence 파라미터로 기록된 AI 결정 소스 생성
+
+    @param context: RecordedDecisionSource의 decisions DataFrame
+    """
+    return RecordedDecisionSource(
+        context, min_confidence=params.get("min_confidence", 0.0)
+    )
+
+
+@dataclass(frozen=True)
+class SharedCandlesLayout:
+    """공유 메모리에 올린 캔들 배열의 위치 정보 (워커로 전달되는 값)"""
+
+    block_name: str
+    total: int  # 전체 캔들 수
+    coins: Tuple[Tuple[str, int, int], ...]  # (티커, 시작 위치, 캔들 수)
+
+
+class SharedCandles:
+    """
+    캔들 종가/시각 배열을 담는 공유 메모리 블록
+
+    하나의 블록에 모든 코인의 종가(float64)를 이어 붙이고, 뒤이어 시각(int64, ns)을 이어 붙입니다.
+    생성한 프로세스에서 close()로 블록을 해제해야 합니다.
+    """
+
+    def __init__(self, candles: Dict[str, DataFrame]):
+        total = sum(len(df) for df in candles.values())
+        self._block = shared_memory.SharedMemory(create=True, size=max(total, 1) * 16)
+
+        close, times = _block_views(self._block, total)
+        coins = []
+        offset = 0
+        for coin_name, df in candles.items():
+            size = len(df)
+            close[offset : offset + size] = df["close"].to_numpy(dtype=np.float64)
+            times[offset : offset + size] = df.index.to_numpy(
+                dtype="datetime64[ns]"
+            ).view(np.int64)
+            coins.append((coin_name, offset, size))
+            offset += size
+
+        self.layout = SharedCandlesLayout(
+            block_name=self._block.name, total=total, coins=tuple(coins)
+        )
+
+    def close(self) -> None:
+        """공유 메모리 블록 해제"""
+        self._block.close()
+        self._block.unlink()
+
+
+def _block_views(
+    block: shared_memory.SharedMemory, total: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """공유 메모리 블록 위의 (종가, 시각) 배열 뷰"""
+    close = np.ndarray((total,), dtype=np.float64, buffer=block.buf, offset=0)
+    times = np.ndarray((total,), dtype=np.int64, buffer=block.buf, offset=total * 8)
+    return close, times
+
+
+def _attach_block(name: str) -> shared_memory.SharedMemory:
+    """기존 공유 메모리 블록에 연결 (블록 해제는 생성한 프로세스가 담당)"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python 3.13 미만: 풀 워커는 부모의 resource tracker를 공유하므로 그대로 연결
+        return shared_memory.SharedMemory(name=name)
+
+
+# 워커 프로세스 상태 (_init_worker에서 한 번 설정)
+_worker_block: Optional[shared_memory.SharedMemory] = None
+_worker_candles: Dict[str, DataFrame] = {}
+_worker_source_factory: Optional[SourceFactory] = None
+_worker_context: Any = None
+
+
+def _init_worker(
+    layout: SharedCandlesLayout, source_factory: SourceFactory, context: Any
+) -> None:
+    """워커 프로세스 초기화: 공유 메모리에 연결하고 복사 없이 캔들 DataFrame 구성"""
+    global _worker_block, _worker_candles, _worker_source_factory, _worker_context
+
+    _worker_block = _attach_block(layout.block_name)
+    close, times = _block_views(_worker_block, layout.total)
+
+    _worker_candles = {
+        coin_name: DataFrame(
+            {"close": close[offset : offset + size]},
+            index=pd.DatetimeIndex(
+                times[offset : offset + size].view("datetime64[ns]")
+            ),
+            copy=False,
+        )
+        for coin_name, offset, size in layout.coins
+    }
+    _worker_source_factory = source_factory
+    _worker_context = context
+
+
+def _run_one(params: Dict[str, Any]) -> Dict[str, Any]:
+    """워커에서 파라미터 조합 하나의 백테스트 실행"""
+    engine_kwargs = {k: v for k, v in params.items() if k in ENGINE_PARAMS}
+    source_params = {k: v for k, v in params.items() if k not in ENGINE_PARAMS}
+
+    try:
+        source = _worker_source_factory(source_params, _worker_context)
+        result = BacktestEngine(**engine_kwargs).run(_worker_candles, source)
+    except Exception as e:
+        return {**params, "error": f"{type(e).__name__}: {str(e)}"}
+
+    return {**params, **result.summary(), "error": None}
+
+
+def expand_grid(grid: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """
+    파라미터 그리드를 모든 조합의 목록으로 전개
+
+    @param grid: 파라미터 이름별 후보 값 목록
+    @return: 파라미터 조합 목록
+    """
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def run_sweep(
+    candles: Dict[str, DataFrame],
+    grid: Dict[str, Sequence[Any]],
+    source_factory: SourceFactory = moving_average_source,
+    context: Any = None,
+    workers: Optional[int] = None,
+    rank_by: str = "sharpe",
+    output_path: Optional[str] = None,
+) -> DataFrame:
+    """
+    파라미터 그리드 전체에 대해 백테스트를 병렬 실행하고 순위를 매김
+
+    @param candles: 티커별 OHLCV 데이터 (close 컬럼과 DatetimeIndex만 사용)
+    @param grid: 파라미터 이름별 후보 값 목록
+                 (fee_multiplier/min_order_amount/initial_krw는 엔진, 나머지는 source_factory로 전달)
+    @param source_factory: (결정 소스 파라미터, context) → DecisionSource, 모듈 최상위 함수여야 함
+    @param context: 워커마다 한 번 전달되는 결정 소스 공통 데이터 (예: 기록된 AI 결정)
+    @param workers: 프로세스 수 (기본: CPU 수)
+    @param rank_by: 순위 기준 지표 (sharpe, total_return, max_drawdown 등)
+    @param output_path: 지정 시 결과를 CSV로 저장
+    @return: 순위 순으로 정렬된 결과 (rank 컬럼 포함)
+    """
+    combinations = expand_grid(grid)
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(combinations) // (workers * 4))
+
+    shared = SharedCandles(candles)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(shared.layout, source_factory, context),
+        ) as executor:
+            rows = list(executor.map(_run_one, combinations, chunksize=chunksize))
+    finally:
+        shared.close()
+
+    results = DataFrame(rows)
+    failed = results["error"].notna().sum()
+    if failed:
+        logger.warning(f"파라미터 조합 {failed}건의 백테스트가 실패했습니다.")
+
+    if rank_by in results:
+        results = results.sort_values(
+            rank_by,
+            ascending=RANK_ASCENDING.get(rank_by, False),
+            na_position="last",
+            kind="stable",
+            ignore_index=True,
+        )
+    results.insert(0, "rank", range(1, len(results) + 1))
+
+    if output_path:
+        results.to_csv(output_path, index=False)
+    return results
@@ -2,12 +2,13 @@
 Balance Controller
 """
 
+from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.ballance.dto.balance_response import BalancesResponse
+from app.ballance.dto.balance_response import BalanceSeriesResponse, BalancesResponse
 from app.ballance.service.balance_service import BalanceService
 from app.common.model.base import get_session
 
@@ -31,6 +32,10 @@ async def get_balance_history(
         le=100,
         description="페이지당 조회할 항목 수 (1-100, 기본값: 20)",
     ),
+    since: Optional[datetime] = Query(
+        None,
+        description="이 시각 이후의 기록만 조회 (예: 2026-10-01T00:00:00, 지정 시 해당 기간의 파티션만 읽음)",
+    ),
     session: AsyncSession = Depends(get_session),
 ) -> BalancesResponse:
     """
@@ -42,6 +47,7 @@ async def get_balance_history(
     1. 첫 페이지: `GET /balance/history?limit=20`
     2. 다음 페이지: 응답의 `next_cursor` 값을 사용하여 `GET /balance/history?cursor={next_cursor}&limit=20`
     3. `has_next`가 `false`이면 마지막 페이지
+    4. 최근 기록만 필요하면 `since`를 지정 (오래된 월 파티션을 읽지 않음)
 
     **각 잔고 항목 정보:**
     - KRW 잔고
@@ -50,4 +56,40 @@ async def get_balance_history(
     - 기록 시각
     """
     balance_service = BalanceService(session)
-    return await balance_service.get_balances(cursor=cursor, limit=limit)
+    return await balance_service.get_balances(cursor=cursor, limit=limit, since=since)
+
+
+@balance_router.get(
+    "/series",
+    summary="잔고 시계열 조회 (차트용)",
+    description="최근 기간의 잔고를 일정 간격으로 반환합니다. 잔고 기록 사이의 시각은 보간합니다.",
+    response_model=BalanceSeriesResponse,
+)
+async def get_balance_series(
+    hours: int = Query(
+        24,
+        ge=1,
+        le=24 * 90,
+        description="조회 기간 (최근 N시간, 1-2160, 기본값: 24)",
+    ),
+    step_seconds: int = Query(
+        600,
+        ge=60,
+        le=86400,
+        description="항목 간격 (초, 60-86400, 기본값: 600)",
+    ),
+    session: AsyncSession = Depends(get_session),
+) -> BalanceSeriesResponse:
+    """
+    잔고 시계열 조회
+
+    잔고는 변동이 있거나 heartbeat 간격이 지났을 때만 기록되므로, 차트에는 이 API를 사용합니다.
+
+    **각 항목 정보:**
+    - 시각, KRW 잔고, 코인 보유량 (KRW 가치), 총 자산
+    - `interpolated`: 앞뒤 잔고 기록 사이를 보간한 값 (마지막 기록 이후는 마지막 값 유지)
+
+    항목 수가 1000개를 넘으면 `step_seconds`를 넓혀 반환합니다. (응답의 `step_seconds` 참고)
+    """
+    balance_service = BalanceService(session)
+    return await balance_service.get_series(hours=hours, step_seconds=step_seconds)
@@ -41,3 +41,23 @@ class BalancesResponse(BaseModel):
         description="다음 페이지를 조회하기 위한 커서 (다음 페이지가 없으면 null)"
     )
     has_next: bool = Field(description="다음 페이지 존재 여부")
+
+
+class BalanceSeriesPointResponse(BaseModel):
+    """잔고 시계열 항목 응답 DTO"""
+
+    timestamp: str = Field(description="시각 (YYYY-MM-DD HH:MM:SS)")
+    amount: float = Field(description="KRW 잔고")
+    coin_amount: float = Field(description="코인 보유량 (KRW 가치)")
+    total_amount: float = Field(description="총 자산 (KRW + 코인)")
+    interpolated: bool = Field(
+        description="기록 사이를 보간한 값인지 여부 (false면 해당 시각의 잔고 기록)"
+    )
+
+
+class BalanceSeriesResponse(BaseModel):
+    """잔고 시계열 응답 DTO (일정 간격, 기록 사이는 보간)"""
+
+    step_seconds: int = Field(description="항목 간격 (초)")
+    snapshot_count: int = Field(description="보간에 사용한 잔고 기록 수")
+    points: list[BalanceSeriesPointResponse] = Field(description="시간순 잔고 목록")
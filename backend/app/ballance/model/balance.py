@@ -4,23 +4,34 @@ Balance 엔티티
 
 from datetime import datetime
 from decimal import Decimal
+from typing import Optional
 
-from sqlalchemy import BigInteger, DateTime, Numeric
+from sqlalchemy import BigInteger, DateTime, Index, Numeric
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.common.model.base import Base
+from app.common.model.base import AutoIncrementId, Base
 
 
 class Balance(Base):
-    """잔고 내역"""
+    """
+    잔고 내역
+
+    created_at 기준 월별 RANGE 파티션 테이블입니다. (Trade와 같이 기본 키는 (id, created_at), 외래 키 없음)
+    """
 
     __tablename__ = "balances"
+    __table_args__ = (Index("idx_balances_run_id", "run_id"),)
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        AutoIncrementId, primary_key=True, autoincrement=True
+    )
     amount: Mapped[Decimal] = mapped_column(Numeric(20, 8), nullable=False)
     coin_amount: Mapped[Decimal] = mapped_column(
         Numeric(20, 8), nullable=False, default=0
     )
+    run_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, primary_key=True, default=datetime.utcnow, nullable=False
     )
+
+    __mapper_args__ = {"primary_key": [id]}
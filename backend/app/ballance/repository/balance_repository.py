@@ -2,6 +2,7 @@
 Balance Repository
 """
 
+from datetime import datetime
 from typing import List, Optional
 
 from sqlalchemy import select
@@ -12,26 +13,49 @@ from app.common.repository.base_repository import BaseRepository
 
 
 class BalanceRepository(BaseRepository[Balance]):
-    """Balance CRUD 연산"""
+    """
+    Balance CRUD 연산
+
+    run_id가 설정되어 있으면 생성하는 잔고 기록을 해당 실행(trade_runs)에 연결합니다.
+    """
 
     def __init__(self, session: AsyncSession):
         super().__init__(Balance, session)
+        self.run_id: Optional[int] = None
+
+    async def create(self, entity: Balance) -> Balance:
+        """엔티티 생성 (실행 ID 연결)"""
+        if entity.run_id is None:
+            entity.run_id = self.run_id
+        return await super().create(entity)
+
+    async def get_latest(self, since: Optional[datetime] = None) -> Optional[Balance]:
+        """
+        최신 잔고 조회
 
-    async def get_latest(self) -> Optional[Balance]:
-        """최신 잔고 조회"""
-        result = await self.session.execute(
-            select(Balance).order_by(Balance.created_at.desc()).limit(1)
+        @param since: 지정 시 이 시각 이후의 기록 중에서만 조회 (해당 기간의 파티션만 읽음)
+        @return: 최신 잔고 (없으면 None)
+        """
+        query = select(Balance)
+        if since is not None:
+            query = query.where(Balance.created_at >= since)
+        result = await self.execute_read(
+            query.order_by(Balance.created_at.desc()).limit(1)
         )
         return result.scalar_one_or_none()
 
     async def get_all_paginated(
-        self, cursor: Optional[int] = None, limit: int = 20
+        self,
+        cursor: Optional[int] = None,
+        limit: int = 20,
+        since: Optional[datetime] = None,
     ) -> List[Balance]:
         """
         잔고 내역을 커서 기반 페이지네이션으로 조회
 
         @param cursor: 이전 페이지의 마지막 잔고 ID (None이면 첫 페이지)
         @param limit: 조회할 항목 수
+        @param since: 지정 시 이 시각 이후의 기록만 조회 (해당 기간의 파티션만 읽음)
         @return: 잔고 내역 목록
         """
         query = select(Balance).order_by(Balance.id.desc())
@@ -39,6 +63,32 @@ class BalanceRepository(BaseRepository[Balance]):
         if cursor is not None:
             query = query.where(Balance.id < cursor)
 
+        if since is not None:
+            query = query.where(Balance.created_at >= since)
+
         query = query.limit(limit)
-        result = await self.session.execute(query)
+        result = await self.execute_read(query)
         return list(result.scalars().all())
+
+    async def get_range(self, start: datetime, end: datetime) -> List[Balance]:
+        """
+        기간 내 잔고 기록과 기간 시작 직전의 기록을 시간순으로 조회
+
+        직전 기록은 기간 앞부분의 보간 기준점으로 사용합니다.
+
+        @param start: 조회 시작 시각
+        @param end: 조회 종료 시각
+        @return: 잔고 기록 목록 (created_at 오름차순)
+        """
+        anchor = await self.execute_read(
+            select(Balance)
+            .where(Balance.created_at < start)
+            .order_by(Balance.created_at.desc())
+            .limit(1)
+        )
+        result = await self.execute_read(
+            select(Balance)
+            .where(Balance.created_at >= start, Balance.created_at <= end)
+            .order_by(Balance.created_at.asc())
+        )
+        return list(anchor.scalars().all()) + list(result.scalars().all())
@@ -2,13 +2,24 @@
 Balance Service
 """
 
-from typing import Optional
+import math
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.ballance.dto.balance_response import BalanceItemResponse, BalancesResponse
+from app.ballance.dto.balance_response import (
+    BalanceItemResponse,
+    BalanceSeriesPointResponse,
+    BalanceSeriesResponse,
+    BalancesResponse,
+)
+from app.ballance.model.balance import Balance
 from app.ballance.repository.balance_repository import BalanceRepository
 
+# 시계열 응답의 최대 항목 수 (넘으면 간격을 넓힘)
+MAX_SERIES_POINTS = 1000
+
 
 class BalanceService:
     """잔고 비즈니스 로직"""
@@ -18,18 +29,22 @@ class BalanceService:
         self.balance_repository = BalanceRepository(session)
 
     async def get_balances(
-        self, cursor: Optional[int] = None, limit: int = 20
+        self,
+        cursor: Optional[int] = None,
+        limit: int = 20,
+        since: Optional[datetime] = None,
     ) -> BalancesResponse:
         """
         잔고 내역을 커서 기반 페이지네이션으로 조회
 
         @param cursor: 이전 페이지의 마지막 잔고 ID (None이면 첫 페이지)
         @param limit: 페이지당 조회할 항목 수 (기본: 20)
+        @param since: 지정 시 이 시각 이후의 기록만 조회
         @return: 잔고 내역 목록 응답 (다음 페이지 정보 포함)
         """
         # limit + 1개를 조회하여 다음 페이지 존재 여부 확인
         balances = await self.balance_repository.get_all_paginated(
-            cursor=cursor, limit=limit + 1
+            cursor=cursor, limit=limit + 1, since=since
         )
 
         # 다음 페이지 존재 여부 판단
@@ -47,3 +62,83 @@ class BalanceService:
         return BalancesResponse(
             items=items, next_cursor=next_cursor, has_next=has_next
         )
+
+    async def get_series(
+        self,
+        hours: int = 24,
+        step_seconds: int = 600,
+        now: Optional[datetime] = None,
+    ) -> BalanceSeriesResponse:
+        """
+        최근 기간의 잔고를 일정 간격의 시계열로 조회
+
+        잔고는 변동이 있거나 heartbeat 간격이 지났을 때만 기록되므로(BALANCE_SNAPSHOT_MODE=change),
+        기록 사이의 시각은 앞뒤 기록을 선형 보간하고 마지막 기록 이후는 마지막 값을 유지합니다.
+
+        @param hours: 조회 기간 (현재 시각 기준 최근 N시간)
+        @param step_seconds: 항목 간격 (초, 항목 수가 MAX_SERIES_POINTS를 넘으면 넓힘)
+        @param now: 기준 시각 (기본: utcnow)
+        @return: 잔고 시계열 응답
+        """
+        end = now or datetime.utcnow()
+        start = end - timedelta(hours=hours)
+        step_seconds = max(step_seconds, math.ceil(hours * 3600 / MAX_SERIES_POINTS))
+
+        snapshots = await self.balance_repository.get_range(start, end)
+
+        return BalanceSeriesResponse(
+            step_seconds=step_seconds,
+            snapshot_count=len(snapshots),
+            points=interpolate_balances(snapshots, start, end, step_seconds),
+        )
+
+
+def interpolate_balances(
+    snapshots: Sequence[Balance],
+    start: datetime,
+    end: datetime,
+    step_seconds: int,
+) -> List[BalanceSeriesPointResponse]:
+    """
+    잔고 기록을 일정 간격의 시계열로 변환
+
+    - 두 기록 사이: 선형 보간
+    - 마지막 기록 이후: 마지막 값 유지
+    - 첫 기록 이전: 항목 없음
+
+    @param snapshots: 잔고 기록 목록 (created_at 오름차순)
+    @param start: 시작 시각
+    @param end: 종료 시각
+    @param step_seconds: 항목 간격 (초)
+    @return: 시계열 항목 목록
+    """
+    points: List[BalanceSeriesPointResponse] = []
+    step = timedelta(seconds=step_seconds)
+    index = 0
+    at = start
+    while at <= end:
+        # snapshots[index - 1].created_at <= at < snapshots[index].created_at
+        while index < len(snapshots) and snapshots[index].created_at <= at:
+            index += 1
+        if index > 0:
+            before = snapshots[index - 1]
+            after = snapshots[index] if index < len(snapshots) else None
+            amount = float(before.amount)
+            coin_amount = float(before.coin_amount)
+            if after is not None and before.created_at != at:
+                ratio = (at - before.created_at) / (
+                    after.created_at - before.created_at
+                )
+                amount += (float(after.amount) - amount) * ratio
+                coin_amount += (float(after.coin_amount) - coin_amount) * ratio
+            points.append(
+                BalanceSeriesPointResponse(
+                    timestamp=at.strftime("%Y-%m-%d %H:%M:%S"),
+                    amount=amount,
+                    coin_amount=coin_amount,
+                    total_amount=amount + coin_amount,
+                    interpolated=before.created_at != at,
+                )
+            )
+        at += step
+    return points
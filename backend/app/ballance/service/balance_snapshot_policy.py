@@ -0,0 +1,78 @@
+"""
+잔고 스냅샷 기록 정책
+
+change 모드에서는 직전 기록 대비 KRW 또는 코인 평가액이 임계값 이상 움직였거나,
+직전 기록 후 heartbeat 간격이 지난 경우에만 잔고를 기록합니다.
+(모든 코인이 HOLD인 실행이 이어지는 동안에는 거의 같은 값의 행이 쌓이지 않음)
+기록되지 않은 구간은 /balance/series에서 앞뒤 기록 사이를 보간하여 보여줍니다.
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.ballance.model.balance import Balance
+from app.configs.config import Settings
+
+SNAPSHOT_MODES = ("every", "change")
+
+
+class BalanceSnapshotPolicy:
+    """
+    잔고 스냅샷 기록 여부 판단
+
+    @param mode: every(매 실행 기록) 또는 change(변동/heartbeat 시에만 기록)
+    @param threshold_pct: 직전 총 자산 대비 KRW/코인 평가액 변동률 임계값 (%)
+    @param heartbeat_seconds: 변동이 없어도 기록하는 간격 (초)
+    """
+
+    def __init__(
+        self,
+        mode: str = "change",
+        threshold_pct: float = 0.5,
+        heartbeat_seconds: int = 3600,
+    ):
+        if mode not in SNAPSHOT_MODES:
+            raise ValueError(f"알 수 없는 BALANCE_SNAPSHOT_MODE: {mode}")
+        self.mode = mode
+        self.threshold_pct = threshold_pct
+        self.heartbeat = timedelta(seconds=heartbeat_seconds)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "BalanceSnapshotPolicy":
+        """설정값으로 정책 생성"""
+        return cls(
+            mode=settings.BALANCE_SNAPSHOT_MODE,
+            threshold_pct=settings.BALANCE_SNAPSHOT_THRESHOLD_PCT,
+            heartbeat_seconds=settings.BALANCE_SNAPSHOT_HEARTBEAT_SECONDS,
+        )
+
+    def should_record(
+        self,
+        latest: Optional[Balance],
+        amount: float,
+        coin_amount: float,
+        now: Optional[datetime] = None,
+    ) -> bool:
+        """
+        새 잔고를 기록해야 하는지 판단
+
+        @param latest: 직전 잔고 기록 (없으면 None)
+        @param amount: 현재 KRW 잔고
+        @param coin_amount: 현재 코인 평가액 (KRW)
+        @param now: 현재 시각 (기본: utcnow)
+        @return: 기록 여부
+        """
+        if self.mode == "every" or latest is None:
+            return True
+
+        now = now or datetime.utcnow()
+        if now - latest.created_at >= self.heartbeat:
+            return True
+
+        last_amount = float(latest.amount)
+        last_coin_amount = float(latest.coin_amount)
+        threshold = (last_amount + last_coin_amount) * self.threshold_pct / 100
+        return (
+            abs(amount - last_amount) > threshold
+            or abs(coin_amount - last_coin_amount) > threshold
+        )
@@ -6,6 +6,8 @@ from fastapi import APIRouter, Depends, status
 
 from app.coin.dto.coin_dto import CoinListResponse, CoinResponse, CreateCoinRequest
 from app.coin.service.coin_service import CoinService
+from app.upbit.client.upbit_client import UpbitClient
+from app.upbit.di.upbit_di import get_upbit_client
 
 coin_router = APIRouter(prefix="/my/coins", tags=["My Coin"])
 
@@ -35,7 +37,7 @@ async def create_coin(
     service: CoinService = Depends(),
 ) -> None:
     """거래 코인 추가"""
-    await service.create_coin(request.name)
+    await service.create_coin(request.name, request.candle_interval)
 
 
 @coin_router.delete(
@@ -47,6 +49,7 @@ async def create_coin(
 async def delete_coin(
     coin_id: int,
     service: CoinService = Depends(),
+    upbit_client: UpbitClient = Depends(get_upbit_client),
 ) -> None:
-    """코인 soft delete"""
-    await service.delete_coin(coin_id)
+    """코인 soft delete (잔고가 남아 있으면 거부)"""
+    await service.delete_coin(coin_id, upbit_client)
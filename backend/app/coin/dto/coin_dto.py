@@ -4,12 +4,15 @@ Coin DTO
 
 from pydantic import BaseModel, Field
 
+from app.coin.model.enums import CandleInterval
+
 
 class CoinResponse(BaseModel):
     """코인 응답 DTO"""
 
     id: int = Field(description="코인 ID")
     name: str = Field(description="코인 이름")
+    candle_interval: CandleInterval = Field(description="분석 캔들 간격")
 
     class Config:
         from_attributes = True
@@ -25,3 +28,7 @@ class CreateCoinRequest(BaseModel):
     """코인 생성 요청 DTO"""
 
     name: str = Field(description="코인 이름", min_length=1, max_length=100)
+    candle_interval: CandleInterval = Field(
+        default=CandleInterval.DAY,
+        description="분석 캔들 간격 (캔들 마감 트리거 모드에서 분석 시점 결정)",
+    )
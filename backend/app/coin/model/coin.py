@@ -4,10 +4,11 @@ Coin 엔티티
 
 from datetime import datetime
 
-from sqlalchemy import BigInteger, Boolean, DateTime, String
+from sqlalchemy import Boolean, DateTime, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.common.model.base import Base
+from app.coin.model.enums import CandleInterval
+from app.common.model.base import AutoIncrementId, Base
 
 
 class Coin(Base):
@@ -15,12 +16,21 @@ class Coin(Base):
 
     __tablename__ = "coins"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(
+        AutoIncrementId, primary_key=True, autoincrement=True
+    )
     name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, nullable=False
     )
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    candle_interval: Mapped[str] = mapped_column(
+        String(20), default=CandleInterval.DAY.value, nullable=False
+    )
 
     # 관계 설정
-    trades = relationship("Trade", back_populates="coin")
+    trades = relationship(
+        "Trade",
+        back_populates="coin",
+        primaryjoin="Coin.id == foreign(Trade.coin_id)",
+    )
@@ -0,0 +1,21 @@
+"""
+코인 관련 Enum 타입 정의
+"""
+
+from enum import Enum
+
+
+class CandleInterval(str, Enum):
+    """분석에 사용할 캔들 간격 (pyupbit interval 값과 동일)"""
+
+    MINUTE1 = "minute1"
+    MINUTE3 = "minute3"
+    MINUTE5 = "minute5"
+    MINUTE10 = "minute10"
+    MINUTE15 = "minute15"
+    MINUTE30 = "minute30"
+    MINUTE60 = "minute60"
+    MINUTE240 = "minute240"
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
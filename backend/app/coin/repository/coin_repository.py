@@ -24,11 +24,20 @@ class CoinRepository(BaseRepository[Coin]):
 
     async def get_all_active(self) -> list[Coin]:
         """삭제되지 않은 모든 코인 조회"""
-        result = await self.session.execute(
+        result = await self.execute_read(
             select(Coin).where(Coin.is_deleted == False)  # noqa: E712
         )
         return list(result.scalars().all())
 
+    async def get_active_candle_intervals(self) -> list[str]:
+        """삭제되지 않은 코인들이 사용하는 캔들 간격 목록 조회"""
+        result = await self.session.execute(
+            select(Coin.candle_interval)
+            .where(Coin.is_deleted == False)  # noqa: E712
+            .distinct()
+        )
+        return list(result.scalars().all())
+
     async def get_by_name_include_deleted(self, name: str) -> Optional[Coin]:
         """이름으로 코인 조회 (soft delete 포함)"""
         result = await self.session.execute(select(Coin).where(Coin.name == name))
@@ -2,34 +2,46 @@
 Coin Service
 """
 
+from typing import Optional
+
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.coin.model.coin import Coin
+from app.coin.model.enums import CandleInterval
 from app.coin.repository.coin_repository import CoinRepository
 from app.common.model.base import get_session
-from app.upbit.client.upbit_client import (
-    UpbitClient,  # noqa: F401 - relationship 등록용
-)
+from app.upbit.client.upbit_client import UpbitClient
 
 
 class CoinService:
-    """코인 비즈니스 로직"""
+    """
+    코인 비즈니스 로직
+
+    조회/추가는 DB 세션만 사용하고, Upbit 클라이언트는 잔고를 확인하는 삭제에서만 받습니다.
+    (코인 목록 조회가 pyupbit를 import하거나 Upbit 클라이언트를 만들지 않도록)
+    """
 
     def __init__(self, session: AsyncSession = Depends(get_session)):
         self.repository = CoinRepository(session)
-        self.upbit_client = UpbitClient()
 
     async def get_all_active(self) -> list[Coin]:
         """삭제되지 않은 모든 코인 조회"""
         return await self.repository.get_all_active()
 
-    async def create_coin(self, name: str) -> None:
+    async def get_by_id(self, coin_id: int) -> Optional[Coin]:
+        """ID로 코인 조회 (soft delete 포함)"""
+        return await self.repository.get_by_id(coin_id)
+
+    async def create_coin(
+        self, name: str, candle_interval: CandleInterval = CandleInterval.DAY
+    ) -> None:
         """
         코인 생성 또는 복구
 
         Args:
             name: 코인 이름
+            candle_interval: 분석 캔들 간격
 
         Raises:
             HTTPException: 이미 존재하는 코인인 경우
@@ -44,30 +56,25 @@ class CoinService:
                 )
             # soft delete된 코인 복구
             existing_coin.is_deleted = False
+            existing_coin.candle_interval = candle_interval.value
             await self.repository.update(existing_coin)
         else:
             # 새 코인 생성
-            new_coin = Coin(name=name)
+            new_coin = Coin(name=name, candle_interval=candle_interval.value)
             await self.repository.create(new_coin)
 
-    async def delete_coin(self, coin_id: int) -> None:
+    async def delete_coin(self, coin_id: int, upbit_client: UpbitClient) -> None:
         """
         코인 soft delete
 
         Args:
             coin_id: 코인 ID
+            upbit_client: 잔고 확인용 Upbit 클라이언트 (get_upbit_client)
 
         Raises:
             HTTPException: 코인을 찾을 수 없는 경우
         """
         coin = await self.repository.get_by_id(coin_id)
-        amount = self.upbit_client.get_krw_balance(coin.name) or 0.0
-
-        if amount > 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="잔고가 남아있는 코인은 삭제할 수 없습니다.",
-            )
 
         if not coin or coin.is_deleted:
             raise HTTPException(
@@ -75,5 +82,13 @@ class CoinService:
                 detail="코인을 찾을 수 없습니다.",
             )
 
+        amount = upbit_client.get_coin_balance(coin.name) or 0.0
+
+        if amount > 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="잔고가 남아있는 코인은 삭제할 수 없습니다.",
+            )
+
         coin.is_deleted = True
         await self.repository.update(coin)
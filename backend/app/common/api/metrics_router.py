@@ -0,0 +1,18 @@
+"""
+Prometheus 메트릭 라우터
+
+API 버전과 무관하게 `/metrics` 경로로 노출합니다.
+"""
+
+from fastapi import APIRouter, Response
+
+from app.common.metrics import render_metrics
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+
+@metrics_router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    """Prometheus 텍스트 형식 메트릭 (multiprocess 모드에서는 모든 워커 합산)"""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
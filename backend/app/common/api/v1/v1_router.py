@@ -8,6 +8,7 @@ from fastapi import APIRouter
 
 from app.ballance.controller.balance_controller import balance_router
 from app.coin.controller.my_coin_controller import coin_router
+from app.position.controller.position_controller import position_router
 from app.trade.controller.trade_controller import trade_router
 from app.upbit.controller.upbit_controller import upbit_router
 
@@ -19,3 +20,4 @@ v1_router.include_router(coin_router)
 v1_router.include_router(upbit_router)
 v1_router.include_router(trade_router)
 v1_router.include_router(balance_router)
+v1_router.include_router(position_router)
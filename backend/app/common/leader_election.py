@@ -0,0 +1,93 @@
+"""
+리더 선출 유틸리티
+
+여러 워커(프로세스) 중 하나만 스케줄러를 실행하도록 리더를 선출합니다.
+분산 락(named_lock)을 보유한 프로세스가 리더가 되며,
+리더 프로세스가 죽으면 락이 해제(GET_LOCK) 또는 만료(lease)되어 다른 워커가 리더를 승계합니다.
+"""
+
+import asyncio
+import traceback
+from logging import Logger
+from typing import Awaitable, Callable, Optional
+
+from app.common.named_lock import named_lock
+
+logger = Logger(__name__)
+
+
+class LeaderElector:
+    """
+    Named Lock 기반 리더 선출기
+
+    @param lock_name: 리더 락 이름
+    @param on_elected: 리더로 선출되었을 때 호출되는 콜백
+    @param on_demoted: 리더십을 잃었을 때 호출되는 콜백
+    @param interval: 리더 선출 재시도 및 리더십 확인 주기 (초)
+    """
+
+    def __init__(
+        self,
+        lock_name: str,
+        on_elected: Callable[[], Awaitable[None]],
+        on_demoted: Callable[[], Awaitable[None]],
+        interval: float = 10.0,
+    ):
+        self.lock_name = lock_name
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.interval = interval
+        self.is_leader = False
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """백그라운드에서 리더 선출 루프 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """리더 선출 루프 종료 (리더였다면 락 해제)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._campaign()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"리더 선출 중 오류 발생: {str(e)}\n{traceback.format_exc()}"
+                )
+            await asyncio.sleep(self.interval)
+
+    async def _campaign(self) -> None:
+        """
+        리더 락 획득을 시도하고, 획득한 경우 리더십을 잃을 때까지 유지합니다.
+
+        팔로워는 시도할 때만 커넥션을 잠깐 사용하고 바로 반환합니다.
+        """
+        async with named_lock(self.lock_name) as lock:
+            if not lock:
+                return
+
+            logger.info(f"리더로 선출되었습니다: {self.lock_name}")
+            self.is_leader = True
+            try:
+                await self.on_elected()
+                # 리더십 유지 확인 (커넥션 단절 또는 lease 만료 시 락을 잃음)
+                while True:
+                    await asyncio.sleep(self.interval)
+                    if not await lock.is_held():
+                        logger.info(f"리더십을 잃었습니다: {self.lock_name}")
+                        break
+            finally:
+                self.is_leader = False
+                await self.on_demoted()
@@ -0,0 +1,244 @@
+"""
+Lease 기반 분산 락 유틸리티
+
+leases 테이블의 만료 시각(expires_at)과 heartbeat 갱신으로 락을 유지합니다.
+획득/갱신/해제는 모두 짧은 autocommit 문장이며, 그 사이에 커넥션을 점유하지 않습니다.
+프로세스가 멈추면 갱신이 끊겨 lease가 만료되고, 다른 워커가 새 fencing token으로 락을 가져갑니다.
+만료 시각의 기록/비교는 DB 시계(utc_now)를 사용하므로 호스트 간 시계 차이로 두 소유자가 겹치지 않습니다.
+"""
+
+import asyncio
+import os
+import socket
+import time
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from logging import Logger
+from typing import AsyncGenerator, Optional
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.common.model.base import get_engine, utc_now
+from app.common.model.lease import Lease
+
+logger = Logger(__name__)
+
+leases = Lease.__table__
+
+
+class LeaseLostError(Exception):
+    """lease를 잃은 상태에서 보호 대상 쓰기를 시도한 경우"""
+
+
+@dataclass(frozen=True)
+class FencingToken:
+    """쓰기 시 검증할 lease 이름과 fencing token"""
+
+    lock_name: str
+    token: int
+
+
+def _new_owner() -> str:
+    """lease 소유자 식별자 (호스트:PID:랜덤)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+@asynccontextmanager
+async def _autocommit() -> AsyncGenerator[AsyncConnection, None]:
+    """문장 단위로 커밋되는 커넥션을 잠깐 빌려 사용"""
+    async with get_engine().connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        yield conn
+
+
+async def try_acquire_lease(
+    lock_name: str, owner: str, ttl_seconds: float
+) -> Optional[int]:
+    """
+    lease 획득 시도
+
+    만료된 lease는 fencing token을 1 증가시키며 가져오고,
+    처음 사용하는 이름이면 token 1로 새로 생성합니다.
+
+    @param lock_name: 락 이름
+    @param owner: 소유자 식별자
+    @param ttl_seconds: lease 유효 시간 (초)
+    @return: 획득 성공 시 fencing token, 실패 시 None
+    """
+    async with _autocommit() as conn:
+        result = await conn.execute(
+            update(leases)
+            .where(leases.c.name == lock_name, leases.c.expires_at < utc_now())
+            .values(
+                owner=owner,
+                fencing_token=leases.c.fencing_token + 1,
+                expires_at=utc_now(ttl_seconds),
+            )
+        )
+        if result.rowcount == 0:
+            try:
+                await conn.execute(
+                    insert(leases).values(
+                        name=lock_name,
+                        owner=owner,
+                        fencing_token=1,
+                        expires_at=utc_now(ttl_seconds),
+                    )
+                )
+            except IntegrityError:
+                # 다른 워커가 유효한 lease를 보유 중
+                return None
+
+        result = await conn.execute(
+            select(leases.c.fencing_token).where(
+                leases.c.name == lock_name, leases.c.owner == owner
+            )
+        )
+        return result.scalar_one_or_none()
+
+
+async def renew_lease(
+    lock_name: str, owner: str, token: int, ttl_seconds: float
+) -> bool:
+    """
+    lease 만료 시각 연장 (heartbeat)
+
+    @return: 여전히 같은 token으로 보유 중이면 True
+    """
+    async with _autocommit() as conn:
+        result = await conn.execute(
+            update(leases)
+            .where(
+                leases.c.name == lock_name,
+                leases.c.owner == owner,
+                leases.c.fencing_token == token,
+            )
+            .values(expires_at=utc_now(ttl_seconds))
+        )
+        return result.rowcount == 1
+
+
+async def release_lease(lock_name: str, owner: str, token: int) -> None:
+    """lease 즉시 만료 처리 (token은 유지하여 단조 증가 보장)"""
+    async with _autocommit() as conn:
+        await conn.execute(
+            update(leases)
+            .where(
+                leases.c.name == lock_name,
+                leases.c.owner == owner,
+                leases.c.fencing_token == token,
+            )
+            .values(expires_at=utc_now())
+        )
+
+
+class LeaseHandle:
+    """
+    획득한 lease 핸들
+
+    백그라운드 heartbeat로 lease를 갱신하며, 갱신에 실패하거나
+    로컬 기준 만료 시각이 지나면 lease를 잃은 것으로 간주합니다.
+    """
+
+    def __init__(self, lock_name: str, owner: str, token: int, ttl_seconds: float):
+        self.lock_name = lock_name
+        self.owner = owner
+        self.fencing_token = token
+        self.ttl_seconds = ttl_seconds
+        self.lost = False
+        # 로컬 만료 시각은 경과 시간만 재면 되므로 monotonic 시계 사용 (DB 만료보다 먼저 지남)
+        self._valid_until = time.monotonic() + ttl_seconds
+        self._heartbeat_task: Optional[asyncio.Task] = None
+
+    def __bool__(self) -> bool:
+        return True
+
+    @property
+    def fencing(self) -> FencingToken:
+        return FencingToken(lock_name=self.lock_name, token=self.fencing_token)
+
+    async def is_held(self) -> bool:
+        """lease 보유 여부"""
+        return not self.lost and time.monotonic() < self._valid_until
+
+    def start_heartbeat(self) -> None:
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+
+    async def stop_heartbeat(self) -> None:
+        if self._heartbeat_task is None:
+            return
+        self._heartbeat_task.cancel()
+        try:
+            await self._heartbeat_task
+        except asyncio.CancelledError:
+            pass
+        self._heartbeat_task = None
+
+    async def _heartbeat(self) -> None:
+        interval = self.ttl_seconds / 3
+        while not self.lost:
+            await asyncio.sleep(interval)
+            renewed_at = time.monotonic()
+            try:
+                renewed = await renew_lease(
+                    self.lock_name, self.owner, self.fencing_token, self.ttl_seconds
+                )
+            except Exception as e:
+                # 일시적인 DB 오류는 다음 heartbeat에서 재시도 (로컬 만료 시각까지)
+                logger.error(f"lease 갱신 오류: {self.lock_name} ({str(e)})")
+                continue
+
+            if renewed:
+                self._valid_until = renewed_at + self.ttl_seconds
+            else:
+                self.lost = True
+                logger.error(
+                    f"lease를 잃었습니다: {self.lock_name} (token: {self.fencing_token})"
+                )
+
+
+@asynccontextmanager
+async def lease_lock(
+    lock_name: str,
+    ttl_seconds: float = 30,
+    timeout: float = 0,
+) -> AsyncGenerator[Optional[LeaseHandle], None]:
+    """
+    Lease 기반 분산 락 컨텍스트 매니저
+
+    @param lock_name: 락 이름 (고유 식별자)
+    @param ttl_seconds: lease 유효 시간 (초, heartbeat는 ttl/3 주기)
+    @param timeout: 락 획득 대기 시간 (초, 기본: 0 - 즉시 반환)
+    @return: 획득 성공 시 LeaseHandle, 실패 시 None
+    """
+    owner = _new_owner()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+
+    token = await try_acquire_lease(lock_name, owner, ttl_seconds)
+    while token is None and loop.time() < deadline:
+        await asyncio.sleep(min(0.5, ttl_seconds / 3))
+        token = await try_acquire_lease(lock_name, owner, ttl_seconds)
+
+    if token is None:
+        logger.info(f"lease 획득 실패: {lock_name} (다른 워커가 보유 중)")
+        yield None
+        return
+
+    handle = LeaseHandle(lock_name, owner, token, ttl_seconds)
+    handle.start_heartbeat()
+    logger.info(f"lease 획득 성공: {lock_name} (token: {token})")
+
+    try:
+        yield handle
+    finally:
+        await handle.stop_heartbeat()
+        try:
+            await release_lease(lock_name, owner, token)
+            logger.info(f"lease 해제: {lock_name}")
+        except Exception as e:
+            # 해제에 실패해도 ttl 이후 자동 만료됨
+            logger.error(f"lease 해제 실패: {lock_name} ({str(e)})")
@@ -0,0 +1,237 @@
+"""
+Prometheus 메트릭
+
+- API: 라우트별 요청 수(상태 코드별), 처리 시간 히스토그램, 처리 중 요청 수
+- 외부 호출: Upbit/OpenAI 메서드별 호출 시간 히스토그램 (성공/실패)
+- DB: SQL 실행 시간 히스토그램, 커넥션 풀 사용/오버플로우 게이지
+- 이벤트 루프 지연: 주기적으로 sleep한 뒤 실제로 깨어난 시각과의 차이
+
+gunicorn 멀티 워커 환경에서는 PROMETHEUS_MULTIPROC_DIR을 지정하면 prometheus_client의
+multiprocess 모드로 동작하여, 어느 워커가 /metrics 요청을 받더라도 모든 워커의 값을 합산해 응답합니다.
+(디렉토리 초기화와 종료된 워커 정리는 gunicorn.conf.py의 on_starting/child_exit 훅에서 처리)
+"""
+
+import asyncio
+import functools
+import os
+import time
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# 외부 API 호출은 수십 ms ~ 수십 초 (OpenAI)
+EXTERNAL_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "API 요청 수",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "API 요청 처리 시간",
+    ["method", "route"],
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "처리 중인 API 요청 수",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+EXTERNAL_CALL_DURATION = Histogram(
+    "external_call_duration_seconds",
+    "외부 API(Upbit/OpenAI) 호출 시간",
+    ["service", "method", "outcome"],
+    buckets=EXTERNAL_BUCKETS,
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "SQL 실행 시간",
+    ["operation"],
+    buckets=DB_BUCKETS,
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "사용 중인 DB 커넥션 수",
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "pool_size를 넘어 생성된 DB 커넥션 수",
+    multiprocess_mode="livesum",
+)
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "이벤트 루프 지연 (예정 시각 대비 늦게 깨어난 시간)",
+    buckets=LOOP_LAG_BUCKETS,
+)
+EVENT_LOOP_LAG_LAST = Gauge(
+    "event_loop_lag_last_seconds",
+    "워커별 마지막 이벤트 루프 지연",
+    multiprocess_mode="liveall",
+)
+
+
+def observe_external_call(service: str) -> Callable[[F], F]:
+    """
+    외부 API 클라이언트 메서드의 호출 시간을 기록하는 데코레이터
+
+    @param service: 서비스 이름 (upbit, openai)
+    """
+
+    def decorator(func: F) -> F:
+        method = func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                result = func(*args, **kwargs)
+                outcome = "success"
+                return result
+            finally:
+                EXTERNAL_CALL_DURATION.labels(service, method, outcome).observe(
+                    time.perf_counter() - started
+                )
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+class MetricsMiddleware:
+    """
+    라우트별 요청 수/처리 시간 기록 ASGI 미들웨어
+
+    route 라벨은 실제 경로가 아닌 라우트 템플릿(예: /api/v1/my/coins/{coin_id})을 사용하여
+    라벨 조합 수가 늘어나지 않게 합니다. 매칭되는 라우트가 없으면 "unmatched"로 기록합니다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_progress.dec()
+            route = scope.get("route")
+            route_path = getattr(route, "path_format", None) or "unmatched"
+            HTTP_REQUESTS.labels(method, route_path, str(status)).inc()
+            HTTP_REQUEST_DURATION.labels(method, route_path).observe(elapsed)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """SQL 실행 시간 측정 이벤트 등록 (엔진당 1회)"""
+    sync_engine = engine.sync_engine
+    if getattr(sync_engine, "_metrics_instrumented", False):
+        return
+    sync_engine._metrics_instrumented = True
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        context._metrics_started = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_metrics_started", None)
+        if started is None:
+            return
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement else ""
+        if operation not in ("SELECT", "INSERT", "UPDATE", "DELETE"):
+            operation = "OTHER"
+        DB_QUERY_DURATION.labels(operation).observe(time.perf_counter() - started)
+
+
+class RuntimeMetricsMonitor:
+    """
+    이벤트 루프 지연과 커넥션 풀 상태를 주기적으로 기록하는 백그라운드 작업
+
+    @param engine: 풀 상태를 기록할 엔진
+    @param interval: 측정 주기 (초)
+    """
+
+    def __init__(self, engine: AsyncEngine, interval: float = 0.5) -> None:
+        self.engine = engine
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - scheduled)
+            EVENT_LOOP_LAG.observe(lag)
+            EVENT_LOOP_LAG_LAST.set(lag)
+            self._record_pool()
+
+    def _record_pool(self) -> None:
+        pool = self.engine.sync_engine.pool
+        checkedout = getattr(pool, "checkedout", None)
+        overflow = getattr(pool, "overflow", None)
+        if checkedout is not None:
+            DB_POOL_CHECKED_OUT.set(checkedout())
+        if overflow is not None:
+            DB_POOL_OVERFLOW.set(max(0, overflow()))
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    /metrics 응답 본문과 Content-Type
+
+    multiprocess 모드이면 요청마다 모든 워커의 메트릭 파일을 합산합니다.
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
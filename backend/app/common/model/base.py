@@ -2,13 +2,39 @@
 SQLAlchemy 데이터베이스 설정
 
 engine, session, Base 클래스를 제공합니다.
+DATABASE_URL의 dialect에 따라 MySQL(aiomysql/asyncmy) 또는 SQLite(aiosqlite, 단일 노드/테스트용)를 사용합니다.
+READ_DATABASE_URL이 설정되면 읽기 전용 조회(BaseRepository.execute_read)는 읽기 엔진(복제본)으로 보냅니다.
 """
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import lru_cache
+from typing import Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Integer,
+    PrimaryKeyConstraint,
+    Table,
+    event,
+    literal,
+)
+from sqlalchemy.dialects import mysql
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateColumn
+from sqlalchemy.sql.functions import FunctionElement
 
 from app.configs.config import settings
 
@@ -19,41 +45,252 @@ class Base(DeclarativeBase):
     pass
 
 
-def get_async_database_url() -> str:
-    """DB URL을 비동기 URL로 변환"""
-    url = settings.DATABASE_URL
+# 자동 증가 기본 키 타입 (SQLite는 INTEGER PRIMARY KEY만 rowid로 자동 증가하므로 INTEGER로 생성)
+AutoIncrementId = BigInteger().with_variant(Integer(), "sqlite")
+
+# 마이크로초까지 저장하는 시각 타입 (MySQL DATETIME은 기본이 초 단위)
+PreciseDateTime = DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql")
+
+
+def _composite_autoincrement_column(table: Table) -> Optional[Column]:
+    """복합 기본 키에 포함된 자동 증가 컬럼 (파티션 테이블의 (id, created_at) 중 id)"""
+    column = table.autoincrement_column
+    if column is not None and len(table.primary_key.columns) > 1:
+        return column
+    return None
+
+
+@compiles(CreateColumn, "sqlite")
+def _compile_sqlite_column(create, compiler, **kw):
+    """
+    SQLite 컬럼 생성
+
+    SQLite는 복합 기본 키의 컬럼을 자동 증가시키지 않으므로,
+    파티션 테이블의 id는 rowid로 자동 증가하는 INTEGER 컬럼으로 만듭니다.
+    """
+    column = create.element
+    if column is _composite_autoincrement_column(column.table):
+        return f"{compiler.preparer.format_column(column)} INTEGER NOT NULL"
+    return compiler.visit_create_column(create, **kw)
+
+
+@compiles(PrimaryKeyConstraint, "sqlite")
+def _compile_sqlite_primary_key(constraint, compiler, **kw):
+    """
+    SQLite 기본 키 생성
+
+    파티션 테이블은 자동 증가 컬럼(id)만 기본 키로 만듭니다. (파티션이 없는 SQLite에서는 id만으로 유일)
+    """
+    column = _composite_autoincrement_column(constraint.table)
+    if column is not None:
+        return f"PRIMARY KEY ({compiler.preparer.format_column(column)})"
+    return compiler.visit_primary_key_constraint(constraint, **kw)
+
+
+class utc_now(FunctionElement):
+    """
+    DB 서버 시계 기준 현재 UTC 시각 (+ offset_seconds)
+
+    여러 호스트가 같은 행의 시각을 기록/비교할 때(lease 만료, 요청 슬롯) 호스트 간 시계 차이의 영향을 받지 않도록
+    애플리케이션의 datetime.utcnow() 대신 사용합니다.
+
+    @param offset_seconds: 더할 시간 (초, 음수 가능)
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+    def __init__(self, offset_seconds: float = 0.0):
+        # 마이크로초 정수로 전달 (MySQL INTERVAL ... MICROSECOND)
+        super().__init__(literal(int(round(offset_seconds * 1_000_000))))
+
+
+@compiles(utc_now, "mysql")
+def _compile_mysql_utc_now(element, compiler, **kw):
+    offset = compiler.process(element.clauses, **kw)
+    return f"DATE_ADD(UTC_TIMESTAMP(6), INTERVAL {offset} MICROSECOND)"
+
+
+@compiles(utc_now, "sqlite")
+def _compile_sqlite_utc_now(element, compiler, **kw):
+    # %f는 밀리초(SS.SSS)까지이므로 000을 붙여 DateTime 저장 형식(마이크로초 6자리)과 맞춤
+    offset = compiler.process(element.clauses, **kw)
+    return (
+        f"strftime('%Y-%m-%d %H:%M:%f000', 'now', ({offset} / 1000000.0) || ' seconds')"
+    )
+
+
+# session.info 키: 읽기 엔진으로 보낼 조회를 실행 중인지 / 이 세션에서 쓰기(flush)를 했는지
+READ_REPLICA_KEY = "read_replica"
+WROTE_KEY = "wrote"
+
+# read_from_primary() 안에서는 읽기 전용 조회도 primary에서 실행
+_read_from_primary: ContextVar[bool] = ContextVar("read_from_primary", default=False)
+
+
+def get_async_database_url(url: str = "") -> str:
+    """DB URL을 비동기 URL로 변환 (기본: DATABASE_URL)"""
+    url = url or settings.DATABASE_URL
     # 이미 비동기 드라이버인 경우 그대로 반환
-    if "aiomysql" in url or "asyncmy" in url:
+    if "aiomysql" in url or "asyncmy" in url or "aiosqlite" in url:
         return url
     # 동기 드라이버를 비동기로 변환
     if url.startswith("mysql+pymysql"):
         return url.replace("mysql+pymysql", "mysql+aiomysql")
     if url.startswith("mysql://"):
         return url.replace("mysql://", "mysql+aiomysql://")
+    if url.startswith("sqlite+pysqlite"):
+        return url.replace("sqlite+pysqlite", "sqlite+aiosqlite")
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://")
     return url
 
 
+def get_database_backend(url: str = "") -> str:
+    """DB 종류 (mysql, sqlite) - 엔진을 만들지 않고 URL로 판단 (기본: DATABASE_URL)"""
+    url = get_async_database_url(url)
+    if not url:
+        return "mysql"
+    return make_url(url).get_backend_name()
+
+
+def is_sqlite(url: str = "") -> bool:
+    """SQLite DB 여부 (기본: DATABASE_URL)"""
+    return get_database_backend(url) == "sqlite"
+
+
+def create_engine_for_url(url: str, pool_size: int, max_overflow: int) -> AsyncEngine:
+    """
+    DB URL에 맞는 비동기 엔진 생성
+
+    SQLite는 파일당 쓰기가 하나씩 직렬화되므로 커넥션 풀 크기 설정을 사용하지 않습니다.
+    - 메모리 DB(sqlite+aiosqlite://): 모든 세션이 같은 DB를 보도록 커넥션 하나를 공유 (StaticPool)
+    - 파일 DB: WAL 모드로 조회가 쓰기를 기다리지 않도록 설정
+    - 공통: 외래 키 제약 활성화 (MySQL과 같은 동작)
+
+    @param url: DB URL (동기 드라이버 URL이면 비동기로 변환)
+    @param pool_size: 커넥션 풀 크기 (MySQL)
+    @param max_overflow: 풀 크기를 넘어 만들 수 있는 커넥션 수 (MySQL)
+    """
+    url = get_async_database_url(url)
+    if not is_sqlite(url):
+        return create_async_engine(
+            url, pool_size=pool_size, max_overflow=max_overflow, echo=False
+        )
+
+    database = make_url(url).database
+    in_memory = not database or database == ":memory:"
+    engine = create_async_engine(
+        url,
+        echo=False,
+        connect_args={"check_same_thread": False},
+        **({"poolclass": StaticPool} if in_memory else {}),
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _configure_sqlite(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        if not in_memory:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.close()
+
+    return engine
+
+
 @lru_cache
 def get_engine():
     """비동기 엔진을 lazy하게 생성"""
-    return create_async_engine(
-        get_async_database_url(),
-        pool_size=settings.DB_POOL_SIZE,
-        max_overflow=settings.DB_MAX_OVERFLOW,
-        echo=False,
+    return create_engine_for_url(
+        settings.DATABASE_URL, settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
     )
 
 
 @lru_cache
-def get_session_maker():
-    """세션 팩토리를 lazy하게 생성"""
+def get_read_engine():
+    """
+    읽기 엔진을 lazy하게 생성 (READ_DATABASE_URL이 없으면 primary 엔진)
+
+    복제본에서 읽기 전용 조회만 실행하므로 쓰기/Named Lock은 이 엔진을 사용하지 않습니다.
+    """
+    if not settings.READ_DATABASE_URL:
+        return get_engine()
+    return create_engine_for_url(
+        settings.READ_DATABASE_URL,
+        settings.READ_DB_POOL_SIZE,
+        settings.READ_DB_MAX_OVERFLOW,
+    )
+
+
+class RoutingSession(Session):
+    """
+    읽기/쓰기 엔진을 고르는 세션
+
+    기본은 primary이며, execute_read()가 조회를 실행하는 동안에만 읽기 엔진을 사용합니다.
+    (같은 조회에서 이어지는 selectin 로드도 읽기 엔진, flush는 항상 primary)
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self.info.get(READ_REPLICA_KEY) and not self._flushing:
+            return get_read_engine().sync_engine
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_written(session: Session, flush_context) -> None:
+    """쓰기를 한 세션은 이후 조회도 primary에서 (read-your-writes)"""
+    session.info[WROTE_KEY] = True
+
+
+@contextmanager
+def read_from_primary(enabled: bool = True) -> Iterator[None]:
+    """
+    블록 안의 읽기 전용 조회를 primary에서 실행 (복제 지연 없이 방금 쓴 값을 읽어야 할 때)
+
+    @param enabled: False면 아무것도 바꾸지 않음
+    """
+    token = _read_from_primary.set(enabled or _read_from_primary.get())
+    try:
+        yield
+    finally:
+        _read_from_primary.reset(token)
+
+
+def get_dialect_name(session: AsyncSession) -> str:
+    """세션이 쓰기에 사용하는 primary DB의 dialect 이름 (mysql, sqlite)"""
+    return session.get_bind().dialect.name
+
+
+def uses_read_replica(session: AsyncSession) -> bool:
+    """
+    세션의 다음 읽기 전용 조회를 읽기 엔진으로 보낼지 여부
+
+    읽기 엔진이 없거나, read_from_primary() 안이거나, 세션이 이미 쓰기를 했거나
+    flush되지 않은 변경이 있으면 primary에서 읽습니다.
+    """
+    if not settings.READ_DATABASE_URL or _read_from_primary.get():
+        return False
+    if session.info.get(WROTE_KEY):
+        return False
+    return not (session.new or session.dirty or session.deleted)
+
+
+def create_session_maker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """엔진에 연결된 세션 팩토리 생성"""
     return async_sessionmaker(
-        get_engine(),
+        engine,
         class_=AsyncSession,
+        sync_session_class=RoutingSession,
         expire_on_commit=False,
     )
 
 
+@lru_cache
+def get_session_maker():
+    """세션 팩토리를 lazy하게 생성"""
+    return create_session_maker(get_engine())
+
+
 # 하위 호환성을 위한 프로퍼티
 @property
 def engine():
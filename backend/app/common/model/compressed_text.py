@@ -0,0 +1,67 @@
+"""
+압축 가능한 텍스트 컬럼 타입
+
+긴 텍스트를 zlib으로 압축하여 BLOB에 저장합니다.
+- 압축한 값: 0x00 + zlib 데이터 (텍스트는 NUL로 시작하지 않으므로 구분 가능)
+- 압축하지 않은 값: UTF-8 바이트 그대로 (기존 TEXT 값을 SQL로 그대로 옮겨 와도 읽을 수 있음)
+
+압축 여부는 쓸 때 TEXT_COMPRESSION/TEXT_COMPRESSION_MIN_BYTES 설정으로 정하며,
+읽을 때는 설정과 관계없이 두 형식을 모두 읽습니다.
+"""
+
+import zlib
+from typing import Optional
+
+from sqlalchemy import LargeBinary
+from sqlalchemy.dialects.mysql import MEDIUMBLOB
+from sqlalchemy.types import TypeDecorator
+
+from app.configs.config import settings
+
+COMPRESSED_PREFIX = b"\x00"
+
+
+def compress_text(value: str, min_bytes: int) -> bytes:
+    """
+    텍스트를 저장할 바이트로 변환
+
+    @param value: 저장할 텍스트
+    @param min_bytes: 이 크기(UTF-8) 이상일 때만 압축 (압축해도 작아지지 않으면 원문 저장)
+    @return: 저장할 바이트
+    """
+    raw = value.encode("utf-8")
+    if len(raw) < min_bytes:
+        return raw
+    compressed = COMPRESSED_PREFIX + zlib.compress(raw)
+    return compressed if len(compressed) < len(raw) else raw
+
+
+def decompress_text(value: bytes) -> str:
+    """저장된 바이트를 텍스트로 변환 (압축/비압축 모두)"""
+    if value.startswith(COMPRESSED_PREFIX):
+        return zlib.decompress(value[len(COMPRESSED_PREFIX) :]).decode("utf-8")
+    return value.decode("utf-8")
+
+
+class CompressedText(TypeDecorator):
+    """zlib 압축 텍스트 (MySQL MEDIUMBLOB, 그 외 BLOB)"""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "mysql":
+            return dialect.type_descriptor(MEDIUMBLOB())
+        return dialect.type_descriptor(LargeBinary())
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        if not settings.TEXT_COMPRESSION:
+            return value.encode("utf-8")
+        return compress_text(value, settings.TEXT_COMPRESSION_MIN_BYTES)
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return decompress_text(bytes(value))
@@ -0,0 +1,21 @@
+"""
+Lease 엔티티
+"""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.common.model.base import Base
+
+
+class Lease(Base):
+    """만료 시각 기반 분산 락 (lease)"""
+
+    __tablename__ = "leases"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    owner: Mapped[str] = mapped_column(String(100), nullable=False)
+    fencing_token: Mapped[int] = mapped_column(BigInteger, nullable=False, default=1)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -0,0 +1,19 @@
+"""
+RateLimit 엔티티
+"""
+
+from datetime import datetime
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.common.model.base import Base, PreciseDateTime
+
+
+class RateLimit(Base):
+    """여러 워커가 함께 지키는 요청 속도 제한의 다음 호출 슬롯 (SharedRateLimiter)"""
+
+    __tablename__ = "rate_limits"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    next_slot_at: Mapped[datetime] = mapped_column(PreciseDateTime, nullable=False)
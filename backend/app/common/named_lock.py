@@ -1,42 +1,62 @@
 """
-MySQL Named Lock 유틸리티
+Named Lock 유틸리티
 
 여러 워커에서 동시 실행을 방지하기 위한 분산 락을 제공합니다.
-MySQL의 GET_LOCK/RELEASE_LOCK 함수를 사용합니다.
+LOCK_BACKEND 설정에 따라 다음 구현 중 하나를 사용합니다.
+- mysql: MySQL의 GET_LOCK/RELEASE_LOCK 함수 (락을 보유하는 동안 커넥션 점유)
+- lease: leases 테이블 기반 lease + heartbeat (커넥션 점유 없음, fencing token 제공)
+
+GET_LOCK이 없는 SQLite에서는 LOCK_BACKEND와 관계없이 lease를 사용합니다.
 """
 
 from contextlib import asynccontextmanager
 from logging import Logger
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional, Union
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.common.model.base import get_session_maker
+from app.common.lease_lock import FencingToken, LeaseHandle, lease_lock
+from app.common.model.base import get_session_maker, is_sqlite
+from app.configs.config import settings
 
 logger = Logger(__name__)
 
 
+class MySqlLockHandle:
+    """GET_LOCK으로 획득한 락 핸들"""
+
+    def __init__(self, lock_name: str, session: AsyncSession):
+        self.lock_name = lock_name
+        self.session = session
+        self.fencing: Optional[FencingToken] = None
+
+    def __bool__(self) -> bool:
+        return True
+
+    async def is_held(self) -> bool:
+        """현재 세션이 락을 보유 중인지 확인"""
+        result = await self.session.execute(
+            text("SELECT IS_USED_LOCK(:lock_name) = CONNECTION_ID()"),
+            {"lock_name": self.lock_name},
+        )
+        return result.scalar() == 1
+
+
+LockHandle = Union[MySqlLockHandle, LeaseHandle]
+
+
 @asynccontextmanager
-async def named_lock(
+async def mysql_named_lock(
     lock_name: str,
     timeout: int = 0,
-) -> AsyncGenerator[bool, None]:
+) -> AsyncGenerator[Optional[MySqlLockHandle], None]:
     """
     MySQL Named Lock 컨텍스트 매니저
 
     @param lock_name: 락 이름 (고유 식별자)
     @param timeout: 락 획득 대기 시간 (초, 기본: 0 - 즉시 반환)
-    @return: 락 획득 성공 여부
-
-    사용 예시:
-        async with named_lock("trade_execution") as acquired:
-            if acquired:
-                # 락 획득 성공 - 작업 실행
-                await do_work()
-            else:
-                # 락 획득 실패 - 다른 워커가 실행 중
-                pass
+    @return: 획득 성공 시 락 핸들, 실패 시 None
     """
     session_maker = get_session_maker()
     acquired = False
@@ -55,10 +75,10 @@ async def named_lock(
 
             if acquired:
                 logger.info(f"락 획득 성공: {lock_name}")
+                yield MySqlLockHandle(lock_name, session)
             else:
                 logger.info(f"락 획득 실패: {lock_name} (다른 워커가 실행 중)")
-
-            yield acquired
+                yield None
 
         finally:
             # 락을 획득한 경우에만 해제
@@ -68,3 +88,34 @@ async def named_lock(
                     {"lock_name": lock_name},
                 )
                 logger.info(f"락 해제: {lock_name}")
+
+
+@asynccontextmanager
+async def named_lock(
+    lock_name: str,
+    timeout: int = 0,
+) -> AsyncGenerator[Optional[LockHandle], None]:
+    """
+    분산 락 컨텍스트 매니저 (LOCK_BACKEND 설정에 따라 구현 선택, SQLite는 항상 lease)
+
+    @param lock_name: 락 이름 (고유 식별자)
+    @param timeout: 락 획득 대기 시간 (초, 기본: 0 - 즉시 반환)
+    @return: 획득 성공 시 락 핸들 (truthy), 실패 시 None
+
+    사용 예시:
+        async with named_lock("trade_execution") as lock:
+            if lock:
+                # 락 획득 성공 - 작업 실행
+                await do_work(fencing=lock.fencing)
+            else:
+                # 락 획득 실패 - 다른 워커가 실행 중
+                pass
+    """
+    if settings.LOCK_BACKEND == "lease" or is_sqlite():
+        async with lease_lock(
+            lock_name, ttl_seconds=settings.LEASE_TTL_SECONDS, timeout=timeout
+        ) as handle:
+            yield handle
+    else:
+        async with mysql_named_lock(lock_name, timeout=timeout) as handle:
+            yield handle
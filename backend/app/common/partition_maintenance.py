@@ -0,0 +1,306 @@
+"""
+월별 파티션 관리
+
+trades/trade_reasons/balances 테이블은 created_at 기준 월별 RANGE COLUMNS 파티션으로 나뉩니다.
+(p202610: 2026-10-01 이상 2026-11-01 미만, pmax: 그 이후 전부)
+
+주기 작업(partition_maintenance_job)이 다음을 수행합니다.
+- 앞으로 PARTITION_PREMAKE_MONTHS개월의 파티션을 pmax에서 미리 분리 (pmax에 데이터가 쌓이지 않도록)
+- 보관 기간(PARTITION_RETENTION_MONTHS)이 지난 파티션을 gzip CSV로 내보낸 뒤 삭제
+  (내보낸 행 수가 파티션 행 수와 같을 때만 삭제)
+- trade_reasons 파티션을 삭제하면 해당 기간의 검색 문서(trade_search_documents)도 삭제
+"""
+
+import asyncio
+import csv
+import gzip
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from logging import Logger
+from pathlib import Path
+from typing import IO, Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.model.compressed_text import decompress_text
+
+logger = Logger(__name__)
+
+PARTITIONED_TABLES = ("trades", "trade_reasons", "balances")
+# 파티션을 삭제할 때 같은 기간의 행을 함께 지울 파티션하지 않은 테이블
+DEPENDENT_TABLES = {"trade_reasons": "trade_search_documents"}
+MAXVALUE_PARTITION = "pmax"
+EXPORT_CHUNK_SIZE = 1000
+
+
+def month_start(value: datetime) -> datetime:
+    """해당 월의 1일 00:00"""
+    return datetime(value.year, value.month, 1)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """월 단위 이동 (month는 1일 00:00)"""
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: datetime) -> str:
+    """월 파티션 이름 (예: p202610)"""
+    return f"p{month:%Y%m}"
+
+
+def partition_definition(month: datetime) -> str:
+    """월 파티션 정의 (해당 월 1일 이상 다음 달 1일 미만)"""
+    return (
+        f"PARTITION {partition_name(month)} "
+        f"VALUES LESS THAN ('{add_months(month, 1):%Y-%m-%d %H:%M:%S}')"
+    )
+
+
+@dataclass
+class PartitionInfo:
+    """
+    파티션 정보 (information_schema.PARTITIONS)
+
+    @param name: 파티션 이름
+    @param upper_bound: 파티션 상한 (이 시각 미만, MAXVALUE이면 None)
+    """
+
+    name: str
+    upper_bound: Optional[datetime]
+
+
+@dataclass
+class PartitionMaintenanceResult:
+    """파티션 관리 결과"""
+
+    created: List[str] = field(default_factory=list)
+    archived: List[str] = field(default_factory=list)
+
+
+def plan_future_partitions(
+    partitions: Sequence[PartitionInfo], now: datetime, premake_months: int
+) -> List[datetime]:
+    """
+    pmax에서 분리해야 할 월 목록
+
+    @param partitions: 현재 파티션 목록
+    @param now: 현재 시각
+    @param premake_months: 이번 달 이후 미리 만들어 둘 개월 수
+    @return: 새로 만들 월 목록 (각 월의 1일)
+    """
+    bounds = [p.upper_bound for p in partitions if p.upper_bound is not None]
+    if not bounds:
+        return []
+    next_month = month_start(max(bounds))
+    last_month = add_months(month_start(now), premake_months)
+
+    months: List[datetime] = []
+    while next_month <= last_month:
+        months.append(next_month)
+        next_month = add_months(next_month, 1)
+    return months
+
+
+def expired_partitions(
+    partitions: Sequence[PartitionInfo], now: datetime, retention_months: int
+) -> List[PartitionInfo]:
+    """
+    보관 기간이 지난 파티션 목록
+
+    상한이 (이번 달 - retention_months)의 1일 이하인 파티션, 즉 모든 행이 보관 기간 밖인 파티션입니다.
+
+    @param partitions: 현재 파티션 목록
+    @param now: 현재 시각
+    @param retention_months: 보관 개월 수 (0 이하면 보관 기간 없음)
+    @return: 내보낸 뒤 삭제할 파티션 목록
+    """
+    if retention_months <= 0:
+        return []
+    cutoff = add_months(month_start(now), -retention_months)
+    return [
+        p for p in partitions if p.upper_bound is not None and p.upper_bound <= cutoff
+    ]
+
+
+def _csv_value(value: Any) -> Any:
+    """CSV에 쓸 값 (압축 저장된 BLOB 컬럼은 텍스트로 풀어서 기록)"""
+    if isinstance(value, (bytes, bytearray)):
+        return decompress_text(bytes(value))
+    return value
+
+
+def _open_gzip_csv(path: Path) -> Tuple[IO[bytes], IO[str]]:
+    """gzip CSV 파일 열기 (fsync를 위해 원본 파일 객체도 반환)"""
+    raw = open(path, "wb")
+    return raw, gzip.open(raw, "wt", newline="", encoding="utf-8")
+
+
+def _close_gzip_csv(raw: IO[bytes], file: IO[str], sync: bool) -> None:
+    """gzip 스트림을 닫고 sync면 디스크에 기록될 때까지 대기"""
+    try:
+        file.close()
+        if sync:
+            raw.flush()
+            os.fsync(raw.fileno())
+    finally:
+        raw.close()
+
+
+class PartitionMaintenance:
+    """
+    월별 파티션 생성 및 만료 파티션 보관/삭제
+
+    @param session: 데이터베이스 세션
+    @param archive_dir: 만료 파티션을 내보낼 디렉토리
+    @param retention_months: 보관 개월 수 (0이면 내보내기/삭제하지 않음)
+    @param premake_months: 이번 달 이후 미리 만들어 둘 파티션 개월 수
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        archive_dir: str = "archive",
+        retention_months: int = 0,
+        premake_months: int = 3,
+    ):
+        self.session = session
+        self.archive_dir = Path(archive_dir)
+        self.retention_months = retention_months
+        self.premake_months = premake_months
+
+    async def run(self, now: Optional[datetime] = None) -> PartitionMaintenanceResult:
+        """
+        모든 파티션 테이블 관리
+
+        @param now: 기준 시각 (기본: utcnow)
+        @return: 생성/보관된 파티션 목록 ("테이블.파티션")
+        """
+        now = now or datetime.utcnow()
+        result = PartitionMaintenanceResult()
+        for table in PARTITIONED_TABLES:
+            partitions = await self.list_partitions(table)
+            if not partitions:
+                logger.warning(
+                    f"{table} 테이블이 파티션되어 있지 않습니다. 건너뜁니다."
+                )
+                continue
+
+            months = plan_future_partitions(partitions, now, self.premake_months)
+            if months:
+                await self._split_maxvalue(table, months)
+                result.created += [f"{table}.{partition_name(m)}" for m in months]
+
+            for partition in expired_partitions(partitions, now, self.retention_months):
+                if await self._archive(table, partition.name):
+                    result.archived.append(f"{table}.{partition.name}")
+                    if table in DEPENDENT_TABLES:
+                        await self._delete_before(
+                            DEPENDENT_TABLES[table], partition.upper_bound
+                        )
+
+        if result.created or result.archived:
+            logger.info(
+                f"🗂️ 파티션 관리: 생성 {result.created}, 보관 후 삭제 {result.archived}"
+            )
+        return result
+
+    async def list_partitions(self, table: str) -> List[PartitionInfo]:
+        """
+        테이블의 파티션 목록 조회 (상한 오름차순)
+
+        @param table: 테이블 이름
+        @return: 파티션 목록 (파티션되지 않은 테이블이면 빈 목록)
+        """
+        rows = await self.session.execute(
+            text(
+                "SELECT PARTITION_NAME, PARTITION_DESCRIPTION "
+                "FROM information_schema.PARTITIONS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table "
+                "AND PARTITION_NAME IS NOT NULL "
+                "ORDER BY PARTITION_ORDINAL_POSITION"
+            ),
+            {"table": table},
+        )
+        partitions: List[PartitionInfo] = []
+        for name, description in rows.all():
+            upper_bound = None
+            if description != "MAXVALUE":
+                upper_bound = datetime.fromisoformat(description.strip("'"))
+            partitions.append(PartitionInfo(name=name, upper_bound=upper_bound))
+        return partitions
+
+    async def _split_maxvalue(self, table: str, months: Sequence[datetime]) -> None:
+        """pmax 파티션에서 월 파티션들을 분리"""
+        definitions = ", ".join(partition_definition(m) for m in months)
+        await self.session.execute(
+            text(
+                f"ALTER TABLE {table} REORGANIZE PARTITION {MAXVALUE_PARTITION} INTO "
+                f"({definitions}, PARTITION {MAXVALUE_PARTITION} VALUES LESS THAN (MAXVALUE))"
+            )
+        )
+
+    async def _archive(self, table: str, partition: str) -> bool:
+        """
+        파티션을 gzip CSV로 내보낸 뒤 삭제
+
+        @return: 삭제 여부 (내보낸 행 수가 파티션 행 수와 다르면 삭제하지 않음)
+        """
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        path = self.archive_dir / f"{table}-{partition}.csv.gz"
+
+        exported = await self._export(table, partition, path)
+        count = await self.session.scalar(
+            text(f"SELECT COUNT(*) FROM {table} PARTITION ({partition})")
+        )
+        if exported != count:
+            logger.error(
+                f"{table}.{partition} 내보내기 행 수 불일치 ({exported} != {count}), 삭제하지 않습니다."
+            )
+            return False
+
+        await self.session.execute(
+            text(f"ALTER TABLE {table} DROP PARTITION {partition}")
+        )
+        logger.info(f"📦 {table}.{partition} {exported}행 보관 후 삭제: {path}")
+        return True
+
+    async def _delete_before(self, table: str, upper_bound: datetime) -> None:
+        """파티션하지 않은 테이블에서 upper_bound 이전에 생성된 행 삭제"""
+        result = await self.session.execute(
+            text(f"DELETE FROM {table} WHERE created_at < :upper_bound"),
+            {"upper_bound": upper_bound},
+        )
+        await self.session.commit()
+        logger.info(f"🧹 {table} {result.rowcount}행 삭제 ({upper_bound} 이전)")
+
+    async def _export(self, table: str, partition: str, path: Path) -> int:
+        """
+        파티션의 모든 행을 gzip CSV로 저장 (임시 파일에 쓴 뒤 이름 변경)
+
+        @return: 내보낸 행 수
+        """
+        result = await self.session.stream(
+            text(f"SELECT * FROM {table} PARTITION ({partition})")
+        )
+        temp_path = path.with_name(path.name + ".tmp")
+        exported = 0
+        # 파일 열기/압축/fsync는 이벤트 루프를 막지 않도록 스레드에서 실행
+        raw, file = await asyncio.to_thread(_open_gzip_csv, temp_path)
+        completed = False
+        try:
+            writer = csv.writer(file)
+            await asyncio.to_thread(writer.writerow, list(result.keys()))
+            async for rows in result.partitions(EXPORT_CHUNK_SIZE):
+                await asyncio.to_thread(
+                    writer.writerows,
+                    [[_csv_value(value) for value in row] for row in rows],
+                )
+                exported += len(rows)
+            completed = True
+        finally:
+            await asyncio.to_thread(_close_gzip_csv, raw, file, completed)
+        await asyncio.to_thread(os.replace, temp_path, path)
+        return exported
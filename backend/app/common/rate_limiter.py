@@ -0,0 +1,127 @@
+"""
+요청 속도 제한
+
+거래소 API의 초당 요청 수 제한을 넘지 않도록 호출 시점을 조절합니다.
+호출할 시각(슬롯)을 락 안에서 동기적으로 예약한 뒤 그 시각까지 기다리므로,
+여러 코루틴/이벤트 루프에서 같은 인스턴스를 공유해도 안전합니다.
+
+- RateLimiter: 프로세스 단위 (메모리)
+- SharedRateLimiter: 계정 단위 (rate_limits 테이블, 여러 워커/호스트가 함께 지킴)
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from datetime import timedelta
+from typing import Deque
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.common.model.base import get_engine, utc_now
+from app.common.model.rate_limit import RateLimit
+
+rate_limits = RateLimit.__table__
+
+
+class RateLimiter:
+    """
+    슬라이딩 윈도우 속도 제한 (어느 period초 구간에서도 최대 rate번 호출)
+
+    @param rate: 구간당 최대 호출 수
+    @param period: 구간 길이 (초)
+    """
+
+    def __init__(self, rate: int, period: float = 1.0):
+        if rate <= 0:
+            raise ValueError("rate는 1 이상이어야 합니다.")
+        self.rate = rate
+        self.period = period
+        # 최근 rate개의 예약 슬롯 (가장 오래된 슬롯 + period 이후에 다음 호출 가능)
+        self._slots: Deque[float] = deque(maxlen=rate)
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        다음 호출 슬롯 예약
+
+        @return: 호출 가능해질 때까지 기다려야 하는 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = now
+            if len(self._slots) == self.rate:
+                slot = max(now, self._slots[0] + self.period)
+            self._slots.append(slot)
+            return slot - now
+
+    async def acquire(self) -> None:
+        """호출 슬롯이 될 때까지 대기"""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class SharedRateLimiter:
+    """
+    DB 기반 계정 단위 속도 제한 (호출 간격 period / rate초)
+
+    거래소의 요청 제한은 계정 단위이므로, 여러 프로세스(gunicorn 워커, 작업 큐 워커)가
+    rate_limits 테이블의 한 행(다음 호출 슬롯)을 행 잠금으로 갱신하며 슬롯을 예약합니다.
+    모든 워커를 합쳐 호출 간격이 period / rate초 이상이므로 어느 period초 구간에서도 최대 rate번 호출합니다.
+    시각은 DB 시계를 사용하므로 호스트 간 시계 차이에 영향을 받지 않습니다.
+
+    @param name: 제한 이름 (계정/API별로 구분)
+    @param rate: 구간당 최대 호출 수
+    @param period: 구간 길이 (초)
+    """
+
+    def __init__(self, name: str, rate: int, period: float = 1.0):
+        if rate <= 0:
+            raise ValueError("rate는 1 이상이어야 합니다.")
+        self.name = name
+        self.rate = rate
+        self.period = period
+        self._row_created = False
+
+    async def _create_row(self) -> None:
+        """처음 사용하는 이름이면 행 생성 (다른 워커가 먼저 만들었으면 그대로 사용)"""
+        try:
+            async with get_engine().begin() as conn:
+                await conn.execute(
+                    insert(rate_limits).values(name=self.name, next_slot_at=utc_now())
+                )
+        except IntegrityError:
+            pass
+        self._row_created = True
+
+    async def reserve(self) -> float:
+        """
+        다음 호출 슬롯 예약
+
+        @return: 호출 가능해질 때까지 기다려야 하는 시간 (초)
+        """
+        if not self._row_created:
+            await self._create_row()
+
+        async with get_engine().begin() as conn:
+            now = await conn.scalar(select(utc_now()))
+            next_slot_at = await conn.scalar(
+                select(rate_limits.c.next_slot_at)
+                .where(rate_limits.c.name == self.name)
+                .with_for_update()
+            )
+            slot = max(now, next_slot_at)
+            await conn.execute(
+                update(rate_limits)
+                .where(rate_limits.c.name == self.name)
+                .values(next_slot_at=slot + timedelta(seconds=self.period / self.rate))
+            )
+        return (slot - now).total_seconds()
+
+    async def acquire(self) -> None:
+        """호출 슬롯이 될 때까지 대기"""
+        delay = await self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
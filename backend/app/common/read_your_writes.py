@@ -0,0 +1,61 @@
+"""
+Read-your-writes 미들웨어
+
+읽기 전용 조회를 복제본으로 보내면, 쓰기 직전에 다시 읽는 화면(예: 코인 추가 후 목록 갱신)이
+복제 지연 때문에 이전 값을 볼 수 있습니다.
+쓰기 요청(POST/PUT/PATCH/DELETE)이 성공하면 쿠키에 만료 시각을 남기고,
+그 시각 전까지 같은 클라이언트의 요청은 모든 조회를 primary에서 처리합니다.
+"""
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.common.model.base import read_from_primary
+
+READ_PRIMARY_UNTIL_COOKIE = "read_primary_until"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class ReadYourWritesMiddleware:
+    """
+    쓰기 요청 후 일정 시간 같은 클라이언트의 조회를 primary로 보내는 ASGI 미들웨어
+
+    @param app: ASGI 앱
+    @param window_seconds: 쓰기 후 primary에서 읽을 시간 (0이면 비활성화)
+    """
+
+    def __init__(self, app: ASGIApp, window_seconds: int) -> None:
+        self.app = app
+        self.window_seconds = window_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.window_seconds <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        is_write = scope["method"] not in SAFE_METHODS
+        cookie = HTTPConnection(scope).cookies.get(READ_PRIMARY_UNTIL_COOKIE)
+        try:
+            sticky = cookie is not None and float(cookie) > time.time()
+        except ValueError:
+            sticky = False
+
+        async def send_wrapper(message: Message) -> None:
+            if (
+                is_write
+                and message["type"] == "http.response.start"
+                and message["status"] < 400
+            ):
+                until = time.time() + self.window_seconds
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{READ_PRIMARY_UNTIL_COOKIE}={until:.3f}; "
+                    f"Max-Age={self.window_seconds}; Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        with read_from_primary(is_write or sticky):
+            await self.app(scope, receive, send_wrapper)
@@ -2,12 +2,13 @@
 기본 Repository 클래스
 """
 
-from typing import Generic, List, Optional, Type, TypeVar
+from typing import Any, Generic, List, Optional, Type, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import Executable, Result, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.common.model.base import Base
+from app.common.model.base import READ_REPLICA_KEY, Base, uses_read_replica
+from app.common.tracing import span
 
 T = TypeVar("T", bound=Base)
 
@@ -28,7 +29,8 @@ class BaseRepository(Generic[T]):
     async def create(self, entity: T) -> T:
         """엔티티 생성"""
         self.session.add(entity)
-        await self.session.commit()
+        with span("db.commit", table=self.model.__tablename__):
+            await self.session.commit()
         await self.session.refresh(entity)
         return entity
 
@@ -41,13 +43,32 @@ class BaseRepository(Generic[T]):
         result = await self.session.execute(select(self.model))
         return list(result.scalars().all())
 
+    async def execute_read(self, query: Executable) -> Result[Any]:
+        """
+        읽기 전용 조회 실행 (읽기 엔진이 설정되어 있으면 복제본에서)
+
+        복제 지연이 문제 되는 경우(같은 세션에서 쓰기를 했거나 read_from_primary() 안)는 primary에서 실행합니다.
+
+        @param query: 조회 쿼리
+        @return: 조회 결과
+        """
+        if not uses_read_replica(self.session):
+            return await self.session.execute(query)
+        self.session.info[READ_REPLICA_KEY] = True
+        try:
+            return await self.session.execute(query)
+        finally:
+            self.session.info.pop(READ_REPLICA_KEY, None)
+
     async def update(self, entity: T) -> T:
         """엔티티 업데이트"""
-        await self.session.commit()
+        with span("db.commit", table=self.model.__tablename__):
+            await self.session.commit()
         await self.session.refresh(entity)
         return entity
 
     async def delete(self, entity: T) -> None:
         """엔티티 삭제"""
         await self.session.delete(entity)
-        await self.session.commit()
+        with span("db.commit", table=self.model.__tablename__):
+            await self.session.commit()
@@ -0,0 +1,445 @@
+"""
+거래 파이프라인 구간별 트레이싱
+
+중첩된 타이밍 span을 기록하여 느린 실행에서 시간이 어느 구간(OHLCV 조회, AI 분석, 호가 조회,
+주문, DB 커밋)에 쓰였는지 확인합니다.
+
+- `span(name, **attributes)`: with 블록 구간을 span으로 기록 (동기/비동기 코드 모두 사용 가능)
+- `traced(name)`: 함수 전체를 span으로 기록하는 데코레이터
+  - `coin`/`coin_name` 인자가 있으면 `coin` 속성으로 태그
+  - 반환값에 `status`가 있으면(Trade) `outcome`, 목록이면 `count` 속성으로 태그
+
+부모-자식 관계는 contextvars로 전파되므로 `asyncio.to_thread`로 넘긴 작업도 같은 trace에 연결됩니다.
+
+TRACING_EXPORTER 설정:
+- `off` (기본값): span을 만들지 않고 공용 no-op 객체를 반환 (전역 변수 확인 1회 비용)
+- `json`: TRACING_JSON_PATH 파일에 span을 한 줄씩 JSON으로 기록
+- `otlp`: TRACING_OTLP_ENDPOINT (OpenTelemetry Collector의 OTLP/HTTP JSON 수신 주소)로 전송
+
+내보내기는 백그라운드 스레드에서 일괄 처리하므로 span 종료 시점에는 큐에 추가만 합니다.
+
+`collect_spans()` 블록 안에서는 exporter 설정과 관계없이 span을 만들어 이름별 호출 수/누적 시간을
+집계합니다. (거래 실행 기록의 구간별 시간에 사용)
+"""
+
+import atexit
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging import Logger
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from app.configs.config import Settings
+
+logger = Logger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+EXPORT_INTERVAL_SECONDS = 1.0
+MAX_BATCH_SIZE = 512
+
+
+class Span:
+    """기록 중인 span"""
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "attributes",
+        "start_ns",
+        "end_ns",
+        "error",
+        "_token",
+    )
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_span_id = parent.span_id if parent else None
+        self.attributes = attributes
+        self.start_ns = 0
+        self.end_ns = 0
+        self.error: Optional[str] = None
+
+    def set(self, **attributes: Any) -> None:
+        """속성 추가 (coin, outcome 등)"""
+        self.attributes.update(attributes)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        self.start_ns = time.time_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end_ns = time.time_ns()
+        _current_span.reset(self._token)
+        if exc is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        if _exporter is not None:
+            _exporter.export(self)
+        collector = _current_collector.get()
+        if collector is not None:
+            collector.add(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": self.end_ns,
+            "duration_ms": self.duration_ms,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class _NoopSpan:
+    """트레이싱 비활성화 시 반환하는 span (아무것도 기록하지 않음)"""
+
+    __slots__ = ()
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+class SpanCollector:
+    """
+    종료된 span의 이름별 호출 수와 누적 시간 집계
+
+    `asyncio.to_thread`로 넘긴 작업의 span도 같은 collector에 모이므로 스레드 간 잠금을 사용합니다.
+    """
+
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = {}
+        self.durations_ns: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            self.counts[span.name] = self.counts.get(span.name, 0) + 1
+            self.durations_ns[span.name] = (
+                self.durations_ns.get(span.name, 0) + span.end_ns - span.start_ns
+            )
+
+    def count(self, *prefixes: str) -> int:
+        """이름이 prefixes 중 하나로 시작하는 span의 호출 수"""
+        with self._lock:
+            return sum(
+                count
+                for name, count in self.counts.items()
+                if name.startswith(prefixes)
+            )
+
+    def total_ms(self, *prefixes: str) -> float:
+        """이름이 prefixes 중 하나로 시작하는 span의 누적 시간 (ms)"""
+        with self._lock:
+            total_ns = sum(
+                duration
+                for name, duration in self.durations_ns.items()
+                if name.startswith(prefixes)
+            )
+        return total_ns / 1_000_000
+
+
+_NOOP_SPAN = _NoopSpan()
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_current_collector: ContextVar[Optional[SpanCollector]] = ContextVar(
+    "current_collector", default=None
+)
+
+
+class SpanExporter:
+    """
+    span 일괄 내보내기 기반 클래스
+
+    export()는 큐에 추가만 하고, 백그라운드 스레드가 주기적으로(또는 큐가 가득 차면) _write()를 호출합니다.
+    """
+
+    def __init__(self) -> None:
+        self._queue: List[Span] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name=type(self).__name__, daemon=True
+        )
+        self._thread.start()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._queue.append(span)
+            full = len(self._queue) >= MAX_BATCH_SIZE
+        if full:
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        """큐에 쌓인 span을 즉시 내보내기"""
+        with self._lock:
+            spans, self._queue = self._queue, []
+        if not spans:
+            return
+        try:
+            self._write(spans)
+        except Exception as e:
+            logger.warning(f"span 내보내기 실패 ({len(spans)}개): {e}")
+
+    def shutdown(self) -> None:
+        self._stopped = True
+        self._wakeup.set()
+        self._thread.join(timeout=5)
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopped:
+            self._wakeup.wait(EXPORT_INTERVAL_SECONDS)
+            self._wakeup.clear()
+            self.flush()
+
+    def _write(self, spans: List[Span]) -> None:
+        raise NotImplementedError
+
+
+class JsonFileExporter(SpanExporter):
+    """span을 JSON Lines 파일에 추가"""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        super().__init__()
+
+    def _write(self, spans: List[Span]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            for span in spans:
+                f.write(json.dumps(span.to_dict(), ensure_ascii=False, default=str))
+                f.write("\n")
+
+
+class OtlpHttpExporter(SpanExporter):
+    """
+    OTLP/HTTP(JSON)로 span 전송
+
+    OpenTelemetry Collector의 `otlp` receiver(http, 기본 4318 포트)가 받을 수 있는 형식입니다.
+    """
+
+    def __init__(self, endpoint: str, service_name: str, timeout: float = 5.0) -> None:
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+        super().__init__()
+
+    def _write(self, spans: List[Span]) -> None:
+        body = json.dumps(self.encode(spans)).encode("utf-8")
+        request = urllib.request.Request(
+            self.endpoint,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+    def encode(self, spans: List[Span]) -> Dict[str, Any]:
+        """OTLP ExportTraceServiceRequest JSON 인코딩"""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            _otlp_attribute("service.name", self.service_name)
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": __name__},
+                            "spans": [_otlp_span(span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _otlp_span(span: Span) -> Dict[str, Any]:
+    encoded = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,  # SPAN_KIND_INTERNAL
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": [
+            _otlp_attribute(key, value) for key, value in span.attributes.items()
+        ],
+        # STATUS_CODE_OK=1, STATUS_CODE_ERROR=2
+        "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+    }
+    if span.parent_span_id:
+        encoded["parentSpanId"] = span.parent_span_id
+    return encoded
+
+
+_exporter: Optional[SpanExporter] = None
+
+
+def configure_tracing(settings: Settings) -> None:
+    """
+    설정에 따라 exporter 구성 (프로세스마다 1회, 워커 fork 이후 호출)
+
+    @raises ValueError: 알 수 없는 TRACING_EXPORTER 값인 경우
+    """
+    if settings.TRACING_EXPORTER == "off":
+        set_exporter(None)
+    elif settings.TRACING_EXPORTER == "json":
+        set_exporter(JsonFileExporter(settings.TRACING_JSON_PATH))
+    elif settings.TRACING_EXPORTER == "otlp":
+        set_exporter(
+            OtlpHttpExporter(
+                settings.TRACING_OTLP_ENDPOINT, settings.TRACING_SERVICE_NAME
+            )
+        )
+    else:
+        raise ValueError(f"알 수 없는 TRACING_EXPORTER: {settings.TRACING_EXPORTER}")
+
+
+def set_exporter(exporter: Optional[SpanExporter]) -> None:
+    """exporter 교체 (기존 exporter는 남은 span을 내보낸 뒤 종료)"""
+    global _exporter
+    previous, _exporter = _exporter, exporter
+    if previous is not None:
+        previous.shutdown()
+
+
+def shutdown_tracing() -> None:
+    """남은 span을 내보내고 트레이싱 종료"""
+    set_exporter(None)
+
+
+atexit.register(shutdown_tracing)
+
+
+def span(name: str, **attributes: Any) -> Any:
+    """
+    with 블록 구간을 span으로 기록
+
+    @param name: span 이름 (예: "upbit.get_ohlcv_raw")
+    @param attributes: span 속성 (예: coin="KRW-BTC")
+    @return: Span (트레이싱 비활성화 시 no-op span)
+    """
+    if not _enabled():
+        return _NOOP_SPAN
+    return Span(name, _current_span.get(), attributes)
+
+
+def _enabled() -> bool:
+    return _exporter is not None or _current_collector.get() is not None
+
+
+@contextmanager
+def collect_spans() -> Iterator[SpanCollector]:
+    """
+    블록 안에서 종료된 span을 집계 (중첩 시 안쪽 블록의 span은 안쪽 collector에만 집계)
+
+    @return: 블록 종료 후에도 집계 결과를 조회할 수 있는 SpanCollector
+    """
+    collector = SpanCollector()
+    token = _current_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _current_collector.reset(token)
+
+
+def current_span() -> Any:
+    """현재 span (없거나 트레이싱 비활성화 시 no-op span)"""
+    return _current_span.get() or _NOOP_SPAN
+
+
+def _call_attributes(
+    signature: inspect.Signature, args: Any, kwargs: Any
+) -> Dict[str, Any]:
+    try:
+        arguments = signature.bind_partial(*args, **kwargs).arguments
+    except TypeError:
+        return {}
+    if "coin" in arguments:
+        coin = arguments["coin"]
+        return {"coin": getattr(coin, "name", coin)}
+    if "coin_name" in arguments:
+        return {"coin": arguments["coin_name"]}
+    return {}
+
+
+def _outcome(result: Any) -> Dict[str, Any]:
+    if isinstance(result, list):
+        return {"count": len(result)}
+    status = getattr(result, "status", None)
+    if status is None:
+        return {}
+    return {"outcome": getattr(status, "value", status)}
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """
+    함수 호출을 span으로 기록하는 데코레이터 (동기/비동기 함수 모두 지원)
+
+    @param name: span 이름
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not _enabled():
+                    return await func(*args, **kwargs)
+                with span(name, **_call_attributes(signature, args, kwargs)) as s:
+                    result = await func(*args, **kwargs)
+                    s.set(**_outcome(result))
+                    return result
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled():
+                return func(*args, **kwargs)
+            with span(name, **_call_attributes(signature, args, kwargs)) as s:
+                result = func(*args, **kwargs)
+                s.set(**_outcome(result))
+                return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -1,16 +1,76 @@
+import asyncio
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from logging import Logger
+from typing import Any, Dict, List, Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.ai.di.open_ai_di import close_open_ai_client
+from app.common.api.metrics_router import metrics_router
 from app.common.api.v1.v1_router import v1_router
-from app.common.model.base import get_engine
+from app.common.leader_election import LeaderElector
+from app.common.metrics import (
+    MetricsMiddleware,
+    RuntimeMetricsMonitor,
+    instrument_engine,
+)
+from app.common.model.base import get_engine, get_read_engine
+from app.common.read_your_writes import ReadYourWritesMiddleware
+from app.common.tracing import configure_tracing, shutdown_tracing
 from app.configs.config import settings
-from app.configs.scheduling_tasks import trade_execution_job
+from app.configs.scheduler import create_scheduler
+from app.trade.service.trade_task_worker import TradeTaskWorker, TradeTaskWorkerPool
 
-scheduler = AsyncIOScheduler()
+logger = Logger(__name__)
+
+SCHEDULER_LEADER_LOCK = "trade_scheduler_leader"
+
+scheduler: Optional[AsyncIOScheduler] = None
+
+
+async def start_scheduler() -> None:
+    """스케줄러 시작 (이미 실행 중이면 무시)"""
+    global scheduler
+    if scheduler is None:
+        scheduler = create_scheduler()
+        scheduler.start()
+
+
+def _running_jobs(scheduler: AsyncIOScheduler) -> List[asyncio.Future]:
+    """
+    실행 중인 작업 목록
+
+    AsyncIOExecutor는 shutdown(wait=True)를 지원하지 않고 실행 중인 작업을 취소만 하므로,
+    종료가 끝났음을 확인하기 위해 실행기의 작업 future를 직접 모읍니다.
+    """
+    return [
+        future
+        for executor in scheduler._executors.values()
+        for future in getattr(executor, "_pending_futures", ())
+        if not future.done()
+    ]
+
+
+async def stop_scheduler() -> None:
+    """
+    스케줄러 종료 (실행 중이 아니면 무시)
+
+    실행 중인 작업(거래 실행 등)은 취소하고 끝날 때까지 기다린 뒤 반환합니다.
+    리더십을 잃은 워커의 이전 실행이 새 리더의 실행과 겹치지 않도록 하며,
+    이미 거래소로 보낸 주문은 취소되어도 OrderSubmitter가 응답을 받아 주문 UUID를 기록합니다.
+    """
+    global scheduler
+    if scheduler is not None:
+        running = _running_jobs(scheduler)
+        # 새 실행을 멈추고 실행 중인 작업 취소
+        scheduler.shutdown(wait=False)
+        scheduler = None
+        if running:
+            logger.info(f"실행 중인 스케줄 작업 {len(running)}개의 종료를 기다립니다.")
+            await asyncio.gather(*running, return_exceptions=True)
 
 
 @asynccontextmanager
@@ -24,16 +84,84 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     engine = get_engine()
     async with engine.begin() as conn:
         await conn.run_sync(lambda _: None)  # 연결 테스트
+    # 읽기 엔진 (READ_DATABASE_URL이 없으면 primary와 같은 엔진)
+    read_engine = get_read_engine()
+    if read_engine is not engine:
+        async with read_engine.connect() as conn:
+            await conn.run_sync(lambda _: None)
+
+    # 외부 API 클라이언트(pyupbit/openai)는 시작 시 만들지 않고 처음 사용할 때 생성하여 프로세스에서 공유
+    # (조회 API만 처리하는 워커는 pandas/pyupbit/openai를 import하지 않아 부팅이 빨라짐)
+
+    # 트레이싱 exporter 구성 (워커 프로세스마다)
+    configure_tracing(settings)
+
+    # 메트릭: SQL 실행 시간, 이벤트 루프 지연, 커넥션 풀 상태
+    instrument_engine(engine)
+    instrument_engine(read_engine)
+    runtime_monitor = RuntimeMetricsMonitor(engine)
+    runtime_monitor.start()
 
     # 스케줄러 시작
-    # scheduler.add_job(trade_execution_job, "interval", seconds=30)
-    # scheduler.start()
+    # - all: 모든 워커가 스케줄링 (Named Lock으로 중복 실행 방지)
+    # - leader: 선출된 리더 워커만 스케줄링, 나머지 워커는 API만 처리
+    elector: Optional[LeaderElector] = None
+    if settings.SCHEDULER_MODE == "all":
+        await start_scheduler()
+    elif settings.SCHEDULER_MODE == "leader":
+        elector = LeaderElector(
+            lock_name=SCHEDULER_LEADER_LOCK,
+            on_elected=start_scheduler,
+            on_demoted=stop_scheduler,
+            interval=settings.LEADER_ELECTION_INTERVAL_SECONDS,
+        )
+        elector.start()
+
+    # 거래 작업 큐 소비자 시작 (queue 모드, 모든 워커 프로세스에서 실행)
+    worker_pool: Optional[TradeTaskWorkerPool] = None
+    if settings.TRADE_EXECUTION_MODE == "queue" and settings.TRADE_TASK_WORKERS > 0:
+        worker_pool = TradeTaskWorkerPool(
+            [
+                TradeTaskWorker(
+                    claim_timeout_seconds=settings.TRADE_TASK_CLAIM_TIMEOUT_SECONDS,
+                    max_attempts=settings.TRADE_TASK_MAX_ATTEMPTS,
+                    poll_interval=settings.TRADE_TASK_POLL_SECONDS,
+                )
+                for _ in range(settings.TRADE_TASK_WORKERS)
+            ]
+        )
+        worker_pool.start()
 
     yield
 
-    # 종료: 스케줄러 및 엔진 정리
-    scheduler.shutdown()
+    # 종료: 큐 소비자, 스케줄러 및 엔진 정리
+    if worker_pool is not None:
+        await worker_pool.stop()
+    if elector is not None:
+        await elector.stop()
+    await stop_scheduler()
+    await runtime_monitor.stop()
+    close_open_ai_client()
     await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
+    shutdown_tracing()
+
+
+def cors_origin_options(origins: List[str]) -> Dict[str, Any]:
+    """
+    CORSMiddleware의 허용 오리진 설정
+
+    프론트엔드는 read-your-writes 쿠키를 주고받기 위해 자격 증명(withCredentials)을 포함하여 요청하고,
+    브라우저는 자격 증명 요청의 응답에 Access-Control-Allow-Origin: *가 있으면 거부합니다.
+    따라서 CORS_ORIGINS="*"이면 모든 오리진을 허용하되 응답에는 요청 오리진을 그대로 돌려줍니다.
+
+    @param origins: 허용 오리진 목록 (settings.cors_origins_list)
+    @return: allow_origins/allow_origin_regex 인자
+    """
+    if "*" in origins:
+        return {"allow_origins": [], "allow_origin_regex": ".*"}
+    return {"allow_origins": origins}
 
 
 def create_app() -> FastAPI:
@@ -56,15 +184,24 @@ def create_app() -> FastAPI:
     # CORS 설정
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=settings.cors_origins_list,
+        **cors_origin_options(settings.cors_origins_list),
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
+    # 라우트별 요청 수/처리 시간 메트릭
+    app.add_middleware(MetricsMiddleware)
+
+    # 쓰기 요청 후 같은 클라이언트의 조회는 잠시 primary에서 (READ_DATABASE_URL 사용 시)
+    app.add_middleware(
+        ReadYourWritesMiddleware, window_seconds=settings.READ_YOUR_WRITES_SECONDS
+    )
+
     # API 라우터 등록
     app.include_router(
         v1_router,
     )
+    app.include_router(metrics_router)
 
     return app
@@ -0,0 +1,82 @@
+"""
+캔들 마감 트리거
+
+Upbit 캔들은 UTC 기준으로 구간이 나뉩니다.
+- 분 캔들: UTC 자정부터 N분 단위 (minute240은 00/04/08/12/16/20시)
+- 일 캔들: UTC 00:00 (KST 09:00)
+- 주 캔들: 월요일 UTC 00:00
+- 월 캔들: 매월 1일 UTC 00:00
+
+캔들이 마감되는 시각(다음 캔들의 시작 시각)에 offset을 더한 시점에 작업을 실행합니다.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from apscheduler.triggers.base import BaseTrigger
+
+from app.coin.model.enums import CandleInterval
+
+CANDLE_INTERVAL_MINUTES = {
+    CandleInterval.MINUTE1: 1,
+    CandleInterval.MINUTE3: 3,
+    CandleInterval.MINUTE5: 5,
+    CandleInterval.MINUTE10: 10,
+    CandleInterval.MINUTE15: 15,
+    CandleInterval.MINUTE30: 30,
+    CandleInterval.MINUTE60: 60,
+    CandleInterval.MINUTE240: 240,
+    CandleInterval.DAY: 1440,
+}
+
+
+def next_candle_close(interval: CandleInterval, after: datetime) -> datetime:
+    """
+    after 이후(after 제외) 처음으로 캔들이 마감되는 시각
+
+    @param interval: 캔들 간격
+    @param after: 기준 시각 (timezone-aware)
+    @return: 캔들 마감 시각 (UTC)
+    """
+    after = after.astimezone(timezone.utc)
+    midnight = after.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    if interval in CANDLE_INTERVAL_MINUTES:
+        step = timedelta(minutes=CANDLE_INTERVAL_MINUTES[interval])
+        return midnight + ((after - midnight) // step + 1) * step
+
+    if interval == CandleInterval.WEEK:
+        days_until_monday = 7 - midnight.weekday()
+        return midnight + timedelta(days=days_until_monday)
+
+    if interval == CandleInterval.MONTH:
+        if midnight.month == 12:
+            return midnight.replace(year=midnight.year + 1, month=1, day=1)
+        return midnight.replace(month=midnight.month + 1, day=1)
+
+    raise ValueError(f"지원하지 않는 캔들 간격입니다: {interval}")
+
+
+class CandleCloseTrigger(BaseTrigger):
+    """
+    캔들 마감 시각 + offset에 실행되는 APScheduler 트리거
+
+    @param interval: 캔들 간격
+    @param offset_seconds: 마감 후 실행까지 지연 (거래소가 캔들을 확정할 시간)
+    """
+
+    def __init__(self, interval: CandleInterval, offset_seconds: float = 0):
+        self.interval = CandleInterval(interval)
+        self.offset = timedelta(seconds=offset_seconds)
+
+    def get_next_fire_time(
+        self, previous_fire_time: Optional[datetime], now: datetime
+    ) -> Optional[datetime]:
+        base = previous_fire_time if previous_fire_time is not None else now
+        return next_candle_close(self.interval, base - self.offset) + self.offset
+
+    def __str__(self) -> str:
+        return f"candle_close[{self.interval.value}, offset={self.offset}]"
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} (interval='{self.interval.value}', offset={self.offset})>"
@@ -4,6 +4,9 @@
 .env 파일에서 환경 변수를 로드하고 검증합니다.
 """
 
+from functools import lru_cache
+from typing import Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -31,15 +34,95 @@ class Settings(BaseSettings):
     # UPBIT API
     UPBIT_ACCESS_KEY: str = ""  # .env에서 로드됨
     UPBIT_SECRET_KEY: str = ""  # .env에서 로드됨
+    # 주문 API 초당 요청 제한 (계정 단위, 모든 워커/호스트 합계를 DB rate_limits로 제한)
+    UPBIT_ORDER_RATE_PER_SECOND: int = 8
+
+    # 거래소 클라이언트 (live: 실제 Upbit API, simulated: 메모리 기반 시뮬레이션 거래소)
+    UPBIT_CLIENT: str = "live"
+    SIM_INITIAL_KRW: float = 10_000_000.0
+    SIM_ORDERBOOK_PATH: str = ""  # 기록된 호가창 JSON (비어 있으면 합성 호가창)
+    SIM_VOLATILITY: float = 0.001  # 호가 조회당 가격 변동성
+    SIM_LATENCY_MS: float = 0.0
+    SIM_LATENCY_JITTER_MS: float = 0.0
+    SIM_FAILURE_RATE: float = 0.0  # 호출당 실패 확률 (0~1)
+    SIM_SEED: Optional[int] = None
 
-    # 데이터베이스 (MySQL)
+    # 데이터베이스 (MySQL, 단일 노드는 SQLite도 가능: sqlite+aiosqlite:///joo_coin.db)
     DATABASE_URL: str = ""  # .env에서 로드됨
     DB_POOL_SIZE: int = 5
     DB_MAX_OVERFLOW: int = 10
+    # 읽기 전용 복제본 (비어 있으면 모든 조회를 DATABASE_URL에서)
+    READ_DATABASE_URL: str = ""
+    READ_DB_POOL_SIZE: int = 5
+    READ_DB_MAX_OVERFLOW: int = 10
+    READ_YOUR_WRITES_SECONDS: int = 5  # 쓰기 요청 후 같은 클라이언트의 조회를 primary에서 처리할 시간 (0이면 비활성화)
 
     # CORS (쉼표로 구분된 문자열, 예: "http://localhost:3000,http://localhost:8080")
+    # 프론트엔드는 read-your-writes 쿠키를 위해 자격 증명을 포함하여 요청하므로,
+    # "*"이면 모든 오리진을 허용하되 응답에는 요청 오리진을 그대로 돌려줌 (운영 환경에서는 오리진을 명시)
     CORS_ORIGINS: str = "*"
 
+    # 스케줄러 (off: 비활성화, all: 모든 워커에서 실행, leader: 선출된 리더 워커에서만 실행)
+    SCHEDULER_MODE: str = "off"
+    TRADE_INTERVAL_SECONDS: int = 30
+    SCHEDULER_MISFIRE_GRACE_SECONDS: int = 30
+    LEADER_ELECTION_INTERVAL_SECONDS: int = 10
+
+    # 실행 트리거 (interval: TRADE_INTERVAL_SECONDS 주기, candle: 코인별 캔들 마감 시점)
+    TRIGGER_MODE: str = "interval"
+    CANDLE_TRIGGER_OFFSET_SECONDS: int = 5
+    CANDLE_RECHECK_SECONDS: int = 0  # 캔들 중간 재확인 주기 (0이면 비활성화)
+    CANDLE_RECHECK_PRICE_CHANGE_PCT: float = (
+        3.0  # 재확인 시 재분석할 최소 가격 변동률 (%)
+    )
+
+    # 분산 락 (mysql: GET_LOCK, lease: leases 테이블 기반 lease + heartbeat, SQLite는 항상 lease)
+    LOCK_BACKEND: str = "mysql"
+    LEASE_TTL_SECONDS: int = 30
+
+    # 거래 실행 방식 (inline: 락을 잡은 워커가 모든 코인을 동시에 분석한 뒤 KRW를 배분하여 일괄 주문,
+    #                queue: 코인별 작업 큐, 작업 추가 시 KRW를 대상 코인들에 균등 배분)
+    TRADE_EXECUTION_MODE: str = "inline"
+    TRADE_TASK_WORKERS: int = (
+        1  # 프로세스당 큐 소비자 수 (queue 모드, 0이면 소비하지 않음)
+    )
+    TRADE_TASK_CLAIM_TIMEOUT_SECONDS: int = 300
+    TRADE_TASK_MAX_ATTEMPTS: int = 3
+    TRADE_TASK_POLL_SECONDS: float = 1.0
+    TRADE_ANALYSIS_CONCURRENCY: int = 8  # inline 모드에서 동시에 분석할 최대 코인 수
+
+    # 주문 체결 확인 (접수된 주문의 체결가/수량/수수료를 일괄 조회하여 거래 상태 확정)
+    ORDER_RECONCILE_INTERVAL_SECONDS: int = 5  # 0이면 비활성화
+    ORDER_RECONCILE_BATCH_SIZE: int = 500  # 1회 확인할 최대 미확정 주문 수
+    ORDER_RECONCILE_TIMEOUT_SECONDS: int = (
+        3600  # 거래소에서 주문을 찾지 못한 채 이 시간이 지나면 FAILED
+    )
+
+    # 잔고 스냅샷 (every: 매 실행 기록, change: 임계값 이상 변동했거나 heartbeat 간격이 지난 경우에만 기록)
+    BALANCE_SNAPSHOT_MODE: str = "change"
+    BALANCE_SNAPSHOT_THRESHOLD_PCT: float = (
+        0.5  # 직전 총 자산 대비 KRW/코인 평가액 변동률 (%)
+    )
+    BALANCE_SNAPSHOT_HEARTBEAT_SECONDS: int = 3600
+
+    # 거래 사유(trade_reasons) 압축 저장 (이 크기 이상의 사유만 zlib 압축)
+    TEXT_COMPRESSION: bool = True
+    TEXT_COMPRESSION_MIN_BYTES: int = 512
+
+    # 월별 파티션 관리 (trades/trade_reasons/balances, MySQL RANGE 파티션)
+    PARTITION_MAINTENANCE_INTERVAL_SECONDS: int = 86400  # 0이면 비활성화
+    PARTITION_PREMAKE_MONTHS: int = 3  # 이번 달 이후 미리 만들어 둘 파티션 개월 수
+    PARTITION_RETENTION_MONTHS: int = (
+        0  # 보관 개월 수 (지난 파티션은 내보낸 뒤 삭제, 0이면 삭제하지 않음)
+    )
+    PARTITION_ARCHIVE_DIR: str = "archive"  # 만료 파티션을 gzip CSV로 내보낼 디렉토리
+
+    # 트레이싱 (off: 비활성화, json: JSON Lines 파일, otlp: OpenTelemetry Collector OTLP/HTTP)
+    TRACING_EXPORTER: str = "off"
+    TRACING_JSON_PATH: str = "traces.jsonl"
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    TRACING_SERVICE_NAME: str = "joo-coin"
+
     @property
     def cors_origins_list(self) -> list[str]:
         """CORS 오리진을 리스트로 반환"""
@@ -50,5 +133,15 @@ class Settings(BaseSettings):
         ]
 
 
+@lru_cache
+def get_settings() -> Settings:
+    """
+    프로세스 단위 Settings 싱글톤
+
+    Settings()는 생성할 때마다 .env 파일을 다시 읽고 파싱하므로 한 번만 만들어 공유합니다.
+    """
+    return Settings()
+
+
 # 전역 설정 인스턴스
-settings = Settings()
+settings = get_settings()
@@ -0,0 +1,213 @@
+"""
+자동 거래 스케줄러 설정
+
+APScheduler를 다음 정책으로 구성합니다.
+- coalesce: 밀린 실행은 한 번으로 합쳐서 실행
+- max_instances=1: 이전 실행이 끝나지 않았으면 새 실행을 시작하지 않음
+- 실행마다 예정 시각 대비 지연(drift)을 기록
+
+TRIGGER_MODE=candle이면 고정 주기 대신 코인별 캔들 마감 시점에 실행합니다.
+접수된 주문의 체결 확인은 트리거와 관계없이 ORDER_RECONCILE_INTERVAL_SECONDS 주기로 실행합니다.
+월별 파티션 관리는 시작 직후 한 번, 이후 PARTITION_MAINTENANCE_INTERVAL_SECONDS 주기로 실행합니다.
+(파티션이 없는 SQLite에서는 등록하지 않음)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from logging import Logger
+from typing import Dict, Optional
+
+from apscheduler.events import (
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_SUBMITTED,
+    JobSubmissionEvent,
+)
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.base import BaseTrigger
+
+from app.coin.model.enums import CandleInterval
+from app.common.model.base import is_sqlite
+from app.configs.candle_trigger import CandleCloseTrigger
+from app.configs.config import settings
+from app.configs.scheduling_tasks import (
+    get_active_candle_intervals,
+    order_reconcile_job,
+    partition_maintenance_job,
+    trade_execution_job,
+)
+
+logger = Logger(__name__)
+
+TRADE_EXECUTION_JOB_ID = "trade_execution"
+CANDLE_CLOSE_JOB_PREFIX = "candle_close:"
+CANDLE_RECHECK_JOB_ID = "candle_recheck"
+CANDLE_JOB_SYNC_JOB_ID = "candle_job_sync"
+CANDLE_JOB_SYNC_SECONDS = 60
+ORDER_RECONCILE_JOB_ID = "order_reconcile"
+PARTITION_MAINTENANCE_JOB_ID = "partition_maintenance"
+
+
+@dataclass
+class SchedulerStats:
+    """스케줄러 실행 통계"""
+
+    runs: int = 0
+    coalesced_ticks: int = 0
+    skipped_overlaps: int = 0
+    last_drift_ms: Optional[float] = None
+    max_drift_ms: float = 0.0
+
+
+scheduler_stats = SchedulerStats()
+
+# 작업별 직전 실행(또는 건너뛴 실행)의 예정 시각 (합쳐진 tick 수 계산용)
+_last_scheduled_at: Dict[str, datetime] = {}
+
+# 합쳐진 tick 수 계산 시 확인할 최대 tick 수 (장시간 중단 후 재개 시 과도한 반복 방지)
+MAX_COUNTED_TICKS = 10_000
+
+
+def _count_skipped_ticks(
+    trigger: BaseTrigger, previous: datetime, scheduled_at: datetime
+) -> int:
+    """직전 예정 시각과 이번 예정 시각 사이에 트리거가 발생했어야 하는 횟수"""
+    count = 0
+    fire_time = trigger.get_next_fire_time(previous, previous)
+    while fire_time is not None and fire_time < scheduled_at:
+        count += 1
+        if count >= MAX_COUNTED_TICKS:
+            break
+        fire_time = trigger.get_next_fire_time(fire_time, fire_time)
+    return count
+
+
+def _on_job_submitted(scheduler: AsyncIOScheduler, event: JobSubmissionEvent) -> None:
+    """
+    작업 실행 시 예정 시각 대비 지연 및 합쳐진 tick 수 기록
+
+    coalesce이면 APScheduler는 밀린 예정 시각 중 마지막 하나만 전달하므로,
+    합쳐진 tick 수는 직전 예정 시각부터 트리거를 다시 계산하여 셉니다.
+    """
+    scheduled_at = event.scheduled_run_times[-1]
+    drift_ms = (datetime.now(timezone.utc) - scheduled_at).total_seconds() * 1000
+
+    coalesced = len(event.scheduled_run_times) - 1
+    previous = _last_scheduled_at.get(event.job_id)
+    job = scheduler.get_job(event.job_id)
+    if previous is not None and job is not None:
+        coalesced = _count_skipped_ticks(job.trigger, previous, scheduled_at)
+    _last_scheduled_at[event.job_id] = scheduled_at
+
+    scheduler_stats.runs += 1
+    scheduler_stats.coalesced_ticks += coalesced
+    scheduler_stats.last_drift_ms = drift_ms
+    scheduler_stats.max_drift_ms = max(scheduler_stats.max_drift_ms, drift_ms)
+
+    logger.info(
+        f"⏱️ 스케줄 실행: {event.job_id} (drift: {drift_ms:.1f}ms, 합쳐진 tick: {coalesced})"
+    )
+
+
+def _on_job_max_instances(event: JobSubmissionEvent) -> None:
+    """이전 실행이 진행 중이라 건너뛴 실행 기록"""
+    _last_scheduled_at[event.job_id] = event.scheduled_run_times[-1]
+    scheduler_stats.skipped_overlaps += 1
+    logger.info(f"⏭️ 이전 실행이 진행 중이라 건너뜁니다: {event.job_id}")
+
+
+def create_scheduler() -> AsyncIOScheduler:
+    """
+    자동 거래 작업이 등록된 스케줄러 생성
+
+    @return: 시작되지 않은 AsyncIOScheduler
+    """
+    scheduler = AsyncIOScheduler(
+        job_defaults={
+            "coalesce": True,
+            "max_instances": 1,
+            "misfire_grace_time": settings.SCHEDULER_MISFIRE_GRACE_SECONDS,
+        },
+        timezone=timezone.utc,
+    )
+    scheduler.add_listener(
+        lambda event: _on_job_submitted(scheduler, event), EVENT_JOB_SUBMITTED
+    )
+    scheduler.add_listener(_on_job_max_instances, EVENT_JOB_MAX_INSTANCES)
+
+    if settings.TRIGGER_MODE == "candle":
+        _add_candle_jobs(scheduler)
+    else:
+        scheduler.add_job(
+            trade_execution_job,
+            "interval",
+            seconds=settings.TRADE_INTERVAL_SECONDS,
+            id=TRADE_EXECUTION_JOB_ID,
+        )
+
+    if settings.ORDER_RECONCILE_INTERVAL_SECONDS > 0:
+        scheduler.add_job(
+            order_reconcile_job,
+            "interval",
+            seconds=settings.ORDER_RECONCILE_INTERVAL_SECONDS,
+            id=ORDER_RECONCILE_JOB_ID,
+        )
+
+    if settings.PARTITION_MAINTENANCE_INTERVAL_SECONDS > 0 and not is_sqlite():
+        scheduler.add_job(
+            partition_maintenance_job,
+            "interval",
+            seconds=settings.PARTITION_MAINTENANCE_INTERVAL_SECONDS,
+            id=PARTITION_MAINTENANCE_JOB_ID,
+            next_run_time=datetime.now(timezone.utc),
+        )
+    return scheduler
+
+
+def _add_candle_jobs(scheduler: AsyncIOScheduler) -> None:
+    """
+    캔들 마감 트리거 작업 등록
+
+    활성 코인들이 사용하는 캔들 간격마다 마감 시점 작업을 하나씩 유지하도록
+    주기적으로 동기화하고, 설정된 경우 캔들 중간 재확인 작업을 등록합니다.
+    """
+
+    async def sync_candle_jobs() -> None:
+        intervals = set(await get_active_candle_intervals())
+        registered = {
+            job.id[len(CANDLE_CLOSE_JOB_PREFIX) :]
+            for job in scheduler.get_jobs()
+            if job.id.startswith(CANDLE_CLOSE_JOB_PREFIX)
+        }
+
+        for interval in intervals - registered:
+            scheduler.add_job(
+                trade_execution_job,
+                CandleCloseTrigger(
+                    CandleInterval(interval),
+                    offset_seconds=settings.CANDLE_TRIGGER_OFFSET_SECONDS,
+                ),
+                kwargs={"candle_interval": interval},
+                id=f"{CANDLE_CLOSE_JOB_PREFIX}{interval}",
+            )
+            logger.info(f"🕯️ 캔들 마감 작업 등록: {interval}")
+
+        for interval in registered - intervals:
+            scheduler.remove_job(f"{CANDLE_CLOSE_JOB_PREFIX}{interval}")
+            logger.info(f"🕯️ 캔들 마감 작업 제거: {interval}")
+
+    scheduler.add_job(
+        sync_candle_jobs,
+        "interval",
+        seconds=CANDLE_JOB_SYNC_SECONDS,
+        id=CANDLE_JOB_SYNC_JOB_ID,
+        next_run_time=datetime.now(timezone.utc),
+    )
+
+    if settings.CANDLE_RECHECK_SECONDS > 0:
+        scheduler.add_job(
+            trade_execution_job,
+            "interval",
+            seconds=settings.CANDLE_RECHECK_SECONDS,
+            kwargs={"price_change_pct": settings.CANDLE_RECHECK_PRICE_CHANGE_PCT},
+            id=CANDLE_RECHECK_JOB_ID,
+        )
@@ -1,24 +1,53 @@
+import time
 import traceback
 from logging import Logger
+from typing import List, Optional
 
-from app.common.model.base import get_session_maker
+from app.ai.di.open_ai_di import get_open_ai_client
+from app.coin.repository.coin_repository import CoinRepository
+from app.common.model.base import get_session_maker, read_from_primary
 from app.common.named_lock import named_lock
+from app.common.partition_maintenance import PartitionMaintenance
+from app.configs.config import settings
+from app.trade.service.order_reconcile_service import OrderReconcileService
 from app.trade.service.trade_service import TradeService
+from app.upbit.di.upbit_di import get_upbit_client
 
 logger = Logger(__name__)
 
 
-async def trade_execution_job() -> None:
+async def trade_execution_job(
+    candle_interval: Optional[str] = None,
+    price_change_pct: Optional[float] = None,
+) -> None:
     """
     주기적으로 실행되는 자동 거래 작업
 
     모든 활성화된 코인에 대해 AI 분석을 수행하고 거래를 실행합니다.
-    MySQL Named Lock을 사용하여 여러 워커에서 동시 실행을 방지합니다.
+    candle_interval이 주어지면 해당 캔들 간격의 코인만, price_change_pct가 주어지면
+    마지막 분석 이후 가격이 크게 움직인 코인만 대상으로 합니다.
+    분산 락(named_lock)을 사용하여 여러 워커에서 동시 실행을 방지하고,
+    lease 백엔드인 경우 fencing token으로 락을 잃은 뒤의 거래 기록을 막습니다.
+
+    queue 모드에서는 코인별 작업을 큐에 추가만 하고, 처리는 각 워커의 큐 소비자가 담당합니다.
+    실행마다 트리거와 락 획득 시간을 trade_runs에 함께 기록합니다.
     """
 
+    # 트리거별로 락을 분리하여 같은 시각에 마감되는 캔들 간격끼리 서로 건너뛰지 않도록 함
+    lock_name = "trade_execution"
+    trigger = "interval"
+    if candle_interval is not None:
+        lock_name = f"trade_execution:{candle_interval}"
+        trigger = f"candle:{candle_interval}"
+    elif price_change_pct is not None:
+        lock_name = "trade_execution:recheck"
+        trigger = "recheck"
+
     # Named Lock 획득 시도 (즉시 반환, 대기 없음)
-    async with named_lock("trade_execution", timeout=0) as acquired:
-        if not acquired:
+    lock_started = time.perf_counter()
+    async with named_lock(lock_name, timeout=0) as lock:
+        lock_wait_ms = (time.perf_counter() - lock_started) * 1000
+        if not lock:
             logger.info("🤩 다른 워커가 거래 작업을 실행 중입니다. 스킵합니다.")
             return
 
@@ -26,9 +55,85 @@ async def trade_execution_job() -> None:
 
         try:
             async with session_maker() as session:
-                trade_service = TradeService(session=session)
-                logger.info("🚀 자동 거래 작업 시작")
-                await trade_service.execute()
+                trade_service = TradeService(
+                    session=session,
+                    upbit_client=get_upbit_client(),
+                    ai_client=get_open_ai_client(),
+                    fencing=lock.fencing,
+                )
+                # 활성 코인/직전 잔고 등 실행 판단에 쓰는 조회는 복제 지연 없이 primary에서
+                with read_from_primary():
+                    if settings.TRADE_EXECUTION_MODE == "queue":
+                        count = await trade_service.enqueue_tasks(
+                            candle_interval=candle_interval,
+                            price_change_pct=price_change_pct,
+                            trigger=trigger,
+                            lock_wait_ms=lock_wait_ms,
+                        )
+                        logger.info(f"📥 코인별 거래 작업 {count}건 추가")
+                    else:
+                        logger.info("🚀 자동 거래 작업 시작")
+                        await trade_service.execute(
+                            candle_interval=candle_interval,
+                            price_change_pct=price_change_pct,
+                            trigger=trigger,
+                            lock_wait_ms=lock_wait_ms,
+                            analysis_concurrency=settings.TRADE_ANALYSIS_CONCURRENCY,
+                        )
 
         except Exception as e:
             logger.error(f"거래 실행 중 오류 발생: {str(e)}\n{traceback.format_exc()}")
+
+
+async def order_reconcile_job() -> None:
+    """
+    주기적으로 실행되는 주문 체결 확인 작업
+
+    거래 실행이 접수만 하고 남긴 PENDING 주문들을 한 번에 조회하여 체결 결과를 기록합니다.
+    거래 실행과 락을 분리하여, 거래 실행 중에도 이전 주문의 체결 확인이 밀리지 않도록 합니다.
+    """
+    async with named_lock("order_reconcile", timeout=0) as lock:
+        if not lock:
+            return
+
+        try:
+            async with get_session_maker()() as session:
+                await OrderReconcileService(
+                    session=session,
+                    upbit_client=get_upbit_client(),
+                    timeout_seconds=settings.ORDER_RECONCILE_TIMEOUT_SECONDS,
+                ).reconcile(limit=settings.ORDER_RECONCILE_BATCH_SIZE)
+        except Exception as e:
+            logger.error(
+                f"주문 체결 확인 중 오류 발생: {str(e)}\n{traceback.format_exc()}"
+            )
+
+
+async def partition_maintenance_job() -> None:
+    """
+    주기적으로 실행되는 월별 파티션 관리 작업
+
+    앞으로 쓸 월 파티션을 미리 만들고, 보관 기간이 지난 파티션은 gzip CSV로 내보낸 뒤 삭제합니다.
+    """
+    async with named_lock("partition_maintenance", timeout=0) as lock:
+        if not lock:
+            return
+
+        try:
+            async with get_session_maker()() as session:
+                await PartitionMaintenance(
+                    session=session,
+                    archive_dir=settings.PARTITION_ARCHIVE_DIR,
+                    retention_months=settings.PARTITION_RETENTION_MONTHS,
+                    premake_months=settings.PARTITION_PREMAKE_MONTHS,
+                ).run()
+        except Exception as e:
+            logger.error(
+                f"파티션 관리 중 오류 발생: {str(e)}\n{traceback.format_exc()}"
+            )
+
+
+async def get_active_candle_intervals() -> List[str]:
+    """활성 코인들이 사용하는 캔들 간격 목록 조회 (캔들 마감 트리거 동기화용)"""
+    async with get_session_maker()() as session:
+        return await CoinRepository(session).get_active_candle_intervals()
@@ -0,0 +1,39 @@
+"""
+Position Controller
+"""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.model.base import get_session
+from app.position.dto.position_response import PositionsResponse
+from app.position.service.position_service import PositionService
+from app.upbit.client.upbit_client import UpbitClient
+from app.upbit.di.upbit_di import get_upbit_client
+
+position_router = APIRouter(prefix="/positions", tags=["Position"])
+
+
+@position_router.get(
+    "",
+    summary="코인별 손익 조회",
+    description="코인별 보유 수량, 평균 단가, 실현 손익(FIFO)과 현재가 기준 미실현 손익을 반환합니다.",
+    response_model=PositionsResponse,
+)
+async def get_positions(
+    session: AsyncSession = Depends(get_session),
+    upbit_client: UpbitClient = Depends(get_upbit_client),
+) -> PositionsResponse:
+    """
+    코인별 손익 조회
+
+    체결이 확정된 거래(SUCCESS/PARTIAL_SUCCESS)가 반영된 포지션 원장을 읽으므로
+    거래 내역 전체를 다시 계산하지 않습니다.
+
+    **각 항목 정보:**
+    - 보유 수량, 평균 취득 단가 (수수료 포함), 취득 원가
+    - 실현 손익: 매도 대금(수수료 차감) - FIFO로 소진한 매수 로트의 원가
+    - 현재가, 평가 금액, 미실현 손익/수익률 (현재가 조회 실패 시 null)
+    """
+    position_service = PositionService(session, upbit_client)
+    return await position_service.get_positions()
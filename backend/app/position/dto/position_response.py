@@ -0,0 +1,45 @@
+"""
+Position Response DTO
+"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class PositionItemResponse(BaseModel):
+    """코인별 포지션 응답 DTO"""
+
+    coin_id: int = Field(description="코인 ID")
+    coin_name: Optional[str] = Field(description="코인 이름")
+    quantity: float = Field(description="보유 수량 (원장 기준, 남은 매수 로트 합계)")
+    average_cost: Optional[float] = Field(
+        description="평균 취득 단가 (수수료 포함, 보유 수량이 없으면 null)"
+    )
+    cost_basis: float = Field(description="보유 수량의 취득 원가 합계 (KRW)")
+    realized_pnl: float = Field(description="실현 손익 (KRW, FIFO, 수수료 반영)")
+    fees_paid: float = Field(description="누적 수수료 (KRW)")
+    current_price: Optional[float] = Field(
+        description="현재가 (보유 수량이 없거나 조회 실패 시 null)"
+    )
+    market_value: Optional[float] = Field(description="평가 금액 (보유 수량 × 현재가)")
+    unrealized_pnl: Optional[float] = Field(
+        description="미실현 손익 (평가 금액 - 취득 원가)"
+    )
+    unrealized_pnl_pct: Optional[float] = Field(
+        description="미실현 수익률 (%, 취득 원가 대비)"
+    )
+
+
+class PositionsResponse(BaseModel):
+    """포지션 목록 응답 DTO"""
+
+    items: List[PositionItemResponse] = Field(description="코인별 포지션 목록")
+    total_realized_pnl: float = Field(description="전체 실현 손익 (KRW)")
+    total_unrealized_pnl: float = Field(
+        description="전체 미실현 손익 (KRW, 현재가를 조회한 코인만)"
+    )
+    total_cost_basis: float = Field(description="전체 취득 원가 (KRW)")
+    total_market_value: float = Field(
+        description="전체 평가 금액 (KRW, 현재가를 조회한 코인만)"
+    )
@@ -0,0 +1,67 @@
+"""
+Position 엔티티
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Numeric
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.common.model.base import AutoIncrementId, Base
+
+
+class Position(Base):
+    """
+    코인별 보유 포지션 (코인 1개당 1행)
+
+    체결이 확정된 거래(SUCCESS/PARTIAL_SUCCESS)가 반영될 때마다 증분 갱신됩니다.
+    - quantity/cost_basis: 남은 매수 로트(PositionLot)의 수량 합계와 취득 원가 합계
+    - realized_pnl: 매도 시 FIFO로 소진한 로트의 원가 대비 실현 손익 (수수료 반영)
+    """
+
+    __tablename__ = "positions"
+
+    coin_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("coins.id"), primary_key=True, autoincrement=False
+    )
+    quantity: Mapped[Decimal] = mapped_column(
+        Numeric(20, 8), nullable=False, default=Decimal("0")
+    )
+    cost_basis: Mapped[Decimal] = mapped_column(
+        Numeric(20, 8), nullable=False, default=Decimal("0")
+    )
+    realized_pnl: Mapped[Decimal] = mapped_column(
+        Numeric(20, 8), nullable=False, default=Decimal("0")
+    )
+    fees_paid: Mapped[Decimal] = mapped_column(
+        Numeric(20, 8), nullable=False, default=Decimal("0")
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+
+    coin = relationship("Coin")
+
+
+class PositionLot(Base):
+    """
+    매수 로트 (체결된 매수 거래 1건당 1행)
+
+    unit_cost는 매수 수수료를 포함한 단위 취득 원가입니다.
+    매도 시 오래된 로트부터 remaining_quantity를 줄이고, 모두 소진된 로트는 삭제합니다.
+    """
+
+    __tablename__ = "position_lots"
+    __table_args__ = (Index("idx_position_lots_coin_id_id", "coin_id", "id"),)
+
+    id: Mapped[int] = mapped_column(
+        AutoIncrementId, primary_key=True, autoincrement=True
+    )
+    coin_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("coins.id"), nullable=False
+    )
+    trade_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    remaining_quantity: Mapped[Decimal] = mapped_column(Numeric(20, 8), nullable=False)
+    unit_cost: Mapped[Decimal] = mapped_column(Numeric(20, 8), nullable=False)
+    opened_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
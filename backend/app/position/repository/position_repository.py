@@ -0,0 +1,48 @@
+"""
+Position Repository
+"""
+
+from typing import List, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.common.repository.base_repository import BaseRepository
+from app.position.model.position import Position, PositionLot
+
+
+class PositionRepository(BaseRepository[Position]):
+    """Position/PositionLot 조회"""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(Position, session)
+
+    async def get_by_coin_ids(self, coin_ids: Sequence[int]) -> List[Position]:
+        """코인들의 포지션 조회 (갱신용)"""
+        result = await self.session.execute(
+            select(Position).where(Position.coin_id.in_(coin_ids))
+        )
+        return list(result.scalars().all())
+
+    async def get_open_lots(self, coin_ids: Sequence[int]) -> List[PositionLot]:
+        """
+        코인들의 남은 매수 로트 조회
+
+        @return: 코인별로 오래된 로트 먼저 (coin_id, id 오름차순)
+        """
+        result = await self.session.execute(
+            select(PositionLot)
+            .where(PositionLot.coin_id.in_(coin_ids))
+            .order_by(PositionLot.coin_id, PositionLot.id)
+        )
+        return list(result.scalars().all())
+
+    async def get_all_with_coin(self) -> List[Position]:
+        """모든 포지션을 코인 정보와 함께 조회 (코인 수만큼의 행)"""
+        result = await self.session.execute(
+            select(Position)
+            .options(selectinload(Position.coin))
+            .order_by(Position.coin_id)
+        )
+        return list(result.scalars().all())
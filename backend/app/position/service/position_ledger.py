@@ -0,0 +1,208 @@
+"""
+포지션 원장 (FIFO 원가 기준)
+
+체결이 확정된 거래를 코인별 포지션에 증분 반영합니다.
+- 매수: 체결 수량/평균 체결가/수수료로 매수 로트를 추가 (단위 원가에 수수료 포함)
+- 매도: 오래된 로트부터 소진하며, 매도 대금(수수료 차감) - 소진한 로트의 원가를 실현 손익으로 누적
+
+OrderReconcileService가 체결을 확정하는 같은 트랜잭션에서 호출하므로,
+거래 1건은 상태가 확정될 때 정확히 한 번 반영됩니다.
+조회는 positions(코인 수만큼의 행)만 읽으면 되므로 거래 내역을 다시 훑지 않습니다.
+"""
+
+from collections import defaultdict, deque
+from datetime import datetime
+from decimal import Decimal
+from logging import Logger
+from typing import Deque, Dict, List, Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.position.model.position import Position, PositionLot
+from app.position.repository.position_repository import PositionRepository
+from app.trade.model.enums import TradeStatus, TradeType
+from app.trade.model.trade import Trade
+
+logger = Logger(__name__)
+
+ZERO = Decimal("0")
+# 체결 수량이 있는 확정 상태 (부분 체결도 체결된 수량만큼 반영)
+FILLED_STATUSES = (TradeStatus.SUCCESS, TradeStatus.PARTIAL_SUCCESS)
+
+
+def new_position(coin_id: int) -> Position:
+    """빈 포지션"""
+    return Position(
+        coin_id=coin_id,
+        quantity=ZERO,
+        cost_basis=ZERO,
+        realized_pnl=ZERO,
+        fees_paid=ZERO,
+    )
+
+
+def apply_buy(
+    position: Position,
+    lots: Deque[PositionLot],
+    trade_id: int,
+    volume: Decimal,
+    price: Decimal,
+    fee: Decimal,
+    at: datetime,
+) -> PositionLot:
+    """
+    매수 체결 반영
+
+    @param position: 코인 포지션
+    @param lots: 코인의 남은 로트 (오래된 순, 새 로트를 뒤에 추가)
+    @param trade_id: 매수 거래 ID
+    @param volume: 체결 수량
+    @param price: 평균 체결가
+    @param fee: 수수료 (KRW)
+    @param at: 체결 시각
+    @return: 새 로트
+    """
+    cost = price * volume + fee
+    lot = PositionLot(
+        coin_id=position.coin_id,
+        trade_id=trade_id,
+        remaining_quantity=volume,
+        unit_cost=cost / volume,
+        opened_at=at,
+    )
+    lots.append(lot)
+    position.quantity += volume
+    position.cost_basis += cost
+    position.fees_paid += fee
+    return lot
+
+
+def apply_sell(
+    position: Position,
+    lots: Deque[PositionLot],
+    volume: Decimal,
+    price: Decimal,
+    fee: Decimal,
+) -> List[PositionLot]:
+    """
+    매도 체결 반영 (FIFO)
+
+    원장보다 많은 수량을 매도한 경우(원장 도입 전부터 보유한 코인 등),
+    원가를 알 수 없는 초과분은 실현 손익에 포함하지 않습니다.
+
+    @param position: 코인 포지션
+    @param lots: 코인의 남은 로트 (오래된 순, 소진한 로트는 앞에서 제거)
+    @param volume: 체결 수량
+    @param price: 평균 체결가
+    @param fee: 수수료 (KRW)
+    @return: 모두 소진된 로트 목록 (삭제 대상)
+    """
+    remaining = volume
+    cost = ZERO
+    exhausted: List[PositionLot] = []
+    while remaining > 0 and lots:
+        lot = lots[0]
+        take = min(remaining, lot.remaining_quantity)
+        cost += take * lot.unit_cost
+        lot.remaining_quantity -= take
+        remaining -= take
+        if lot.remaining_quantity <= 0:
+            exhausted.append(lots.popleft())
+
+    matched = volume - remaining
+    if remaining > 0:
+        logger.warning(
+            f"코인 {position.coin_id}: 원장에 없는 수량 {remaining} 매도 (실현 손익에서 제외)"
+        )
+    if matched > 0:
+        proceeds = price * matched - fee * matched / volume
+        position.realized_pnl += proceeds - cost
+        position.quantity -= matched
+        position.cost_basis -= cost
+    if not lots:
+        # 반올림 오차 정리
+        position.quantity = ZERO
+        position.cost_basis = ZERO
+    position.fees_paid += fee
+    return exhausted
+
+
+class PositionLedger:
+    """
+    확정된 거래를 포지션 원장에 반영
+
+    @param session: 데이터베이스 세션 (커밋은 호출자가 함)
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.repository = PositionRepository(session)
+
+    async def apply(self, trades: List[Trade], now: Optional[datetime] = None) -> int:
+        """
+        체결이 확정된 거래들을 포지션에 반영 (세션에만 반영, 커밋하지 않음)
+
+        @param trades: 상태가 확정된 거래 목록 (체결 수량이 없는 거래는 무시)
+        @param now: 갱신 시각 (기본: utcnow)
+        @return: 반영한 거래 수
+        """
+        fills = sorted(
+            (
+                trade
+                for trade in trades
+                if trade.status in FILLED_STATUSES
+                and trade.coin_id is not None
+                and trade.filled_volume
+                and trade.filled_price is not None
+            ),
+            key=lambda trade: trade.id,
+        )
+        if not fills:
+            return 0
+
+        now = now or datetime.utcnow()
+        coin_ids = sorted({trade.coin_id for trade in fills})
+        positions: Dict[int, Position] = {
+            position.coin_id: position
+            for position in await self.repository.get_by_coin_ids(coin_ids)
+        }
+        lots: Dict[int, Deque[PositionLot]] = defaultdict(deque)
+        for lot in await self.repository.get_open_lots(coin_ids):
+            lots[lot.coin_id].append(lot)
+
+        for trade in fills:
+            position = positions.get(trade.coin_id)
+            if position is None:
+                position = positions[trade.coin_id] = new_position(trade.coin_id)
+                self.session.add(position)
+
+            fee = trade.paid_fee or ZERO
+            if trade.trade_type == TradeType.BUY.value:
+                self.session.add(
+                    apply_buy(
+                        position,
+                        lots[trade.coin_id],
+                        trade.id,
+                        trade.filled_volume,
+                        trade.filled_price,
+                        fee,
+                        trade.filled_at or now,
+                    )
+                )
+            elif trade.trade_type == TradeType.SELL.value:
+                for lot in apply_sell(
+                    position,
+                    lots[trade.coin_id],
+                    trade.filled_volume,
+                    trade.filled_price,
+                    fee,
+                ):
+                    if inspect(lot).persistent:
+                        await self.session.delete(lot)
+                    else:
+                        # 같은 배치에서 추가되었다가 소진된 로트
+                        self.session.expunge(lot)
+            position.updated_at = now
+
+        return len(fills)
@@ -0,0 +1,95 @@
+"""
+Position Service
+"""
+
+import asyncio
+from logging import Logger
+from typing import Dict, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.position.dto.position_response import PositionItemResponse, PositionsResponse
+from app.position.model.position import Position
+from app.position.repository.position_repository import PositionRepository
+from app.upbit.client.upbit_client import UpbitClient
+
+logger = Logger(__name__)
+
+
+class PositionService:
+    """
+    포지션 조회 비즈니스 로직
+
+    @param session: 데이터베이스 세션
+    @param upbit_client: 프로세스에서 공유하는 Upbit 클라이언트 (현재가 조회)
+    """
+
+    def __init__(self, session: AsyncSession, upbit_client: UpbitClient):
+        self.position_repository = PositionRepository(session)
+        self.upbit_client = upbit_client
+
+    async def get_positions(self) -> PositionsResponse:
+        """
+        코인별 실현/미실현 손익 조회
+
+        positions(코인 수만큼의 행)와 보유 코인의 현재가(1회 요청)만 사용합니다.
+
+        @return: 코인별 포지션과 합계
+        """
+        positions = await self.position_repository.get_all_with_coin()
+        prices = await self._current_prices(positions)
+
+        items = [self._to_item(position, prices) for position in positions]
+        return PositionsResponse(
+            items=items,
+            total_realized_pnl=sum(item.realized_pnl for item in items),
+            total_unrealized_pnl=sum(item.unrealized_pnl or 0.0 for item in items),
+            total_cost_basis=sum(item.cost_basis for item in items),
+            total_market_value=sum(item.market_value or 0.0 for item in items),
+        )
+
+    async def _current_prices(self, positions: List[Position]) -> Dict[str, float]:
+        """보유 수량이 있는 코인의 현재가 (조회 실패 시 빈 값)"""
+        coin_names = [
+            position.coin.name
+            for position in positions
+            if position.quantity > 0 and position.coin is not None
+        ]
+        if not coin_names:
+            return {}
+        try:
+            return await asyncio.to_thread(
+                self.upbit_client.get_current_prices, coin_names
+            )
+        except Exception as e:
+            logger.warning(f"현재가 조회 실패, 미실현 손익 없이 반환: {str(e)}")
+            return {}
+
+    @staticmethod
+    def _to_item(position: Position, prices: Dict[str, float]) -> PositionItemResponse:
+        """Position 엔티티를 응답 항목으로 변환"""
+        coin_name = position.coin.name if position.coin else None
+        quantity = float(position.quantity)
+        cost_basis = float(position.cost_basis)
+        current_price = prices.get(coin_name) if quantity > 0 else None
+
+        market_value = unrealized_pnl = unrealized_pnl_pct = None
+        if current_price is not None:
+            market_value = quantity * current_price
+            unrealized_pnl = market_value - cost_basis
+            if cost_basis > 0:
+                unrealized_pnl_pct = unrealized_pnl / cost_basis * 100
+
+        return PositionItemResponse(
+            coin_id=position.coin_id,
+            coin_name=coin_name,
+            quantity=quantity,
+            average_cost=cost_basis / quantity if quantity > 0 else None,
+            cost_basis=cost_basis,
+            realized_pnl=float(position.realized_pnl),
+            fees_paid=float(position.fees_paid),
+            current_price=current_price,
+            market_value=market_value,
+            unrealized_pnl=unrealized_pnl,
+            unrealized_pnl_pct=unrealized_pnl_pct,
+        )
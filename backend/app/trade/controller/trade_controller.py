@@ -1,8 +1,25 @@
+from datetime import datetime
 from typing import Optional
 
 from app.common.model.base import get_session
-from app.trade.dto.transaction_response import TransactionsResponse
+from app.trade.di.trade_di import (
+    get_decision_stats_cache,
+    get_trade_service,
+    get_transaction_query_service,
+)
+from app.trade.dto.decision_stats_response import DecisionStatsResponse
+from app.trade.dto.trade_run_response import TradeRunsResponse
+from app.trade.dto.transaction_response import (
+    TransactionItemResponse,
+    TransactionsResponse,
+)
+from app.trade.service.decision_stats_service import (
+    DecisionStatsCache,
+    DecisionStatsService,
+)
+from app.trade.service.trade_run_service import TradeRunService
 from app.trade.service.trade_service import TradeService
+from app.trade.service.transaction_query_service import TransactionQueryService
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,9 +31,10 @@ trade_router = APIRouter(prefix="/trade", tags=["Trade"])
     summary="즉시 트레이드 실행",
     description="등록 해놓은 코인을 기반으로 즉시 트레이드를 실행합니다.",
 )
-async def execute_trades(session: AsyncSession = Depends(get_session)) -> None:
+async def execute_trades(
+    trade_service: TradeService = Depends(get_trade_service),
+) -> None:
     """트레이드 실행 엔드포인트"""
-    trade_service = TradeService(session)
     await trade_service.execute()
 
 
@@ -41,7 +59,15 @@ async def get_transactions(
         le=100,
         description="페이지당 조회할 항목 수 (1-100, 기본값: 20)",
     ),
-    session: AsyncSession = Depends(get_session),
+    since: Optional[datetime] = Query(
+        None,
+        description="이 시각 이후의 거래만 조회 (예: 2026-10-01T00:00:00, 지정 시 해당 기간의 파티션만 읽음)",
+    ),
+    include_reasons: bool = Query(
+        False,
+        description="AI 분석 결과/실행 사유 포함 여부 (기본: 제외, 상세 조회 API로 개별 조회)",
+    ),
+    query_service: TransactionQueryService = Depends(get_transaction_query_service),
 ) -> TransactionsResponse:
     """
     내 거래 내역 조회 (Cursor 기반 페이지네이션)
@@ -52,6 +78,8 @@ async def get_transactions(
     1. 첫 페이지: `GET /transactions?limit=20`
     2. 다음 페이지: 응답의 `next_cursor` 값을 사용하여 `GET /transactions?cursor={next_cursor}&limit=20`
     3. `has_next`가 `false`이면 마지막 페이지
+    4. 최근 거래만 필요하면 `since`를 지정 (오래된 월 파티션을 읽지 않음)
+    5. 사유는 `GET /transactions/{trade_id}`로 펼칠 때 조회 (`include_reasons=true`면 목록에 포함)
 
     **각 거래 항목 정보:**
     - 코인 정보 (ID, 이름)
@@ -59,10 +87,159 @@ async def get_transactions(
     - 거래 가격 및 수량
     - 위험도 (none/low/medium/high)
     - 거래 상태 (pending/success/partial_success/failed/no_action)
+    - AI 분석 결과 (ai_reason), 거래 실행 사유 (execution_reason): `include_reasons=true`일 때만 포함
+    """
+    return await query_service.get_transactions(
+        cursor=cursor,
+        limit=limit,
+        trade_type=trade_type,
+        since=since,
+        include_reasons=include_reasons,
+    )
+
+
+@trade_router.get(
+    "/transactions/search",
+    summary="거래 사유 검색",
+    description="AI 분석 결과/실행 사유에 검색어가 포함된 거래를 최신순으로 페이지네이션하여 반환합니다.",
+    response_model=TransactionsResponse,
+)
+async def search_transactions(
+    q: str = Query(
+        ...,
+        min_length=2,
+        max_length=100,
+        description="검색어 (2자 이상, 구문 단위로 일치, 예: '골든 크로스', 'bearish divergence')",
+    ),
+    cursor: Optional[int] = Query(
+        None,
+        description="이전 페이지의 마지막 거래 ID (첫 페이지 조회 시 생략)",
+    ),
+    coin_id: Optional[int] = Query(None, description="코인 ID 필터"),
+    trade_type: Optional[str] = Query(
+        None,
+        description="거래 유형 필터 (예: 'buy', 'sell', 'hold')",
+    ),
+    trade_status: Optional[str] = Query(
+        None,
+        alias="status",
+        description="거래 상태 필터 (pending/success/partial_success/failed/no_action)",
+    ),
+    since: Optional[datetime] = Query(None, description="조회 시작 시각 (포함)"),
+    until: Optional[datetime] = Query(None, description="조회 종료 시각 (미포함)"),
+    limit: int = Query(
+        20,
+        ge=1,
+        le=100,
+        description="페이지당 조회할 항목 수 (1-100, 기본값: 20)",
+    ),
+    query_service: TransactionQueryService = Depends(get_transaction_query_service),
+) -> TransactionsResponse:
+    """
+    거래 사유 검색 (Cursor 기반 페이지네이션)
+
+    거래 사유 검색 문서(trade_search_documents)의 ngram FULLTEXT 인덱스를 사용하므로
+    전체 기간에 대해서도 목록을 모두 받아 찾을 필요가 없습니다.
+
+    **사용 방법:**
+    1. 첫 페이지: `GET /transactions/search?q=골든 크로스`
+    2. 다음 페이지: 응답의 `next_cursor` 값을 `cursor`로 전달
+    3. 코인/유형/상태/기간 필터는 함께 지정 가능
+
+    각 항목에는 `ai_reason`, `execution_reason`이 포함됩니다.
+    """
+    return await query_service.search_transactions(
+        query=q,
+        cursor=cursor,
+        limit=limit,
+        coin_id=coin_id,
+        trade_type=trade_type,
+        trade_status=trade_status,
+        since=since,
+        until=until,
+    )
+
+
+@trade_router.get(
+    "/transactions/{trade_id}",
+    summary="거래 상세 조회",
+    description="거래 1건을 AI 분석 결과, 실행 사유와 함께 반환합니다.",
+    response_model=TransactionItemResponse,
+)
+async def get_transaction(
+    trade_id: int,
+    query_service: TransactionQueryService = Depends(get_transaction_query_service),
+) -> TransactionItemResponse:
+    """
+    거래 상세 조회
+
+    목록에서 거래를 펼칠 때 사용합니다.
+
+    **추가 정보:**
     - AI 분석 결과 (ai_reason)
     - 거래 실행 사유 (execution_reason): 잔고, 현재 가격, 수수료, 실패 원인 등 상세 정보
     """
-    trade_service = TradeService(session)
-    return await trade_service.get_transactions(
-        cursor=cursor, limit=limit, trade_type=trade_type
-    )
+    return await query_service.get_transaction(trade_id)
+
+
+@trade_router.get(
+    "/runs",
+    summary="거래 실행 기록 조회",
+    description="최근 거래 실행 기록을 구간별 소요 시간과 함께 최신순으로 반환합니다.",
+    response_model=TradeRunsResponse,
+)
+async def get_runs(
+    cursor: Optional[int] = Query(
+        None,
+        description="이전 페이지의 마지막 실행 ID (첫 페이지 조회 시 생략)",
+    ),
+    limit: int = Query(
+        20,
+        ge=1,
+        le=100,
+        description="페이지당 조회할 항목 수 (1-100, 기본값: 20)",
+    ),
+    session: AsyncSession = Depends(get_session),
+) -> TradeRunsResponse:
+    """
+    거래 실행 기록 조회 (Cursor 기반 페이지네이션)
+
+    스케줄러 주기보다 실행이 오래 걸리는지(다음 주기가 락을 얻지 못해 건너뛰는지) 확인하는 용도입니다.
+
+    **각 실행 항목 정보:**
+    - 트리거 (interval/candle:<간격>/recheck/manual), 모드 (inline/queue), 상태 (running/success/failed)
+    - 시작/종료 시각, 전체 시간 (duration_ms), 락 획득 시간 (lock_wait_ms)
+    - 활성/대상 코인 수, 기록된 거래 수
+    - 구간별 누적 시간 (stages): OHLCV 조회, AI 분석, 현재가 조회, 주문, 잔고 조회, DB 커밋
+    - 구간에 포함되지 않은 시간 (other_ms), Upbit/OpenAI 호출 수
+    """
+    trade_run_service = TradeRunService(session)
+    return await trade_run_service.get_runs(cursor=cursor, limit=limit)
+
+
+@trade_router.get(
+    "/stats",
+    summary="코인별 AI 결정 통계",
+    description="코인별 AI 결정(BUY/SELL/HOLD) 횟수, 평균 신뢰도, 실패 원인별 실패율, 위험 수준 분포를 반환합니다.",
+    response_model=DecisionStatsResponse,
+)
+async def get_decision_stats(
+    session: AsyncSession = Depends(get_session),
+    cache: DecisionStatsCache = Depends(get_decision_stats_cache),
+) -> DecisionStatsResponse:
+    """
+    코인별 AI 결정 통계 조회
+
+    trades를 커버링 인덱스(idx_trades_decision_stats)로 GROUP BY 집계하고,
+    결과는 다음 실행이 끝날 때까지 캐시합니다. (`run_id`: 통계에 반영된 마지막 실행)
+
+    **각 코인 항목 정보:**
+    - AI 결정별 횟수 (buy/sell/hold), AI 결정 없이 끝난 횟수 (분석 실패)
+    - 평균 신뢰도 (0~1)
+    - FAILED 거래 수, 실패율, 실패 원인별 횟수
+      (ai_quota/ai_api_error/ai_error/insufficient_krw/no_holdings/below_min_order/
+      order_rejected/order_cancelled/order_not_found/unknown)
+    - 위험 수준별 횟수 (none/low/medium/high)
+    """
+    decision_stats_service = DecisionStatsService(session, cache)
+    return await decision_stats_service.get_stats()
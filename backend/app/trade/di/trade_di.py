@@ -0,0 +1,35 @@
+from functools import lru_cache
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.ai.client.open_ai_client import OpenAIClient
+from app.ai.di.open_ai_di import get_open_ai_client
+from app.common.model.base import get_session
+from app.trade.service.decision_stats_service import DecisionStatsCache
+from app.trade.service.trade_service import TradeService
+from app.trade.service.transaction_query_service import TransactionQueryService
+from app.upbit.client.upbit_client import UpbitClient
+from app.upbit.di.upbit_di import get_upbit_client
+
+
+def get_trade_service(
+    session: AsyncSession = Depends(get_session),
+    upbit_client: UpbitClient = Depends(get_upbit_client),
+    ai_client: OpenAIClient = Depends(get_open_ai_client),
+) -> TradeService:
+    """요청 세션과 프로세스 공유 클라이언트로 TradeService 구성 (거래 실행 API 전용)"""
+    return TradeService(session, upbit_client=upbit_client, ai_client=ai_client)
+
+
+def get_transaction_query_service(
+    session: AsyncSession = Depends(get_session),
+) -> TransactionQueryService:
+    """요청 세션으로 거래 내역 조회 서비스 구성 (Upbit/OpenAI 클라이언트를 만들지 않음)"""
+    return TransactionQueryService(session)
+
+
+@lru_cache
+def get_decision_stats_cache() -> DecisionStatsCache:
+    """프로세스 단위 결정 통계 캐시 싱글톤"""
+    return DecisionStatsCache()
@@ -0,0 +1,45 @@
+"""
+Decision Stats Response DTO
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class CoinDecisionStatsResponse(BaseModel):
+    """코인별 AI 결정 통계"""
+
+    coin_id: int = Field(description="코인 ID")
+    coin_name: Optional[str] = Field(description="코인 이름")
+    total_count: int = Field(description="전체 거래 기록 수 (분석 실패 포함)")
+    decision_counts: Dict[str, int] = Field(
+        description="AI 결정별 횟수 (buy/sell/hold)"
+    )
+    analysis_failure_count: int = Field(
+        description="AI 결정 없이 끝난 횟수 (OHLCV 조회/AI 분석 실패)"
+    )
+    average_confidence: Optional[float] = Field(
+        description="AI 결정의 평균 신뢰도 (0~1, 기록된 신뢰도가 없으면 null)"
+    )
+    failure_count: int = Field(description="FAILED 거래 수")
+    failure_rate: float = Field(
+        description="실패율 (FAILED 거래 수 / 전체 거래 기록 수)"
+    )
+    failure_categories: Dict[str, int] = Field(
+        description="실패 원인별 횟수 (FailureCategory)"
+    )
+    risk_levels: Dict[str, int] = Field(
+        description="위험 수준별 횟수 (none/low/medium/high)"
+    )
+
+
+class DecisionStatsResponse(BaseModel):
+    """코인별 AI 결정 통계 응답 DTO"""
+
+    items: List[CoinDecisionStatsResponse] = Field(description="코인별 통계")
+    run_id: Optional[int] = Field(
+        description="통계에 반영된 마지막 실행 ID (끝난 실행이 없으면 null)"
+    )
+    computed_at: datetime = Field(description="집계 시각 (UTC)")
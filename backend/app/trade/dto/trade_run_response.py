@@ -0,0 +1,92 @@
+"""
+TradeRun Response DTO
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from app.trade.model.trade_run import TradeRun
+
+
+class TradeRunStagesResponse(BaseModel):
+    """구간별 누적 시간 (ms)"""
+
+    ohlcv_ms: float = Field(description="OHLCV 조회")
+    ai_ms: float = Field(description="AI 분석 (OpenAI)")
+    price_ms: float = Field(description="현재가/호가 조회")
+    order_ms: float = Field(description="매수/매도 주문")
+    balance_ms: float = Field(description="잔고 조회 (Upbit)")
+    db_commit_ms: float = Field(description="DB 커밋")
+
+
+class TradeRunItemResponse(BaseModel):
+    """거래 실행 기록 항목 응답 DTO"""
+
+    id: int = Field(description="실행 ID")
+    trigger: str = Field(
+        description="실행 트리거 (interval/candle:<간격>/recheck/manual)"
+    )
+    mode: str = Field(description="실행 모드 (inline/queue)")
+    status: str = Field(description="실행 상태 (running/success/failed)")
+    started_at: datetime = Field(description="시작 시각 (UTC)")
+    finished_at: Optional[datetime] = Field(
+        description="종료 시각 (UTC, 실행 중이면 null)"
+    )
+    duration_ms: Optional[float] = Field(description="전체 실행 시간 (ms)")
+    lock_wait_ms: float = Field(description="실행 락 획득에 걸린 시간 (ms)")
+    active_coin_count: int = Field(description="활성 코인 수")
+    target_coin_count: int = Field(description="실행 대상 코인 수")
+    trade_count: int = Field(description="기록된 거래 수")
+    stages: TradeRunStagesResponse = Field(description="구간별 누적 시간")
+    other_ms: Optional[float] = Field(
+        description="전체 시간 중 구간별 시간에 포함되지 않은 시간 (ms, queue 모드는 null)"
+    )
+    upbit_calls: int = Field(description="Upbit API 호출 수")
+    openai_calls: int = Field(description="OpenAI API 호출 수")
+    error: Optional[str] = Field(description="실패 시 오류 내용")
+
+    @staticmethod
+    def from_run(run: TradeRun) -> "TradeRunItemResponse":
+        """TradeRun 엔티티를 TradeRunItemResponse로 변환"""
+        stages = TradeRunStagesResponse(
+            ohlcv_ms=run.ohlcv_ms,
+            ai_ms=run.ai_ms,
+            price_ms=run.price_ms,
+            order_ms=run.order_ms,
+            balance_ms=run.balance_ms,
+            db_commit_ms=run.db_commit_ms,
+        )
+        other_ms = None
+        if run.mode == "inline" and run.duration_ms is not None:
+            other_ms = max(0.0, run.duration_ms - sum(stages.model_dump().values()))
+
+        return TradeRunItemResponse(
+            id=run.id,
+            trigger=run.trigger,
+            mode=run.mode,
+            status=run.status,
+            started_at=run.started_at,
+            finished_at=run.finished_at,
+            duration_ms=run.duration_ms,
+            lock_wait_ms=run.lock_wait_ms,
+            active_coin_count=run.active_coin_count,
+            target_coin_count=run.target_coin_count,
+            trade_count=run.trade_count,
+            stages=stages,
+            other_ms=other_ms,
+            upbit_calls=run.upbit_calls,
+            openai_calls=run.openai_calls,
+            error=run.error,
+        )
+
+
+class TradeRunsResponse(BaseModel):
+    """거래 실행 기록 목록 응답 DTO (Cursor 기반 페이지네이션)"""
+
+    items: list[TradeRunItemResponse] = Field(description="실행 기록 목록")
+    next_cursor: Optional[int] = Field(
+        description="다음 페이지를 조회하기 위한 커서 (다음 페이지가 없으면 null)"
+    )
+    has_next: bool = Field(description="다음 페이지 존재 여부")
@@ -21,12 +21,23 @@ class TransactionItemResponse(BaseModel):
     risk_level: str = Field(description="위험 수준 (none/low/medium/high)")
     status: str = Field(description="거래 상태 (pending/success/partial_success/failed/no_action)")
     timestamp: str = Field(description="거래 시각 (YYYY-MM-DD HH:MM:SS)")
-    ai_reason: Optional[str] = Field(description="AI 분석 결과")
-    execution_reason: Optional[str] = Field(description="거래 실행 사유 (잔고, 가격, 수량 등 상세 정보)")
+    ai_reason: Optional[str] = Field(
+        default=None, description="AI 분석 결과 (목록 조회에서는 include_reasons=true일 때만 포함)"
+    )
+    execution_reason: Optional[str] = Field(
+        default=None,
+        description="거래 실행 사유 (잔고, 가격, 수량 등 상세 정보, 목록 조회에서는 include_reasons=true일 때만 포함)",
+    )
 
     @staticmethod
-    def from_trade(trade, coin_name: Optional[str] = None) -> "TransactionItemResponse":
-        """Trade 엔티티를 TransactionItemResponse로 변환"""
+    def from_trade(
+        trade, coin_name: Optional[str] = None, include_reasons: bool = True
+    ) -> "TransactionItemResponse":
+        """
+        Trade 엔티티를 TransactionItemResponse로 변환
+
+        include_reasons가 False이면 거래 사유를 읽지 않습니다. (사유 없이 로드한 거래)
+        """
         return TransactionItemResponse(
             id=trade.id,
             coin_id=trade.coin_id,
@@ -37,8 +48,8 @@ class TransactionItemResponse(BaseModel):
             risk_level=trade.risk_level,
             status=trade.status,
             timestamp=trade.created_at.strftime("%Y-%m-%d %H:%M:%S") if isinstance(trade.created_at, datetime) else trade.created_at,
-            ai_reason=trade.ai_reason,
-            execution_reason=trade.execution_reason,
+            ai_reason=trade.ai_reason if include_reasons else None,
+            execution_reason=trade.execution_reason if include_reasons else None,
         )
 
 
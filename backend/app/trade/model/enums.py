@@ -30,3 +30,35 @@ class TradeStatus(str, Enum):
     PARTIAL_SUCCESS = "partial_success"  # 부분 성공
     FAILED = "failed"  # 실패
     NO_ACTION = "no_action"  # 거래 없음 (코인 없음, 잔액 없음 등)
+
+
+class FailureCategory(str, Enum):
+    """FAILED 거래의 실패 원인 분류 (execution_reason 요약, 통계 집계용)"""
+
+    AI_QUOTA = "ai_quota"  # OpenAI API quota 초과
+    AI_API_ERROR = "ai_api_error"  # OpenAI API 오류
+    AI_ERROR = "ai_error"  # 그 외 OHLCV 조회/AI 분석 실패
+    INSUFFICIENT_KRW = "insufficient_krw"  # KRW 잔고 부족 (매수 불가)
+    NO_HOLDINGS = "no_holdings"  # 보유 코인 없음 (매도 불가)
+    BELOW_MIN_ORDER = "below_min_order"  # 최소 주문 금액 미만 (매도 불가)
+    ORDER_REJECTED = "order_rejected"  # 주문 접수 실패
+    ORDER_CANCELLED = "order_cancelled"  # 체결 없이 주문 취소
+    ORDER_NOT_FOUND = "order_not_found"  # 거래소에서 주문을 찾을 수 없음
+    UNKNOWN = "unknown"  # 분류할 수 없음 (기존 기록)
+
+
+class TradeTaskStatus(str, Enum):
+    """코인별 거래 작업 큐 상태"""
+
+    QUEUED = "queued"  # 대기 중
+    RUNNING = "running"  # 워커가 처리 중
+    DONE = "done"  # 처리 완료
+    FAILED = "failed"  # 처리 실패 (재시도 횟수 초과 포함)
+
+
+class TradeRunStatus(str, Enum):
+    """거래 실행(run) 상태"""
+
+    RUNNING = "running"  # 실행 중 (끝나지 않은 채 남아 있으면 워커가 중단된 것)
+    SUCCESS = "success"  # 완료
+    FAILED = "failed"  # 예외로 중단
@@ -6,22 +6,49 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, Numeric, String, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import BigInteger, DateTime, Index, Numeric, String, event
+from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
-from app.common.model.base import Base
+from app.common.model.base import AutoIncrementId, Base
 from app.trade.model.enums import RiskLevel, TradeStatus, TradeType
+from app.trade.model.trade_reason import TradeReason
 
 
 class Trade(Base):
-    """거래 내역"""
+    """
+    거래 내역
+
+    created_at 기준 월별 RANGE 파티션 테이블입니다. (MySQL)
+    파티션 테이블은 외래 키를 가질 수 없어 coin_id/run_id/task_id는 인덱스만 두고,
+    기본 키에 파티션 컬럼을 포함해야 하므로 기본 키는 (id, created_at)입니다.
+    ORM에서는 id만으로 거래를 식별합니다. (id는 AUTO_INCREMENT로 유일)
+
+    ai_reason/execution_reason은 trade_reasons 테이블에 저장되며, 기존처럼 속성으로 읽고 씁니다.
+    (거래와 함께 로드되므로 사유가 필요 없는 조회는 raiseload(Trade.reason)로 제외)
+    """
 
     __tablename__ = "trades"
+    __table_args__ = (
+        Index("idx_trades_run_id", "run_id"),
+        Index("idx_trades_task_id", "task_id"),
+        Index("idx_trades_status_order_uuid", "status", "order_uuid"),
+        # 코인별 결정 통계 집계 (GROUP BY를 인덱스만으로 처리)
+        Index(
+            "idx_trades_decision_stats",
+            "coin_id",
+            "trade_type",
+            "status",
+            "risk_level",
+            "failure_category",
+            "confidence",
+        ),
+    )
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
-    coin_id: Mapped[Optional[int]] = mapped_column(
-        BigInteger, ForeignKey("coins.id"), nullable=True
+    id: Mapped[int] = mapped_column(
+        AutoIncrementId, primary_key=True, autoincrement=True
     )
+    coin_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     trade_type: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
     price: Mapped[Decimal] = mapped_column(
         Numeric(20, 8), nullable=False, default=Decimal("0")
@@ -33,14 +60,52 @@ class Trade(Base):
         String(10), nullable=False, default=RiskLevel.NONE.value
     )
     status: Mapped[TradeStatus] = mapped_column(String(20), nullable=False)
-    ai_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    execution_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # AI 신뢰도 (0~1, AI 결정이 있는 거래만)
+    confidence: Mapped[Optional[Decimal]] = mapped_column(Numeric(5, 4), nullable=True)
+    # 실패 원인 분류 (FAILED 거래만, FailureCategory)
+    failure_category: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)
+    fencing_token: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    run_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    # 큐 모드에서 거래를 기록한 작업 (재시도 시 중복 주문 방지)
+    task_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    # 주문 체결 정보 (주문 접수 시 order_uuid 기록, 체결 확인 후 나머지 기록)
+    order_uuid: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    filled_price: Mapped[Optional[Decimal]] = mapped_column(
+        Numeric(20, 8), nullable=True
+    )
+    filled_volume: Mapped[Optional[Decimal]] = mapped_column(
+        Numeric(20, 8), nullable=True
+    )
+    paid_fee: Mapped[Optional[Decimal]] = mapped_column(Numeric(20, 8), nullable=True)
+    filled_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, primary_key=True, default=datetime.utcnow, nullable=False
+    )
+
+    __mapper_args__ = {"primary_key": [id]}
+
+    # 관계 설정 (외래 키가 없으므로 조인 조건을 직접 지정)
+    coin = relationship(
+        "Coin",
+        back_populates="trades",
+        primaryjoin="foreign(Trade.coin_id) == Coin.id",
+    )
+    reason: Mapped[Optional[TradeReason]] = relationship(
+        primaryjoin="Trade.id == foreign(TradeReason.trade_id)",
+        uselist=False,
+        lazy="selectin",
+        cascade="all, delete-orphan",
     )
 
-    # 관계 설정
-    coin = relationship("Coin", back_populates="trades")
+    # 사유가 없던 거래에 값을 쓰면 trade_reasons 행을 만듦
+    ai_reason: AssociationProxy[Optional[str]] = association_proxy(
+        "reason", "ai_reason", creator=lambda value: TradeReason(ai_reason=value)
+    )
+    execution_reason: AssociationProxy[Optional[str]] = association_proxy(
+        "reason",
+        "execution_reason",
+        creator=lambda value: TradeReason(execution_reason=value),
+    )
 
     @property
     def trade_type_enum(self) -> Optional[TradeType]:
@@ -51,3 +116,22 @@ class Trade(Base):
     def risk_level_enum(self) -> RiskLevel:
         """risk_level을 Enum으로 반환"""
         return RiskLevel(self.risk_level)
+
+
+@event.listens_for(Session, "before_flush")
+def _copy_created_at_to_reason(session: Session, flush_context, instances) -> None:
+    """
+    새 거래 사유의 created_at을 거래의 created_at으로 설정
+
+    사유 행이 거래와 다른 월 파티션에 저장되지 않도록, 거래 시각이 없으면 먼저 정하고 같은 값을 씁니다.
+    """
+    for trade in [*session.new, *session.dirty]:
+        if not isinstance(trade, Trade):
+            continue
+        # 로드되지 않은 관계는 새로 설정된 것이 아니므로 건너뜀 (flush 중 지연 로드 방지)
+        reason = trade.__dict__.get("reason")
+        if reason is None or reason not in session.new:
+            continue
+        if trade.created_at is None:
+            trade.created_at = datetime.utcnow()
+        reason.created_at = trade.created_at
@@ -0,0 +1,61 @@
+"""
+TradeReason 엔티티
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, delete, event, insert
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.common.model.base import Base
+from app.common.model.compressed_text import CompressedText
+from app.trade.model.trade_search_document import (
+    TradeSearchDocument,
+    build_search_content,
+)
+
+
+class TradeReason(Base):
+    """
+    거래 사유 (거래 1건당 1행)
+
+    수 KB에 이르는 AI 분석 결과/실행 사유를 trades에서 분리하여,
+    목록 조회가 좁은 trades 행만 읽도록 합니다. (긴 사유는 zlib 압축 저장)
+    trades와 같은 기준의 월별 RANGE 파티션 테이블이므로 기본 키는 (trade_id, created_at)이며,
+    created_at은 거래의 created_at과 같습니다. (MySQL)
+    기록/수정 시 같은 트랜잭션에서 검색 문서(trade_search_documents)도 갱신합니다.
+    """
+
+    __tablename__ = "trade_reasons"
+
+    trade_id: Mapped[int] = mapped_column(
+        BigInteger, primary_key=True, autoincrement=False
+    )
+    ai_reason: Mapped[Optional[str]] = mapped_column(CompressedText, nullable=True)
+    execution_reason: Mapped[Optional[str]] = mapped_column(
+        CompressedText, nullable=True
+    )
+    # 거래와 같은 파티션에 저장되도록 거래의 created_at을 그대로 사용 (Trade의 before_flush 참고)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, primary_key=True, nullable=False
+    )
+
+    __mapper_args__ = {"primary_key": [trade_id]}
+
+
+@event.listens_for(TradeReason, "after_insert")
+@event.listens_for(TradeReason, "after_update")
+def _sync_search_document(mapper, connection, target: TradeReason) -> None:
+    """거래 사유가 기록/수정되면 검색 문서를 다시 씀 (사유가 모두 비면 삭제)"""
+    documents = TradeSearchDocument.__table__
+    connection.execute(delete(documents).where(documents.c.trade_id == target.trade_id))
+    content = build_search_content(target.ai_reason, target.execution_reason)
+    if content:
+        connection.execute(
+            insert(documents).values(
+                trade_id=target.trade_id,
+                content=content,
+                created_at=target.created_at,
+            )
+        )
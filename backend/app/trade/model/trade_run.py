@@ -0,0 +1,50 @@
+"""
+TradeRun 엔티티
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Float, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.common.model.base import AutoIncrementId, Base
+from app.trade.model.enums import TradeRunStatus
+
+
+class TradeRun(Base):
+    """
+    거래 실행(execute 1회) 기록
+
+    구간별 시간(*_ms)은 해당 구간 호출의 누적 시간입니다.
+    queue 모드에서는 started_at/finished_at이 작업을 큐에 추가한 구간이고,
+    구간별 시간과 호출 수는 워커가 작업을 처리할 때마다 누적됩니다.
+    """
+
+    __tablename__ = "trade_runs"
+    __table_args__ = (Index("idx_trade_runs_started_at", "started_at"),)
+
+    id: Mapped[int] = mapped_column(
+        AutoIncrementId, primary_key=True, autoincrement=True
+    )
+    trigger: Mapped[str] = mapped_column(String(50), nullable=False)
+    mode: Mapped[str] = mapped_column(String(10), nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default=TradeRunStatus.RUNNING.value
+    )
+    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    duration_ms: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    lock_wait_ms: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    active_coin_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    target_coin_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    trade_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    ohlcv_ms: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    ai_ms: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    price_ms: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    order_ms: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    balance_ms: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    db_commit_ms: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    upbit_calls: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    openai_calls: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -0,0 +1,45 @@
+"""
+TradeSearchDocument 엔티티
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, Index, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.common.model.base import Base
+
+
+def build_search_content(
+    ai_reason: Optional[str], execution_reason: Optional[str]
+) -> str:
+    """검색 대상 텍스트 (AI 분석 결과 + 실행 사유)"""
+    return "\n".join(filter(None, [ai_reason, execution_reason]))
+
+
+class TradeSearchDocument(Base):
+    """
+    거래 사유 검색 문서 (거래 1건당 1행)
+
+    trade_reasons는 압축 저장되고 파티션 테이블이라 FULLTEXT 인덱스를 둘 수 없으므로,
+    사유 원문을 파티션하지 않은 이 테이블에 복사하여 ngram FULLTEXT 인덱스로 검색합니다. (MySQL)
+    trade_reasons가 기록/수정될 때마다 같은 트랜잭션에서 갱신됩니다. (TradeReason 참고)
+    """
+
+    __tablename__ = "trade_search_documents"
+    __table_args__ = (
+        Index(
+            "ft_trade_search_documents_content",
+            "content",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ),
+        Index("idx_trade_search_documents_created_at", "created_at"),
+    )
+
+    trade_id: Mapped[int] = mapped_column(
+        BigInteger, primary_key=True, autoincrement=False
+    )
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -0,0 +1,57 @@
+"""
+TradeTask 엔티티
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.common.model.base import AutoIncrementId, Base
+from app.trade.model.enums import TradeTaskStatus
+
+
+class TradeTask(Base):
+    """코인별 AI 분석/거래 작업 큐"""
+
+    __tablename__ = "trade_tasks"
+    __table_args__ = (
+        Index("idx_trade_tasks_status_id", "status", "id"),
+        Index("idx_trade_tasks_coin_id_status", "coin_id", "status"),
+    )
+
+    id: Mapped[int] = mapped_column(
+        AutoIncrementId, primary_key=True, autoincrement=True
+    )
+    coin_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("coins.id"), nullable=False
+    )
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default=TradeTaskStatus.QUEUED.value
+    )
+    fee_multiplier: Mapped[float] = mapped_column(Float, nullable=False)
+    min_order_amount: Mapped[float] = mapped_column(Float, nullable=False)
+    # 작업 추가 시 이 코인에 배분한 KRW (매수 상한, None이면 처리 시점의 KRW 잔고 전체)
+    krw_budget: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    claimed_by: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    claim_expires_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True
+    )
+    trade_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    run_id: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
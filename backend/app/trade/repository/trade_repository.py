@@ -2,20 +2,114 @@
 Trade Repository
 """
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
 
+from app.common.lease_lock import FencingToken, LeaseLostError
+from app.common.model.base import get_dialect_name
+from app.common.model.lease import Lease
 from app.common.repository.base_repository import BaseRepository
+from app.common.tracing import span
+from app.trade.model.enums import TradeStatus
 from app.trade.model.trade import Trade
-from sqlalchemy import select
+from app.trade.model.trade_search_document import TradeSearchDocument
+from sqlalchemy import Row, func, inspect, select, update
+from sqlalchemy.dialects.mysql import match
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 
 class TradeRepository(BaseRepository[Trade]):
-    """Trade CRUD 연산"""
+    """
+    Trade CRUD 연산
 
-    def __init__(self, session: AsyncSession):
+    fencing이 주어지면 모든 쓰기 트랜잭션에서 lease의 fencing token을 확인하여,
+    lease를 잃은(만료 후 다른 워커가 가져간) 워커의 쓰기를 거부합니다.
+    run_id가 설정되어 있으면 생성하는 거래를 해당 실행(trade_runs)에 연결하고,
+    task_id가 설정되어 있으면 해당 큐 작업(trade_tasks)에 연결합니다.
+    """
+
+    def __init__(self, session: AsyncSession, fencing: Optional[FencingToken] = None):
         super().__init__(Trade, session)
+        self.fencing = fencing
+        self.run_id: Optional[int] = None
+        self.task_id: Optional[int] = None
+
+    async def create(self, entity: Trade) -> Trade:
+        """엔티티 생성 (fencing token 검증, 실행/작업 ID 연결)"""
+        await self._check_fencing(entity)
+        if entity.run_id is None:
+            entity.run_id = self.run_id
+        if entity.task_id is None:
+            entity.task_id = self.task_id
+        return await super().create(entity)
+
+    async def update(self, entity: Trade) -> Trade:
+        """엔티티 업데이트 (fencing token 검증)"""
+        await self._check_fencing(entity)
+        return await super().update(entity)
+
+    async def check_lease(self) -> None:
+        """
+        쓰기 없이 lease 보유 여부만 확인 (거래소 주문 전송 직전)
+
+        @raises LeaseLostError: lease가 다른 token으로 넘어간 경우
+        """
+        if self.fencing is None:
+            return
+        await self._check_fencing()
+        # 공유 락 해제
+        await self.session.commit()
+
+    async def save_order_uuid(self, trade: Trade, order_uuid: str) -> None:
+        """
+        접수된 주문 UUID만 별도 커밋으로 기록 (fencing token 검증 없음)
+
+        lease를 잃어 접수 결과를 기록할 수 없어도, 이미 거래소에 접수된 주문은
+        OrderReconcileService가 체결을 확인할 수 있도록 UUID를 남깁니다.
+
+        @param trade: 주문과 짝을 이루는 PENDING 거래
+        @param order_uuid: 거래소 주문 UUID
+        """
+        # 앞선 기록 실패로 남은 트랜잭션을 정리 (롤백으로 만료된 거래도 다시 로드하지 않고 ID를 얻음)
+        await self.session.rollback()
+        trade_id = inspect(trade).identity[0]
+        await self.session.execute(
+            update(Trade)
+            .where(Trade.id == trade_id)
+            .values(order_uuid=order_uuid)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+
+    async def _check_fencing(self, entity: Optional[Trade] = None) -> None:
+        """
+        현재 트랜잭션에서 lease의 fencing token이 그대로인지 확인
+
+        공유 락(FOR SHARE)으로 조회하므로 커밋 전까지 다른 워커가 lease를 가져갈 수 없습니다.
+
+        @param entity: 지정 시 검증한 token을 기록할 거래
+        @raises LeaseLostError: lease가 다른 token으로 넘어간 경우
+        """
+        if self.fencing is None:
+            return
+
+        result = await self.session.execute(
+            select(Lease.fencing_token)
+            .where(Lease.name == self.fencing.lock_name)
+            .with_for_update(read=True)
+        )
+        current_token = result.scalar_one_or_none()
+
+        if current_token != self.fencing.token:
+            await self.session.rollback()
+            raise LeaseLostError(
+                f"lease '{self.fencing.lock_name}'를 잃어 쓰기를 거부합니다. "
+                f"(보유 token: {self.fencing.token}, 현재 token: {current_token})"
+            )
+
+        if entity is not None:
+            entity.fencing_token = self.fencing.token
 
     async def get_by_coin_id(self, coin_id: int) -> List[Trade]:
         """코인 ID로 거래 내역 조회"""
@@ -26,6 +120,16 @@ class TradeRepository(BaseRepository[Trade]):
         )
         return list(result.scalars().all())
 
+    async def get_latest_priced_by_coin_id(self, coin_id: int) -> Optional[Trade]:
+        """코인의 가격이 기록된 가장 최근 거래 조회 (마지막 분석 시점의 가격)"""
+        result = await self.session.execute(
+            select(Trade)
+            .where(Trade.coin_id == coin_id, Trade.price > 0)
+            .order_by(Trade.id.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
     async def get_all_with_coin(self) -> List[Trade]:
         """
         모든 거래 내역을 코인 정보와 함께 조회
@@ -39,27 +143,199 @@ class TradeRepository(BaseRepository[Trade]):
         )
         return list(result.scalars().all())
 
+    async def get_ai_decisions_with_coin(
+        self, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> List[Trade]:
+        """
+        AI 결정(BUY/SELL/HOLD)이 기록된 거래를 코인 정보와 함께 조회 (백테스트용)
+
+        AI 분석 자체가 실패한 기록(trade_type 없음)은 제외합니다.
+
+        @param since: 조회 시작 시각 (UTC, 포함)
+        @param until: 조회 종료 시각 (UTC, 미포함)
+        @return: 생성 시각 기준 오름차순으로 정렬된 거래 목록
+        """
+        query = (
+            select(Trade)
+            .options(selectinload(Trade.coin))
+            .where(Trade.trade_type.is_not(None), Trade.coin_id.is_not(None))
+        )
+        if since is not None:
+            query = query.where(Trade.created_at >= since)
+        if until is not None:
+            query = query.where(Trade.created_at < until)
+
+        result = await self.session.execute(query.order_by(Trade.created_at, Trade.id))
+        return list(result.scalars().all())
+
     async def get_all_with_coin_paginated(
-        self, cursor: Optional[int], limit: int, trade_type: Optional[str]
+        self,
+        cursor: Optional[int],
+        limit: int,
+        trade_type: Optional[str],
+        since: Optional[datetime] = None,
+        include_reasons: bool = False,
     ) -> List[Trade]:
         """
         거래 내역을 커서 기반 페이지네이션으로 조회
 
         @param cursor: 이전 페이지의 마지막 거래 ID (None이면 첫 페이지)
         @param limit: 조회할 최대 개수
+        @param since: 지정 시 이 시각 이후의 거래만 조회 (해당 기간의 파티션만 읽음)
+        @param include_reasons: 거래 사유(trade_reasons)도 함께 로드할지 여부
         @return: 생성 시각 기준 내림차순으로 정렬된 거래 내역 목록
         """
         query = select(Trade).options(selectinload(Trade.coin))
+        if not include_reasons:
+            query = query.options(raiseload(Trade.reason))
 
         # cursor가 있으면 해당 ID보다 작은 항목만 조회
         if cursor is not None:
             query = query.where(Trade.id < cursor)
 
+        if since is not None:
+            query = query.where(Trade.created_at >= since)
+
         if trade_type is not None:
             query = query.where(Trade.trade_type == trade_type)
 
         # created_at 기준 내림차순 정렬
         query = query.order_by(Trade.created_at.desc()).limit(limit)
 
-        result = await self.session.execute(query)
+        result = await self.execute_read(query)
         return list(result.scalars().all())
+
+    async def search(
+        self,
+        query: str,
+        cursor: Optional[int],
+        limit: int,
+        coin_id: Optional[int] = None,
+        trade_type: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Trade]:
+        """
+        거래 사유(AI 분석 결과, 실행 사유)에 검색어가 포함된 거래를 커서 기반 페이지네이션으로 조회
+
+        trade_search_documents의 ngram FULLTEXT 인덱스로 검색어를 구문(phrase)으로 찾습니다.
+        (FULLTEXT가 없는 SQLite는 LIKE 부분 문자열 검색)
+
+        @param query: 검색어 (예: "골든 크로스", 2자 이상)
+        @param cursor: 이전 페이지의 마지막 거래 ID (None이면 첫 페이지)
+        @param limit: 조회할 최대 개수
+        @param coin_id: 코인 ID 필터
+        @param trade_type: 거래 유형 필터
+        @param status: 거래 상태 필터
+        @param since: 조회 시작 시각 (포함)
+        @param until: 조회 종료 시각 (미포함)
+        @return: 거래 ID 내림차순으로 정렬된 거래 목록 (사유 포함)
+        """
+        if get_dialect_name(self.session) == "mysql":
+            phrase = '"' + query.replace('"', " ").strip() + '"'
+            condition = match(
+                TradeSearchDocument.content, against=phrase
+            ).in_boolean_mode()
+        else:
+            condition = TradeSearchDocument.content.contains(
+                query.strip(), autoescape=True
+            )
+        stmt = (
+            select(Trade)
+            .join(TradeSearchDocument, TradeSearchDocument.trade_id == Trade.id)
+            .options(selectinload(Trade.coin))
+            .where(condition)
+        )
+
+        if cursor is not None:
+            stmt = stmt.where(TradeSearchDocument.trade_id < cursor)
+        if coin_id is not None:
+            stmt = stmt.where(Trade.coin_id == coin_id)
+        if trade_type is not None:
+            stmt = stmt.where(Trade.trade_type == trade_type)
+        if status is not None:
+            stmt = stmt.where(Trade.status == status)
+        if since is not None:
+            stmt = stmt.where(Trade.created_at >= since)
+        if until is not None:
+            stmt = stmt.where(Trade.created_at < until)
+
+        stmt = stmt.order_by(TradeSearchDocument.trade_id.desc()).limit(limit)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_with_coin(self, trade_id: int) -> Optional[Trade]:
+        """
+        거래 1건을 코인 정보, 거래 사유와 함께 조회
+
+        @param trade_id: 거래 ID
+        @return: 거래 (없으면 None)
+        """
+        result = await self.session.execute(
+            select(Trade).options(selectinload(Trade.coin)).where(Trade.id == trade_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_by_task_id(self, task_id: int) -> Optional[Trade]:
+        """
+        큐 작업이 기록한 거래 조회
+
+        @param task_id: 작업 ID
+        @return: 거래 (없으면 None)
+        """
+        result = await self.session.execute(
+            select(Trade).where(Trade.task_id == task_id).order_by(Trade.id).limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_open_orders(self, limit: int) -> List[Trade]:
+        """
+        체결 확인이 필요한 거래 조회 (주문이 접수되었지만 아직 PENDING인 거래)
+
+        @param limit: 조회할 최대 개수
+        @return: ID 오름차순(오래된 주문 먼저)으로 정렬된 거래 목록
+        """
+        result = await self.session.execute(
+            select(Trade)
+            .where(
+                Trade.status == TradeStatus.PENDING.value,
+                Trade.order_uuid.is_not(None),
+            )
+            .order_by(Trade.id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_decision_stats(self) -> Sequence[Row[Any]]:
+        """
+        코인/결정/상태/위험 수준/실패 원인별 거래 수와 신뢰도 합계 집계
+
+        GROUP BY 컬럼과 집계 컬럼이 모두 idx_trades_decision_stats에 있으므로 테이블 행을 읽지 않습니다.
+
+        @return: (coin_id, trade_type, status, risk_level, failure_category,
+                  trade_count, confidence_count, confidence_sum) 행 목록
+        """
+        group_by = (
+            Trade.coin_id,
+            Trade.trade_type,
+            Trade.status,
+            Trade.risk_level,
+            Trade.failure_category,
+        )
+        result = await self.session.execute(
+            select(
+                *group_by,
+                func.count().label("trade_count"),
+                func.count(Trade.confidence).label("confidence_count"),
+                func.sum(Trade.confidence).label("confidence_sum"),
+            )
+            .where(Trade.coin_id.is_not(None))
+            .group_by(*group_by)
+        )
+        return result.all()
+
+    async def update_all(self) -> None:
+        """세션에서 변경된 거래들을 한 번의 커밋으로 저장 (fencing token 검증 없음)"""
+        with span("db.commit", table=self.model.__tablename__):
+            await self.session.commit()
@@ -0,0 +1,76 @@
+"""
+TradeRun Repository
+"""
+
+from typing import Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.repository.base_repository import BaseRepository
+from app.common.tracing import span
+from app.trade.model.trade_run import TradeRun
+
+
+class TradeRunRepository(BaseRepository[TradeRun]):
+    """TradeRun CRUD 연산"""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(TradeRun, session)
+
+    async def add_stats(self, run_id: int, stats: Dict[str, Union[int, float]]) -> None:
+        """
+        구간별 시간/호출 수/거래 수를 누적 (UPDATE ... SET col = col + ?)
+
+        queue 모드에서 여러 워커가 같은 실행에 동시에 더하므로 읽은 값을 덮어쓰지 않고 DB에서 더합니다.
+
+        @param run_id: 실행 ID
+        @param stats: 컬럼 이름별 더할 값
+        """
+        values = {
+            name: getattr(TradeRun, name) + value
+            for name, value in stats.items()
+            if value
+        }
+        if not values:
+            return
+        await self.session.execute(
+            update(TradeRun).where(TradeRun.id == run_id).values(values)
+        )
+        with span("db.commit", table=TradeRun.__tablename__):
+            await self.session.commit()
+
+    async def get_recent_paginated(
+        self, cursor: Optional[int] = None, limit: int = 20
+    ) -> List[TradeRun]:
+        """
+        실행 기록을 커서 기반 페이지네이션으로 조회
+
+        @param cursor: 이전 페이지의 마지막 실행 ID (None이면 첫 페이지)
+        @param limit: 조회할 항목 수
+        @return: 최신순 실행 기록 목록
+        """
+        query = select(TradeRun).order_by(TradeRun.id.desc())
+
+        if cursor is not None:
+            query = query.where(TradeRun.id < cursor)
+
+        result = await self.session.execute(query.limit(limit))
+        return list(result.scalars().all())
+
+    async def get_latest_finished_version(self) -> Optional[Tuple[int, int]]:
+        """
+        마지막으로 끝난 실행의 ID와 거래 수
+
+        queue 모드에서는 실행이 끝난 뒤에도 워커가 거래 수를 누적하므로 거래 수도 함께 반환합니다.
+
+        @return: (실행 ID, 거래 수), 끝난 실행이 없으면 None
+        """
+        result = await self.session.execute(
+            select(TradeRun.id, TradeRun.trade_count)
+            .where(TradeRun.finished_at.is_not(None))
+            .order_by(TradeRun.id.desc())
+            .limit(1)
+        )
+        row = result.first()
+        return (row.id, row.trade_count) if row else None
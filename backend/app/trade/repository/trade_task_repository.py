@@ -0,0 +1,188 @@
+"""
+TradeTask Repository
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.common.repository.base_repository import BaseRepository
+from app.trade.model.enums import TradeTaskStatus
+from app.trade.model.trade_task import TradeTask
+
+
+class TradeTaskRepository(BaseRepository[TradeTask]):
+    """TradeTask 큐 연산"""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(TradeTask, session)
+
+    async def enqueue(
+        self,
+        coin_ids: List[int],
+        fee_multiplier: float,
+        min_order_amount: float,
+        run_id: Optional[int] = None,
+        krw_budgets: Optional[Dict[int, float]] = None,
+    ) -> int:
+        """
+        코인별 작업을 큐에 추가
+
+        이미 대기 중이거나 처리 중인 작업이 있는 코인은 건너뜁니다.
+        (워커가 밀려도 같은 코인의 작업이 쌓이지 않도록)
+
+        @param coin_ids: 작업을 추가할 코인 ID 목록
+        @param fee_multiplier: 수수료 계수
+        @param min_order_amount: 최소 주문 금액
+        @param run_id: 작업을 추가한 실행 ID (처리 결과를 해당 실행에 누적)
+        @param krw_budgets: 코인별 매수 상한 KRW (없는 코인은 처리 시점의 KRW 잔고 전체)
+        @return: 추가된 작업 수
+        """
+        if not coin_ids:
+            return 0
+
+        result = await self.session.execute(
+            select(TradeTask.coin_id).where(
+                TradeTask.coin_id.in_(coin_ids),
+                TradeTask.status.in_(
+                    [TradeTaskStatus.QUEUED.value, TradeTaskStatus.RUNNING.value]
+                ),
+            )
+        )
+        pending_coin_ids = set(result.scalars().all())
+
+        tasks = [
+            TradeTask(
+                coin_id=coin_id,
+                status=TradeTaskStatus.QUEUED.value,
+                fee_multiplier=fee_multiplier,
+                min_order_amount=min_order_amount,
+                run_id=run_id,
+                krw_budget=(krw_budgets or {}).get(coin_id),
+            )
+            for coin_id in coin_ids
+            if coin_id not in pending_coin_ids
+        ]
+        self.session.add_all(tasks)
+        await self.session.commit()
+        return len(tasks)
+
+    async def claim(
+        self, worker_id: str, claim_timeout_seconds: int, max_attempts: int
+    ) -> Optional[TradeTask]:
+        """
+        처리할 작업 하나를 점유 (SELECT ... FOR UPDATE SKIP LOCKED)
+
+        대기 중인 작업 또는 점유 시간이 만료된(워커가 멈춘) 작업을 가져옵니다.
+        SKIP LOCKED가 없는 SQLite에서는 같은 작업을 조회한 워커 중 조건부 UPDATE에 성공한 워커만 점유합니다.
+        만료된 작업의 시도 횟수가 max_attempts에 도달했으면 FAILED로 처리하고 다음 작업을 찾습니다.
+
+        @param worker_id: 점유하는 워커 식별자
+        @param claim_timeout_seconds: 점유 유효 시간 (초)
+        @param max_attempts: 최대 시도 횟수
+        @return: 점유한 작업 (없으면 None)
+        """
+        while True:
+            now = datetime.utcnow()
+            result = await self.session.execute(
+                select(TradeTask)
+                .where(
+                    or_(
+                        TradeTask.status == TradeTaskStatus.QUEUED.value,
+                        and_(
+                            TradeTask.status == TradeTaskStatus.RUNNING.value,
+                            TradeTask.claim_expires_at < now,
+                        ),
+                    )
+                )
+                .order_by(TradeTask.id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+                .execution_options(populate_existing=True)
+            )
+            task = result.scalar_one_or_none()
+
+            if task is None:
+                await self.session.commit()
+                return None
+
+            if task.attempts >= max_attempts:
+                await self._update_if_unchanged(
+                    task,
+                    status=TradeTaskStatus.FAILED.value,
+                    error=f"점유 시간 초과로 {task.attempts}회 시도 후 포기 (마지막 워커: {task.claimed_by})",
+                    finished_at=now,
+                )
+                continue
+
+            if await self._update_if_unchanged(
+                task,
+                status=TradeTaskStatus.RUNNING.value,
+                attempts=task.attempts + 1,
+                claimed_by=worker_id,
+                claim_expires_at=now + timedelta(seconds=claim_timeout_seconds),
+            ):
+                return task
+            # 다른 워커가 먼저 점유함 (SQLite) - 다음 작업 찾기
+
+    async def _update_if_unchanged(self, task: TradeTask, **values) -> bool:
+        """
+        조회 이후 다른 워커가 바꾸지 않은 작업만 갱신하고 커밋
+
+        MySQL은 FOR UPDATE SKIP LOCKED로 잠근 행이므로 항상 성공합니다.
+
+        @param task: 조회한 작업
+        @param values: 갱신할 컬럼 값
+        @return: 갱신 성공 여부 (성공하면 task에도 반영)
+        """
+        result = await self.session.execute(
+            update(TradeTask)
+            .where(
+                TradeTask.id == task.id,
+                TradeTask.status == task.status,
+                TradeTask.attempts == task.attempts,
+            )
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        if result.rowcount != 1:
+            return False
+        for key, value in values.items():
+            set_committed_value(task, key, value)
+        return True
+
+    async def finish(
+        self,
+        task: TradeTask,
+        status: TradeTaskStatus,
+        trade_id: Optional[int] = None,
+        error: Optional[str] = None,
+    ) -> bool:
+        """
+        작업 처리 결과 기록
+
+        점유가 만료되어 다른 워커가 다시 가져간 작업은 덮어쓰지 않습니다.
+
+        @return: 결과 기록 성공 여부 (점유를 잃었으면 False)
+        """
+        result = await self.session.execute(
+            update(TradeTask)
+            .where(
+                TradeTask.id == task.id,
+                TradeTask.claimed_by == task.claimed_by,
+                TradeTask.attempts == task.attempts,
+                TradeTask.status == TradeTaskStatus.RUNNING.value,
+            )
+            .values(
+                status=status.value,
+                trade_id=trade_id,
+                error=error,
+                finished_at=datetime.utcnow(),
+            )
+        )
+        await self.session.commit()
+        return result.rowcount == 1
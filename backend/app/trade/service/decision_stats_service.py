@@ -0,0 +1,154 @@
+"""
+코인별 AI 결정 통계
+
+trades를 SQL GROUP BY로 집계하고(idx_trades_decision_stats 커버링 인덱스),
+결과를 마지막으로 끝난 실행을 버전으로 프로세스에 캐시합니다.
+새 실행이 끝나기 전까지는 통계 패널을 열어도 trades를 다시 집계하지 않습니다.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.coin.repository.coin_repository import CoinRepository
+from app.trade.dto.decision_stats_response import (
+    CoinDecisionStatsResponse,
+    DecisionStatsResponse,
+)
+from app.trade.model.enums import FailureCategory, TradeStatus, TradeType
+from app.trade.repository.trade_repository import TradeRepository
+from app.trade.repository.trade_run_repository import TradeRunRepository
+
+DECISION_TYPES = (TradeType.BUY.value, TradeType.SELL.value, TradeType.HOLD.value)
+
+
+class DecisionStatsCache:
+    """
+    결정 통계 캐시 (프로세스 단위, get_decision_stats_cache)
+
+    버전은 마지막으로 끝난 실행의 (ID, 거래 수)입니다.
+    실행이 끝나거나 queue 워커가 그 실행에 거래를 더하면 버전이 바뀌어 다시 집계합니다.
+    """
+
+    def __init__(self):
+        self._version: Optional[Tuple[int, int]] = None
+        self._response: Optional[DecisionStatsResponse] = None
+
+    def get(
+        self, version: Optional[Tuple[int, int]]
+    ) -> Optional[DecisionStatsResponse]:
+        """버전이 같으면 캐시된 통계, 아니면 None"""
+        if self._response is None or self._version != version:
+            return None
+        return self._response
+
+    def put(
+        self, version: Optional[Tuple[int, int]], response: DecisionStatsResponse
+    ) -> None:
+        """버전과 함께 통계 저장"""
+        self._version = version
+        self._response = response
+
+
+class DecisionStatsService:
+    """
+    코인별 AI 결정 통계 비즈니스 로직
+
+    @param session: 데이터베이스 세션
+    @param cache: 프로세스에서 공유하는 통계 캐시
+    """
+
+    def __init__(self, session: AsyncSession, cache: DecisionStatsCache):
+        self.trade_repository = TradeRepository(session)
+        self.trade_run_repository = TradeRunRepository(session)
+        self.coin_repository = CoinRepository(session)
+        self.cache = cache
+
+    async def get_stats(self) -> DecisionStatsResponse:
+        """
+        코인별 결정 횟수, 평균 신뢰도, 실패 원인별 실패율, 위험 수준 분포 조회
+
+        마지막으로 끝난 실행 이후 캐시된 통계가 있으면 trades를 읽지 않습니다.
+        (체결 확인으로 바뀐 상태는 다음 실행이 끝날 때 반영)
+
+        @return: 코인별 통계
+        """
+        version = await self.trade_run_repository.get_latest_finished_version()
+        cached = self.cache.get(version)
+        if cached is not None:
+            return cached
+
+        rows = await self.trade_repository.get_decision_stats()
+        coin_names = {
+            coin.id: coin.name
+            for coin in await self.coin_repository.get_all_include_deleted()
+        }
+        response = DecisionStatsResponse(
+            items=self.aggregate(rows, coin_names),
+            run_id=version[0] if version else None,
+            computed_at=datetime.utcnow(),
+        )
+        self.cache.put(version, response)
+        return response
+
+    @staticmethod
+    def aggregate(
+        rows: Sequence[Row[Any]], coin_names: Dict[int, str]
+    ) -> List[CoinDecisionStatsResponse]:
+        """
+        GROUP BY 결과를 코인별 통계로 합침
+
+        @param rows: TradeRepository.get_decision_stats() 결과
+        @param coin_names: 코인 ID별 이름
+        @return: 코인 ID 순 통계
+        """
+        totals: Dict[int, int] = defaultdict(int)
+        decisions: Dict[int, Dict[str, int]] = defaultdict(
+            lambda: dict.fromkeys(DECISION_TYPES, 0)
+        )
+        analysis_failures: Dict[int, int] = defaultdict(int)
+        confidence: Dict[int, List[float]] = defaultdict(lambda: [0, 0.0])
+        failures: Dict[int, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        risk_levels: Dict[int, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+        for row in rows:
+            coin_id, count = row.coin_id, row.trade_count
+            totals[coin_id] += count
+            if row.trade_type in DECISION_TYPES:
+                decisions[coin_id][row.trade_type] += count
+            elif row.trade_type is None:
+                analysis_failures[coin_id] += count
+            if row.confidence_count:
+                confidence[coin_id][0] += row.confidence_count
+                confidence[coin_id][1] += float(row.confidence_sum)
+            if row.status == TradeStatus.FAILED.value:
+                failures[coin_id][
+                    row.failure_category or FailureCategory.UNKNOWN.value
+                ] += count
+            risk_levels[coin_id][row.risk_level] += count
+
+        items = []
+        for coin_id in sorted(totals):
+            total = totals[coin_id]
+            confidence_count, confidence_sum = confidence[coin_id]
+            failure_count = sum(failures[coin_id].values())
+            items.append(
+                CoinDecisionStatsResponse(
+                    coin_id=coin_id,
+                    coin_name=coin_names.get(coin_id),
+                    total_count=total,
+                    decision_counts=decisions[coin_id],
+                    analysis_failure_count=analysis_failures[coin_id],
+                    average_confidence=(
+                        confidence_sum / confidence_count if confidence_count else None
+                    ),
+                    failure_count=failure_count,
+                    failure_rate=failure_count / total,
+                    failure_categories=dict(failures[coin_id]),
+                    risk_levels=dict(risk_levels[coin_id]),
+                )
+            )
+        return items
@@ -0,0 +1,134 @@
+"""
+주문 체결 확인
+
+거래 실행은 주문을 접수한 뒤 체결을 기다리지 않고 거래를 PENDING(주문 UUID 포함)으로 남깁니다.
+OrderReconcileService는 주기적으로 PENDING 주문들을 거래소에 한 번에 조회(요청당 최대 100개)하여
+체결가/체결 수량/수수료와 최종 상태(SUCCESS/PARTIAL_SUCCESS/FAILED)를 기록하고,
+체결된 거래를 같은 커밋에서 코인별 포지션 원장(PositionLedger)에 반영합니다.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+from logging import Logger
+from typing import Dict, List
+
+from app.common.tracing import traced
+from app.position.service.position_ledger import PositionLedger
+from app.trade.model.enums import FailureCategory, TradeStatus
+from app.trade.model.trade import Trade
+from app.trade.repository.trade_repository import TradeRepository
+from app.upbit.client.upbit_client import UpbitClient
+from app.upbit.dto.order_dto import UpbitOrder
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = Logger(__name__)
+
+
+class OrderReconcileService:
+    """
+    접수된 주문의 체결 결과를 거래 내역에 반영
+
+    @param session: 데이터베이스 세션
+    @param upbit_client: 프로세스에서 공유하는 Upbit 클라이언트 (get_upbit_client)
+    @param timeout_seconds: 거래소에서 주문을 찾지 못한 채 이 시간이 지나면 FAILED로 확정
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        upbit_client: UpbitClient,
+        timeout_seconds: int = 3600,
+    ):
+        self.trade_repository = TradeRepository(session)
+        self.position_ledger = PositionLedger(session)
+        self.upbit_client = upbit_client
+        self.timeout = timedelta(seconds=timeout_seconds)
+
+    @traced("trade.reconcile_orders")
+    async def reconcile(self, limit: int = 500) -> int:
+        """
+        미확정 주문의 체결 결과 확인
+
+        아직 체결 중(wait/watch)인 주문은 그대로 두고 다음 확인에서 다시 조회합니다.
+        확정된 거래와 포지션 원장 갱신은 한 번의 커밋으로 저장합니다.
+
+        @param limit: 1회 확인할 최대 주문 수
+        @return: 상태가 확정된 거래 수
+        """
+        trades = await self.trade_repository.get_open_orders(limit)
+        if not trades:
+            return 0
+
+        # 거래소 조회(요청당 100개씩 HTTP 호출)는 이벤트 루프를 막지 않도록 스레드에서 실행
+        fetched = await asyncio.to_thread(
+            self.upbit_client.get_orders, [trade.order_uuid for trade in trades]
+        )
+        orders: Dict[str, UpbitOrder] = {order.uuid: order for order in fetched}
+
+        now = datetime.utcnow()
+        settled: List[Trade] = []
+        for trade in trades:
+            order = orders.get(trade.order_uuid)
+            if order is None:
+                if now - trade.created_at >= self.timeout:
+                    self._expire(trade, now)
+                    settled.append(trade)
+                continue
+            if order.is_open:
+                continue
+            self._apply_fill(trade, order, now)
+            settled.append(trade)
+
+        if settled:
+            await self.position_ledger.apply(settled, now)
+            await self.trade_repository.update_all()
+            logger.info(f"🧾 주문 체결 확인: {len(settled)}/{len(trades)}건 확정")
+        return len(settled)
+
+    @staticmethod
+    def _apply_fill(trade: Trade, order: UpbitOrder, now: datetime) -> None:
+        """
+        종료된 주문의 체결 정보와 최종 상태 기록
+
+        - 전량 체결: SUCCESS
+        - 일부 체결 후 잔량 취소: PARTIAL_SUCCESS
+        - 체결 없이 취소: FAILED
+        """
+        trade.filled_volume = Decimal(str(order.executed_volume))
+        trade.paid_fee = Decimal(str(order.paid_fee))
+        average_price = order.average_price
+        trade.filled_price = (
+            Decimal(str(average_price)) if average_price is not None else None
+        )
+        trade.filled_at = now
+
+        fill = (
+            f"평균 체결가 {average_price:,.0f}원, " if average_price is not None else ""
+        ) + f"체결 수량 {order.executed_volume:.8f}, 수수료 {order.paid_fee:,.2f}원"
+        if order.executed_volume <= 0:
+            trade.status = TradeStatus.FAILED
+            trade.failure_category = FailureCategory.ORDER_CANCELLED.value
+            result = "주문 취소 (체결 없음)"
+        elif order.is_fully_filled:
+            trade.status = TradeStatus.SUCCESS
+            result = f"체결 완료: {fill}"
+        else:
+            trade.status = TradeStatus.PARTIAL_SUCCESS
+            result = f"부분 체결 (잔량 취소): {fill}"
+        trade.execution_reason = "\n".join(
+            filter(None, [trade.execution_reason, result])
+        )
+
+    def _expire(self, trade: Trade, now: datetime) -> None:
+        """거래소에서 찾을 수 없는 주문을 FAILED로 확정"""
+        trade.status = TradeStatus.FAILED
+        trade.failure_category = FailureCategory.ORDER_NOT_FOUND.value
+        trade.filled_at = now
+        result = (
+            f"주문 조회 실패: {self.timeout.total_seconds():.0f}초 동안 거래소에서 "
+            f"주문({trade.order_uuid})을 찾을 수 없습니다."
+        )
+        trade.execution_reason = "\n".join(
+            filter(None, [trade.execution_reason, result])
+        )
@@ -0,0 +1,211 @@
+"""
+주문 일괄 접수
+
+한 실행에서 결정된 매수/매도 주문들을 거래소 주문 요청 제한(UPBIT_ORDER_RATE_PER_SECOND) 안에서
+동시에 접수하고, 응답이 도착하는 순서대로 각 거래(Trade)에 주문 UUID 또는 실패 사유를 기록합니다.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from logging import Logger
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from app.common.lease_lock import LeaseLostError
+from app.common.rate_limiter import RateLimiter, SharedRateLimiter
+from app.common.tracing import traced
+from app.trade.model.enums import FailureCategory, TradeStatus, TradeType
+from app.trade.model.trade import Trade
+from app.trade.repository.trade_repository import TradeRepository
+from app.upbit.client.upbit_client import UpbitClient
+
+logger = Logger(__name__)
+
+
+@dataclass
+class OrderRequest:
+    """
+    접수할 주문 (PENDING으로 기록된 거래와 짝을 이룸)
+
+    @param trade: PENDING 상태로 기록된 거래
+    @param coin_name: 코인 이름 (예: KRW-BTC)
+    @param side: 매수/매도
+    @param amount: 매수는 주문 금액(KRW), 매도는 주문 수량
+    @param summary: 접수 사유에 남길 주문 내용 (예: "50,000원")
+    @param reasons: 지금까지의 실행 사유 (접수 결과를 덧붙여 기록)
+    """
+
+    trade: Trade
+    coin_name: str
+    side: TradeType
+    amount: float
+    summary: str
+    reasons: List[str] = field(default_factory=list)
+
+    @property
+    def label(self) -> str:
+        return "매수" if self.side == TradeType.BUY else "매도"
+
+
+class OrderSubmitter:
+    """
+    주문 일괄 접수
+
+    @param trade_repository: 거래 저장소 (접수 결과 기록, fencing token 검증 포함)
+    @param upbit_client: 프로세스에서 공유하는 Upbit 클라이언트
+    @param rate_limiter: 계정 단위 주문 요청 속도 제한 (get_order_rate_limiter)
+    """
+
+    def __init__(
+        self,
+        trade_repository: TradeRepository,
+        upbit_client: UpbitClient,
+        rate_limiter: Union[RateLimiter, SharedRateLimiter],
+    ):
+        self.trade_repository = trade_repository
+        self.upbit_client = upbit_client
+        self.rate_limiter = rate_limiter
+
+    @traced("trade.submit_orders")
+    async def submit(self, orders: List[OrderRequest]) -> List[Trade]:
+        """
+        주문들을 속도 제한 안에서 동시에 접수
+
+        거래소 호출은 스레드에서 동시에 실행하고, DB 기록은 응답이 도착하는 순서대로 하나씩 저장합니다.
+        주문마다 보내기 직전에 lease를 확인하여, lease를 잃은 뒤에는 주문을 보내지 않습니다.
+        lease를 잃기 전에 보낸 주문은 접수 결과 대신 주문 UUID만 별도로 기록하여 체결 확인이 가능하게 합니다.
+        (체결 결과는 OrderReconcileService가 확인하여 상태 확정)
+
+        @param orders: 접수할 주문 목록
+        @return: 접수 결과가 기록된 거래 목록 (응답 도착 순서)
+        @raises LeaseLostError: 전송 전 확인 또는 기록 중 락을 잃은 경우
+        """
+        if not orders:
+            return []
+
+        # lease 확인과 접수 결과 기록이 같은 세션을 동시에 사용하지 않도록 직렬화
+        session_lock = asyncio.Lock()
+        # 거래소로 보내기 시작한 주문의 요청 (id(order) → (주문, 요청))
+        sending: Dict[int, Tuple[OrderRequest, "asyncio.Future[str]"]] = {}
+        handled: Set[int] = set()
+        tasks = [
+            asyncio.ensure_future(self._send(order, session_lock, sending))
+            for order in orders
+        ]
+        trades: List[Trade] = []
+        lease_error: Optional[LeaseLostError] = None
+        try:
+            for completed in asyncio.as_completed(tasks):
+                order, order_uuid, error = await completed
+                if isinstance(error, LeaseLostError):
+                    # 보내지 않은 주문
+                    lease_error = lease_error or error
+                    continue
+                async with session_lock:
+                    if lease_error is None:
+                        try:
+                            trades.append(await self._record(order, order_uuid, error))
+                            handled.add(id(order))
+                            continue
+                        except LeaseLostError as e:
+                            lease_error = e
+                    if order_uuid is not None:
+                        await self.trade_repository.save_order_uuid(
+                            order.trade, order_uuid
+                        )
+                    handled.add(id(order))
+        finally:
+            # 기록 중 예외가 발생하면 속도 제한 대기 중인 주문은 보내지 않고,
+            # 이미 보낸 주문은 응답을 기다려 주문 UUID를 남김
+            for task in tasks:
+                task.cancel()
+            unrecorded = [sent for key, sent in sending.items() if key not in handled]
+            if unrecorded:
+                await self._save_sent_order_uuids(unrecorded, session_lock)
+
+        if lease_error is not None:
+            logger.error(
+                f"lease를 잃어 주문 접수를 중단합니다. (기록 {len(trades)}건 / 주문 {len(orders)}건)"
+            )
+            raise lease_error
+
+        logger.info(f"📨 주문 {len(trades)}건 접수 완료")
+        return trades
+
+    async def _save_sent_order_uuids(
+        self,
+        sent: List[Tuple[OrderRequest, "asyncio.Future[str]"]],
+        session_lock: asyncio.Lock,
+    ) -> None:
+        """
+        접수 결과를 기록하지 못한 채 중단된, 이미 보낸 주문들의 UUID 저장
+
+        submit이 예외로 중단되어도 거래소에 나간 주문은 체결 확인이 가능해야 하므로,
+        응답을 모두 기다린 뒤 받은 주문 UUID를 기록합니다. (저장 실패는 원래 예외를 가리지 않도록 로그만 남김)
+        """
+        results = await asyncio.gather(
+            *(request for _, request in sent), return_exceptions=True
+        )
+        async with session_lock:
+            for (order, _), result in zip(sent, results):
+                if not isinstance(result, str):
+                    continue
+                try:
+                    await self.trade_repository.save_order_uuid(order.trade, result)
+                except Exception as e:
+                    logger.error(
+                        f"주문 UUID 저장 실패: {order.coin_name} {result} ({str(e)})"
+                    )
+
+    async def _send(
+        self,
+        order: OrderRequest,
+        session_lock: asyncio.Lock,
+        sending: Dict[int, Tuple[OrderRequest, "asyncio.Future[str]"]],
+    ) -> Tuple[OrderRequest, Optional[str], Optional[Exception]]:
+        """
+        속도 제한 슬롯을 기다린 뒤 lease를 확인하고 주문 1건 접수 (실패는 예외 대신 반환)
+
+        lease를 잃었으면 주문을 보내지 않고 LeaseLostError를 반환합니다.
+        보내기 시작한 요청은 sending에 남기고 취소되지 않도록 보호합니다. (취소되어도 응답을 받아 UUID 기록)
+        """
+        await self.rate_limiter.acquire()
+        try:
+            async with session_lock:
+                await self.trade_repository.check_lease()
+        except LeaseLostError as e:
+            return order, None, e
+
+        send = (
+            self.upbit_client.buy
+            if order.side == TradeType.BUY
+            else self.upbit_client.sell
+        )
+        request = asyncio.ensure_future(
+            asyncio.to_thread(send, order.coin_name, order.amount)
+        )
+        sending[id(order)] = (order, request)
+        try:
+            order_uuid = await asyncio.shield(request)
+        except Exception as e:
+            return order, None, e
+        return order, order_uuid, None
+
+    async def _record(
+        self,
+        order: OrderRequest,
+        order_uuid: Optional[str],
+        error: Optional[Exception],
+    ) -> Trade:
+        """접수 결과를 거래에 기록 (접수 성공 시 체결 확인 전까지 PENDING 유지)"""
+        trade = order.trade
+        if error is None:
+            order.reasons.append(
+                f"{order.label} 주문 접수: {order.summary} (주문 UUID: {order_uuid})"
+            )
+            trade.order_uuid = order_uuid
+        else:
+            order.reasons.append(f"{order.label} 주문 실패: {str(error)}")
+            trade.status = TradeStatus.FAILED
+            trade.failure_category = FailureCategory.ORDER_REJECTED.value
+        trade.execution_reason = "\n".join(order.reasons)
+        return await self.trade_repository.update(trade)
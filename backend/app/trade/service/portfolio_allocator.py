@@ -0,0 +1,58 @@
+"""
+포트폴리오 배분
+
+한 번의 실행에서 BUY로 결정된 코인들에 가용 KRW를 나눕니다.
+코인별 가중치는 AI 신뢰도 × 위험 수준 가중치이며, 최소 주문 금액에 못 미치는 코인은
+가중치가 작은 순서로 제외하고 나머지 코인에 다시 배분합니다.
+"""
+
+from typing import Dict, Hashable, Mapping, TypeVar
+
+from app.ai.dto.ai_analysis_response import AiAnalysisResponse, RiskLevel
+
+K = TypeVar("K", bound=Hashable)
+
+# 위험 수준별 가중치 (위험이 높을수록 적게 배분)
+RISK_WEIGHTS: Dict[RiskLevel, float] = {
+    RiskLevel.LOW: 1.0,
+    RiskLevel.MEDIUM: 0.6,
+    RiskLevel.HIGH: 0.3,
+    RiskLevel.NONE: 0.0,
+}
+
+
+def decision_weight(ai_result: AiAnalysisResponse) -> float:
+    """
+    AI 결정의 배분 가중치
+
+    @param ai_result: AI 분석 결과
+    @return: 신뢰도 × 위험 수준 가중치
+    """
+    return ai_result.confidence * RISK_WEIGHTS.get(ai_result.risk_level, 0.0)
+
+
+def allocate_buy_budgets(
+    weights: Mapping[K, float], krw_balance: float, min_budget: float
+) -> Dict[K, float]:
+    """
+    가용 KRW를 가중치 비율로 배분
+
+    @param weights: 코인별 가중치
+    @param krw_balance: 배분할 KRW
+    @param min_budget: 코인당 최소 배분 금액 (이보다 적게 배분될 코인은 제외)
+    @return: 코인별 배분 금액 (제외된 코인은 0)
+    """
+    selected = {key: weight for key, weight in weights.items() if weight > 0}
+    budgets: Dict[K, float] = {}
+    while selected:
+        total = sum(selected.values())
+        budgets = {
+            key: krw_balance * weight / total for key, weight in selected.items()
+        }
+        smallest = min(selected, key=lambda key: selected[key])
+        if budgets[smallest] >= min_budget:
+            break
+        del selected[smallest]
+        budgets = {}
+
+    return {key: budgets.get(key, 0.0) for key in weights}
@@ -0,0 +1,182 @@
+import time
+import traceback
+from contextlib import asynccontextmanager
+from datetime import datetime
+from logging import Logger
+from typing import AsyncIterator, Dict, Optional, Tuple, Union
+
+from app.common.tracing import SpanCollector, collect_spans
+from app.trade.dto.trade_run_response import TradeRunItemResponse, TradeRunsResponse
+from app.trade.model.enums import TradeRunStatus
+from app.trade.model.trade_run import TradeRun
+from app.trade.repository.trade_run_repository import TradeRunRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = Logger(__name__)
+
+# 구간별 시간 컬럼 -> 집계할 span 이름 prefix
+STAGE_SPAN_PREFIXES: Dict[str, Tuple[str, ...]] = {
+    "ohlcv_ms": ("upbit.get_ohlcv",),
+    "ai_ms": ("openai.",),
+    "price_ms": ("upbit.get_current_price", "upbit.get_orderbook"),
+    "order_ms": ("upbit.buy", "upbit.sell"),
+    "balance_ms": (
+        "upbit.get_krw_balance",
+        "upbit.get_coin_balance",
+        "upbit.get_my_balance",
+    ),
+    "db_commit_ms": ("db.commit",),
+}
+
+
+class TradeRunContext:
+    """
+    진행 중인 실행의 기록 상태
+
+    @param run: 실행 기록 (start() 전에는 저장되지 않음)
+    @param collector: 실행 중 종료된 span 집계
+    """
+
+    def __init__(self, run: TradeRun, collector: SpanCollector):
+        self.run = run
+        self.collector = collector
+        self.run_id: Optional[int] = None
+        self.trade_count = 0
+
+
+class TradeRunService:
+    """거래 실행(run) 기록 비즈니스 로직"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.trade_run_repository = TradeRunRepository(session)
+
+    @asynccontextmanager
+    async def record(
+        self, trigger: str, mode: str, lock_wait_ms: float = 0.0
+    ) -> AsyncIterator[TradeRunContext]:
+        """
+        블록 실행 1회를 trade_runs에 기록
+
+        실행 대상 코인이 없는 실행은 기록하지 않도록, 블록 안에서 대상이 확정된 뒤 start()를 호출해야 저장됩니다.
+        블록이 끝나면 종료 시각, 전체 시간, 구간별 누적 시간, 외부 호출 수를 기록하고,
+        예외로 끝나면 FAILED로 기록한 뒤 예외를 그대로 전파합니다.
+
+        @param trigger: 실행 트리거 (interval/candle:<간격>/recheck/manual)
+        @param mode: 실행 모드 (inline/queue)
+        @param lock_wait_ms: 실행 락 획득에 걸린 시간 (ms)
+        @return: 진행 중인 실행의 기록 상태
+        """
+        run = TradeRun(
+            trigger=trigger,
+            mode=mode,
+            status=TradeRunStatus.RUNNING.value,
+            started_at=datetime.utcnow(),
+            lock_wait_ms=lock_wait_ms,
+            active_coin_count=0,
+            target_coin_count=0,
+            trade_count=0,
+        )
+        started = time.perf_counter()
+        error: Optional[Exception] = None
+
+        with collect_spans() as collector:
+            context = TradeRunContext(run, collector)
+            try:
+                yield context
+            except Exception as e:
+                error = e
+
+        if context.run_id is not None:
+            await self._finish(context, (time.perf_counter() - started) * 1000, error)
+        if error is not None:
+            raise error
+
+    async def start(
+        self, context: TradeRunContext, active_coin_count: int, target_coin_count: int
+    ) -> int:
+        """
+        실행 기록 저장
+
+        @param context: record()가 반환한 실행 기록 상태
+        @param active_coin_count: 활성 코인 수
+        @param target_coin_count: 실행 대상 코인 수
+        @return: 실행 ID
+        """
+        context.run.active_coin_count = active_coin_count
+        context.run.target_coin_count = target_coin_count
+        run = await self.trade_run_repository.create(context.run)
+        context.run_id = run.id
+        return run.id
+
+    async def _finish(
+        self,
+        context: TradeRunContext,
+        duration_ms: float,
+        error: Optional[Exception],
+    ) -> None:
+        """
+        실행 종료 기록 (기록 실패가 거래 결과나 원래 예외를 가리지 않도록 로그만 남김)
+
+        @param context: 실행 기록 상태
+        @param duration_ms: 전체 실행 시간 (ms)
+        @param error: 실행을 중단시킨 예외 (성공 시 None)
+        """
+        run = context.run
+        try:
+            if error is not None:
+                await self.session.rollback()
+            run.status = (
+                TradeRunStatus.FAILED.value if error else TradeRunStatus.SUCCESS.value
+            )
+            run.finished_at = datetime.utcnow()
+            run.duration_ms = duration_ms
+            run.error = f"{type(error).__name__}: {error}" if error else None
+            await self.trade_run_repository.update(run)
+            await self.add_stats(context.run_id, context.collector, context.trade_count)
+        except Exception as e:
+            logger.error(f"거래 실행 기록 실패: {str(e)}\n{traceback.format_exc()}")
+
+    async def add_stats(
+        self, run_id: int, collector: SpanCollector, trade_count: int
+    ) -> None:
+        """
+        span 집계를 구간별 시간/외부 호출 수로 변환하여 실행 기록에 누적
+
+        @param run_id: 실행 ID
+        @param collector: span 집계
+        @param trade_count: 더할 거래 수
+        """
+        stats: Dict[str, Union[int, float]] = {
+            column: collector.total_ms(*prefixes)
+            for column, prefixes in STAGE_SPAN_PREFIXES.items()
+        }
+        stats["upbit_calls"] = collector.count("upbit.")
+        stats["openai_calls"] = collector.count("openai.")
+        stats["trade_count"] = trade_count
+        await self.trade_run_repository.add_stats(run_id, stats)
+
+    async def get_runs(
+        self, cursor: Optional[int] = None, limit: int = 20
+    ) -> TradeRunsResponse:
+        """
+        최근 실행 기록을 커서 기반 페이지네이션으로 조회
+
+        @param cursor: 이전 페이지의 마지막 실행 ID (None이면 첫 페이지)
+        @param limit: 페이지당 조회할 항목 수
+        @return: 실행 기록 목록 응답 (다음 페이지 정보 포함)
+        """
+        runs = await self.trade_run_repository.get_recent_paginated(
+            cursor=cursor, limit=limit + 1
+        )
+
+        has_next = len(runs) > limit
+        if has_next:
+            runs = runs[:limit]
+        next_cursor = runs[-1].id if has_next and runs else None
+
+        return TradeRunsResponse(
+            items=[TradeRunItemResponse.from_run(run) for run in runs],
+            next_cursor=next_cursor,
+            has_next=has_next,
+        )
@@ -1,125 +1,568 @@
+import asyncio
 import traceback
+from dataclasses import dataclass
+from datetime import datetime
 from decimal import Decimal
 from logging import Logger
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 
 from app.ai.client.open_ai_client import OpenAIClient
 from app.ai.dto.ai_analysis_response import AiAnalysisResponse, Decision, RiskLevel
 from app.ballance.model.balance import Balance
 from app.ballance.repository.balance_repository import BalanceRepository
+from app.ballance.service.balance_snapshot_policy import BalanceSnapshotPolicy
 from app.coin.model.coin import Coin
 from app.coin.service.coin_service import CoinService
-from app.trade.dto.transaction_response import (
-    TransactionItemResponse,
-    TransactionsResponse,
-)
-from app.trade.model.enums import TradeStatus, TradeType
+from app.common.lease_lock import FencingToken, LeaseLostError
+from app.common.rate_limiter import RateLimiter, SharedRateLimiter
+from app.common.tracing import collect_spans, traced
+from app.configs.config import get_settings
+from app.trade.model.enums import FailureCategory, TradeStatus, TradeType
 from app.trade.model.trade import Trade
+from app.trade.model.trade_task import TradeTask
 from app.trade.repository.trade_repository import TradeRepository
+from app.trade.repository.trade_task_repository import TradeTaskRepository
+from app.trade.service.order_submitter import OrderRequest, OrderSubmitter
+from app.trade.service.portfolio_allocator import (
+    allocate_buy_budgets,
+    decision_weight,
+)
+from app.trade.service.trade_run_service import TradeRunService
 from app.upbit.client.upbit_client import UpbitClient
+from app.upbit.di.upbit_di import get_order_rate_limiter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = Logger(__name__)
 
 
-class TradeService:
-    """거래 비즈니스 로직"""
+@dataclass
+class CoinAnalysis:
+    """
+    코인별 분석 결과 (분석 단계와 주문 단계 사이에 전달)
+
+    @param coin_name: 코인 이름
+    @param ai_result: AI 분석 결과 (분석 실패 시 None)
+    @param coin_balance: 보유 코인 수량 (매도 결정일 때만 조회)
+    @param error: OHLCV 조회/AI 분석 중 발생한 예외
+    @param coin: 거래 대상 코인 (분석이 끝난 뒤 채움)
+    """
+
+    coin_name: str
+    ai_result: Optional[AiAnalysisResponse] = None
+    coin_balance: float = 0.0
+    error: Optional[Exception] = None
+    coin: Optional[Coin] = None
+
+    @property
+    def decision(self) -> Optional[Decision]:
+        """AI 결정 (분석 실패 시 None)"""
+        return self.ai_result.decision if self.ai_result is not None else None
 
-    def __init__(self, session: AsyncSession):
+
+# 주문을 내는 결정과 주문 단계의 처리 순서 (매도 → 매수)
+_DECISION_ORDER = {Decision.SELL: 0, Decision.BUY: 1}
+
+
+def _execution_order(analysis: CoinAnalysis) -> int:
+    """주문 단계에서의 처리 순서"""
+    return _DECISION_ORDER[analysis.decision]
+
+
+class TradeService:
+    """
+    거래 비즈니스 로직
+
+    @param session: 데이터베이스 세션
+    @param upbit_client: 프로세스에서 공유하는 Upbit 클라이언트 (get_upbit_client)
+    @param ai_client: 프로세스에서 공유하는 OpenAI 클라이언트 (get_open_ai_client)
+    @param fencing: lease 락의 fencing token (거래 기록 시 검증)
+    @param order_rate_limiter: 주문 요청 속도 제한 (기본: 계정 단위 get_order_rate_limiter)
+    @param snapshot_policy: 잔고 스냅샷 기록 정책 (기본: BALANCE_SNAPSHOT_* 설정)
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        upbit_client: UpbitClient,
+        ai_client: OpenAIClient,
+        fencing: Optional[FencingToken] = None,
+        order_rate_limiter: Optional[Union[RateLimiter, SharedRateLimiter]] = None,
+        snapshot_policy: Optional[BalanceSnapshotPolicy] = None,
+    ):
         self.session = session
-        self.trade_repository = TradeRepository(session)
+        self.trade_repository = TradeRepository(session, fencing=fencing)
         self.balance_repository = BalanceRepository(session)
+        self.trade_task_repository = TradeTaskRepository(session)
+        self.trade_run_service = TradeRunService(session)
         self.coin_service = CoinService(session=session)
-        self.upbit_client = UpbitClient()
-        self.ai_client = OpenAIClient()
+        self.upbit_client = upbit_client
+        self.ai_client = ai_client
+        self.order_submitter = OrderSubmitter(
+            self.trade_repository,
+            upbit_client,
+            order_rate_limiter or get_order_rate_limiter(),
+        )
+        self.snapshot_policy = snapshot_policy or BalanceSnapshotPolicy.from_settings(
+            get_settings()
+        )
 
+    @traced("trade.execute")
     async def execute(
-        self, fee_multiplier: float = 0.9995, min_order_amount: float = 5000.0
+        self,
+        fee_multiplier: float = 0.9995,
+        min_order_amount: float = 5000.0,
+        candle_interval: Optional[str] = None,
+        price_change_pct: Optional[float] = None,
+        trigger: str = "manual",
+        lock_wait_ms: float = 0.0,
+        analysis_concurrency: int = 8,
     ) -> List[Trade]:
         """
         모든 활성화된 코인에 대해 AI 분석 후 자동 거래를 실행합니다.
 
+        모든 코인을 먼저 동시에 분석한 뒤, 가용 KRW를 BUY 결정들에 신뢰도 × 위험 수준으로 배분하고
+        주문을 한 번에 실행합니다.
+        실행 1회를 trade_runs에 기록하고, 이번 실행에서 기록한 거래/잔고를 실행 ID로 연결합니다.
+        (조건에 맞는 코인이 없어 바로 끝난 실행은 기록하지 않음)
+
         @param fee_multiplier: 수수료를 고려한 실제 매매 가능 금액 계수 (기본: 0.9995)
         @param min_order_amount: 최소 주문 금액 (기본: 5000 KRW)
+        @param candle_interval: 지정 시 해당 캔들 간격의 코인만 실행 (캔들 마감 트리거)
+        @param price_change_pct: 지정 시 마지막 분석 가격 대비 변동률이 이 값 이상인 코인만 실행
+        @param trigger: 실행 트리거 (interval/candle:<간격>/recheck/manual)
+        @param lock_wait_ms: 실행 락 획득에 걸린 시간 (ms)
+        @param analysis_concurrency: 동시에 분석할 최대 코인 수
         @return: 실행된 거래 목록
         """
         executed_trades: List[Trade] = []
 
-        # 1. 활성화된 모든 코인 조회
-        active_coins = await self.coin_service.get_all_active()
+        async with self.trade_run_service.record(
+            trigger, "inline", lock_wait_ms
+        ) as run:
+            # 1. 활성화된 모든 코인 조회
+            active_coins = await self.coin_service.get_all_active()
+            target_coins = await self._select_target_coins(
+                active_coins, candle_interval, price_change_pct
+            )
+            if active_coins and not target_coins:
+                # 조건에 맞는 코인이 없으면 잔고 기록 없이 종료
+                return executed_trades
+
+            self._link_run(
+                await self.trade_run_service.start(
+                    run, len(active_coins), len(target_coins)
+                )
+            )
+            try:
+                await self._trade_coins(
+                    target_coins,
+                    executed_trades,
+                    fee_multiplier,
+                    min_order_amount,
+                    analysis_concurrency,
+                )
+            finally:
+                run.trade_count = len(executed_trades)
 
+        return executed_trades
+
+    async def _trade_coins(
+        self,
+        coins: List[Coin],
+        executed_trades: List[Trade],
+        fee_multiplier: float,
+        min_order_amount: float,
+        analysis_concurrency: int = 8,
+    ) -> None:
+        """
+        잔고 기록 후 모든 코인을 동시에 분석하고, KRW를 배분하여 주문을 한 번에 실행
+
+        1. 분석: 코인별 OHLCV 조회/AI 분석을 동시에 실행 (DB 접근 없음)
+        2. 배분: 가용 KRW를 BUY 결정들에 신뢰도 × 위험 수준 가중치로 배분
+        3. 주문: 매도/매수 거래를 기록하고 주문을 속도 제한 안에서 동시에 접수한 뒤, 나머지 결정(HOLD/분석 실패)을 기록
+
+        @param coins: 실행 대상 코인 목록
+        @param executed_trades: 실행된 거래를 추가할 목록 (실패로 중단되어도 그때까지의 거래가 남음)
+        @param fee_multiplier: 수수료 계수
+        @param min_order_amount: 최소 주문 금액
+        @param analysis_concurrency: 동시에 분석할 최대 코인 수
+        """
         # 2. 거래 전 잔고 기록
         await self._record_balance()
 
-        if not active_coins:
-            reason = "거래 가능한 활성화된 코인이 없습니다."
-
-            # NO_ACTION 상태로 기록
-            trade = Trade(
-                coin_id=None,
-                trade_type=None,
-                price=Decimal("0"),
-                amount=Decimal("0"),
-                risk_level=RiskLevel.NONE.value,
-                status=TradeStatus.NO_ACTION,
-                ai_reason=None,
-                execution_reason=reason,
-            )
-            no_action_trade = await self.trade_repository.create(trade)
+        if not coins:
+            no_action_trade = await self._record_no_active_coins()
             executed_trades.append(no_action_trade)
-            return executed_trades
+            return
 
-        # 3. 현재 KRW 잔고 조회
+        # 3. 모든 코인 동시 분석
+        analyses = await self._analyze_coins(coins, analysis_concurrency)
+
+        # 4. 현재 KRW 잔고를 BUY 결정들에 배분
         krw_balance = self.upbit_client.get_krw_balance()
+        budgets = allocate_buy_budgets(
+            {
+                analysis.coin.id: decision_weight(analysis.ai_result)
+                for analysis in analyses
+                if analysis.decision == Decision.BUY
+            },
+            krw_balance,
+            min_order_amount / fee_multiplier,
+        )
 
-        # 4. 각 코인에 대해 AI 분석 및 거래 실행
-        for coin in active_coins:
-            try:
-                coin_trade: Optional[Trade] = await self._process_coin_trade(
-                    coin=coin,
+        # 5. 매도 → 매수 거래를 PENDING으로 기록한 뒤 주문을 한 번에 접수
+        #    (매도로 확보되는 KRW는 다음 실행에서 배분)
+        orders: List[OrderRequest] = []
+        order_analyses = sorted(
+            (a for a in analyses if a.decision in _DECISION_ORDER),
+            key=_execution_order,
+        )
+        for analysis in order_analyses:
+            await self._record_decision(
+                analysis,
+                executed_trades,
+                krw_balance=budgets.get(analysis.coin.id, krw_balance),
+                fee_multiplier=fee_multiplier,
+                min_order_amount=min_order_amount,
+                allocation=self._allocation_note(
+                    budgets, analysis.coin.id, krw_balance, min_order_amount
+                ),
+                orders=orders,
+            )
+        try:
+            await self.order_submitter.submit(orders)
+        except LeaseLostError:
+            raise
+        except Exception as e:
+            logger.error(
+                f"주문 일괄 접수 중 오류 발생: {str(e)}\ntraceback: {traceback.format_exc()}"
+            )
+
+        # 6. 나머지 결정(HOLD/분석 실패) 기록
+        for analysis in analyses:
+            if analysis.decision not in _DECISION_ORDER:
+                await self._record_decision(
+                    analysis,
+                    executed_trades,
                     krw_balance=krw_balance,
                     fee_multiplier=fee_multiplier,
                     min_order_amount=min_order_amount,
                 )
 
-                if coin_trade:
-                    executed_trades.append(coin_trade)
-                    # 거래 후 KRW 잔고 갱신 (매수 시)
-                    if (
-                        coin_trade.trade_type == TradeType.BUY.value
-                        and coin_trade.status == TradeStatus.SUCCESS
-                    ):
-                        krw_balance = self.upbit_client.get_krw_balance()
+    async def _record_decision(
+        self,
+        analysis: CoinAnalysis,
+        executed_trades: List[Trade],
+        **kwargs,
+    ) -> None:
+        """
+        코인 1개의 분석 결과를 거래로 기록 (코인별 오류는 로그만 남기고 다음 코인 진행)
+
+        @param analysis: 코인 분석 결과
+        @param executed_trades: 기록된 거래를 추가할 목록
+        @param kwargs: _execute_decision()에 전달할 인자
+        """
+        try:
+            coin_trade = await self._execute_decision(analysis, **kwargs)
+            if coin_trade:
+                executed_trades.append(coin_trade)
+
+        except LeaseLostError:
+            # 락을 잃은 경우 더 이상 거래를 기록할 수 없으므로 즉시 중단
+            raise
+        except Exception as e:
+            logger.error(
+                f"코인 {analysis.coin_name} 거래 처리 중 오류 발생: {str(e)}\ntraceback: {traceback.format_exc()}"
+            )
+
+    async def _analyze_coins(
+        self, coins: List[Coin], concurrency: int
+    ) -> List[CoinAnalysis]:
+        """
+        코인별 분석을 최대 concurrency개씩 동시에 실행
+
+        분석 중 예외가 발생한 코인은 오류를 기록하고 이번 실행에서 제외합니다.
 
-            except Exception as e:
+        @param coins: 분석할 코인 목록
+        @param concurrency: 동시에 분석할 최대 코인 수
+        @return: 분석 결과 목록 (코인 순서 유지)
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def analyze(coin: Coin) -> CoinAnalysis:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._analyze_coin, coin.name, coin.candle_interval
+                )
+
+        results = await asyncio.gather(
+            *(analyze(coin) for coin in coins), return_exceptions=True
+        )
+
+        analyses: List[CoinAnalysis] = []
+        for coin, result in zip(coins, results):
+            if isinstance(result, BaseException):
                 logger.error(
-                    f"코인 {coin.name} 거래 처리 중 오류 발생: {str(e)}\ntraceback: {traceback.format_exc()}"
+                    f"코인 {coin.name} 분석 중 오류 발생: {str(result)}\n"
+                    f"traceback: {''.join(traceback.format_exception(type(result), result, result.__traceback__))}"
                 )
                 continue
+            result.coin = coin
+            analyses.append(result)
+        return analyses
+
+    @staticmethod
+    def _allocation_note(
+        budgets: Dict[int, float],
+        coin_id: int,
+        krw_balance: float,
+        min_order_amount: float,
+    ) -> Optional[str]:
+        """매수 사유에 남길 KRW 배분 내역 (BUY 결정이 아니면 None)"""
+        if coin_id not in budgets:
+            return None
+        share = budgets[coin_id]
+        if share <= 0:
+            return (
+                f"KRW 배분 제외: 전체 {krw_balance:,.0f}원을 {len(budgets)}개 매수 결정에 "
+                f"나누면 최소 주문 금액({min_order_amount:,.0f}원)에 못 미침"
+            )
+        return (
+            f"KRW 배분: 전체 {krw_balance:,.0f}원 중 {share:,.0f}원 "
+            f"({share / krw_balance:.1%}, 매수 결정 {len(budgets)}개)"
+        )
 
-        return executed_trades
+    @staticmethod
+    def _task_allocation_note(
+        krw_budget: float, krw_balance: float, min_order_amount: float
+    ) -> str:
+        """큐 작업의 매수 사유에 남길 KRW 배분 내역"""
+        if krw_budget <= 0:
+            return (
+                f"KRW 배분 제외: 작업 추가 시점의 KRW를 대상 코인들에 나누면 "
+                f"최소 주문 금액({min_order_amount:,.0f}원)에 못 미침"
+            )
+        return (
+            f"KRW 배분: 작업 추가 시 균등 배분 {krw_budget:,.0f}원 "
+            f"(현재 KRW 잔고 {krw_balance:,.0f}원)"
+        )
+
+    def _link_run(self, run_id: Optional[int]) -> None:
+        """이후 기록하는 거래/잔고를 실행(trade_runs)에 연결"""
+        self.trade_repository.run_id = run_id
+        self.balance_repository.run_id = run_id
+
+    async def enqueue_tasks(
+        self,
+        fee_multiplier: float = 0.9995,
+        min_order_amount: float = 5000.0,
+        candle_interval: Optional[str] = None,
+        price_change_pct: Optional[float] = None,
+        trigger: str = "manual",
+        lock_wait_ms: float = 0.0,
+    ) -> int:
+        """
+        모든 활성화된 코인에 대해 코인별 거래 작업을 큐에 추가합니다.
+
+        실제 AI 분석과 거래는 각 워커 프로세스의 TradeTaskWorker가
+        작업을 하나씩 점유하여 execute_task()로 처리합니다.
+        작업에는 실행 ID가 함께 저장되어, 처리 결과(거래, 구간별 시간)가 같은 실행 기록에 누적됩니다.
+        AI 결정 전이므로 현재 KRW 잔고를 대상 코인들에 균등하게 배분하여 작업별 매수 상한으로 저장합니다.
+        (먼저 처리된 작업이 KRW 잔고 전체로 매수하지 않도록)
+
+        @param fee_multiplier: 수수료 계수
+        @param min_order_amount: 최소 주문 금액
+        @param candle_interval: 지정 시 해당 캔들 간격의 코인만 추가
+        @param price_change_pct: 지정 시 마지막 분석 가격 대비 변동률이 이 값 이상인 코인만 추가
+        @param trigger: 실행 트리거 (interval/candle:<간격>/recheck/manual)
+        @param lock_wait_ms: 실행 락 획득에 걸린 시간 (ms)
+        @return: 추가된 작업 수
+        """
+        async with self.trade_run_service.record(trigger, "queue", lock_wait_ms) as run:
+            active_coins = await self.coin_service.get_all_active()
+            target_coins = await self._select_target_coins(
+                active_coins, candle_interval, price_change_pct
+            )
+            if active_coins and not target_coins:
+                return 0
+
+            run_id = await self.trade_run_service.start(
+                run, len(active_coins), len(target_coins)
+            )
+            self._link_run(run_id)
+
+            # 거래 전 잔고 기록
+            await self._record_balance()
 
+            if not target_coins:
+                await self._record_no_active_coins()
+                run.trade_count = 1
+                return 0
+
+            coin_ids = [coin.id for coin in target_coins]
+            krw_budgets = allocate_buy_budgets(
+                {coin_id: 1.0 for coin_id in coin_ids},
+                self.upbit_client.get_krw_balance(),
+                min_order_amount / fee_multiplier,
+            )
+            return await self.trade_task_repository.enqueue(
+                coin_ids=coin_ids,
+                fee_multiplier=fee_multiplier,
+                min_order_amount=min_order_amount,
+                run_id=run_id,
+                krw_budgets=krw_budgets,
+            )
+
+    async def execute_task(self, task: TradeTask) -> Optional[Trade]:
+        """
+        큐에서 점유한 코인별 작업을 처리합니다.
+
+        작업을 추가한 실행이 있으면 거래를 해당 실행에 연결하고, 처리 중 구간별 시간을 누적합니다.
+        거래는 주문 접수 전에 작업 ID와 함께 기록되므로, 점유가 만료되어 재시도하는 작업은
+        이전 시도가 기록한 거래가 있으면 다시 분석/주문하지 않고 그 거래를 반환합니다.
+        (주문 체결 여부는 OrderReconcileService가 확인)
+
+        @param task: 점유한 거래 작업
+        @return: 실행된 거래 또는 None (코인이 삭제된 경우)
+        """
+        if task.attempts > 1:
+            previous_trade = await self.trade_repository.get_by_task_id(task.id)
+            if previous_trade is not None:
+                logger.info(
+                    f"이전 시도가 기록한 거래가 있어 주문하지 않습니다: task={task.id}, trade={previous_trade.id}"
+                )
+                return previous_trade
+
+        coin = await self.coin_service.get_by_id(task.coin_id)
+        if coin is None or coin.is_deleted:
+            return None
+
+        self._link_run(task.run_id)
+        self.trade_repository.task_id = task.id
+        with collect_spans() as collector:
+            # 작업에 배분된 KRW와 처리 시점의 KRW 잔고 중 작은 금액으로 매수
+            krw_balance = self.upbit_client.get_krw_balance()
+            allocation = None
+            if task.krw_budget is not None:
+                allocation = self._task_allocation_note(
+                    task.krw_budget, krw_balance, task.min_order_amount
+                )
+                krw_balance = min(krw_balance, task.krw_budget)
+
+            trade = await self._process_coin_trade(
+                coin=coin,
+                krw_balance=krw_balance,
+                fee_multiplier=task.fee_multiplier,
+                min_order_amount=task.min_order_amount,
+                allocation=allocation,
+            )
+
+        if task.run_id is not None:
+            await self.trade_run_service.add_stats(
+                task.run_id, collector, 1 if trade else 0
+            )
+        return trade
+
+    async def _select_target_coins(
+        self,
+        active_coins: List[Coin],
+        candle_interval: Optional[str],
+        price_change_pct: Optional[float],
+    ) -> List[Coin]:
+        """
+        실행 대상 코인 선택
+
+        @param active_coins: 활성화된 코인 목록
+        @param candle_interval: 지정 시 해당 캔들 간격의 코인만 선택
+        @param price_change_pct: 지정 시 마지막 분석 가격 대비 변동률(%)이 이 값 이상인 코인만 선택
+        @return: 실행 대상 코인 목록
+        """
+        coins = active_coins
+        if candle_interval is not None:
+            coins = [coin for coin in coins if coin.candle_interval == candle_interval]
+
+        if price_change_pct is None or not coins:
+            return coins
+
+        # 캔들 중간 재확인: 변동성이 큰 코인만 다시 분석
+        current_prices = self.upbit_client.get_current_prices(
+            [coin.name for coin in coins]
+        )
+        volatile_coins: List[Coin] = []
+        for coin in coins:
+            last_trade = await self.trade_repository.get_latest_priced_by_coin_id(
+                coin.id
+            )
+            current_price = current_prices.get(coin.name)
+            if last_trade is None or not current_price:
+                continue
+            last_price = float(last_trade.price)
+            change_pct = abs(current_price - last_price) / last_price * 100
+            if change_pct >= price_change_pct:
+                volatile_coins.append(coin)
+        return volatile_coins
+
+    async def _record_no_active_coins(self) -> Trade:
+        """활성화된 코인이 없는 실행을 NO_ACTION 상태로 기록"""
+        reason = "거래 가능한 활성화된 코인이 없습니다."
+
+        trade = Trade(
+            coin_id=None,
+            trade_type=None,
+            price=Decimal("0"),
+            amount=Decimal("0"),
+            risk_level=RiskLevel.NONE.value,
+            status=TradeStatus.NO_ACTION,
+            ai_reason=None,
+            execution_reason=reason,
+        )
+        return await self.trade_repository.create(trade)
+
+    @traced("trade.process_coin")
     async def _process_coin_trade(
         self,
         coin: Coin,
         krw_balance: float,
         fee_multiplier: float,
         min_order_amount: float,
+        allocation: Optional[str] = None,
     ) -> Optional[Trade]:
         """
         개별 코인에 대한 AI 분석 및 거래 처리
 
         @param coin: 거래 대상 코인
-        @param krw_balance: 현재 KRW 잔고
+        @param krw_balance: 매수에 사용할 KRW
         @param fee_multiplier: 수수료 계수
         @param min_order_amount: 최소 주문 금액
+        @param allocation: 매수 사유에 남길 KRW 배분 내역
         @return: 실행된 거래 또는 None
         """
-        coin_name = coin.name
+        analysis = await asyncio.to_thread(
+            self._analyze_coin, coin.name, coin.candle_interval
+        )
+        analysis.coin = coin
+        return await self._execute_decision(
+            analysis,
+            krw_balance=krw_balance,
+            fee_multiplier=fee_multiplier,
+            min_order_amount=min_order_amount,
+            allocation=allocation,
+        )
 
+    @traced("trade.analyze_coin")
+    def _analyze_coin(self, coin_name: str, candle_interval: str) -> CoinAnalysis:
+        """
+        OHLCV 조회 및 AI 분석 (DB에 접근하지 않으므로 스레드에서 동시에 실행 가능)
+
+        OHLCV 조회/AI 분석 실패는 예외 대신 결과의 error로 반환하여 FAILED 거래로 기록합니다.
+
+        @param coin_name: 코인 이름 (예: KRW-BTC)
+        @param candle_interval: 캔들 간격
+        @return: 분석 결과 (coin은 호출한 쪽에서 채움)
+        """
         try:
             # 1. OHLCV 데이터 조회
-            df = self.upbit_client.get_ohlcv_raw(coin_name)
+            df = self.upbit_client.get_ohlcv_raw(coin_name, interval=candle_interval)
 
             # 2. AI 분석
             ai_result: AiAnalysisResponse = self.ai_client.get_bitcoin_trading_decision(
@@ -127,17 +570,56 @@ class TradeService:
             )
 
         except Exception as e:
+            return CoinAnalysis(coin_name=coin_name, error=e)
+
+        # 3. 매도 결정이면 현재 코인 잔고 조회
+        coin_balance = 0.0
+        if ai_result.decision == Decision.SELL:
+            coin_balance = self.upbit_client.get_coin_balance(coin_name)
+
+        return CoinAnalysis(
+            coin_name=coin_name, ai_result=ai_result, coin_balance=coin_balance
+        )
+
+    async def _execute_decision(
+        self,
+        analysis: CoinAnalysis,
+        krw_balance: float,
+        fee_multiplier: float,
+        min_order_amount: float,
+        allocation: Optional[str] = None,
+        orders: Optional[List[OrderRequest]] = None,
+    ) -> Optional[Trade]:
+        """
+        분석 결과에 따라 거래 실행 및 기록
+
+        @param analysis: 코인 분석 결과
+        @param krw_balance: 이 코인의 매수에 사용할 KRW
+        @param fee_multiplier: 수수료 계수
+        @param min_order_amount: 최소 주문 금액
+        @param allocation: 매수 사유에 남길 KRW 배분 내역
+        @param orders: 지정 시 주문을 바로 접수하지 않고 이 목록에 추가 (일괄 접수)
+        @return: 실행된 거래 또는 None
+        """
+        coin = analysis.coin
+        coin_name = analysis.coin_name
+        ai_result = analysis.ai_result
+
+        if analysis.error is not None:
             # AI 분석 실패 시 FAILED 상태로 기록
-            error_type = type(e).__name__
-            error_message = str(e)
+            error_type = type(analysis.error).__name__
+            error_message = str(analysis.error)
 
             # OpenAI RateLimitError 등 특정 에러 처리
             if "RateLimitError" in error_type or "429" in error_message:
                 reason = f"AI 분석 실패 (OpenAI API quota 초과)\n에러: {error_message}"
+                failure_category = FailureCategory.AI_QUOTA
             elif "APIError" in error_type or "OpenAI" in error_type:
                 reason = f"AI 분석 실패 (OpenAI API 오류)\n에러 타입: {error_type}\n에러 메시지: {error_message}"
+                failure_category = FailureCategory.AI_API_ERROR
             else:
                 reason = f"AI 분석 실패\n에러 타입: {error_type}\n에러 메시지: {error_message}"
+                failure_category = FailureCategory.AI_ERROR
 
             trade = Trade(
                 coin_id=coin.id,
@@ -146,15 +628,13 @@ class TradeService:
                 amount=Decimal("0"),
                 risk_level=RiskLevel.NONE.value,
                 status=TradeStatus.FAILED,
+                failure_category=failure_category.value,
                 ai_reason=None,
                 execution_reason=reason,
             )
             return await self.trade_repository.create(trade)
 
-        # 3. 현재 코인 잔고 조회
-        coin_balance = self.upbit_client.get_coin_balance(coin_name)
-
-        # 4. 결정에 따라 거래 실행
+        # 결정에 따라 거래 실행
         if ai_result.decision == Decision.BUY:
             return await self._execute_buy(
                 coin=coin,
@@ -163,16 +643,19 @@ class TradeService:
                 fee_multiplier=fee_multiplier,
                 min_order_amount=min_order_amount,
                 ai_result=ai_result,
+                allocation=allocation,
+                orders=orders,
             )
 
         elif ai_result.decision == Decision.SELL:
             return await self._execute_sell(
                 coin=coin,
                 coin_name=coin_name,
-                coin_balance=coin_balance,
+                coin_balance=analysis.coin_balance,
                 fee_multiplier=fee_multiplier,
                 min_order_amount=min_order_amount,
                 ai_result=ai_result,
+                orders=orders,
             )
 
         elif ai_result.decision == Decision.HOLD:
@@ -186,6 +669,7 @@ class TradeService:
                 amount=Decimal("0"),
                 risk_level=ai_result.risk_level.value,
                 status=TradeStatus.NO_ACTION,
+                confidence=Decimal(str(ai_result.confidence)),
                 ai_reason=ai_result.reason,
                 execution_reason=f"AI HOLD 결정 (Confidence: {ai_result.confidence:.2%})",
             )
@@ -193,6 +677,7 @@ class TradeService:
 
         return None
 
+    @traced("trade.buy")
     async def _execute_buy(
         self,
         coin: Coin,
@@ -201,13 +686,22 @@ class TradeService:
         fee_multiplier: float,
         min_order_amount: float,
         ai_result: AiAnalysisResponse,
+        allocation: Optional[str] = None,
+        orders: Optional[List[OrderRequest]] = None,
     ) -> Optional[Trade]:
-        """매수 실행"""
+        """
+        매수 실행
+
+        orders가 주어지면 PENDING 거래만 기록하고 주문은 목록에 추가하여 일괄 접수합니다.
+        """
         reasons = []
         reasons.append(
             f"AI 매수 결정: Confidence {ai_result.confidence:.2%}, Reason: {ai_result.reason}"
         )
-        reasons.append(f"보유 KRW 잔고: {krw_balance:,.0f}원")
+        if allocation is not None:
+            reasons.append(allocation)
+        else:
+            reasons.append(f"보유 KRW 잔고: {krw_balance:,.0f}원")
 
         available_buy_amount = krw_balance * fee_multiplier
 
@@ -223,6 +717,8 @@ class TradeService:
                 amount=Decimal("0"),
                 risk_level=ai_result.risk_level.value,
                 status=TradeStatus.FAILED,
+                confidence=Decimal(str(ai_result.confidence)),
+                failure_category=FailureCategory.INSUFFICIENT_KRW.value,
                 ai_reason=ai_result.reason,
                 execution_reason="\n".join(reasons),
             )
@@ -244,26 +740,26 @@ class TradeService:
             amount=Decimal(str(coin_amount)),
             risk_level=ai_result.risk_level.value,
             status=TradeStatus.PENDING,
+            confidence=Decimal(str(ai_result.confidence)),
             ai_reason=ai_result.reason,
             execution_reason="\n".join(reasons),
         )
         trade = await self.trade_repository.create(trade)
 
-        try:
-            # 매수 실행
-            self.upbit_client.buy(coin_name, available_buy_amount)
-
-            reasons.append(f"매수 주문 실행 완료: {available_buy_amount:,.0f}원")
-            trade.status = TradeStatus.SUCCESS
-            trade.execution_reason = "\n".join(reasons)
-
-        except Exception as e:
-            reasons.append(f"매수 주문 실패: {str(e)}")
-            trade.status = TradeStatus.FAILED
-            trade.execution_reason = "\n".join(reasons)
-
-        return await self.trade_repository.update(trade)
+        # 매수 주문 접수 (체결 결과는 OrderReconcileService가 확인하여 상태 확정)
+        return await self._submit_order(
+            OrderRequest(
+                trade=trade,
+                coin_name=coin_name,
+                side=TradeType.BUY,
+                amount=available_buy_amount,
+                summary=f"{available_buy_amount:,.0f}원",
+                reasons=reasons,
+            ),
+            orders,
+        )
 
+    @traced("trade.sell")
     async def _execute_sell(
         self,
         coin: Coin,
@@ -272,8 +768,13 @@ class TradeService:
         fee_multiplier: float,
         min_order_amount: float,
         ai_result: AiAnalysisResponse,
+        orders: Optional[List[OrderRequest]] = None,
     ) -> Optional[Trade]:
-        """매도 실행"""
+        """
+        매도 실행
+
+        orders가 주어지면 PENDING 거래만 기록하고 주문은 목록에 추가하여 일괄 접수합니다.
+        """
         reasons = []
         reasons.append(
             f"AI 매도 결정: Confidence {ai_result.confidence:.2%}, Reason: {ai_result.reason}"
@@ -292,6 +793,8 @@ class TradeService:
                 amount=Decimal("0"),
                 risk_level=ai_result.risk_level.value,
                 status=TradeStatus.FAILED,
+                confidence=Decimal(str(ai_result.confidence)),
+                failure_category=FailureCategory.NO_HOLDINGS.value,
                 ai_reason=ai_result.reason,
                 execution_reason="\n".join(reasons),
             )
@@ -320,6 +823,8 @@ class TradeService:
                 amount=Decimal(str(coin_balance)),
                 risk_level=ai_result.risk_level.value,
                 status=TradeStatus.FAILED,
+                confidence=Decimal(str(ai_result.confidence)),
+                failure_category=FailureCategory.BELOW_MIN_ORDER.value,
                 ai_reason=ai_result.reason,
                 execution_reason="\n".join(reasons),
             )
@@ -333,30 +838,44 @@ class TradeService:
             amount=Decimal(str(coin_balance)),
             risk_level=ai_result.risk_level.value,
             status=TradeStatus.PENDING,
+            confidence=Decimal(str(ai_result.confidence)),
             ai_reason=ai_result.reason,
             execution_reason="\n".join(reasons),
         )
         trade = await self.trade_repository.create(trade)
 
-        try:
-            # 매도 실행
-            self.upbit_client.sell(coin_name, coin_balance)
-
-            reasons.append(
-                f"매도 주문 실행 완료: {coin_balance:.8f} {coin_name} (약 {available_sell_amount:,.0f}원)"
-            )
-            trade.status = TradeStatus.SUCCESS
-            trade.execution_reason = "\n".join(reasons)
+        # 매도 주문 접수 (체결 결과는 OrderReconcileService가 확인하여 상태 확정)
+        return await self._submit_order(
+            OrderRequest(
+                trade=trade,
+                coin_name=coin_name,
+                side=TradeType.SELL,
+                amount=coin_balance,
+                summary=f"{coin_balance:.8f} {coin_name}, 약 {available_sell_amount:,.0f}원",
+                reasons=reasons,
+            ),
+            orders,
+        )
 
-        except Exception as e:
-            reasons.append(f"매도 주문 실패: {str(e)}")
-            trade.status = TradeStatus.FAILED
-            trade.execution_reason = "\n".join(reasons)
+    async def _submit_order(
+        self, order: OrderRequest, orders: Optional[List[OrderRequest]]
+    ) -> Trade:
+        """
+        주문을 바로 접수하거나, 일괄 접수 목록에 추가
 
-        return await self.trade_repository.update(trade)
+        @param order: 접수할 주문
+        @param orders: 일괄 접수 목록 (None이면 바로 접수)
+        @return: 거래 (일괄 접수 시 접수 전 PENDING 상태)
+        """
+        if orders is not None:
+            orders.append(order)
+            return order.trade
+        trades = await self.order_submitter.submit([order])
+        return trades[0]
 
+    @traced("trade.record_balance")
     async def _record_balance(self) -> None:
-        """현재 잔고를 데이터베이스에 기록"""
+        """현재 잔고를 데이터베이스에 기록 (스냅샷 정책에 따라 변동이 없으면 생략)"""
         krw_balance = self.upbit_client.get_krw_balance()
 
         # 모든 활성 코인의 총 보유량 조회 (KRW 가치로 환산)
@@ -369,6 +888,16 @@ class TradeService:
                 current_price = self.upbit_client.get_current_price(coin.name)
                 total_coin_value += coin_balance * current_price
 
+        # 직전 기록 대비 변동이 작으면 기록 생략 (BALANCE_SNAPSHOT_MODE=change)
+        # heartbeat보다 오래된 기록은 어차피 새로 기록하므로 최근 파티션만 조회
+        latest = await self.balance_repository.get_latest(
+            since=datetime.utcnow() - self.snapshot_policy.heartbeat
+        )
+        if not self.snapshot_policy.should_record(
+            latest, krw_balance, total_coin_value
+        ):
+            return
+
         # 잔고 기록
         balance = Balance(
             amount=Decimal(str(krw_balance)),
@@ -376,42 +905,3 @@ class TradeService:
         )
 
         await self.balance_repository.create(balance)
-
-    async def get_transactions(
-        self,
-        cursor: Optional[int] = None,
-        limit: int = 20,
-        trade_type: Optional[str] = None,
-    ) -> TransactionsResponse:
-        """
-        거래 내역을 커서 기반 페이지네이션으로 조회
-
-        @param cursor: 이전 페이지의 마지막 거래 ID (None이면 첫 페이지)
-        @param limit: 페이지당 조회할 항목 수 (기본: 20)
-        @return: 거래 내역 목록 응답 (다음 페이지 정보 포함)
-        """
-        # limit + 1개를 조회하여 다음 페이지 존재 여부 확인
-        trades = await self.trade_repository.get_all_with_coin_paginated(
-            cursor=cursor, limit=limit + 1, trade_type=trade_type
-        )
-
-        # 다음 페이지 존재 여부 판단
-        has_next = len(trades) > limit
-
-        # 실제 반환할 항목은 limit개만
-        if has_next:
-            trades = trades[:limit]
-            next_cursor = trades[-1].id if trades else None
-        else:
-            next_cursor = None
-
-        items = [
-            TransactionItemResponse.from_trade(
-                trade=trade, coin_name=trade.coin.name if trade.coin else None
-            )
-            for trade in trades
-        ]
-
-        return TransactionsResponse(
-            items=items, next_cursor=next_cursor, has_next=has_next
-        )
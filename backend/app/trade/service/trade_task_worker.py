@@ -0,0 +1,132 @@
+"""
+TradeTask 워커
+
+trade_tasks 큐에서 코인별 작업을 점유하여 처리합니다.
+모든 워커 프로세스(여러 노드 포함)가 같은 큐를 소비하므로,
+한 주기에 처리할 수 있는 코인 수가 워커 수에 비례해 늘어납니다.
+"""
+
+import asyncio
+import os
+import socket
+import traceback
+import uuid
+from logging import Logger
+from typing import List, Optional
+
+from app.ai.di.open_ai_di import get_open_ai_client
+from app.common.model.base import get_session_maker, read_from_primary
+from app.trade.model.enums import TradeTaskStatus
+from app.trade.model.trade_task import TradeTask
+from app.trade.repository.trade_task_repository import TradeTaskRepository
+from app.trade.service.trade_service import TradeService
+from app.upbit.di.upbit_di import get_upbit_client
+
+logger = Logger(__name__)
+
+
+class TradeTaskWorker:
+    """
+    거래 작업 큐 소비자
+
+    작업 처리 중 워커가 멈추면 점유 시간(claim_timeout_seconds)이 지난 뒤
+    다른 워커가 작업을 다시 가져가 재시도합니다 (최대 max_attempts회).
+
+    @param claim_timeout_seconds: 작업 점유 유효 시간 (초)
+    @param max_attempts: 작업당 최대 시도 횟수
+    @param poll_interval: 큐가 비었을 때 재조회 간격 (초)
+    """
+
+    def __init__(
+        self,
+        claim_timeout_seconds: int = 300,
+        max_attempts: int = 3,
+        poll_interval: float = 1.0,
+    ):
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.claim_timeout_seconds = claim_timeout_seconds
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+
+    async def run(self) -> None:
+        """큐가 빌 때까지 작업을 처리하고, 비면 poll_interval만큼 대기를 반복"""
+        while True:
+            try:
+                # 활성 코인/직전 잔고 등 실행 판단에 쓰는 조회는 복제 지연 없이 primary에서
+                with read_from_primary():
+                    processed = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"거래 작업 워커 오류: {str(e)}\n{traceback.format_exc()}")
+                processed = False
+
+            if not processed:
+                await asyncio.sleep(self.poll_interval)
+
+    async def run_once(self) -> bool:
+        """
+        작업 하나를 점유하여 처리
+
+        @return: 처리한 작업이 있으면 True
+        """
+        session_maker = get_session_maker()
+
+        async with session_maker() as session:
+            task: Optional[TradeTask] = await TradeTaskRepository(session).claim(
+                worker_id=self.worker_id,
+                claim_timeout_seconds=self.claim_timeout_seconds,
+                max_attempts=self.max_attempts,
+            )
+
+        if task is None:
+            return False
+
+        logger.info(f"🧾 거래 작업 처리 시작: task={task.id}, coin={task.coin_id}")
+
+        async with session_maker() as session:
+            repository = TradeTaskRepository(session)
+            try:
+                trade_service = TradeService(
+                    session=session,
+                    upbit_client=get_upbit_client(),
+                    ai_client=get_open_ai_client(),
+                )
+                trade = await trade_service.execute_task(task)
+            except Exception as e:
+                await session.rollback()
+                await repository.finish(
+                    task,
+                    TradeTaskStatus.FAILED,
+                    error=f"{type(e).__name__}: {str(e)}\n{traceback.format_exc()}",
+                )
+                return True
+
+            recorded = await repository.finish(
+                task,
+                TradeTaskStatus.DONE,
+                trade_id=trade.id if trade else None,
+            )
+            if not recorded:
+                logger.info(
+                    f"점유 시간이 만료되어 결과를 기록하지 않습니다: task={task.id}"
+                )
+
+        return True
+
+
+class TradeTaskWorkerPool:
+    """프로세스 내 TradeTaskWorker 실행 관리"""
+
+    def __init__(self, workers: List[TradeTaskWorker]):
+        self.workers = workers
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        self._tasks = [asyncio.create_task(worker.run()) for worker in self.workers]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
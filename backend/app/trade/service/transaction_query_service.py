@@ -0,0 +1,139 @@
+"""
+거래 내역 조회
+
+목록/검색/상세 조회는 DB 세션만 사용하므로, 거래 실행에 필요한 Upbit/OpenAI 클라이언트 없이 구성합니다.
+(조회 API만 처리하는 워커는 pandas/pyupbit/openai를 import하지 않음)
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from app.trade.dto.transaction_response import (
+    TransactionItemResponse,
+    TransactionsResponse,
+)
+from app.trade.model.trade import Trade
+from app.trade.repository.trade_repository import TradeRepository
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class TransactionQueryService:
+    """
+    거래 내역 조회 로직
+
+    @param session: 데이터베이스 세션
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.trade_repository = TradeRepository(session)
+
+    async def get_transactions(
+        self,
+        cursor: Optional[int] = None,
+        limit: int = 20,
+        trade_type: Optional[str] = None,
+        since: Optional[datetime] = None,
+        include_reasons: bool = False,
+    ) -> TransactionsResponse:
+        """
+        거래 내역을 커서 기반 페이지네이션으로 조회
+
+        @param cursor: 이전 페이지의 마지막 거래 ID (None이면 첫 페이지)
+        @param limit: 페이지당 조회할 항목 수 (기본: 20)
+        @param since: 지정 시 이 시각 이후의 거래만 조회
+        @param include_reasons: 거래 사유 포함 여부 (기본: 제외, 사유는 get_transaction으로 조회)
+        @return: 거래 내역 목록 응답 (다음 페이지 정보 포함)
+        """
+        # limit + 1개를 조회하여 다음 페이지 존재 여부 확인
+        trades = await self.trade_repository.get_all_with_coin_paginated(
+            cursor=cursor,
+            limit=limit + 1,
+            trade_type=trade_type,
+            since=since,
+            include_reasons=include_reasons,
+        )
+        return self._to_transactions_page(trades, limit, include_reasons)
+
+    async def search_transactions(
+        self,
+        query: str,
+        cursor: Optional[int] = None,
+        limit: int = 20,
+        coin_id: Optional[int] = None,
+        trade_type: Optional[str] = None,
+        trade_status: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> TransactionsResponse:
+        """
+        거래 사유(AI 분석 결과, 실행 사유)로 거래 검색 (커서 기반 페이지네이션)
+
+        @param query: 검색어 (구문 단위로 일치)
+        @param cursor: 이전 페이지의 마지막 거래 ID (None이면 첫 페이지)
+        @param limit: 페이지당 조회할 항목 수 (기본: 20)
+        @param coin_id: 코인 ID 필터
+        @param trade_type: 거래 유형 필터
+        @param trade_status: 거래 상태 필터
+        @param since: 조회 시작 시각 (포함)
+        @param until: 조회 종료 시각 (미포함)
+        @return: 거래 내역 목록 응답 (사유 포함, 다음 페이지 정보 포함)
+        """
+        trades = await self.trade_repository.search(
+            query=query,
+            cursor=cursor,
+            limit=limit + 1,
+            coin_id=coin_id,
+            trade_type=trade_type,
+            status=trade_status,
+            since=since,
+            until=until,
+        )
+        return self._to_transactions_page(trades, limit, include_reasons=True)
+
+    @staticmethod
+    def _to_transactions_page(
+        trades: List[Trade], limit: int, include_reasons: bool
+    ) -> TransactionsResponse:
+        """limit + 1개까지 조회한 거래로 페이지 응답 구성"""
+        # 다음 페이지 존재 여부 판단
+        has_next = len(trades) > limit
+
+        # 실제 반환할 항목은 limit개만
+        if has_next:
+            trades = trades[:limit]
+            next_cursor = trades[-1].id if trades else None
+        else:
+            next_cursor = None
+
+        items = [
+            TransactionItemResponse.from_trade(
+                trade=trade,
+                coin_name=trade.coin.name if trade.coin else None,
+                include_reasons=include_reasons,
+            )
+            for trade in trades
+        ]
+
+        return TransactionsResponse(
+            items=items, next_cursor=next_cursor, has_next=has_next
+        )
+
+    async def get_transaction(self, trade_id: int) -> TransactionItemResponse:
+        """
+        거래 1건을 사유와 함께 조회
+
+        @param trade_id: 거래 ID
+        @return: 거래 상세 (AI 분석 결과, 실행 사유 포함)
+        @raises HTTPException: 거래를 찾을 수 없는 경우 (404)
+        """
+        trade = await self.trade_repository.get_with_coin(trade_id)
+        if trade is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="거래를 찾을 수 없습니다.",
+            )
+
+        return TransactionItemResponse.from_trade(
+            trade=trade, coin_name=trade.coin.name if trade.coin else None
+        )
@@ -0,0 +1,457 @@
+"""
+시뮬레이션 거래소 클라이언트
+
+UpbitClient와 같은 인터페이스를 제공하지만 실제 Upbit API를 호출하지 않습니다.
+- KRW/코인 잔고를 메모리에 보관
+- 합성 호가창(랜덤 워크 가격) 또는 기록된 호가창 스냅샷으로 시장가 주문을 체결
+- 호출마다 지연(latency)과 실패를 주입
+
+UPBIT_CLIENT=simulated로 설정하면 get_upbit_client()가 이 클라이언트를 반환하므로,
+실제 계정 없이 API와 스케줄러 전체를 성능/부하 테스트할 수 있습니다.
+"""
+
+import json
+import random
+import threading
+import time
+import uuid
+import zlib
+from datetime import datetime, timedelta
+from logging import Logger
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from pandas import DataFrame, DatetimeIndex
+
+from app.common.metrics import observe_external_call
+from app.common.tracing import traced
+from app.configs.config import Settings
+from app.upbit.client.upbit_client import UpbitClient
+from app.upbit.dto.coin_balance import CoinBalance
+from app.upbit.dto.my_ballance_response import MyBallanceResponse
+from app.upbit.dto.ohlcv_dto import OhlcvItem, OhlcvResponse
+from app.upbit.dto.order_dto import UpbitOrder
+
+logger = Logger(__name__)
+
+# 캔들 간격별 길이 (분), pyupbit interval 값 기준
+INTERVAL_MINUTES = {
+    "minute1": 1,
+    "minute3": 3,
+    "minute5": 5,
+    "minute10": 10,
+    "minute15": 15,
+    "minute30": 30,
+    "minute60": 60,
+    "minute240": 240,
+    "day": 1440,
+    "week": 10080,
+    "month": 43200,
+}
+
+OHLCV_COUNT = 200  # pyupbit.get_ohlcv 기본 개수
+ORDERBOOK_LEVELS = 15  # Upbit 호가창 단계 수
+
+
+class SimulatedExchangeError(Exception):
+    """주입된 거래소 호출 실패 또는 주문 불가"""
+
+
+class SimulatedUpbitClient(UpbitClient):
+    """
+    메모리 기반 시뮬레이션 거래소
+
+    @param initial_krw: 초기 KRW 잔고
+    @param initial_balances: 초기 코인 보유량 (티커 → 수량)
+    @param initial_prices: 초기 가격 (티커 → 가격, 없으면 티커별로 정해진 임의 가격)
+    @param recorded_orderbooks: 기록된 호가창 스냅샷 (티커 → pyupbit.get_orderbook 형식 목록),
+                                조회할 때마다 다음 스냅샷을 순환하여 사용
+    @param volatility: 합성 호가창의 호가 조회당 가격 변동성 (로그 수익률 표준편차)
+    @param spread_bps: 합성 호가창의 매수/매도 호가 차이 (bp)
+    @param depth_krw: 합성 호가창의 호가 단계별 평균 잔량 (KRW)
+    @param fee_rate: 체결 금액 대비 수수료율 (Upbit KRW 마켓: 0.05%)
+    @param latency_ms: 호출당 지연 (ms)
+    @param latency_jitter_ms: 호출당 추가 지연의 최대값 (ms, 균등 분포)
+    @param failure_rate: 호출당 실패 확률 (0~1)
+    @param seed: 난수 시드
+    """
+
+    def __init__(
+        self,
+        initial_krw: float = 10_000_000.0,
+        initial_balances: Optional[Dict[str, float]] = None,
+        initial_prices: Optional[Dict[str, float]] = None,
+        recorded_orderbooks: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        volatility: float = 0.001,
+        spread_bps: float = 5.0,
+        depth_krw: float = 50_000_000.0,
+        fee_rate: float = 0.0005,
+        latency_ms: float = 0.0,
+        latency_jitter_ms: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        # 실제 API 키와 pyupbit.Upbit은 사용하지 않음
+        self.krw = initial_krw
+        self.balances: Dict[str, float] = dict(initial_balances or {})
+        self.prices: Dict[str, float] = dict(initial_prices or {})
+        self.recorded_orderbooks = recorded_orderbooks or {}
+        self.volatility = volatility
+        self.spread_bps = spread_bps
+        self.depth_krw = depth_krw
+        self.fee_rate = fee_rate
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.failure_rate = failure_rate
+
+        self.orders: Dict[str, Dict[str, Any]] = {}
+        self._orderbook_cursor: Dict[str, int] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "SimulatedUpbitClient":
+        """
+        설정값(SIM_*)으로 생성
+
+        @param settings: Settings 인스턴스
+        @return: SimulatedUpbitClient
+        """
+        recorded_orderbooks = None
+        if settings.SIM_ORDERBOOK_PATH:
+            with open(settings.SIM_ORDERBOOK_PATH, encoding="utf-8") as f:
+                recorded_orderbooks = json.load(f)
+
+        return cls(
+            initial_krw=settings.SIM_INITIAL_KRW,
+            recorded_orderbooks=recorded_orderbooks,
+            volatility=settings.SIM_VOLATILITY,
+            latency_ms=settings.SIM_LATENCY_MS,
+            latency_jitter_ms=settings.SIM_LATENCY_JITTER_MS,
+            failure_rate=settings.SIM_FAILURE_RATE,
+            seed=settings.SIM_SEED,
+        )
+
+    # 시세 조회 API
+    @traced("upbit.get_ohlcv")
+    @observe_external_call("upbit")
+    def get_ohlcv(self, coin_name: str) -> OhlcvResponse:
+        self._simulate_call()
+        df = self._generate_ohlcv(coin_name, "day")
+        items = [
+            OhlcvItem(
+                timestamp=index.to_pydatetime(),
+                open=row.open,
+                high=row.high,
+                low=row.low,
+                close=row.close,
+                volume=row.volume,
+                value=row.value,
+            )
+            for index, row in zip(df.index, df.itertuples(index=False))
+        ]
+        return OhlcvResponse(items=items)
+
+    @traced("upbit.get_ohlcv_raw")
+    @observe_external_call("upbit")
+    def get_ohlcv_raw(self, coin_name: str, interval: str = "day") -> DataFrame:
+        """
+        현재 가격에서 끝나는 합성 OHLCV 데이터 (pyupbit.get_ohlcv와 같은 컬럼, KST 인덱스)
+
+        @raises ValueError: 지원하지 않는 캔들 간격
+        """
+        self._simulate_call()
+        return self._generate_ohlcv(coin_name, interval)
+
+    def _generate_ohlcv(self, coin_name: str, interval: str) -> DataFrame:
+        if interval not in INTERVAL_MINUTES:
+            raise ValueError(
+                f"'{coin_name}' 데이터를 조회할 수 없습니다. (interval: {interval})"
+            )
+
+        with self._lock:
+            last_price = self._mid_price(coin_name)
+
+        minutes = INTERVAL_MINUTES[interval]
+        step_volatility = self.volatility * np.sqrt(minutes)
+        rng = np.random.default_rng(self._random.getrandbits(32))
+
+        # 현재 가격에서 거꾸로 랜덤 워크하여 종가 생성
+        log_returns = rng.normal(0, step_volatility, OHLCV_COUNT)
+        close = last_price * np.exp(-np.cumsum(log_returns[::-1])[::-1] + log_returns)
+        open_ = np.concatenate(([close[0]], close[:-1]))
+        wick = np.abs(rng.normal(0, step_volatility / 2, (2, OHLCV_COUNT)))
+        high = np.maximum(open_, close) * (1 + wick[0])
+        low = np.minimum(open_, close) * (1 - wick[1])
+        volume = rng.exponential(self.depth_krw / last_price, OHLCV_COUNT)
+
+        now_kst = datetime.utcnow() + timedelta(hours=9)
+        last_start = now_kst - timedelta(
+            minutes=(now_kst.hour * 60 + now_kst.minute) % min(minutes, 1440),
+            seconds=now_kst.second,
+            microseconds=now_kst.microsecond,
+        )
+        index = DatetimeIndex(
+            [last_start - timedelta(minutes=minutes * i) for i in range(OHLCV_COUNT)][
+                ::-1
+            ]
+        )
+
+        return DataFrame(
+            {
+                "open": open_,
+                "high": high,
+                "low": low,
+                "close": close,
+                "volume": volume,
+                "value": volume * close,
+            },
+            index=index,
+        )
+
+    @traced("upbit.get_current_price")
+    @observe_external_call("upbit")
+    def get_current_price(self, coin_name: str) -> float:
+        # 현재 매도 호가 조회 (get_orderbook을 거치지 않아 호출 1회로 기록)
+        self._simulate_call()
+        with self._lock:
+            orderbook = self._next_orderbook(coin_name)
+        return orderbook["orderbook_units"][0]["ask_price"]
+
+    @traced("upbit.get_current_prices")
+    @observe_external_call("upbit")
+    def get_current_prices(self, coin_names: List[str]) -> Dict[str, float]:
+        if not coin_names:
+            return {}
+        self._simulate_call()
+        with self._lock:
+            return {coin_name: self._mid_price(coin_name) for coin_name in coin_names}
+
+    @traced("upbit.get_orderbook")
+    @observe_external_call("upbit")
+    def get_orderbook(self, coin_name: str) -> Dict[str, Any]:
+        """
+        호가창 조회 (pyupbit.get_orderbook 형식)
+
+        기록된 스냅샷이 있으면 순환하여 반환하고, 없으면 가격을 한 단계 움직인 뒤 합성 호가창을 만듭니다.
+        """
+        self._simulate_call()
+        with self._lock:
+            return self._next_orderbook(coin_name)
+
+    # 주문 API
+    @traced("upbit.buy")
+    @observe_external_call("upbit")
+    def buy(self, coin_name: str, amount: float) -> str:
+        """
+        시장가 매수 (KRW 금액 지정), 매도 호가를 소진하며 체결
+
+        @param coin_name: 티커 (예: "KRW-BTC")
+        @param amount: 매수할 KRW 금액 (수수료 별도)
+        @return: 주문 UUID (호가 잔량이 부족해 일부만 체결되면 cancel 상태)
+        @raises SimulatedExchangeError: 주입된 실패 또는 KRW 잔고 부족
+        """
+        self._simulate_call()
+        with self._lock:
+            fee = amount * self.fee_rate
+            if amount + fee > self.krw:
+                raise SimulatedExchangeError(
+                    f"KRW 잔고 부족 (필요: {amount + fee:,.0f}원, 보유: {self.krw:,.0f}원)"
+                )
+
+            orderbook = self._next_orderbook(coin_name)
+            remaining = amount
+            volume = 0.0
+            for unit in orderbook["orderbook_units"]:
+                level_funds = unit["ask_price"] * unit["ask_size"]
+                take = min(remaining, level_funds)
+                volume += take / unit["ask_price"]
+                remaining -= take
+                if remaining <= 0:
+                    break
+
+            funds = amount - remaining
+            paid_fee = funds * self.fee_rate
+            self.krw -= funds + paid_fee
+            self.balances[coin_name] = self.balances.get(coin_name, 0.0) + volume
+            return self._record_order(
+                coin_name,
+                "bid",
+                volume,
+                funds,
+                paid_fee,
+                filled=remaining <= 0,
+                price=amount,
+            )
+
+    @traced("upbit.sell")
+    @observe_external_call("upbit")
+    def sell(self, coin_name: str, amount: float) -> str:
+        """
+        시장가 매도 (수량 지정), 매수 호가를 소진하며 체결
+
+        @param coin_name: 티커 (예: "KRW-BTC")
+        @param amount: 매도할 코인 수량
+        @return: 주문 UUID (호가 잔량이 부족해 일부만 체결되면 cancel 상태)
+        @raises SimulatedExchangeError: 주입된 실패 또는 보유 수량 부족
+        """
+        self._simulate_call()
+        with self._lock:
+            held = self.balances.get(coin_name, 0.0)
+            if amount > held:
+                raise SimulatedExchangeError(
+                    f"{coin_name} 보유 수량 부족 (필요: {amount:.8f}, 보유: {held:.8f})"
+                )
+
+            orderbook = self._next_orderbook(coin_name)
+            remaining = amount
+            funds = 0.0
+            for unit in orderbook["orderbook_units"]:
+                take = min(remaining, unit["bid_size"])
+                funds += take * unit["bid_price"]
+                remaining -= take
+                if remaining <= 0:
+                    break
+
+            volume = amount - remaining
+            paid_fee = funds * self.fee_rate
+            self.balances[coin_name] = held - volume
+            self.krw += funds - paid_fee
+            return self._record_order(
+                coin_name, "ask", volume, funds, paid_fee, filled=remaining <= 0
+            )
+
+    @traced("upbit.get_orders")
+    @observe_external_call("upbit")
+    def get_orders(self, order_uuids: List[str]) -> List[UpbitOrder]:
+        """
+        주문 상태 일괄 조회 (기록되지 않은 UUID는 제외)
+
+        @param order_uuids: 주문 UUID 목록
+        @return: 조회된 주문 목록
+        @raises SimulatedExchangeError: 주입된 실패
+        """
+        self._simulate_call()
+        with self._lock:
+            return [
+                UpbitOrder.model_validate(self.orders[order_uuid])
+                for order_uuid in order_uuids
+                if order_uuid in self.orders
+            ]
+
+    # 잔고 조회 API
+    @traced("upbit.get_coin_balance")
+    @observe_external_call("upbit")
+    def get_coin_balance(self, coin_name: str) -> float:
+        self._simulate_call()
+        with self._lock:
+            return self.balances.get(coin_name, 0.0)
+
+    @traced("upbit.get_krw_balance")
+    @observe_external_call("upbit")
+    def get_krw_balance(self) -> float:
+        self._simulate_call()
+        with self._lock:
+            return self.krw
+
+    @traced("upbit.get_my_balance")
+    @observe_external_call("upbit")
+    def get_my_balance(self, coin_names: list[str]) -> MyBallanceResponse:
+        self._simulate_call()
+        with self._lock:
+            return MyBallanceResponse(
+                krw=self.krw,
+                coin_balances=[
+                    CoinBalance(coin_name=coin, balance=self.balances.get(coin, 0.0))
+                    for coin in coin_names
+                ],
+            )
+
+    def _simulate_call(self) -> None:
+        """지연 및 실패 주입"""
+        delay_ms = self.latency_ms
+        if self.latency_jitter_ms > 0:
+            delay_ms += self._random.uniform(0, self.latency_jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+        if self.failure_rate > 0 and self._random.random() < self.failure_rate:
+            raise SimulatedExchangeError("주입된 거래소 호출 실패")
+
+    def _mid_price(self, coin_name: str) -> float:
+        """현재 기준 가격 (락 보유 상태에서 호출)"""
+        if coin_name in self.recorded_orderbooks:
+            snapshots = self.recorded_orderbooks[coin_name]
+            cursor = self._orderbook_cursor.get(coin_name, 0)
+            unit = snapshots[(cursor - 1) % len(snapshots)]["orderbook_units"][0]
+            return (unit["ask_price"] + unit["bid_price"]) / 2
+
+        if coin_name not in self.prices:
+            # 티커별로 고정된 임의 초기 가격 (1만 ~ 1억 원)
+            self.prices[coin_name] = float(
+                10 ** (4 + zlib.crc32(coin_name.encode()) % 5)
+            )
+        return self.prices[coin_name]
+
+    def _next_orderbook(self, coin_name: str) -> Dict[str, Any]:
+        """다음 호가창 (락 보유 상태에서 호출)"""
+        if coin_name in self.recorded_orderbooks:
+            snapshots = self.recorded_orderbooks[coin_name]
+            cursor = self._orderbook_cursor.get(coin_name, 0)
+            self._orderbook_cursor[coin_name] = cursor + 1
+            return snapshots[cursor % len(snapshots)]
+
+        price = self._mid_price(coin_name) * float(
+            np.exp(self._random.gauss(0, self.volatility))
+        )
+        self.prices[coin_name] = price
+
+        half_spread = price * self.spread_bps / 20_000
+        tick = price * 0.0001
+        units = []
+        for level in range(ORDERBOOK_LEVELS):
+            ask_price = price + half_spread + tick * level
+            bid_price = price - half_spread - tick * level
+            units.append(
+                {
+                    "ask_price": ask_price,
+                    "bid_price": bid_price,
+                    "ask_size": self._random.expovariate(price / self.depth_krw),
+                    "bid_size": self._random.expovariate(price / self.depth_krw),
+                }
+            )
+
+        return {
+            "market": coin_name,
+            "timestamp": int(time.time() * 1000),
+            "total_ask_size": sum(unit["ask_size"] for unit in units),
+            "total_bid_size": sum(unit["bid_size"] for unit in units),
+            "orderbook_units": units,
+        }
+
+    def _record_order(
+        self,
+        coin_name: str,
+        side: str,
+        volume: float,
+        funds: float,
+        fee: float,
+        filled: bool,
+        price: Optional[float] = None,
+    ) -> str:
+        """체결된 주문 기록 (락 보유 상태에서 호출)"""
+        order_uuid = str(uuid.uuid4())
+        self.orders[order_uuid] = {
+            "uuid": order_uuid,
+            "side": side,
+            "ord_type": "price" if side == "bid" else "market",
+            "market": coin_name,
+            # 시장가 주문의 미체결 잔량은 취소됨
+            "state": "done" if filled else "cancel",
+            "price": price,
+            "executed_volume": volume,
+            "executed_funds": funds,
+            "paid_fee": fee,
+            "created_at": datetime.utcnow().isoformat(),
+        }
+        return order_uuid
@@ -1,21 +1,37 @@
-from typing import List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import pyupbit
-from pandas import DataFrame
-
-from app.configs import config
+from app.common.metrics import observe_external_call
+from app.common.tracing import traced
+from app.configs.config import Settings, get_settings
 from app.upbit.dto.coin_balance import CoinBalance
 from app.upbit.dto.my_ballance_response import MyBallanceResponse
 from app.upbit.dto.ohlcv_dto import OhlcvItem, OhlcvResponse
+from app.upbit.dto.order_dto import UpbitOrder
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+ORDERS_BY_UUIDS_URL = "https://api.upbit.com/v1/orders/uuids"
+ORDERS_BY_UUIDS_LIMIT = 100  # /v1/orders/uuids 요청당 최대 UUID 수
+
+
+class UpbitOrderError(Exception):
+    """주문 접수 실패 (pyupbit은 주문 API 오류를 예외 대신 None/error 응답으로 반환)"""
 
 
 class UpbitClient:
-    def __init__(self):
-        self.access = config.Settings().UPBIT_ACCESS_KEY
-        self.secret = config.Settings().UPBIT_SECRET_KEY
+    def __init__(self, settings: Optional[Settings] = None):
+        # pyupbit은 pandas/requests를 함께 불러오므로 클라이언트를 처음 만들 때 import
+        import pyupbit
+
+        settings = settings or get_settings()
+        self.access = settings.UPBIT_ACCESS_KEY
+        self.secret = settings.UPBIT_SECRET_KEY
         self.upbit = pyupbit.Upbit(self.access, self.secret)
 
     # 시세 조회 API
+    @traced("upbit.get_ohlcv")
+    @observe_external_call("upbit")
     def get_ohlcv(self, coin_name: str) -> OhlcvResponse:
         """
         OHLCV 데이터를 조회합니다.
@@ -24,7 +40,9 @@ class UpbitClient:
         @return: OhlcvResponse
         @raises ValueError: 유효하지 않은 티커이거나 데이터 조회 실패 시
         """
-        df: DataFrame = pyupbit.get_ohlcv(coin_name)
+        import pyupbit
+
+        df = pyupbit.get_ohlcv(coin_name)
 
         if df is None:
             raise ValueError(
@@ -47,15 +65,20 @@ class UpbitClient:
         return OhlcvResponse(items=items)
 
     # 시세 조회 API
-    def get_ohlcv_raw(self, coin_name: str) -> DataFrame:
+    @traced("upbit.get_ohlcv_raw")
+    @observe_external_call("upbit")
+    def get_ohlcv_raw(self, coin_name: str, interval: str = "day") -> "DataFrame":
         """
         OHLCV 데이터를 조회합니다.
 
         @param coin_name: 티커 (예: "KRW-BTC")
+        @param interval: 캔들 간격 (예: "day", "minute60")
         @return: OhlcvResponse
         @raises ValueError: 유효하지 않은 티커이거나 데이터 조회 실패 시
         """
-        df: DataFrame = pyupbit.get_ohlcv(coin_name)
+        import pyupbit
+
+        df = pyupbit.get_ohlcv(coin_name, interval=interval)
 
         if df is None:
             raise ValueError(
@@ -64,24 +87,97 @@ class UpbitClient:
 
         return df
 
+    @traced("upbit.get_current_price")
+    @observe_external_call("upbit")
     def get_current_price(self, coin_name: str) -> float:
+        import pyupbit
+
         # 현재 매도 호가 조회
         orderbook = pyupbit.get_orderbook(ticker=coin_name)
         current_price = orderbook["orderbook_units"][0]["ask_price"]
         return current_price
 
-    def buy(self, coin_name: str, amount: float) -> None:
-        self.upbit.buy_market_order(coin_name, amount)
+    @traced("upbit.get_current_prices")
+    @observe_external_call("upbit")
+    def get_current_prices(self, coin_names: List[str]) -> Dict[str, float]:
+        """
+        여러 코인의 현재 체결 가격을 한 번의 요청으로 조회합니다.
 
-    def sell(self, coin_name: str, amount: float) -> None:
+        @param coin_names: 티커 목록 (예: ["KRW-BTC", "KRW-ETH"])
+        @return: 티커별 현재 가격
         """
-        코인 시장가 매도를 실행합니다.
+        if not coin_names:
+            return {}
+
+        import pyupbit
+
+        prices = pyupbit.get_current_price(coin_names)
+        if not isinstance(prices, dict):
+            # 티커가 하나면 float으로 반환됨
+            return {coin_names[0]: prices}
+        return prices
+
+    @traced("upbit.buy")
+    @observe_external_call("upbit")
+    def buy(self, coin_name: str, amount: float) -> str:
+        """
+        코인 시장가 매수 주문을 접수합니다. (체결을 기다리지 않음)
+
+        @param coin_name: 티커 (예: "KRW-BTC")
+        @param amount: 매수할 KRW 금액
+        @return: 주문 UUID
+        @raises UpbitOrderError: 주문이 접수되지 않은 경우
+        """
+        return self._order_uuid(self.upbit.buy_market_order(coin_name, amount))
+
+    @traced("upbit.sell")
+    @observe_external_call("upbit")
+    def sell(self, coin_name: str, amount: float) -> str:
+        """
+        코인 시장가 매도 주문을 접수합니다. (체결을 기다리지 않음)
 
         @param coin_name: 티커 (예: "KRW-BTC")
         @param amount: 매도할 코인 수량
+        @return: 주문 UUID
+        @raises UpbitOrderError: 주문이 접수되지 않은 경우
+        """
+        return self._order_uuid(self.upbit.sell_market_order(coin_name, amount))
+
+    @staticmethod
+    def _order_uuid(result: Optional[Dict[str, Any]]) -> str:
+        """주문 API 응답에서 주문 UUID 추출"""
+        if not result:
+            raise UpbitOrderError("주문 API 호출 실패 (응답 없음)")
+        if "error" in result:
+            error = result["error"]
+            raise UpbitOrderError(f"{error.get('name')}: {error.get('message')}")
+        return result["uuid"]
+
+    @traced("upbit.get_orders")
+    @observe_external_call("upbit")
+    def get_orders(self, order_uuids: List[str]) -> List[UpbitOrder]:
         """
-        self.upbit.sell_market_order(coin_name, amount)
+        주문 UUID 목록의 상태를 일괄 조회합니다. (/v1/orders/uuids, 요청당 최대 100개)
+
+        @param order_uuids: 주문 UUID 목록
+        @return: 조회된 주문 목록 (거래소에서 찾지 못한 주문은 제외)
+        @raises UpbitError: API 호출 실패 시 (pyupbit.errors)
+        """
+        from pyupbit.request_api import _call_get
+
+        orders: List[UpbitOrder] = []
+        for start in range(0, len(order_uuids), ORDERS_BY_UUIDS_LIMIT):
+            query = {"uuids[]": order_uuids[start : start + ORDERS_BY_UUIDS_LIMIT]}
+            response = _call_get(
+                ORDERS_BY_UUIDS_URL,
+                params=query,
+                headers=self.upbit._request_headers(query),
+            )
+            orders.extend(UpbitOrder.model_validate(item) for item in response.json())
+        return orders
 
+    @traced("upbit.get_coin_balance")
+    @observe_external_call("upbit")
     def get_coin_balance(self, coin_name: str) -> float:
         """
         특정 코인의 보유량을 조회합니다.
@@ -92,6 +188,8 @@ class UpbitClient:
         balance = self.upbit.get_balance(coin_name)
         return balance if balance is not None else 0.0
 
+    @traced("upbit.get_krw_balance")
+    @observe_external_call("upbit")
     def get_krw_balance(self) -> float:
         """
         KRW 잔고를 조회합니다.
@@ -101,6 +199,8 @@ class UpbitClient:
         balance = self.upbit.get_balance("KRW")
         return balance if balance is not None else 0.0
 
+    @traced("upbit.get_my_balance")
+    @observe_external_call("upbit")
     def get_my_balance(self, coin_names: list[str]) -> MyBallanceResponse:
         krw = self.upbit.get_balance("KRW") or 0.0
         coin_balaces: List[CoinBalance] = []
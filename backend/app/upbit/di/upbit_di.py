@@ -1,5 +1,37 @@
+from functools import lru_cache
+from typing import Union
+
+from app.common.rate_limiter import RateLimiter, SharedRateLimiter
+from app.configs.config import get_settings
 from app.upbit.client.upbit_client import UpbitClient
 
 
+@lru_cache
 def get_upbit_client() -> UpbitClient:
-    return UpbitClient()
+    """
+    프로세스 단위 UpbitClient 싱글톤
+
+    UPBIT_CLIENT=simulated이면 메모리 기반 시뮬레이션 거래소를 반환합니다.
+    (잔고가 프로세스 내에서 공유되어야 하므로 매 요청마다 새로 만들지 않음)
+    """
+    settings = get_settings()
+    if settings.UPBIT_CLIENT == "simulated":
+        from app.upbit.client.simulated_upbit_client import SimulatedUpbitClient
+
+        return SimulatedUpbitClient.from_settings(settings)
+    return UpbitClient(settings)
+
+
+@lru_cache
+def get_order_rate_limiter() -> Union[RateLimiter, SharedRateLimiter]:
+    """
+    주문 요청 속도 제한 싱글톤
+
+    Upbit의 주문 API 요청 제한은 계정 단위이므로, 모든 워커/호스트가 DB(rate_limits)로
+    UPBIT_ORDER_RATE_PER_SECOND를 함께 지킵니다.
+    UPBIT_CLIENT=simulated이면 거래소가 프로세스 메모리에만 있으므로 프로세스 단위로 제한합니다.
+    """
+    settings = get_settings()
+    if settings.UPBIT_CLIENT == "simulated":
+        return RateLimiter(settings.UPBIT_ORDER_RATE_PER_SECOND)
+    return SharedRateLimiter("upbit_order", settings.UPBIT_ORDER_RATE_PER_SECOND)
@@ -0,0 +1,59 @@
+"""
+주문 DTO
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+# 시장가 매수는 호가 단위로 나누어떨어지지 않는 잔액이 취소(cancel)되므로,
+# 주문 금액의 이 비율 이상 체결되었으면 전량 체결로 판단
+MARKET_BUY_FILLED_RATIO = 0.999
+
+
+class UpbitOrder(BaseModel):
+    """주문 상태 (Upbit /v1/orders/uuids 응답 항목)"""
+
+    uuid: str = Field(description="주문 UUID")
+    side: str = Field(description="주문 종류 (bid: 매수, ask: 매도)")
+    ord_type: str = Field(
+        description="주문 방식 (price: 시장가 매수, market: 시장가 매도, limit: 지정가)"
+    )
+    market: str = Field(description="티커 (예: KRW-BTC)")
+    state: str = Field(
+        description="주문 상태 (wait/watch: 미체결, done: 체결 완료, cancel: 취소)"
+    )
+    price: Optional[float] = Field(
+        default=None, description="주문 가격 (시장가 매수는 주문 금액)"
+    )
+    executed_volume: float = Field(default=0.0, description="체결된 수량")
+    executed_funds: Optional[float] = Field(
+        default=None, description="체결된 금액 (KRW)"
+    )
+    paid_fee: float = Field(default=0.0, description="사용된 수수료 (KRW)")
+
+    @property
+    def is_open(self) -> bool:
+        """아직 체결/취소되지 않은 주문인지 여부"""
+        return self.state in ("wait", "watch")
+
+    @property
+    def is_fully_filled(self) -> bool:
+        """전량 체결 여부"""
+        if self.state == "done":
+            return True
+        if (
+            self.state == "cancel"
+            and self.ord_type == "price"
+            and self.price
+            and self.executed_funds is not None
+        ):
+            return self.executed_funds >= self.price * MARKET_BUY_FILLED_RATIO
+        return False
+
+    @property
+    def average_price(self) -> Optional[float]:
+        """평균 체결가 (체결 수량이 없거나 체결 금액을 알 수 없으면 None)"""
+        if self.executed_funds is None or self.executed_volume <= 0:
+            return None
+        return self.executed_funds / self.executed_volume
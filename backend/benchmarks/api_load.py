@@ -0,0 +1,268 @@
+"""
+조회 API 부하 테스트
+
+실행 중인 서버에 여러 시나리오의 요청을 동시에 보내고 시나리오별 처리량과 지연(p50/p99)을 측정합니다.
+benchmarks.seed_history로 대량 내역을 생성한 DB에서 인덱스/쿼리 변경 전후를 비교하는 용도입니다.
+
+시나리오:
+- `/trade/transactions`: 첫 페이지, 깊은 페이지(ID 범위의 1%/50%/99% 지점 커서), trade_type 필터, limit=100,
+  사유 포함(include_reasons=true)
+- `/trade/transactions/{id}`: 거래 상세 (사유 포함)
+- `/trade/transactions/search`: 사유 검색 (매수/매도 근거 구문, HOLD 근거 구문, 코인 필터)
+- `/balance/history`: 첫 페이지, 깊은 페이지
+- `/my/coins`
+
+깊은 페이지 커서는 시작 시 첫 페이지의 최대 ID로부터 계산합니다.
+
+사용 예시:
+    python -m benchmarks.api_load --base-url http://localhost:8000/api/v1 --concurrency 32 --duration 30
+    python -m benchmarks.api_load --scenarios transactions_first transactions_deep_99 --output load.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+DEPTHS = {"1": 0.01, "50": 0.5, "99": 0.99}
+
+# 사유 검색 시나리오 (seed_history가 남기는 문장 기준)
+SEARCHES: Dict[str, Dict[str, Any]] = {
+    "search_common": {"q": "bearish divergence"},
+    "search_hold": {"q": "squeeze forming"},
+    "search_coin": {"q": "bullish crossover", "coin_id": 1},
+}
+
+
+@dataclass
+class Scenario:
+    """부하 테스트 시나리오 (요청 경로와 쿼리 파라미터)"""
+
+    name: str
+    path: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    weight: float = 1.0
+
+
+@dataclass
+class ScenarioResult:
+    """시나리오별 측정 결과"""
+
+    name: str
+    requests: int = 0
+    errors: int = 0
+    requests_per_second: float = 0.0
+    p50_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+    latencies_ms: List[float] = field(default_factory=list, repr=False)
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _max_id(client: httpx.AsyncClient, path: str) -> Optional[int]:
+    """첫 페이지의 최신 항목 ID (내역이 없으면 None)"""
+    response = await client.get(path, params={"limit": 1})
+    response.raise_for_status()
+    items = response.json()["items"]
+    return items[0]["id"] if items else None
+
+
+async def build_scenarios(client: httpx.AsyncClient) -> List[Scenario]:
+    """서버의 현재 데이터 범위로 시나리오 목록 구성"""
+    scenarios = [
+        Scenario("transactions_first", "/trade/transactions", {"limit": 20}, weight=4),
+        Scenario("transactions_limit_100", "/trade/transactions", {"limit": 100}),
+        Scenario(
+            "transactions_with_reasons",
+            "/trade/transactions",
+            {"limit": 20, "include_reasons": "true"},
+        ),
+        Scenario("balance_first", "/balance/history", {"limit": 20}, weight=2),
+        Scenario("my_coins", "/my/coins", weight=2),
+    ]
+    for name, params in SEARCHES.items():
+        scenarios.append(
+            Scenario(name, "/trade/transactions/search", {"limit": 20, **params})
+        )
+    for trade_type in ("buy", "sell", "hold"):
+        scenarios.append(
+            Scenario(
+                f"transactions_{trade_type}",
+                "/trade/transactions",
+                {"limit": 20, "trade_type": trade_type},
+            )
+        )
+
+    trade_max_id = await _max_id(client, "/trade/transactions")
+    balance_max_id = await _max_id(client, "/balance/history")
+    if trade_max_id:
+        scenarios.append(
+            Scenario("transaction_detail", f"/trade/transactions/{trade_max_id}")
+        )
+    for label, depth in DEPTHS.items():
+        if trade_max_id:
+            cursor = max(1, int(trade_max_id * (1 - depth)))
+            scenarios.append(
+                Scenario(
+                    f"transactions_deep_{label}",
+                    "/trade/transactions",
+                    {"limit": 20, "cursor": cursor},
+                )
+            )
+            scenarios.append(
+                Scenario(
+                    f"transactions_sell_deep_{label}",
+                    "/trade/transactions",
+                    {"limit": 20, "cursor": cursor, "trade_type": "sell"},
+                )
+            )
+        if balance_max_id:
+            scenarios.append(
+                Scenario(
+                    f"balance_deep_{label}",
+                    "/balance/history",
+                    {"limit": 20, "cursor": max(1, int(balance_max_id * (1 - depth)))},
+                )
+            )
+    return scenarios
+
+
+async def _worker(
+    client: httpx.AsyncClient,
+    scenarios: List[Scenario],
+    results: Dict[str, ScenarioResult],
+    deadline: float,
+    rng: random.Random,
+) -> None:
+    weights = [scenario.weight for scenario in scenarios]
+    while time.perf_counter() < deadline:
+        scenario = rng.choices(scenarios, weights=weights)[0]
+        result = results[scenario.name]
+        started = time.perf_counter()
+        try:
+            response = await client.get(scenario.path, params=scenario.params)
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            ok = False
+        result.latencies_ms.append((time.perf_counter() - started) * 1000)
+        result.requests += 1
+        if not ok:
+            result.errors += 1
+
+
+async def run(
+    base_url: str,
+    concurrency: int,
+    duration: float,
+    scenario_names: Optional[List[str]],
+    timeout: float,
+    seed: int,
+) -> Dict[str, Any]:
+    """부하 테스트 실행 및 결과 집계"""
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    async with httpx.AsyncClient(
+        base_url=base_url, timeout=timeout, limits=limits
+    ) as client:
+        scenarios = await build_scenarios(client)
+        if scenario_names:
+            unknown = set(scenario_names) - {scenario.name for scenario in scenarios}
+            if unknown:
+                raise ValueError(f"알 수 없는 시나리오: {sorted(unknown)}")
+            scenarios = [s for s in scenarios if s.name in scenario_names]
+
+        results = {
+            scenario.name: ScenarioResult(scenario.name) for scenario in scenarios
+        }
+        rng = random.Random(seed)
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(
+            *[
+                _worker(
+                    client, scenarios, results, deadline, random.Random(rng.random())
+                )
+                for _ in range(concurrency)
+            ]
+        )
+        elapsed = time.perf_counter() - started
+
+    all_latencies: List[float] = []
+    for result in results.values():
+        result.requests_per_second = result.requests / elapsed
+        result.p50_ms = _percentile(result.latencies_ms, 50)
+        result.p99_ms = _percentile(result.latencies_ms, 99)
+        result.max_ms = max(result.latencies_ms, default=0.0)
+        all_latencies.extend(result.latencies_ms)
+
+    return {
+        "base_url": base_url,
+        "concurrency": concurrency,
+        "duration_seconds": elapsed,
+        "total": {
+            "requests": len(all_latencies),
+            "errors": sum(result.errors for result in results.values()),
+            "requests_per_second": len(all_latencies) / elapsed,
+            "p50_ms": _percentile(all_latencies, 50),
+            "p99_ms": _percentile(all_latencies, 99),
+        },
+        "scenarios": [
+            {
+                key: value
+                for key, value in asdict(result).items()
+                if key != "latencies_ms"
+            }
+            for result in results.values()
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="조회 API 부하 테스트")
+    parser.add_argument(
+        "--base-url", default="http://localhost:8000/api/v1", help="API 기본 주소"
+    )
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 요청 수")
+    parser.add_argument("--duration", type=float, default=30.0, help="측정 시간 (초)")
+    parser.add_argument(
+        "--scenarios", nargs="+", default=None, help="실행할 시나리오 이름 (기본: 전체)"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=30.0, help="요청 타임아웃 (초)"
+    )
+    parser.add_argument("--seed", type=int, default=42, help="시나리오 선택 난수 시드")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    output = asyncio.run(
+        run(
+            args.base_url,
+            args.concurrency,
+            args.duration,
+            args.scenarios,
+            args.timeout,
+            args.seed,
+        )
+    )
+    text = json.dumps(output, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+백테스트 엔진 처리량 벤치마크
+
+합성 분봉(로그 정규 랜덤 워크) 데이터로 BacktestEngine.run()의 실행 시간을 측정합니다.
+
+사용 예시:
+    python -m benchmarks.backtest_engine --coins 36 --years 2
+    python -m benchmarks.backtest_engine --coins 10 --years 1 --short 5 --long 20
+"""
+
+import argparse
+import json
+import time
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from app.backtest.decision_source import MovingAverageCrossStrategy
+from app.backtest.engine import BacktestEngine
+
+MINUTES_PER_YEAR = 365 * 24 * 60
+
+
+def generate_candles(coins: int, minutes: int, seed: int = 0) -> Dict[str, DataFrame]:
+    """
+    합성 분봉 데이터 생성
+
+    @param coins: 코인 수
+    @param minutes: 코인당 캔들 수
+    @param seed: 난수 시드
+    @return: 티커별 OHLCV(close만 포함) 데이터
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2023-01-01 09:00", periods=minutes, freq="min")
+    return {
+        f"KRW-SIM{i}": DataFrame(
+            {"close": np.exp(np.cumsum(rng.normal(0, 0.001, minutes))) * 10_000},
+            index=index,
+        )
+        for i in range(coins)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="백테스트 엔진 처리량 벤치마크")
+    parser.add_argument("--coins", type=int, default=36, help="코인 수")
+    parser.add_argument("--years", type=float, default=2.0, help="분봉 기간 (년)")
+    parser.add_argument("--short", type=int, default=20, help="단기 이동평균 기간")
+    parser.add_argument("--long", type=int, default=100, help="장기 이동평균 기간")
+    args = parser.parse_args()
+
+    minutes = int(args.years * MINUTES_PER_YEAR)
+    candles = generate_candles(args.coins, minutes)
+
+    started = time.perf_counter()
+    result = BacktestEngine().run(
+        candles, MovingAverageCrossStrategy(args.short, args.long)
+    )
+    elapsed = time.perf_counter() - started
+
+    output = {
+        "coins": args.coins,
+        "candles_per_coin": minutes,
+        "total_candles": args.coins * minutes,
+        "elapsed_seconds": elapsed,
+        "candles_per_second": args.coins * minutes / elapsed,
+        **result.summary(),
+    }
+    print(json.dumps(output, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+백테스트 파라미터 스윕 확장성 벤치마크
+
+같은 파라미터 그리드를 프로세스 수를 늘려가며 실행하여 처리량과 속도 향상 비율을 측정합니다.
+
+사용 예시:
+    python -m benchmarks.backtest_sweep --coins 10 --years 0.5
+    python -m benchmarks.backtest_sweep --workers 1 2 4 8 --output sweep.csv
+"""
+
+import argparse
+import json
+import os
+import time
+
+from app.backtest.sweep import expand_grid, run_sweep
+from benchmarks.backtest_engine import MINUTES_PER_YEAR, generate_candles
+
+GRID = {
+    "short_window": [5, 10, 20, 30],
+    "long_window": [60, 120, 240, 480],
+    "fee_multiplier": [0.9995, 0.999],
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="백테스트 파라미터 스윕 확장성 벤치마크"
+    )
+    parser.add_argument("--coins", type=int, default=10, help="코인 수")
+    parser.add_argument("--years", type=float, default=0.5, help="분봉 기간 (년)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=None,
+        help="측정할 프로세스 수 목록 (기본: 1, 2, 4, ... CPU 수)",
+    )
+    parser.add_argument("--output", default=None, help="마지막 실행 결과 CSV 경로")
+    args = parser.parse_args()
+
+    cpu_count = os.cpu_count() or 1
+    workers_list = args.workers or sorted(
+        {1, cpu_count, *[2**i for i in range(1, 8) if 2**i < cpu_count]}
+    )
+
+    candles = generate_candles(args.coins, int(args.years * MINUTES_PER_YEAR))
+    combinations = len(expand_grid(GRID))
+
+    runs = []
+    baseline = None
+    for workers in workers_list:
+        started = time.perf_counter()
+        results = run_sweep(
+            candles,
+            GRID,
+            workers=workers,
+            output_path=args.output if workers == workers_list[-1] else None,
+        )
+        elapsed = time.perf_counter() - started
+        baseline = baseline or elapsed
+        runs.append(
+            {
+                "workers": workers,
+                "elapsed_seconds": elapsed,
+                "backtests_per_second": combinations / elapsed,
+                "speedup": baseline / elapsed,
+            }
+        )
+
+    output = {
+        "coins": args.coins,
+        "candles_per_coin": int(args.years * MINUTES_PER_YEAR),
+        "combinations": combinations,
+        "runs": runs,
+        "best": results.iloc[0].to_dict(),
+    }
+    print(json.dumps(output, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
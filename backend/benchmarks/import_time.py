@@ -0,0 +1,182 @@
+"""
+애플리케이션 import 시간 리포트
+
+새 프로세스에서 `python -X importtime -c "import app.main"`을 반복 실행하여 다음을 측정합니다.
+- 전체 import 시간 (반복 실행 중앙값)
+- 최상위 패키지별 import 시간 (self 시간 합계, 상위 N개)
+- 처음 사용할 때 불러와야 하는 무거운 라이브러리(pandas, numpy, pyupbit, openai)가 import되었는지
+
+gunicorn 워커는 부팅할 때마다 app.main을 import하므로, 이 시간이 워커 부팅/콜드 스타트 시간의 하한입니다.
+전체 시간이 예산(--budget-ms)을 넘거나 무거운 라이브러리가 import되면 종료 코드 1로 끝납니다.
+
+사용 예시:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --module app.main --repeat 5 --budget-ms 1000 --top 15
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List
+
+# 워커 부팅 시 app.main import 예산 (ms)
+DEFAULT_BUDGET_MS = 1000.0
+
+# app.main import 시 불러오지 않아야 하는 라이브러리 (클라이언트/백테스트에서 처음 사용할 때 import)
+LAZY_MODULES = ("pandas", "numpy", "pyupbit", "openai")
+
+_LINE_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass
+class ImportRecord:
+    """-X importtime 출력 한 줄"""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportTimeReport:
+    """리포트 결과"""
+
+    module: str
+    repeat: int
+    budget_ms: float
+    total_ms: float
+    total_ms_runs: List[float] = field(default_factory=list)
+    top_packages_ms: Dict[str, float] = field(default_factory=dict)
+    lazy_modules_imported: List[str] = field(default_factory=list)
+    over_budget: bool = False
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    """
+    -X importtime 출력 파싱
+
+    @param stderr: `python -X importtime` 프로세스의 표준 에러
+    @return: import 기록 목록 (헤더/기타 출력 제외)
+    """
+    records: List[ImportRecord] = []
+    for line in stderr.splitlines():
+        match = _LINE_PATTERN.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        records.append(
+            ImportRecord(
+                module=module,
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=len(indent) // 2,
+            )
+        )
+    return records
+
+
+def measure(module: str) -> List[ImportRecord]:
+    """
+    새 인터프리터에서 모듈을 import하며 import 시간 기록
+
+    @param module: import할 모듈 (예: app.main)
+    @return: import 기록 목록
+    @raises RuntimeError: import가 실패한 경우
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"'{module}' import 실패:\n{completed.stderr}")
+    return parse_importtime(completed.stderr)
+
+
+def _total_us(records: List[ImportRecord], module: str) -> int:
+    for record in records:
+        if record.module == module and record.depth == 0:
+            return record.cumulative_us
+    # 이미 import된 상위 패키지 등으로 기록이 없으면 최상위 기록의 합계
+    return sum(record.cumulative_us for record in records if record.depth == 0)
+
+
+def _package_self_ms(records: List[ImportRecord]) -> Dict[str, float]:
+    totals: Dict[str, int] = {}
+    for record in records:
+        package = record.module.split(".", 1)[0]
+        totals[package] = totals.get(package, 0) + record.self_us
+    return {package: us / 1000 for package, us in totals.items()}
+
+
+def run(module: str, repeat: int, budget_ms: float, top: int) -> ImportTimeReport:
+    """
+    import 시간 리포트 생성
+
+    @param module: import할 모듈
+    @param repeat: 반복 실행 횟수 (전체 시간은 중앙값, 패키지별 시간은 마지막 실행 기준)
+    @param budget_ms: 전체 import 시간 예산 (ms)
+    @param top: 리포트에 포함할 패키지 수
+    @return: 리포트 결과
+    """
+    runs_ms: List[float] = []
+    records: List[ImportRecord] = []
+    for _ in range(repeat):
+        records = measure(module)
+        runs_ms.append(_total_us(records, module) / 1000)
+
+    packages = sorted(
+        _package_self_ms(records).items(), key=lambda item: item[1], reverse=True
+    )
+    imported = {record.module.split(".", 1)[0] for record in records}
+    total_ms = statistics.median(runs_ms)
+
+    return ImportTimeReport(
+        module=module,
+        repeat=repeat,
+        budget_ms=budget_ms,
+        total_ms=round(total_ms, 1),
+        total_ms_runs=[round(ms, 1) for ms in runs_ms],
+        top_packages_ms={package: round(ms, 1) for package, ms in packages[:top]},
+        lazy_modules_imported=[name for name in LAZY_MODULES if name in imported],
+        over_budget=total_ms > budget_ms,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="애플리케이션 import 시간 리포트")
+    parser.add_argument("--module", default="app.main", help="import할 모듈")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 실행 횟수")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help="전체 import 시간 예산 (ms, 초과 시 종료 코드 1)",
+    )
+    parser.add_argument("--top", type=int, default=15, help="출력할 패키지 수")
+    args = parser.parse_args()
+
+    report = run(args.module, args.repeat, args.budget_ms, args.top)
+    print(json.dumps(asdict(report), indent=2, ensure_ascii=False))
+
+    if report.lazy_modules_imported:
+        print(
+            f"지연 import 대상이 import됨: {', '.join(report.lazy_modules_imported)}",
+            file=sys.stderr,
+        )
+    if report.over_budget:
+        print(
+            f"import 시간 예산 초과: {report.total_ms}ms > {report.budget_ms}ms",
+            file=sys.stderr,
+        )
+    if report.lazy_modules_imported or report.over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+분산 락 경합 벤치마크
+
+N개의 가상 워커가 같은 락을 반복해서 획득/해제하며 다음을 측정합니다.
+- 획득 시도 지연 (p50/p99)
+- 초당 획득 횟수
+- 상호 배제 위반 횟수 (동시에 두 워커가 락을 보유한 경우)
+- 최대 점유 커넥션 수 (락 보유 중 커넥션을 잡고 있는지 확인)
+
+사용 예시:
+    python -m benchmarks.lease_contention --backend lease --workers 16 --duration 10
+    python -m benchmarks.lease_contention --backend mysql --workers 16 --duration 10
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from contextlib import AbstractAsyncContextManager
+from dataclasses import asdict, dataclass, field
+from typing import Callable, List
+
+from app.common.lease_lock import lease_lock
+from app.common.model.base import get_engine
+from app.common.named_lock import mysql_named_lock
+
+LOCK_NAME = "benchmark_contention"
+
+
+@dataclass
+class ContentionResult:
+    """벤치마크 결과"""
+
+    backend: str
+    workers: int
+    duration_seconds: float
+    attempts: int = 0
+    acquisitions: int = 0
+    violations: int = 0
+    max_checked_out_connections: int = 0
+    acquire_p50_ms: float = 0.0
+    acquire_p99_ms: float = 0.0
+    acquisitions_per_second: float = 0.0
+    latencies_ms: List[float] = field(default_factory=list, repr=False)
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _worker(
+    lock_factory: Callable[[], AbstractAsyncContextManager],
+    result: ContentionResult,
+    holders: List[int],
+    hold_seconds: float,
+    deadline: float,
+) -> None:
+    loop = asyncio.get_running_loop()
+    while loop.time() < deadline:
+        started = time.perf_counter()
+        async with lock_factory() as lock:
+            result.latencies_ms.append((time.perf_counter() - started) * 1000)
+            result.attempts += 1
+            if lock:
+                result.acquisitions += 1
+                holders[0] += 1
+                if holders[0] > 1:
+                    result.violations += 1
+                await asyncio.sleep(hold_seconds)
+                holders[0] -= 1
+        # 재시도 간격 (jitter)
+        await asyncio.sleep(random.uniform(0.01, 0.05))
+
+
+async def _sample_pool(result: ContentionResult, deadline: float) -> None:
+    loop = asyncio.get_running_loop()
+    pool = get_engine().pool
+    while loop.time() < deadline:
+        result.max_checked_out_connections = max(
+            result.max_checked_out_connections, pool.checkedout()
+        )
+        await asyncio.sleep(0.005)
+
+
+async def run(
+    backend: str, workers: int, duration: float, hold_ms: float, ttl: float
+) -> ContentionResult:
+    """경합 벤치마크 실행"""
+    if backend == "lease":
+
+        def lock_factory() -> AbstractAsyncContextManager:
+            return lease_lock(LOCK_NAME, ttl_seconds=ttl)
+
+    else:
+
+        def lock_factory() -> AbstractAsyncContextManager:
+            return mysql_named_lock(LOCK_NAME)
+
+    result = ContentionResult(
+        backend=backend, workers=workers, duration_seconds=duration
+    )
+    holders = [0]
+    deadline = asyncio.get_running_loop().time() + duration
+
+    await asyncio.gather(
+        _sample_pool(result, deadline),
+        *[
+            _worker(lock_factory, result, holders, hold_ms / 1000, deadline)
+            for _ in range(workers)
+        ],
+    )
+    await get_engine().dispose()
+
+    result.acquire_p50_ms = (
+        statistics.median(result.latencies_ms) if result.latencies_ms else 0.0
+    )
+    result.acquire_p99_ms = _percentile(result.latencies_ms, 99)
+    result.acquisitions_per_second = result.acquisitions / duration
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="분산 락 경합 벤치마크")
+    parser.add_argument("--backend", choices=["lease", "mysql"], default="lease")
+    parser.add_argument("--workers", type=int, default=16, help="가상 워커 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 시간 (초)")
+    parser.add_argument("--hold-ms", type=float, default=50.0, help="락 보유 시간 (ms)")
+    parser.add_argument("--ttl", type=float, default=5.0, help="lease 유효 시간 (초)")
+    args = parser.parse_args()
+
+    result = asyncio.run(
+        run(args.backend, args.workers, args.duration, args.hold_ms, args.ttl)
+    )
+    output = asdict(result)
+    output.pop("latencies_ms")
+    print(json.dumps(output, indent=2))
+
+
+if __name__ == "__main__":
+    main()
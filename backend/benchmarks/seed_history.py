@@ -0,0 +1,356 @@
+"""
+거래/잔고 내역 대량 시드 데이터 생성기
+
+부하 테스트(benchmarks.api_load)용으로 실제 운영과 비슷한 형태의 `trades`/`trade_reasons`/`balances` 행을 대량으로 생성합니다.
+
+- 실행(run)마다 활성 코인별 거래 1건 + 잔고 1건을 --interval-minutes 간격으로 과거부터 현재까지 기록
+- 결정 비율: HOLD/BUY/SELL (기본 60/20/20), BUY/SELL 중 --failure-ratio 만큼 FAILED
+- ai_reason/execution_reason은 TradeService가 남기는 형식과 길이(수백 자)를 따르며 trade_reasons에 저장
+  (대량 insert는 ORM 이벤트를 거치지 않으므로 검색 문서도 직접 생성)
+- 코인 가격과 잔고는 코인별 랜덤 워크
+
+기본값(40만 회 × 5코인)은 거래 200만 건, 잔고 40만 건입니다.
+기존 거래 내역이 있는 DB에서는 --append 없이 실행하지 않습니다. (부하 테스트 전용 DB를 사용하세요)
+
+사용 예시:
+    python -m benchmarks.seed_history
+    python -m benchmarks.seed_history --runs 1000000 --coins 10 --batch-size 10000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List
+
+from sqlalchemy import func, insert, select
+
+from app.ballance.model.balance import Balance
+from app.coin.model.coin import Coin
+from app.common.model.base import get_session_maker
+from app.trade.model.enums import RiskLevel, TradeStatus, TradeType
+from app.trade.model.trade import Trade
+from app.trade.model.trade_reason import TradeReason
+from app.trade.model.trade_search_document import (
+    TradeSearchDocument,
+    build_search_content,
+)
+
+COIN_PRICES = {
+    "KRW-BTC": 135_000_000.0,
+    "KRW-ETH": 4_800_000.0,
+    "KRW-XRP": 3_200.0,
+    "KRW-SOL": 280_000.0,
+    "KRW-DOGE": 450.0,
+    "KRW-ADA": 1_100.0,
+    "KRW-AVAX": 52_000.0,
+    "KRW-LINK": 27_000.0,
+    "KRW-DOT": 10_500.0,
+    "KRW-TRX": 340.0,
+}
+FEE_MULTIPLIER = 0.9995
+MIN_ORDER_AMOUNT = 5000
+
+
+def coin_names(count: int) -> List[str]:
+    """시드 코인 이름 (주요 코인 이후에는 KRW-SEED###)"""
+    names = list(COIN_PRICES)[:count]
+    names += [f"KRW-SEED{i:03d}" for i in range(count - len(names))]
+    return names
+
+
+def ai_reason(rng: random.Random, decision: TradeType, price: float) -> str:
+    """AI 분석 결과 형식의 근거 문장 (약 300~600자)"""
+    rsi = rng.randint(20, 80)
+    volume = rng.uniform(0.5, 2.5)
+    if decision == TradeType.HOLD:
+        return (
+            f"Market in consolidation phase. RSI: {rsi} (neutral), no divergence. "
+            "MACD: weak histogram, no crossover, neutral trend. "
+            "Bollinger: price within bands, squeeze forming indicates imminent volatility expansion. "
+            f"MA: neutral trend. Volume: {volume:.1f}x average suggests lack of conviction. "
+            "Wait for breakout confirmation before taking position."
+        )
+
+    bullish = decision == TradeType.BUY
+    stop = price * (
+        1 - rng.uniform(0.01, 0.03) if bullish else 1 + rng.uniform(0.01, 0.03)
+    )
+    target = price * (
+        1 + rng.uniform(0.02, 0.06) if bullish else 1 - rng.uniform(0.02, 0.06)
+    )
+    risk = abs(price - stop) / price * 100
+    reward = abs(target - price) / price * 100
+    return (
+        f"{'Bullish' if bullish else 'Bearish'} confluence detected. "
+        f"RSI: {rsi} ({'oversold' if bullish else 'overbought'}) with "
+        f"{'bullish' if bullish else 'bearish'} divergence. "
+        f"MACD: histogram turned {'positive' if bullish else 'negative'} with "
+        f"{'bullish' if bullish else 'bearish'} crossover. "
+        f"Bollinger: price at {'lower' if bullish else 'upper'} band. "
+        f"Volume: {volume:.1f}x average confirms {'reversal' if bullish else 'distribution'}. "
+        f"Entry: {price:,.0f} KRW, Stop-loss: {stop:,.0f} KRW ({risk:.1f}% risk), "
+        f"Take-profit: {target:,.0f} KRW ({reward:.1f}% gain). "
+        f"Risk-reward ratio: 1:{reward / risk:.1f}"
+    )
+
+
+def trade_row(
+    rng: random.Random,
+    coin_id: int,
+    coin_name: str,
+    price: float,
+    krw_balance: float,
+    coin_balance: float,
+    created_at: datetime,
+    ratios: Dict[TradeType, float],
+    failure_ratio: float,
+) -> Dict[str, Any]:
+    """TradeService가 기록하는 형식의 거래 행 1건 (ai_reason/execution_reason 포함)"""
+    decision = rng.choices(list(ratios), weights=list(ratios.values()))[0]
+    confidence = rng.uniform(0.5, 0.95)
+    reason = ai_reason(rng, decision, price)
+    row = {
+        "coin_id": coin_id,
+        "trade_type": decision.value,
+        "price": Decimal("0"),
+        "amount": Decimal("0"),
+        "risk_level": rng.choice(
+            [RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH]
+        ).value,
+        "ai_reason": reason,
+        "created_at": created_at,
+    }
+
+    if decision == TradeType.HOLD:
+        row["status"] = TradeStatus.NO_ACTION.value
+        row["execution_reason"] = f"AI HOLD 결정 (Confidence: {confidence:.2%})"
+        return row
+
+    failed = rng.random() < failure_ratio
+    if decision == TradeType.BUY:
+        available = krw_balance * FEE_MULTIPLIER
+        amount = available / price * FEE_MULTIPLIER
+        reasons = [
+            f"AI 매수 결정: Confidence {confidence:.2%}, Reason: {reason}",
+            f"보유 KRW 잔고: {krw_balance:,.0f}원",
+            f"현재 {coin_name} 가격: {price:,.0f}원",
+            f"매수 예정 수량: {amount:.8f} {coin_name}",
+            f"매수 주문 실패: {rng.choice(['insufficient_funds_bid', 'under_min_total_bid', 'timeout'])}"
+            if failed
+            else f"매수 주문 실행 완료: {available:,.0f}원",
+        ]
+    else:
+        amount = coin_balance
+        reasons = [
+            f"AI 매도 결정: Confidence {confidence:.2%}, Reason: {reason}",
+            f"보유 {coin_name} 수량: {coin_balance:.8f}",
+            f"현재 {coin_name} 가격: {price:,.0f}원",
+            f"매도 예상 금액: {coin_balance * price * FEE_MULTIPLIER:,.0f}원",
+            f"매도 주문 실패: {rng.choice(['insufficient_funds_ask', 'under_min_total_ask', 'timeout'])}"
+            if failed
+            else f"매도 주문 실행 완료: {coin_balance:.8f} {coin_name}",
+        ]
+
+    row["price"] = Decimal(f"{price:.8f}")
+    row["amount"] = Decimal(f"{amount:.8f}")
+    row["status"] = (TradeStatus.FAILED if failed else TradeStatus.SUCCESS).value
+    row["execution_reason"] = "\n".join(reasons)
+    return row
+
+
+async def prepare_coins(names: List[str]) -> Dict[str, int]:
+    """시드 코인을 활성 상태로 준비하고 이름 → ID 반환"""
+    async with get_session_maker()() as session:
+        result = await session.execute(select(Coin).where(Coin.name.in_(names)))
+        coins = {coin.name: coin for coin in result.scalars().all()}
+        for name in names:
+            if name not in coins:
+                coins[name] = Coin(name=name)
+                session.add(coins[name])
+            coins[name].is_deleted = False
+        await session.commit()
+        return {name: coin.id for name, coin in coins.items()}
+
+
+async def seed(
+    runs: int,
+    coins: int,
+    interval_minutes: int,
+    batch_size: int,
+    ratios: Dict[TradeType, float],
+    failure_ratio: float,
+    seed_value: int,
+    append: bool,
+) -> Dict[str, Any]:
+    """
+    시드 데이터 생성
+
+    @raises RuntimeError: 기존 거래 내역이 있고 append가 아닌 경우
+    """
+    rng = random.Random(seed_value)
+    session_maker = get_session_maker()
+
+    async with session_maker() as session:
+        existing = await session.scalar(select(func.count()).select_from(Trade))
+        # trade_reasons 행을 함께 넣기 위해 거래 ID를 직접 지정
+        last_trade_id = await session.scalar(select(func.max(Trade.id))) or 0
+    if existing and not append:
+        raise RuntimeError(
+            f"기존 거래 내역이 {existing}건 있습니다. (부하 테스트 전용 DB를 사용하거나 --append를 지정하세요)"
+        )
+
+    names = coin_names(coins)
+    coin_ids = await prepare_coins(names)
+    prices = {name: COIN_PRICES.get(name, rng.uniform(100, 100_000)) for name in names}
+    coin_balances = {name: 0.0 for name in names}
+    krw_balance = 10_000_000.0
+
+    started_at = datetime.utcnow() - timedelta(minutes=interval_minutes * runs)
+    started = time.perf_counter()
+    trades: List[Dict[str, Any]] = []
+    reasons: List[Dict[str, Any]] = []
+    documents: List[Dict[str, Any]] = []
+    balances: List[Dict[str, Any]] = []
+    trade_count = balance_count = 0
+
+    async def flush() -> None:
+        nonlocal trades, reasons, documents, balances, trade_count, balance_count
+        async with session_maker() as session:
+            if trades:
+                await session.execute(insert(Trade), trades)
+                await session.execute(insert(TradeReason), reasons)
+                await session.execute(insert(TradeSearchDocument), documents)
+            if balances:
+                await session.execute(insert(Balance), balances)
+            await session.commit()
+        trade_count += len(trades)
+        balance_count += len(balances)
+        trades, reasons, documents, balances = [], [], [], []
+
+    for run_index in range(runs):
+        created_at = started_at + timedelta(minutes=interval_minutes * run_index)
+        for name in names:
+            prices[name] *= 1 + rng.gauss(0, 0.01)
+            row = trade_row(
+                rng,
+                coin_ids[name],
+                name,
+                prices[name],
+                krw_balance / len(names),
+                coin_balances[name],
+                created_at,
+                ratios,
+                failure_ratio,
+            )
+            if row["status"] == TradeStatus.SUCCESS.value:
+                funds = float(row["amount"]) * prices[name]
+                if (
+                    row["trade_type"] == TradeType.BUY.value
+                    and funds >= MIN_ORDER_AMOUNT
+                ):
+                    krw_balance -= funds / FEE_MULTIPLIER**2
+                    coin_balances[name] += float(row["amount"])
+                elif row["trade_type"] == TradeType.SELL.value:
+                    krw_balance += funds * FEE_MULTIPLIER
+                    coin_balances[name] = 0.0
+            last_trade_id += 1
+            row["id"] = last_trade_id
+            reasons.append(
+                {
+                    "trade_id": last_trade_id,
+                    "ai_reason": row.pop("ai_reason"),
+                    "execution_reason": row.pop("execution_reason"),
+                    "created_at": created_at,
+                }
+            )
+            documents.append(
+                {
+                    "trade_id": last_trade_id,
+                    "content": build_search_content(
+                        reasons[-1]["ai_reason"], reasons[-1]["execution_reason"]
+                    ),
+                    "created_at": created_at,
+                }
+            )
+            trades.append(row)
+
+        balances.append(
+            {
+                "amount": Decimal(f"{max(krw_balance, 0.0):.8f}"),
+                "coin_amount": Decimal(
+                    f"{sum(coin_balances[name] * prices[name] for name in names):.8f}"
+                ),
+                "created_at": created_at,
+            }
+        )
+
+        if len(trades) >= batch_size:
+            await flush()
+            print(
+                f"runs={run_index + 1}/{runs} trades={trade_count} balances={balance_count} "
+                f"elapsed={time.perf_counter() - started:.1f}s",
+                file=sys.stderr,
+            )
+    await flush()
+
+    elapsed = time.perf_counter() - started
+    return {
+        "runs": runs,
+        "coins": names,
+        "trades": trade_count,
+        "balances": balance_count,
+        "from": started_at.isoformat(),
+        "elapsed_seconds": elapsed,
+        "rows_per_second": (trade_count + balance_count) / elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="거래/잔고 내역 대량 시드 데이터 생성")
+    parser.add_argument("--runs", type=int, default=400_000, help="거래 실행 횟수")
+    parser.add_argument("--coins", type=int, default=5, help="활성 코인 수")
+    parser.add_argument(
+        "--interval-minutes", type=int, default=10, help="실행 간격 (분)"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=5000, help="커밋당 거래 행 수"
+    )
+    parser.add_argument("--hold-ratio", type=float, default=0.6, help="HOLD 결정 비율")
+    parser.add_argument("--buy-ratio", type=float, default=0.2, help="BUY 결정 비율")
+    parser.add_argument("--sell-ratio", type=float, default=0.2, help="SELL 결정 비율")
+    parser.add_argument(
+        "--failure-ratio", type=float, default=0.15, help="BUY/SELL 중 FAILED 비율"
+    )
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument(
+        "--append", action="store_true", help="기존 거래 내역이 있어도 추가 생성"
+    )
+    args = parser.parse_args()
+
+    ratios = {
+        TradeType.HOLD: args.hold_ratio,
+        TradeType.BUY: args.buy_ratio,
+        TradeType.SELL: args.sell_ratio,
+    }
+    summary = asyncio.run(
+        seed(
+            args.runs,
+            args.coins,
+            args.interval_minutes,
+            args.batch_size,
+            ratios,
+            args.failure_ratio,
+            args.seed,
+            args.append,
+        )
+    )
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""
+거래 실행(TradeService.execute) 확장성 벤치마크
+
+시뮬레이션 거래소(SimulatedUpbitClient)와 가짜 AI(FakeOpenAIClient)에 지연을 주입하고,
+실제 DB(DATABASE_URL)에 대해 활성 코인 수를 늘려가며 execute()를 실행합니다.
+
+실행마다 측정하는 값:
+- 전체 실행 시간 (wall time)
+- DB 왕복 횟수 (SQL 실행 수 + 커밋 수)
+- 외부 호출 수 (Upbit/OpenAI 메서드별)
+- 최대 메모리 사용량 (tracemalloc peak)
+
+결과는 JSON 기준값(baseline)으로 저장하고, 이후 실행을 기준값과 비교하여 회귀를 감지합니다.
+DB 왕복 횟수(반복 중 최소값)와 외부 호출 수는 시드가 같으면 결정적이므로 증가하면 바로 회귀로 판단하고,
+실행 시간은 허용 비율(--tolerance)을 넘을 때만 회귀로 판단합니다.
+
+벤치마크는 "KRW-BENCH"로 시작하는 코인만 사용하며, 다른 활성 코인이 있는 DB에서는 실행하지 않습니다.
+(alembic upgrade head가 적용된 벤치마크 전용 DB를 사용하세요)
+
+사용 예시:
+    python -m benchmarks.trade_run --save-baseline
+    python -m benchmarks.trade_run --compare
+    python -m benchmarks.trade_run --coins 1 10 50 --upbit-latency-ms 30 --ai-latency-ms 800
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
+
+from sqlalchemy import event, select, update
+
+from app.ai.client.fake_open_ai_client import FakeOpenAIClient
+from app.coin.model.coin import Coin
+from app.common.model.base import get_engine, get_session_maker
+from app.trade.service.trade_service import TradeService
+from app.upbit.client.simulated_upbit_client import SimulatedUpbitClient
+
+BENCH_COIN_PREFIX = "KRW-BENCH"
+DEFAULT_COIN_COUNTS = [1, 5, 10, 25, 50, 100, 200]
+DEFAULT_BASELINE_PATH = Path(__file__).parent / "baselines" / "trade_run.json"
+SEED = 42
+
+
+@dataclass
+class RunResult:
+    """코인 수별 측정 결과 (실행 시간은 반복 중 중앙값, DB 왕복 횟수는 최소값)"""
+
+    coins: int
+    wall_ms: float
+    wall_ms_runs: List[float]
+    sql_statements: int
+    commits: int
+    db_round_trips: int
+    external_calls: Dict[str, int] = field(default_factory=dict)
+    peak_memory_kb: float = 0.0
+
+
+class CallCounter:
+    """감싼 객체의 메서드 호출 횟수를 세는 프록시"""
+
+    def __init__(self, target: Any, prefix: str, counts: Counter):
+        self._target = target
+        self._prefix = prefix
+        self._counts = counts
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if not callable(attribute):
+            return attribute
+
+        def counted(*args, **kwargs):
+            self._counts[f"{self._prefix}.{name}"] += 1
+            return attribute(*args, **kwargs)
+
+        return counted
+
+
+class DbCounter:
+    """엔진의 SQL 실행/커밋 횟수 측정"""
+
+    def __init__(self):
+        self.statements = 0
+        self.commits = 0
+
+    def _on_execute(self, *args) -> None:
+        self.statements += 1
+
+    def _on_commit(self, *args) -> None:
+        self.commits += 1
+
+    def attach(self) -> None:
+        sync_engine = get_engine().sync_engine
+        event.listen(sync_engine, "before_cursor_execute", self._on_execute)
+        event.listen(sync_engine, "commit", self._on_commit)
+
+    def detach(self) -> None:
+        sync_engine = get_engine().sync_engine
+        event.remove(sync_engine, "before_cursor_execute", self._on_execute)
+        event.remove(sync_engine, "commit", self._on_commit)
+
+
+async def prepare_coins(count: int) -> None:
+    """
+    벤치마크 코인 count개만 활성화
+
+    @raises RuntimeError: 벤치마크 코인이 아닌 활성 코인이 있는 경우
+    """
+    async with get_session_maker()() as session:
+        result = await session.execute(
+            select(Coin.name).where(
+                Coin.is_deleted.is_(False), Coin.name.not_like(f"{BENCH_COIN_PREFIX}%")
+            )
+        )
+        others = list(result.scalars().all())
+        if others:
+            raise RuntimeError(
+                f"벤치마크 코인이 아닌 활성 코인이 있습니다: {others[:5]} "
+                "(벤치마크 전용 DB를 사용하세요)"
+            )
+
+        names = [f"{BENCH_COIN_PREFIX}{i:03d}" for i in range(count)]
+        result = await session.execute(
+            select(Coin.name).where(Coin.name.like(f"{BENCH_COIN_PREFIX}%"))
+        )
+        existing = set(result.scalars().all())
+        session.add_all([Coin(name=name) for name in names if name not in existing])
+        await session.execute(
+            update(Coin)
+            .where(Coin.name.like(f"{BENCH_COIN_PREFIX}%"))
+            .values(is_deleted=True)
+        )
+        await session.execute(
+            update(Coin).where(Coin.name.in_(names)).values(is_deleted=False)
+        )
+        await session.commit()
+
+
+async def run_once(
+    coins: int, upbit_latency_ms: float, ai_latency_ms: float
+) -> Dict[str, Any]:
+    """execute() 1회 실행 및 측정"""
+    counts: Counter = Counter()
+    names = [f"{BENCH_COIN_PREFIX}{i:03d}" for i in range(coins)]
+    upbit_client = SimulatedUpbitClient(
+        initial_krw=100_000_000,
+        initial_prices={name: 10_000.0 for name in names},
+        initial_balances={name: 10.0 for name in names},
+        latency_ms=upbit_latency_ms,
+        seed=SEED,
+    )
+    ai_client = FakeOpenAIClient(latency_ms=ai_latency_ms, seed=SEED)
+
+    db_counter = DbCounter()
+    db_counter.attach()
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        async with get_session_maker()() as session:
+            await TradeService(
+                session=session,
+                upbit_client=CallCounter(upbit_client, "upbit", counts),
+                ai_client=CallCounter(ai_client, "openai", counts),
+            ).execute()
+        wall_ms = (time.perf_counter() - started) * 1000
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        db_counter.detach()
+
+    return {
+        "wall_ms": wall_ms,
+        "sql_statements": db_counter.statements,
+        "commits": db_counter.commits,
+        "external_calls": dict(sorted(counts.items())),
+        "peak_memory_kb": peak / 1024,
+    }
+
+
+async def run(
+    coin_counts: List[int], repeat: int, upbit_latency_ms: float, ai_latency_ms: float
+) -> List[RunResult]:
+    results = []
+    for coins in coin_counts:
+        await prepare_coins(coins)
+        runs = [
+            await run_once(coins, upbit_latency_ms, ai_latency_ms)
+            for _ in range(repeat)
+        ]
+        # 동시 분석의 완료 순서에 따라 flush가 나뉘어 SQL 수가 조금씩 달라질 수 있으므로
+        # DB 왕복 횟수는 반복 중 가장 적은 실행을 기준으로 기록
+        fewest = min(runs, key=lambda r: r["sql_statements"] + r["commits"])
+        results.append(
+            RunResult(
+                coins=coins,
+                wall_ms=statistics.median(r["wall_ms"] for r in runs),
+                wall_ms_runs=[r["wall_ms"] for r in runs],
+                sql_statements=fewest["sql_statements"],
+                commits=fewest["commits"],
+                db_round_trips=fewest["sql_statements"] + fewest["commits"],
+                external_calls=fewest["external_calls"],
+                peak_memory_kb=max(r["peak_memory_kb"] for r in runs),
+            )
+        )
+        print(
+            f"coins={coins:>3} wall={results[-1].wall_ms:>9.1f}ms "
+            f"db={results[-1].db_round_trips:>5} "
+            f"external={sum(results[-1].external_calls.values()):>5} "
+            f"peak={results[-1].peak_memory_kb:>8.0f}KB",
+            file=sys.stderr,
+        )
+
+    await prepare_coins(0)
+    return results
+
+
+def compare(
+    results: List[RunResult], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """
+    기준값 대비 회귀 항목
+
+    @param tolerance: 실행 시간/메모리 허용 증가 비율 (예: 0.2 → 20%)
+    @return: 회귀 설명 목록 (없으면 빈 목록)
+    """
+    baseline_runs = {run["coins"]: run for run in baseline["runs"]}
+    regressions = []
+    for result in results:
+        base = baseline_runs.get(result.coins)
+        if base is None:
+            continue
+        for key in ("db_round_trips",):
+            if getattr(result, key) > base[key]:
+                regressions.append(
+                    f"coins={result.coins} {key}: {base[key]} → {getattr(result, key)}"
+                )
+        for name, count in result.external_calls.items():
+            if count > base["external_calls"].get(name, 0):
+                regressions.append(
+                    f"coins={result.coins} {name}: "
+                    f"{base['external_calls'].get(name, 0)} → {count}"
+                )
+        for key in ("wall_ms", "peak_memory_kb"):
+            if getattr(result, key) > base[key] * (1 + tolerance):
+                regressions.append(
+                    f"coins={result.coins} {key}: {base[key]:.1f} → {getattr(result, key):.1f}"
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="거래 실행 확장성 벤치마크")
+    parser.add_argument(
+        "--coins",
+        type=int,
+        nargs="+",
+        default=DEFAULT_COIN_COUNTS,
+        help="활성 코인 수 목록",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="코인 수별 반복 횟수")
+    parser.add_argument(
+        "--upbit-latency-ms", type=float, default=20.0, help="Upbit 호출당 지연 (ms)"
+    )
+    parser.add_argument(
+        "--ai-latency-ms", type=float, default=200.0, help="OpenAI 호출당 지연 (ms)"
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="결과를 기준값으로 저장"
+    )
+    parser.add_argument(
+        "--compare", action="store_true", help="기준값과 비교하여 회귀 시 종료 코드 1"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="실행 시간/메모리 허용 증가 비율"
+    )
+    args = parser.parse_args()
+
+    if args.compare and not args.save_baseline and not args.baseline.exists():
+        print(
+            f"기준값 파일이 없습니다: {args.baseline}\n"
+            "먼저 --save-baseline으로 기준값을 저장하세요.",
+            file=sys.stderr,
+        )
+        sys.exit(2)
+
+    results = asyncio.run(
+        run(args.coins, args.repeat, args.upbit_latency_ms, args.ai_latency_ms)
+    )
+    output = {
+        "config": {
+            "repeat": args.repeat,
+            "upbit_latency_ms": args.upbit_latency_ms,
+            "ai_latency_ms": args.ai_latency_ms,
+            "seed": SEED,
+            # DB 왕복 횟수는 DB 종류(dialect)에 따라 다를 수 있으므로 같은 종류끼리만 비교
+            "database": get_engine().dialect.name,
+        },
+        "runs": [asdict(result) for result in results],
+    }
+    print(json.dumps(output, indent=2))
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(output, indent=2) + "\n", encoding="utf-8")
+        print(f"기준값 저장: {args.baseline}", file=sys.stderr)
+
+    if args.compare:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if baseline["config"] != output["config"]:
+            print("기준값과 설정이 달라 비교할 수 없습니다.", file=sys.stderr)
+            sys.exit(2)
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"회귀: {regression}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
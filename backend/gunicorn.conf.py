@@ -0,0 +1,30 @@
+"""
+gunicorn 설정
+
+gunicorn은 실행 디렉토리의 gunicorn.conf.py를 자동으로 읽습니다.
+워커 수, 바인딩 등 실행 옵션은 docker-compose.yml의 명령행 인자로 지정하고,
+여기서는 Prometheus multiprocess 모드를 위한 훅만 설정합니다.
+
+- PROMETHEUS_MULTIPROC_DIR: 워커가 메트릭 값을 기록하는 공유 디렉토리 (워커가 app을 import하기 전에 설정)
+- on_starting: 이전 실행의 메트릭 파일 삭제
+- child_exit: 종료된 워커의 live 게이지 파일 정리
+"""
+
+import os
+import shutil
+
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus_multiproc")
+
+
+def on_starting(server):
+    """마스터 시작 시 메트릭 디렉토리 초기화"""
+    path = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """워커 종료 시 해당 워커의 live 게이지 값 제거"""
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,29 @@
+"""
+FakeOpenAIClient 테스트
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from app.ai.client.fake_open_ai_client import FakeOpenAIClient
+
+
+def _decisions(client: FakeOpenAIClient, count: int, workers: int):
+    df = [0] * 10
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(
+                lambda _: client.get_bitcoin_trading_decision(df), range(count)
+            )
+        )
+    return sorted(
+        (result.decision.value, result.confidence, result.risk_level.value)
+        for result in results
+    )
+
+
+def test_same_seed_gives_same_decisions_across_threads():
+    """여러 스레드에서 동시에 호출해도 같은 시드면 같은 결정 목록"""
+    sequential = _decisions(FakeOpenAIClient(latency_jitter_ms=1, seed=42), 200, 1)
+    concurrent = _decisions(FakeOpenAIClient(latency_jitter_ms=1, seed=42), 200, 16)
+
+    assert concurrent == sequential
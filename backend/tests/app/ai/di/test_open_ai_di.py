@@ -0,0 +1,22 @@
+"""
+OpenAIClient 싱글톤 테스트
+"""
+
+from app.ai.di.open_ai_di import close_open_ai_client, get_open_ai_client
+from app.configs.config import get_settings
+
+
+def test_client_is_shared_until_closed(mocker):
+    """같은 프로세스에서는 같은 클라이언트를 반환하고, 정리 후에는 새로 생성"""
+    mocker.patch.object(get_settings(), "OPENAI_API_KEY", "sk-test")
+    close_open_ai_client()
+
+    client = get_open_ai_client()
+    assert get_open_ai_client() is client
+
+    close = mocker.spy(client.client, "close")
+    close_open_ai_client()
+
+    close.assert_called_once()
+    assert get_open_ai_client() is not client
+    close_open_ai_client()
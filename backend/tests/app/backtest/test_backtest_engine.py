@@ -0,0 +1,149 @@
+"""
+BacktestEngine 테스트
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.backtest.decision_source import (
+    BUY,
+    HOLD,
+    SELL,
+    MovingAverageCrossStrategy,
+    RecordedDecisionSource,
+    parse_confidence,
+)
+from app.backtest.engine import BacktestEngine
+
+FEE = 0.9995
+
+
+def simulate_sequentially(close, decisions, initial_krw, fee, min_order_amount):
+    """TradeService의 매수/매도 규칙을 캔들마다 그대로 적용한 기준 구현"""
+    krw, amount = initial_krw, 0.0
+    equity = []
+    for price, decision in zip(close, decisions):
+        if decision == BUY and amount == 0:
+            available = krw * fee
+            if available >= min_order_amount:
+                amount = available / price * fee
+                krw -= available
+        elif decision == SELL and amount > 0:
+            proceeds = amount * price * fee
+            if proceeds >= min_order_amount:
+                krw += proceeds
+                amount = 0.0
+        equity.append(krw + amount * price)
+    return np.array(equity)
+
+
+class TestSimulate:
+    """simulate() 테스트"""
+
+    def test_round_trip_applies_fee_like_trade_service(self):
+        """매수 시 KRW * fee로 매수하고 수량에도 fee 적용, 매도 시 수령액에 fee 적용"""
+        engine = BacktestEngine(fee_multiplier=FEE, min_order_amount=5000)
+        close = np.array([100.0, 110.0, 120.0])
+        decisions = np.array([BUY, HOLD, SELL], dtype=np.int8)
+
+        equity, trades = engine.simulate(close, decisions, 1_000_000)
+
+        amount = 1_000_000 * FEE / 100.0 * FEE
+        residual = 1_000_000 * (1 - FEE)
+        assert list(trades["trade_type"]) == ["buy", "sell"]
+        assert trades["amount"].iloc[0] == pytest.approx(amount)
+        assert trades["krw_amount"].iloc[0] == pytest.approx(1_000_000 * FEE)
+        assert equity[1] == pytest.approx(residual + amount * 110.0)
+        assert equity[2] == pytest.approx(residual + amount * 120.0 * FEE)
+
+    def test_min_order_amount_blocks_buy(self):
+        """가용 금액이 최소 주문 금액 미만이면 매수하지 않음"""
+        engine = BacktestEngine(min_order_amount=5000)
+        close = np.array([100.0, 200.0])
+        decisions = np.array([BUY, SELL], dtype=np.int8)
+
+        equity, trades = engine.simulate(close, decisions, 5000)
+
+        assert trades.empty
+        assert list(equity) == [5000, 5000]
+
+    @pytest.mark.parametrize("initial_krw", [6000.0, 20000.0, 1_000_000.0])
+    def test_matches_sequential_simulation(self, initial_krw):
+        """반복/무시되는 신호와 최소 주문 금액 조건을 포함해 순차 처리 결과와 일치"""
+        rng = np.random.default_rng(42)
+        close = np.exp(np.cumsum(rng.normal(0, 0.05, 2000))) * 100
+        decisions = rng.choice([BUY, SELL, HOLD], 2000, p=[0.1, 0.1, 0.8]).astype(
+            np.int8
+        )
+        engine = BacktestEngine(fee_multiplier=FEE, min_order_amount=5000)
+
+        equity, _ = engine.simulate(close, decisions, initial_krw)
+
+        expected = simulate_sequentially(close, decisions, initial_krw, FEE, 5000)
+        np.testing.assert_allclose(equity, expected)
+
+
+class TestRun:
+    """run() 테스트"""
+
+    def test_run_with_moving_average_strategy(self):
+        """코인별 계좌를 합산한 자산 곡선과 지표 계산"""
+        index = pd.date_range("2025-01-01", periods=500, freq="min")
+        rng = np.random.default_rng(0)
+        candles = {
+            name: pd.DataFrame(
+                {"close": np.exp(np.cumsum(rng.normal(0, 0.01, 500))) * 1000},
+                index=index,
+            )
+            for name in ["KRW-BTC", "KRW-ETH"]
+        }
+
+        result = BacktestEngine(initial_krw=1_000_000).run(
+            candles, MovingAverageCrossStrategy(5, 20)
+        )
+
+        assert len(result.equity) == 500
+        assert result.equity.iloc[0] == pytest.approx(1_000_000)
+        assert result.equity.to_numpy() == pytest.approx(
+            result.coin_equity.sum(axis=1).to_numpy()
+        )
+        assert set(result.trades["coin_name"]) == {"KRW-BTC", "KRW-ETH"}
+        assert (result.drawdown <= 0).all()
+        assert 0 <= result.max_drawdown < 1
+
+
+class TestRecordedDecisionSource:
+    """RecordedDecisionSource 테스트"""
+
+    def test_parse_confidence(self):
+        """매수/매도/HOLD 실행 사유 형식에서 신뢰도 추출"""
+        assert parse_confidence("AI 매수 결정: Confidence 85.00%, Reason: x") == 0.85
+        assert parse_confidence("AI HOLD 결정 (Confidence: 70.50%)") == 0.705
+        assert parse_confidence("AI 분석 실패") is None
+
+    def test_decisions_are_placed_on_candle_in_kst(self):
+        """UTC 결정 시각을 KST 캔들에 매핑하고 신뢰도가 낮은 결정은 HOLD 처리"""
+        candles = pd.DataFrame(
+            {"close": [1.0, 1.0, 1.0]},
+            index=pd.date_range("2025-01-01 09:00", periods=3, freq="h"),
+        )
+        decisions = pd.DataFrame(
+            {
+                "coin_name": ["KRW-BTC", "KRW-BTC", "KRW-BTC"],
+                "decided_at": [
+                    datetime(2025, 1, 1, 0, 30),  # KST 09:30 → 0번 캔들
+                    datetime(2025, 1, 1, 1, 10),  # KST 10:10 → 1번 캔들 (신뢰도 낮음)
+                    datetime(2025, 1, 1, 2, 0),  # KST 11:00 → 2번 캔들
+                ],
+                "decision": ["buy", "sell", "sell"],
+                "confidence": [0.9, 0.3, 0.8],
+            }
+        )
+        source = RecordedDecisionSource(decisions, min_confidence=0.5)
+
+        result = source.decide("KRW-BTC", candles)
+
+        assert list(result) == [BUY, HOLD, SELL]
@@ -0,0 +1,90 @@
+"""
+백테스트 파라미터 스윕 테스트
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas import DataFrame
+
+from app.backtest.decision_source import MovingAverageCrossStrategy
+from app.backtest.engine import BacktestEngine
+from app.backtest.sweep import expand_grid, run_sweep
+
+GRID = {
+    "short_window": [3, 5, 30],
+    "long_window": [10, 20],
+    "fee_multiplier": [0.9995, 0.999],
+}
+METRICS = ["final_equity", "total_return", "max_drawdown", "sharpe", "trades"]
+
+
+@pytest.fixture
+def candles():
+    """코인 2개의 합성 분봉 (코인마다 길이가 다름)"""
+    rng = np.random.default_rng(7)
+    return {
+        coin_name: DataFrame(
+            {"close": np.exp(np.cumsum(rng.normal(0, 0.01, size))) * 10_000},
+            index=pd.date_range("2024-01-01 09:00", periods=size, freq="min"),
+        )
+        for coin_name, size in (("KRW-AAA", 400), ("KRW-BBB", 300))
+    }
+
+
+def test_expand_grid():
+    """모든 조합을 그리드 순서대로 전개"""
+    assert expand_grid({"a": [1, 2], "b": ["x"]}) == [
+        {"a": 1, "b": "x"},
+        {"a": 2, "b": "x"},
+    ]
+
+
+def test_run_sweep_matches_sequential_backtests(candles, tmp_path):
+    """공유 메모리 워커 결과가 조합별 순차 백테스트와 같고, 샤프 순으로 순위를 매겨 CSV로 저장"""
+    output_path = tmp_path / "sweep.csv"
+
+    results = run_sweep(candles, GRID, workers=2, output_path=str(output_path))
+
+    assert len(results) == len(expand_grid(GRID))
+    for row in results.itertuples(index=False):
+        if row.short_window >= row.long_window:
+            # 잘못된 조합은 실패로 기록하고 순위 맨 뒤
+            assert "ValueError" in row.error
+            continue
+        expected = (
+            BacktestEngine(fee_multiplier=row.fee_multiplier)
+            .run(
+                candles,
+                MovingAverageCrossStrategy(row.short_window, row.long_window),
+            )
+            .summary()
+        )
+        assert pd.isna(row.error)
+        assert row.trades > 0
+        for metric in METRICS:
+            assert getattr(row, metric) == pytest.approx(expected[metric])
+
+    assert list(results["rank"]) == list(range(1, len(results) + 1))
+    ranked = results["sharpe"].dropna().to_numpy()
+    assert list(ranked) == sorted(ranked, reverse=True)
+    assert results["error"].notna().sum() == 4
+    assert results["error"].tail(4).notna().all()
+
+    saved = pd.read_csv(output_path)
+    assert list(saved.columns) == list(results.columns)
+    assert list(saved["rank"]) == list(results["rank"])
+    np.testing.assert_allclose(saved["sharpe"], results["sharpe"], equal_nan=True)
+
+
+def test_run_sweep_ranks_drawdown_ascending(candles):
+    """max_drawdown은 작을수록 높은 순위"""
+    results = run_sweep(
+        candles,
+        {"short_window": [3, 5], "long_window": [10, 20]},
+        workers=2,
+        rank_by="max_drawdown",
+    )
+
+    drawdowns = list(results["max_drawdown"])
+    assert drawdowns == sorted(drawdowns)
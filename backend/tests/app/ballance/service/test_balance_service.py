@@ -0,0 +1,61 @@
+"""
+BalanceService 테스트
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.ballance.model.balance import Balance
+from app.ballance.repository.balance_repository import BalanceRepository
+from app.ballance.service.balance_service import BalanceService, interpolate_balances
+
+START = datetime(2024, 1, 1, 0, 0, 0)
+
+
+def _balance(minutes: int, amount: str, coin_amount: str = "0") -> Balance:
+    return Balance(
+        amount=Decimal(amount),
+        coin_amount=Decimal(coin_amount),
+        created_at=START + timedelta(minutes=minutes),
+    )
+
+
+def test_interpolate_between_snapshots_and_hold_after_last():
+    """기록 사이는 선형 보간, 마지막 기록 이후는 마지막 값 유지, 첫 기록 이전은 항목 없음"""
+    snapshots = [_balance(10, "1000", "100"), _balance(30, "3000", "300")]
+
+    points = interpolate_balances(
+        snapshots, START, START + timedelta(minutes=40), step_seconds=600
+    )
+
+    assert [(p.timestamp[11:16], p.amount, p.interpolated) for p in points] == [
+        ("00:10", 1000.0, False),
+        ("00:20", 2000.0, True),
+        ("00:30", 3000.0, False),
+        ("00:40", 3000.0, True),
+    ]
+    assert points[1].coin_amount == pytest.approx(200.0)
+    assert points[1].total_amount == pytest.approx(2200.0)
+
+
+async def test_get_series_widens_step_to_cap_points(mocker):
+    """항목 수가 최대치를 넘으면 간격을 넓혀 조회"""
+    repo = mocker.MagicMock(spec=BalanceRepository)
+    repo.get_range = AsyncMock(return_value=[_balance(-5, "1000")])
+    mocker.patch(
+        "app.ballance.service.balance_service.BalanceRepository", return_value=repo
+    )
+    service = BalanceService(MagicMock(spec=AsyncSession))
+
+    response = await service.get_series(
+        hours=720, step_seconds=60, now=START + timedelta(hours=720)
+    )
+
+    assert response.step_seconds == 2592
+    assert len(response.points) == 1001
+    assert response.snapshot_count == 1
+    repo.get_range.assert_awaited_once_with(START, START + timedelta(hours=720))
@@ -0,0 +1,52 @@
+"""
+BalanceSnapshotPolicy 테스트
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.ballance.model.balance import Balance
+from app.ballance.service.balance_snapshot_policy import BalanceSnapshotPolicy
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _latest(age_seconds: int = 60) -> Balance:
+    return Balance(
+        amount=Decimal("60000"),
+        coin_amount=Decimal("40000"),
+        created_at=NOW - timedelta(seconds=age_seconds),
+    )
+
+
+@pytest.fixture
+def policy():
+    return BalanceSnapshotPolicy(
+        mode="change", threshold_pct=0.5, heartbeat_seconds=3600
+    )
+
+
+def test_skips_small_change(policy):
+    """직전 총 자산의 0.5% 이하 변동은 기록하지 않음"""
+    assert not policy.should_record(_latest(), 60000, 40400, now=NOW)
+
+
+def test_records_change_beyond_threshold(policy):
+    """KRW 또는 코인 평가액이 임계값을 넘게 움직이면 기록"""
+    assert policy.should_record(_latest(), 60000, 40600, now=NOW)
+    assert policy.should_record(_latest(), 59000, 40000, now=NOW)
+
+
+def test_records_heartbeat_and_first_snapshot(policy):
+    """변동이 없어도 heartbeat 간격이 지났거나 첫 기록이면 기록"""
+    assert policy.should_record(_latest(age_seconds=3600), 60000, 40000, now=NOW)
+    assert policy.should_record(None, 60000, 40000, now=NOW)
+
+
+def test_every_mode_always_records():
+    """every 모드는 매 실행 기록"""
+    policy = BalanceSnapshotPolicy(mode="every")
+
+    assert policy.should_record(_latest(), 60000, 40000, now=NOW)
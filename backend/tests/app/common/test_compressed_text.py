@@ -0,0 +1,30 @@
+"""
+압축 텍스트 저장 형식 테스트
+"""
+
+from app.common.model.compressed_text import (
+    COMPRESSED_PREFIX,
+    compress_text,
+    decompress_text,
+)
+
+
+def test_long_text_is_compressed_and_restored():
+    """min_bytes 이상의 텍스트는 압축되고 원문으로 복원"""
+    text = "AI 매수 결정: 상승 추세가 이어지고 거래량이 늘고 있습니다.\n" * 50
+
+    stored = compress_text(text, min_bytes=512)
+
+    assert stored.startswith(COMPRESSED_PREFIX)
+    assert len(stored) < len(text.encode("utf-8"))
+    assert decompress_text(stored) == text
+
+
+def test_short_text_is_stored_as_utf8():
+    """min_bytes 미만의 텍스트는 UTF-8 그대로 저장 (기존 TEXT 값과 같은 형식)"""
+    text = "AI HOLD 결정 (Confidence: 72.00%)"
+
+    stored = compress_text(text, min_bytes=512)
+
+    assert stored == text.encode("utf-8")
+    assert decompress_text(stored) == text
@@ -0,0 +1,81 @@
+"""
+애플리케이션 import 테스트
+"""
+
+import os
+import subprocess
+import sys
+
+from benchmarks.import_time import LAZY_MODULES, parse_importtime
+
+
+def test_app_main_does_not_import_heavy_libraries():
+    """app.main import 시 pandas/numpy/pyupbit/openai는 불러오지 않음 (처음 사용할 때 import)"""
+    code = (
+        "import sys\n"
+        "import app.main\n"
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert completed.stdout.strip() == ""
+
+
+def test_history_endpoints_do_not_import_heavy_libraries(tmp_path):
+    """조회 API(거래 내역/검색/상세, 코인 목록)는 OPENAI_API_KEY 없이 동작하고 pandas/numpy/pyupbit/openai를 불러오지 않음"""
+    code = (
+        "import asyncio, sys\n"
+        "from fastapi.testclient import TestClient\n"
+        "import app.main\n"
+        "from app.common.model.base import Base, get_engine\n"
+        "async def create_schema():\n"
+        "    async with get_engine().begin() as conn:\n"
+        "        await conn.run_sync(Base.metadata.create_all)\n"
+        "    await get_engine().dispose()\n"
+        "asyncio.run(create_schema())\n"
+        "with TestClient(app.main.app) as client:\n"
+        "    for path in ('/api/v1/trade/transactions', '/api/v1/trade/transactions/search?q=abc',\n"
+        "                 '/api/v1/trade/transactions/1', '/api/v1/my/coins'):\n"
+        "        print(path, client.get(path).status_code)\n"
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))\n"
+    )
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite+aiosqlite:///{tmp_path / 'history.db'}",
+        "OPENAI_API_KEY": "",
+        "SCHEDULER_MODE": "off",
+    }
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+
+    *responses, imported = completed.stdout.splitlines()
+    assert responses == [
+        "/api/v1/trade/transactions 200",
+        "/api/v1/trade/transactions/search?q=abc 200",
+        "/api/v1/trade/transactions/1 404",
+        "/api/v1/my/coins 200",
+    ]
+    assert imported == ""
+
+
+def test_parse_importtime():
+    """-X importtime 출력에서 모듈별 self/누적 시간과 깊이를 파싱"""
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   app.configs.config\n"
+        "import time:        80 |        200 | app.main\n"
+    )
+
+    records = parse_importtime(stderr)
+
+    assert [(r.module, r.self_us, r.cumulative_us, r.depth) for r in records] == [
+        ("app.configs.config", 120, 120, 1),
+        ("app.main", 80, 200, 0),
+    ]
@@ -0,0 +1,167 @@
+"""
+LeaderElector 테스트 (가짜 락 백엔드)
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Callable, List, Optional
+
+import pytest
+
+from app.common import leader_election
+from app.common.leader_election import LeaderElector
+
+INTERVAL = 0.01
+
+
+class FakeLease:
+    """FakeLockBackend가 발급한 락"""
+
+    def __init__(self, backend: "FakeLockBackend"):
+        self.backend = backend
+
+    async def is_held(self) -> bool:
+        return self.backend.holder is self
+
+
+class FakeLockBackend:
+    """프로세스 내에서 한 번에 한 보유자만 허용하는 named_lock 대체"""
+
+    def __init__(self):
+        self.holder: Optional[FakeLease] = None
+        self.failures = 0
+
+    @asynccontextmanager
+    async def named_lock(self, lock_name: str):
+        if self.failures > 0:
+            self.failures -= 1
+            raise ConnectionError("db down")
+        if self.holder is not None:
+            yield None
+            return
+        lease = FakeLease(self)
+        self.holder = lease
+        try:
+            yield lease
+        finally:
+            if self.holder is lease:
+                self.holder = None
+
+    def expire(self) -> None:
+        """보유자의 lease 만료 (다른 워커가 가져갈 수 있음)"""
+        self.holder = None
+
+
+@pytest.fixture
+def backend(monkeypatch) -> FakeLockBackend:
+    backend = FakeLockBackend()
+    monkeypatch.setattr(leader_election, "named_lock", backend.named_lock)
+    return backend
+
+
+class Recorder:
+    """리더 선출/해제 콜백 호출 기록"""
+
+    def __init__(self, name: str, events: List[str]):
+        self.name = name
+        self.events = events
+
+    async def on_elected(self) -> None:
+        self.events.append(f"{self.name}:elected")
+
+    async def on_demoted(self) -> None:
+        self.events.append(f"{self.name}:demoted")
+
+
+def _elector(name: str, events: List[str]) -> LeaderElector:
+    recorder = Recorder(name, events)
+    return LeaderElector(
+        "scheduler_leader",
+        on_elected=recorder.on_elected,
+        on_demoted=recorder.on_demoted,
+        interval=INTERVAL,
+    )
+
+
+async def _wait_until(condition: Callable[[], bool], timeout: float = 1.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(INTERVAL / 2)
+
+
+async def test_only_one_elector_becomes_leader(backend):
+    """여러 워커 중 락을 잡은 하나만 리더가 됨"""
+    events: List[str] = []
+    electors = [_elector("a", events), _elector("b", events)]
+    for elector in electors:
+        elector.start()
+    try:
+        await _wait_until(lambda: any(elector.is_leader for elector in electors))
+        await asyncio.sleep(INTERVAL * 5)
+
+        assert sum(elector.is_leader for elector in electors) == 1
+        assert len(events) == 1 and events[0].endswith(":elected")
+    finally:
+        for elector in electors:
+            await elector.stop()
+
+
+async def test_leader_is_demoted_when_lock_is_lost(backend):
+    """락을 잃으면 리더 해제 콜백을 호출하고, 다음 주기에 다시 선출 가능"""
+    events: List[str] = []
+    elector = _elector("a", events)
+    elector.start()
+    try:
+        await _wait_until(lambda: elector.is_leader)
+        backend.expire()
+        # 해제 직후 다른 워커가 락을 가져감
+        other = FakeLease(backend)
+        backend.holder = other
+
+        await _wait_until(lambda: not elector.is_leader)
+        assert events == ["a:elected", "a:demoted"]
+
+        backend.expire()
+        await _wait_until(lambda: elector.is_leader)
+        assert events == ["a:elected", "a:demoted", "a:elected"]
+    finally:
+        await elector.stop()
+
+
+async def test_follower_takes_over_when_leader_stops(backend):
+    """리더가 종료되면 락이 해제되어 팔로워가 리더를 승계"""
+    events: List[str] = []
+    leader = _elector("a", events)
+    leader.start()
+    await _wait_until(lambda: leader.is_leader)
+    follower = _elector("b", events)
+    follower.start()
+    try:
+        await asyncio.sleep(INTERVAL * 3)
+        assert not follower.is_leader
+
+        await leader.stop()
+        await _wait_until(lambda: follower.is_leader)
+
+        assert not leader.is_leader
+        assert events == ["a:elected", "a:demoted", "b:elected"]
+    finally:
+        await follower.stop()
+
+    assert events[-1] == "b:demoted"
+    assert backend.holder is None
+
+
+async def test_campaign_error_is_retried(backend):
+    """락 획득 중 오류가 나도 다음 주기에 다시 시도"""
+    backend.failures = 2
+    events: List[str] = []
+    elector = _elector("a", events)
+    elector.start()
+    try:
+        await _wait_until(lambda: elector.is_leader)
+        assert backend.failures == 0
+        assert events == ["a:elected"]
+    finally:
+        await elector.stop()
@@ -0,0 +1,125 @@
+"""
+lease_lock 테스트 (인메모리 SQLite)
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+from app.common import lease_lock
+from app.common.lease_lock import (
+    FencingToken,
+    LeaseLostError,
+    lease_lock as acquire_lease_lock,
+    renew_lease,
+    try_acquire_lease,
+)
+from app.common.model.lease import Lease
+from app.trade.model.enums import TradeStatus
+from app.trade.model.trade import Trade
+from app.trade.repository.trade_repository import TradeRepository
+
+
+@pytest.fixture(autouse=True)
+def sqlite_lease(monkeypatch, sqlite_engine):
+    """lease가 인메모리 DB를 사용하도록 설정"""
+    monkeypatch.setattr(lease_lock, "get_engine", lambda: sqlite_engine)
+
+
+async def _get_lease(sqlite_engine, name: str) -> Lease:
+    async with sqlite_engine.connect() as conn:
+        result = await conn.execute(select(Lease.__table__).where(Lease.name == name))
+        return result.one()
+
+
+async def _expire(sqlite_engine, name: str) -> None:
+    async with sqlite_engine.begin() as conn:
+        await conn.execute(
+            update(Lease.__table__)
+            .where(Lease.name == name)
+            .values(expires_at=datetime.utcnow())
+        )
+
+
+async def test_heartbeat_renews_lease(sqlite_engine):
+    """heartbeat가 ttl/3 주기로 만료 시각을 연장하여 ttl이 지나도 락을 유지"""
+    async with acquire_lease_lock("job", ttl_seconds=0.3) as lock:
+        first_expires_at = (await _get_lease(sqlite_engine, "job")).expires_at
+        await asyncio.sleep(0.5)
+
+        assert await lock.is_held()
+        assert (await _get_lease(sqlite_engine, "job")).expires_at > first_expires_at
+        assert await try_acquire_lease("job", "other", 30) is None
+
+
+async def test_expired_lease_is_taken_over_with_higher_token():
+    """만료된 lease는 다른 소유자가 token을 1 올려 가져가고, 이전 소유자는 갱신할 수 없음"""
+    assert await try_acquire_lease("job", "first", -1) == 1
+
+    assert await try_acquire_lease("job", "second", 30) == 2
+    assert await renew_lease("job", "first", 1, 30) is False
+    assert await renew_lease("job", "second", 2, 30) is True
+
+
+async def test_expiry_is_written_with_db_clock(sqlite_engine):
+    """만료 시각은 DB 시계 기준 현재 + ttl (호스트 시계를 쓰지 않음)"""
+    before = datetime.utcnow()
+    assert await try_acquire_lease("job", "first", 30) == 1
+
+    expires_at = (await _get_lease(sqlite_engine, "job")).expires_at
+
+    assert before + timedelta(seconds=29) < expires_at
+    assert expires_at < datetime.utcnow() + timedelta(seconds=31)
+
+
+async def test_heartbeat_detects_takeover(sqlite_engine):
+    """lease가 만료되어 다른 소유자에게 넘어가면 다음 heartbeat에서 잃은 것으로 표시"""
+    async with acquire_lease_lock("job", ttl_seconds=0.3) as lock:
+        await _expire(sqlite_engine, "job")
+        assert await try_acquire_lease("job", "other", 30) == 2
+
+        await asyncio.sleep(0.2)
+
+        assert lock.lost
+        assert not await lock.is_held()
+
+
+async def test_lease_expires_locally_when_renewal_fails(monkeypatch):
+    """DB 오류로 갱신하지 못하면 로컬 만료 시각이 지난 뒤 보유하지 않은 것으로 간주"""
+
+    async def failing_renew(*args, **kwargs):
+        raise ConnectionError("db down")
+
+    monkeypatch.setattr(lease_lock, "renew_lease", failing_renew)
+
+    async with acquire_lease_lock("job", ttl_seconds=0.2) as lock:
+        assert await lock.is_held()
+        await asyncio.sleep(0.3)
+
+        assert not lock.lost
+        assert not await lock.is_held()
+
+
+async def test_fencing_rejects_stale_token(sqlite_session):
+    """lease가 넘어간 뒤 이전 token으로 쓰면 LeaseLostError, 현재 token이면 token과 함께 기록"""
+    async with acquire_lease_lock("trade") as lock:
+        stale = lock.fencing
+    # 해제(만료)된 lease를 다른 워커가 가져감
+    current = await try_acquire_lease("trade", "other", 30)
+
+    with pytest.raises(LeaseLostError):
+        await TradeRepository(sqlite_session, fencing=stale).create(
+            Trade(coin_id=1, status=TradeStatus.NO_ACTION)
+        )
+    with pytest.raises(LeaseLostError):
+        await TradeRepository(sqlite_session, fencing=stale).check_lease()
+
+    repository = TradeRepository(
+        sqlite_session, fencing=FencingToken(lock_name="trade", token=current)
+    )
+    await repository.check_lease()
+    trade = await repository.create(Trade(coin_id=1, status=TradeStatus.NO_ACTION))
+
+    assert (await sqlite_session.get(Trade, trade.id)).fencing_token == current
@@ -0,0 +1,89 @@
+"""
+Prometheus 메트릭 테스트
+"""
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.common.api.metrics_router import metrics_router
+from app.common.metrics import MetricsMiddleware, observe_external_call
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture
+def client():
+    router = APIRouter(prefix="/test-metrics")
+
+    @router.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(router)
+    app.include_router(metrics_router)
+    return TestClient(app)
+
+
+def test_requests_labeled_by_route_template(client):
+    """경로 파라미터가 달라도 같은 라우트 템플릿으로 집계하고, 없는 경로는 unmatched"""
+    labels = {
+        "method": "GET",
+        "route": "/test-metrics/items/{item_id}",
+        "status": "200",
+    }
+    before = _sample("http_requests_total", **labels)
+    unmatched_before = _sample(
+        "http_requests_total", method="GET", route="unmatched", status="404"
+    )
+
+    client.get("/test-metrics/items/1")
+    client.get("/test-metrics/items/2")
+    client.get("/test-metrics/missing")
+
+    assert _sample("http_requests_total", **labels) == before + 2
+    assert (
+        _sample("http_requests_total", method="GET", route="unmatched", status="404")
+        == unmatched_before + 1
+    )
+
+
+def test_metrics_endpoint_exposes_text_format(client):
+    """/metrics는 Prometheus 텍스트 형식으로 응답"""
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "http_request_duration_seconds_bucket" in response.text
+
+
+def test_external_call_outcome():
+    """외부 호출은 성공/실패를 outcome 라벨로 구분"""
+
+    @observe_external_call("test")
+    def fail():
+        raise RuntimeError("down")
+
+    before = _sample(
+        "external_call_duration_seconds_count",
+        service="test",
+        method="fail",
+        outcome="error",
+    )
+    with pytest.raises(RuntimeError):
+        fail()
+
+    assert (
+        _sample(
+            "external_call_duration_seconds_count",
+            service="test",
+            method="fail",
+            outcome="error",
+        )
+        == before + 1
+    )
@@ -0,0 +1,30 @@
+"""
+named_lock 테스트 (인메모리 SQLite)
+"""
+
+import pytest
+
+from app.common import lease_lock
+from app.common.lease_lock import LeaseHandle
+from app.common.named_lock import named_lock
+from app.configs.config import settings
+
+
+@pytest.fixture
+def sqlite_lock(monkeypatch, sqlite_engine):
+    """DATABASE_URL이 SQLite이고 lease가 인메모리 DB를 사용하도록 설정"""
+    monkeypatch.setattr(settings, "DATABASE_URL", "sqlite+aiosqlite://")
+    monkeypatch.setattr(settings, "LOCK_BACKEND", "mysql")
+    monkeypatch.setattr(lease_lock, "get_engine", lambda: sqlite_engine)
+
+
+async def test_named_lock_uses_lease_on_sqlite(sqlite_lock):
+    """SQLite는 GET_LOCK이 없으므로 LOCK_BACKEND와 관계없이 lease로 락을 잡음"""
+    async with named_lock("trade_execution") as lock:
+        async with named_lock("trade_execution") as other:
+            assert isinstance(lock, LeaseHandle)
+            assert await lock.is_held()
+            assert other is None
+
+    async with named_lock("trade_execution") as lock:
+        assert lock.fencing.token == 2
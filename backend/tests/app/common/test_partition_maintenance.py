@@ -0,0 +1,113 @@
+"""
+파티션 관리 계획/보관 테스트
+"""
+
+import csv
+import gzip
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from app.common.model.compressed_text import compress_text
+from app.common.partition_maintenance import (
+    PartitionInfo,
+    PartitionMaintenance,
+    expired_partitions,
+    partition_definition,
+    plan_future_partitions,
+)
+
+
+def _partitions(*months: str) -> list:
+    """월 파티션 목록 + pmax (예: "2026-08" → p202608, 상한 2026-09-01)"""
+    partitions = []
+    for month in months:
+        year, mon = map(int, month.split("-"))
+        upper = datetime(year + mon // 12, mon % 12 + 1, 1)
+        partitions.append(PartitionInfo(name=f"p{year}{mon:02d}", upper_bound=upper))
+    partitions.append(PartitionInfo(name="pmax", upper_bound=None))
+    return partitions
+
+
+def test_partition_definition():
+    """월 파티션 정의는 다음 달 1일 미만"""
+    assert partition_definition(datetime(2026, 12, 1)) == (
+        "PARTITION p202612 VALUES LESS THAN ('2027-01-01 00:00:00')"
+    )
+
+
+def test_plan_future_partitions_fills_up_to_premake_months():
+    """마지막 월 파티션 다음 달부터 이번 달 + premake_months까지 생성"""
+    partitions = _partitions("2026-09", "2026-10", "2026-11")
+
+    months = plan_future_partitions(
+        partitions, now=datetime(2026, 10, 19), premake_months=3
+    )
+
+    assert months == [datetime(2026, 12, 1), datetime(2027, 1, 1)]
+
+
+def test_plan_future_partitions_nothing_when_ahead():
+    """이미 충분히 만들어져 있으면 생성하지 않음"""
+    partitions = _partitions("2026-10", "2026-11", "2026-12", "2027-01")
+
+    assert (
+        plan_future_partitions(partitions, now=datetime(2026, 10, 19), premake_months=3)
+        == []
+    )
+
+
+def test_expired_partitions_only_fully_outside_retention():
+    """모든 행이 보관 기간 밖인 파티션만 만료 (pmax 제외)"""
+    partitions = _partitions("2026-06", "2026-07", "2026-08", "2026-09", "2026-10")
+
+    expired = expired_partitions(
+        partitions, now=datetime(2026, 10, 19), retention_months=3
+    )
+
+    # 보관 기준: 2026-07-01 이후 → 6월 파티션만 만료
+    assert [p.name for p in expired] == ["p202606"]
+
+
+def test_expired_partitions_disabled_without_retention():
+    """retention_months가 0이면 보관/삭제하지 않음"""
+    partitions = _partitions("2020-01", "2026-10")
+
+    assert (
+        expired_partitions(partitions, now=datetime(2026, 10, 19), retention_months=0)
+        == []
+    )
+
+
+class _FakeStreamResult:
+    """session.stream() 결과 (keys, partitions)"""
+
+    def __init__(self, keys: list, rows: list):
+        self._keys = keys
+        self._rows = rows
+
+    def keys(self) -> list:
+        return self._keys
+
+    async def partitions(self, size: int):
+        for i in range(0, len(self._rows), size):
+            yield self._rows[i : i + size]
+
+
+async def test_export_writes_gzip_csv(tmp_path, mocker):
+    """파티션 행을 gzip CSV로 내보내고 임시 파일은 남기지 않음 (압축 BLOB은 텍스트로)"""
+    rows = [(1, compress_text("골든 크로스 " * 100, 0)), (2, None)]
+    session = MagicMock()
+    session.stream = AsyncMock(return_value=_FakeStreamResult(["id", "reason"], rows))
+    mocker.patch("app.common.partition_maintenance.EXPORT_CHUNK_SIZE", 1)
+    path = tmp_path / "trades_p202401.csv.gz"
+
+    exported = await PartitionMaintenance(session)._export("trades", "p202401", path)
+
+    assert exported == 2
+    assert list(tmp_path.iterdir()) == [path]
+    with gzip.open(path, "rt", newline="", encoding="utf-8") as file:
+        assert list(csv.reader(file)) == [
+            ["id", "reason"],
+            ["1", "골든 크로스 " * 100],
+            ["2", ""],
+        ]
@@ -0,0 +1,38 @@
+"""
+RateLimiter / SharedRateLimiter 테스트
+"""
+
+import pytest
+
+from app.common import rate_limiter
+from app.common.rate_limiter import RateLimiter, SharedRateLimiter
+
+
+def test_reserve_spaces_calls_beyond_rate(mocker):
+    """구간당 rate번까지는 바로 호출하고, 이후 호출은 가장 오래된 슬롯 + period까지 대기"""
+    mocker.patch("app.common.rate_limiter.time.monotonic", return_value=100.0)
+    limiter = RateLimiter(rate=2, period=1.0)
+
+    delays = [limiter.reserve() for _ in range(5)]
+
+    assert delays == pytest.approx([0.0, 0.0, 1.0, 1.0, 2.0])
+
+
+def test_rate_must_be_positive():
+    """rate가 0 이하이면 ValueError"""
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        SharedRateLimiter("order", rate=0)
+
+
+async def test_shared_limiter_spaces_calls_across_instances(monkeypatch, sqlite_engine):
+    """여러 워커(인스턴스)가 같은 이름의 슬롯을 함께 예약하여 합계가 rate를 넘지 않음"""
+    monkeypatch.setattr(rate_limiter, "get_engine", lambda: sqlite_engine)
+    workers = [SharedRateLimiter("order", rate=4), SharedRateLimiter("order", rate=4)]
+    other = SharedRateLimiter("other", rate=4)
+
+    delays = [await workers[i % 2].reserve() for i in range(4)]
+
+    assert delays == pytest.approx([0.0, 0.25, 0.5, 0.75], abs=0.05)
+    assert await other.reserve() == pytest.approx(0.0, abs=0.05)
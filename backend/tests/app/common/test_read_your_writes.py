@@ -0,0 +1,87 @@
+"""
+Read-your-writes 미들웨어 테스트
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.testclient import TestClient
+
+from app.common.model import base
+from app.common.read_your_writes import (
+    READ_PRIMARY_UNTIL_COOKIE,
+    ReadYourWritesMiddleware,
+)
+from app.configs.app import cors_origin_options
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware, window_seconds=5)
+
+    @app.get("/items")
+    async def get_items():
+        return {"primary": base._read_from_primary.get()}
+
+    @app.post("/items")
+    async def create_item():
+        return {"primary": base._read_from_primary.get()}
+
+    return TestClient(app)
+
+
+def test_reads_after_write_go_to_primary(client):
+    """쓰기 요청이 성공하면 같은 클라이언트의 이후 조회는 primary"""
+    assert client.get("/items").json() == {"primary": False}
+
+    response = client.post("/items")
+
+    assert response.json() == {"primary": True}
+    assert READ_PRIMARY_UNTIL_COOKIE in response.cookies
+    assert client.get("/items").json() == {"primary": True}
+
+
+def test_expired_cookie_reads_from_replica(client):
+    """만료된 쿠키는 무시"""
+    client.cookies.set(READ_PRIMARY_UNTIL_COOKIE, "1.0")
+
+    assert client.get("/items").json() == {"primary": False}
+
+
+@pytest.mark.parametrize("origins", [["*"], ["http://localhost:3000"]])
+def test_first_credentialed_write_from_allowed_origin_gets_cookie(origins):
+    """쿠키가 없는 첫 쓰기 요청에도 요청 오리진을 명시하여 응답 (와일드카드면 브라우저가 응답과 쿠키를 거부)"""
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware, window_seconds=5)
+    app.add_middleware(
+        CORSMiddleware,
+        **cors_origin_options(origins),
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    @app.post("/items")
+    async def create_item():
+        return {}
+
+    client = TestClient(app)
+    headers = {"Origin": "http://localhost:3000"}
+
+    preflight = client.options(
+        "/items", headers={**headers, "Access-Control-Request-Method": "POST"}
+    )
+    response = client.post("/items", headers=headers)
+
+    for result in (preflight, response):
+        assert result.headers["access-control-allow-origin"] == "http://localhost:3000"
+        assert result.headers["access-control-allow-credentials"] == "true"
+    assert READ_PRIMARY_UNTIL_COOKIE in response.cookies
+
+
+def test_explicit_origins_reject_others():
+    """오리진을 명시하면 목록에 없는 오리진은 허용하지 않음"""
+    assert cors_origin_options(["http://localhost:3000"]) == {
+        "allow_origins": ["http://localhost:3000"]
+    }
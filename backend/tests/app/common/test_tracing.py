@@ -0,0 +1,113 @@
+"""
+트레이싱 테스트
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.common import tracing
+from app.common.tracing import (
+    OtlpHttpExporter,
+    SpanExporter,
+    set_exporter,
+    span,
+    traced,
+)
+
+
+class MemoryExporter(SpanExporter):
+    """내보낸 span을 메모리에 보관"""
+
+    def __init__(self):
+        self.spans = []
+        super().__init__()
+
+    def _write(self, spans):
+        self.spans.extend(spans)
+
+
+@pytest.fixture
+def exporter():
+    exporter = MemoryExporter()
+    set_exporter(exporter)
+    yield exporter
+    set_exporter(None)
+
+
+class TestSpan:
+    """span 기록 테스트"""
+
+    def test_disabled_returns_noop(self):
+        """exporter가 없으면 공용 no-op span을 반환"""
+        assert span("a") is span("b") is tracing._NOOP_SPAN
+
+    async def test_nested_spans_share_trace(self, exporter):
+        """중첩 span은 같은 trace에 부모-자식으로 기록"""
+
+        @traced("child")
+        async def child(coin_name: str):
+            return SimpleNamespace(status="success")
+
+        with span("parent") as parent:
+            await child("KRW-BTC")
+        exporter.flush()
+
+        recorded = {s.name: s for s in exporter.spans}
+        assert recorded["child"].trace_id == parent.trace_id
+        assert recorded["child"].parent_span_id == parent.span_id
+        assert recorded["child"].attributes == {"coin": "KRW-BTC", "outcome": "success"}
+
+    def test_error_is_recorded(self, exporter):
+        """예외는 span에 기록하고 그대로 전파"""
+
+        @traced("process")
+        def process(coin):
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            process(coin=SimpleNamespace(name="KRW-ETH"))
+        exporter.flush()
+
+        assert exporter.spans[0].error == "ValueError: boom"
+        assert exporter.spans[0].attributes == {"coin": "KRW-ETH"}
+
+
+def test_otlp_encoding(exporter):
+    """OTLP JSON 인코딩: hex ID, 부모 ID, 문자열 타임스탬프, 오류 상태"""
+    with span("parent"):
+        with span("child", coin="KRW-BTC", attempts=2):
+            pass
+    exporter.flush()
+
+    otlp = OtlpHttpExporter.__new__(OtlpHttpExporter)
+    otlp.service_name = "joo-coin"
+    encoded = otlp.encode(exporter.spans)
+
+    spans = encoded["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    child = next(s for s in spans if s["name"] == "child")
+    parent = next(s for s in spans if s["name"] == "parent")
+    assert len(child["traceId"]) == 32 and len(child["spanId"]) == 16
+    assert child["parentSpanId"] == parent["spanId"]
+    assert "parentSpanId" not in parent
+    assert {"key": "attempts", "value": {"intValue": "2"}} in child["attributes"]
+    assert child["status"] == {"code": 1}
+
+
+def test_collect_spans_without_exporter():
+    """exporter가 없어도 collect_spans 블록 안의 span은 이름별로 집계"""
+
+    @traced("upbit.get_current_price")
+    def get_price(coin_name: str):
+        return 1.0
+
+    with tracing.collect_spans() as collector:
+        get_price("KRW-BTC")
+        get_price("KRW-ETH")
+        with span("db.commit"):
+            pass
+
+    assert collector.count("upbit.") == 2
+    assert collector.count("db.commit", "openai.") == 1
+    assert collector.total_ms("upbit.") >= 0
+    assert span("after") is tracing._NOOP_SPAN
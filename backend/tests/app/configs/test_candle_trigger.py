@@ -0,0 +1,82 @@
+"""
+캔들 마감 트리거 테스트
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.coin.model.enums import CandleInterval
+from app.configs.candle_trigger import CandleCloseTrigger, next_candle_close
+
+
+def utc(*args) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class TestNextCandleClose:
+    """next_candle_close() 테스트"""
+
+    @pytest.mark.parametrize(
+        "interval, after, expected",
+        [
+            (
+                CandleInterval.MINUTE1,
+                utc(2025, 11, 22, 10, 30, 15),
+                utc(2025, 11, 22, 10, 31),
+            ),
+            (
+                CandleInterval.MINUTE15,
+                utc(2025, 11, 22, 10, 30),
+                utc(2025, 11, 22, 10, 45),
+            ),
+            (
+                CandleInterval.MINUTE60,
+                utc(2025, 11, 22, 23, 59, 59),
+                utc(2025, 11, 23, 0, 0),
+            ),
+            (
+                CandleInterval.MINUTE240,
+                utc(2025, 11, 22, 5, 0),
+                utc(2025, 11, 22, 8, 0),
+            ),
+            (CandleInterval.DAY, utc(2025, 11, 22, 0, 0), utc(2025, 11, 23, 0, 0)),
+            # 2025-11-22는 토요일 → 다음 월요일
+            (CandleInterval.WEEK, utc(2025, 11, 22, 12, 0), utc(2025, 11, 24, 0, 0)),
+            (CandleInterval.WEEK, utc(2025, 11, 24, 0, 0), utc(2025, 12, 1, 0, 0)),
+            (CandleInterval.MONTH, utc(2025, 12, 15, 0, 0), utc(2026, 1, 1, 0, 0)),
+        ],
+    )
+    def test_next_candle_close(self, interval, after, expected):
+        """캔들 간격별 다음 마감 시각 (기준 시각이 마감 시각이면 그 다음 마감)"""
+        assert next_candle_close(interval, after) == expected
+
+    def test_next_candle_close_converts_to_utc(self):
+        """KST 09:00(UTC 00:00) 직후의 일봉 마감은 다음날 KST 09:00"""
+        kst = timezone(timedelta(hours=9))
+        after = datetime(2025, 11, 22, 9, 0, 1, tzinfo=kst)
+        assert next_candle_close(CandleInterval.DAY, after) == utc(2025, 11, 23, 0, 0)
+
+
+class TestCandleCloseTrigger:
+    """CandleCloseTrigger 테스트"""
+
+    def test_first_fire_time_includes_offset(self):
+        """첫 실행은 다음 마감 시각 + offset"""
+        trigger = CandleCloseTrigger(CandleInterval.MINUTE60, offset_seconds=5)
+        now = utc(2025, 11, 22, 10, 30)
+        assert trigger.get_next_fire_time(None, now) == utc(2025, 11, 22, 11, 0, 5)
+
+    def test_within_offset_fires_for_just_closed_candle(self):
+        """마감 직후 offset 이내라면 방금 마감된 캔들에 대해 실행"""
+        trigger = CandleCloseTrigger(CandleInterval.MINUTE60, offset_seconds=5)
+        now = utc(2025, 11, 22, 11, 0, 2)
+        assert trigger.get_next_fire_time(None, now) == utc(2025, 11, 22, 11, 0, 5)
+
+    def test_next_fire_time_after_previous(self):
+        """이전 실행 이후에는 다음 캔들 마감 + offset"""
+        trigger = CandleCloseTrigger(CandleInterval.DAY, offset_seconds=5)
+        previous = utc(2025, 11, 22, 0, 0, 5)
+        assert trigger.get_next_fire_time(previous, previous) == utc(
+            2025, 11, 23, 0, 0, 5
+        )
@@ -0,0 +1,171 @@
+"""
+스케줄러 설정 테스트 (고정 시계)
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import apscheduler.executors.base
+import apscheduler.schedulers.base
+import apscheduler.triggers.interval
+import pytest
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from app.configs import app as app_module
+from app.configs import scheduler as scheduler_module
+from app.configs.config import settings
+from app.configs.scheduler import (
+    TRADE_EXECUTION_JOB_ID,
+    SchedulerStats,
+    create_scheduler,
+)
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class FrozenClock:
+    """APScheduler와 스케줄러 리스너가 읽는 현재 시각을 고정"""
+
+    def __init__(self, now: datetime):
+        self.now = now
+        clock = self
+
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return clock.now.astimezone(tz) if tz else clock.now
+
+        self.datetime = FrozenDatetime
+
+    def set(self, seconds: float) -> None:
+        self.now = T0 + timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FrozenClock:
+    clock = FrozenClock(T0)
+    for module in (
+        apscheduler.schedulers.base,
+        apscheduler.executors.base,
+        apscheduler.triggers.interval,
+        scheduler_module,
+    ):
+        monkeypatch.setattr(module, "datetime", clock.datetime)
+    return clock
+
+
+@pytest.fixture
+def stats(monkeypatch) -> SchedulerStats:
+    stats = SchedulerStats()
+    monkeypatch.setattr(scheduler_module, "scheduler_stats", stats)
+    monkeypatch.setattr(scheduler_module, "_last_scheduled_at", {})
+    return stats
+
+
+@pytest.fixture
+def interval_settings(monkeypatch):
+    monkeypatch.setattr(settings, "TRIGGER_MODE", "interval")
+    monkeypatch.setattr(settings, "TRADE_INTERVAL_SECONDS", 30)
+    monkeypatch.setattr(settings, "SCHEDULER_MISFIRE_GRACE_SECONDS", 300)
+    monkeypatch.setattr(settings, "ORDER_RECONCILE_INTERVAL_SECONDS", 0)
+    monkeypatch.setattr(settings, "PARTITION_MAINTENANCE_INTERVAL_SECONDS", 0)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_coalesces_ticks_skips_overlaps_and_records_drift(
+    clock, stats, interval_settings, monkeypatch
+):
+    """밀린 tick은 한 번으로 합치고, 이전 실행 중인 tick은 건너뛰며, 예정 시각 대비 지연을 기록"""
+    release = asyncio.Event()
+    started = []
+
+    async def trade_execution_job():
+        started.append(clock.now)
+        await release.wait()
+
+    monkeypatch.setattr(scheduler_module, "trade_execution_job", trade_execution_job)
+    scheduler = create_scheduler()
+    scheduler.start()
+    try:
+        job = scheduler.get_job(TRADE_EXECUTION_JOB_ID)
+        assert (job.coalesce, job.max_instances) == (True, 1)
+        assert job.next_run_time == T0 + timedelta(seconds=30)
+
+        # 30초 예정 실행을 1초 늦게 처리
+        clock.set(31)
+        scheduler._process_jobs()
+        await _settle()
+        assert len(started) == 1
+        assert (stats.runs, stats.coalesced_ticks, stats.last_drift_ms) == (
+            1,
+            0,
+            1000.0,
+        )
+
+        # 실행 중에 60/90/120초 tick이 밀림 → 한 번으로 합쳐 건너뜀
+        clock.set(125)
+        scheduler._process_jobs()
+        await _settle()
+        assert len(started) == 1
+        assert stats.skipped_overlaps == 1
+
+        # 실행이 끝난 뒤 150/180/210초 tick → 한 번만 실행, 합쳐진 tick 2개
+        release.set()
+        await _settle()
+        clock.set(215)
+        scheduler._process_jobs()
+        await _settle()
+        assert started == [T0 + timedelta(seconds=31), T0 + timedelta(seconds=215)]
+        assert (stats.runs, stats.coalesced_ticks, stats.skipped_overlaps) == (2, 2, 1)
+        assert stats.last_drift_ms == 5000.0
+        assert stats.max_drift_ms == 5000.0
+    finally:
+        scheduler.shutdown(wait=False)
+
+
+async def test_leader_callbacks_start_and_stop_scheduler(monkeypatch):
+    """리더 선출 시 스케줄러를 시작하고, 리더십을 잃으면 종료"""
+    created = MagicMock()
+    monkeypatch.setattr(app_module, "create_scheduler", lambda: created)
+    monkeypatch.setattr(app_module, "scheduler", None)
+
+    await app_module.start_scheduler()
+    await app_module.start_scheduler()
+    assert app_module.scheduler is created
+    created.start.assert_called_once_with()
+
+    await app_module.stop_scheduler()
+    created.shutdown.assert_called_once_with(wait=False)
+    assert app_module.scheduler is None
+
+
+async def test_stop_scheduler_waits_for_running_job(monkeypatch):
+    """리더십을 잃으면 실행 중인 작업을 취소하고, 작업이 끝난 뒤에 반환"""
+    started = asyncio.Event()
+    finished = []
+
+    async def job():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        finally:
+            # 취소된 뒤의 정리 작업 (주문 UUID 기록 등)
+            await asyncio.sleep(0.05)
+            finished.append(True)
+
+    running_scheduler = AsyncIOScheduler()
+    running_scheduler.add_job(job, "date")
+    monkeypatch.setattr(app_module, "create_scheduler", lambda: running_scheduler)
+    monkeypatch.setattr(app_module, "scheduler", None)
+
+    await app_module.start_scheduler()
+    await asyncio.wait_for(started.wait(), timeout=2)
+    await app_module.stop_scheduler()
+
+    assert finished == [True]
+    assert app_module.scheduler is None
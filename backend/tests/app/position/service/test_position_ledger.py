@@ -0,0 +1,56 @@
+"""
+포지션 원장 (FIFO) 계산 테스트
+"""
+
+from collections import deque
+from datetime import datetime
+from decimal import Decimal
+
+from app.position.service.position_ledger import apply_buy, apply_sell, new_position
+
+AT = datetime(2026, 1, 1)
+
+
+def test_sell_consumes_oldest_lot_first():
+    """매도는 오래된 로트부터 소진하고 수수료를 반영한 실현 손익을 누적"""
+    position = new_position(1)
+    lots = deque()
+    apply_buy(position, lots, 1, Decimal("1"), Decimal("100"), Decimal("0"), AT)
+    apply_buy(position, lots, 2, Decimal("1"), Decimal("200"), Decimal("0"), AT)
+
+    exhausted = apply_sell(position, lots, Decimal("1.5"), Decimal("300"), Decimal("3"))
+
+    # 원가 100 + 0.5 * 200 = 200, 대금 450 - 3 = 447
+    assert [lot.trade_id for lot in exhausted] == [1]
+    assert lots[0].remaining_quantity == Decimal("0.5")
+    assert position.quantity == Decimal("0.5")
+    assert position.cost_basis == Decimal("100")
+    assert position.realized_pnl == Decimal("247")
+    assert position.fees_paid == Decimal("3")
+
+
+def test_buy_fee_is_included_in_unit_cost():
+    """매수 수수료는 로트의 단위 원가에 포함"""
+    position = new_position(1)
+    lots = deque()
+
+    lot = apply_buy(position, lots, 1, Decimal("2"), Decimal("100"), Decimal("1"), AT)
+
+    assert lot.unit_cost == Decimal("100.5")
+    assert position.cost_basis == Decimal("201")
+
+
+def test_oversold_quantity_is_excluded_from_pnl():
+    """원장보다 많이 매도하면 원가를 아는 수량만 실현 손익에 반영"""
+    position = new_position(1)
+    lots = deque()
+    apply_buy(position, lots, 1, Decimal("1"), Decimal("100"), Decimal("0"), AT)
+
+    exhausted = apply_sell(position, lots, Decimal("2"), Decimal("150"), Decimal("2"))
+
+    # 1개만 매칭: 대금 150 - 수수료 1 - 원가 100
+    assert len(exhausted) == 1
+    assert not lots
+    assert position.quantity == Decimal("0")
+    assert position.cost_basis == Decimal("0")
+    assert position.realized_pnl == Decimal("49")
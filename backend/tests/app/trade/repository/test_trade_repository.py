@@ -0,0 +1,168 @@
+"""
+TradeRepository 테스트 (인메모리 SQLite)
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from app.coin.model.coin import Coin
+from app.common.lease_lock import FencingToken, LeaseLostError
+from app.common.model.lease import Lease
+from app.trade.model.enums import FailureCategory, TradeStatus, TradeType
+from app.trade.model.trade import Trade
+from app.trade.model.trade_reason import TradeReason
+from app.trade.model.trade_search_document import TradeSearchDocument
+from app.trade.repository.trade_repository import TradeRepository
+
+
+async def _create_trades(session):
+    coin = Coin(name="KRW-BTC", is_deleted=False, candle_interval="day")
+    session.add(coin)
+    await session.commit()
+
+    repository = TradeRepository(session)
+    trades = [
+        Trade(
+            coin_id=coin.id,
+            trade_type=TradeType.BUY.value,
+            status=TradeStatus.SUCCESS,
+            confidence=Decimal("0.8"),
+            ai_reason="골든 크로스 발생, 거래량 증가",
+        ),
+        Trade(
+            coin_id=coin.id,
+            trade_type=TradeType.SELL.value,
+            status=TradeStatus.FAILED,
+            confidence=Decimal("0.6"),
+            failure_category=FailureCategory.NO_HOLDINGS.value,
+            ai_reason="데드 크로스 100% 확인",
+        ),
+        Trade(
+            coin_id=coin.id,
+            trade_type=TradeType.BUY.value,
+            status=TradeStatus.SUCCESS,
+            confidence=Decimal("0.4"),
+            ai_reason="골든 크로스 이후 조정",
+        ),
+    ]
+    for trade in trades:
+        await repository.create(trade)
+    return coin, trades
+
+
+async def test_create_assigns_increasing_ids(sqlite_session):
+    """(id, created_at) 복합 기본 키 테이블에서도 id가 자동 증가"""
+    _, trades = await _create_trades(sqlite_session)
+
+    assert [trade.id for trade in trades] == [1, 2, 3]
+
+
+async def test_get_all_with_coin_paginated(sqlite_session):
+    """커서 이전의 거래를 코인 정보와 함께 조회"""
+    _, trades = await _create_trades(sqlite_session)
+    repository = TradeRepository(sqlite_session)
+
+    page = await repository.get_all_with_coin_paginated(
+        cursor=trades[2].id, limit=10, trade_type=None
+    )
+
+    assert sorted(trade.id for trade in page) == [1, 2]
+    assert {trade.coin.name for trade in page} == {"KRW-BTC"}
+
+
+async def test_search_falls_back_to_like_on_sqlite(sqlite_session):
+    """FULLTEXT가 없는 SQLite에서는 부분 문자열로 검색 (LIKE 와일드카드는 이스케이프)"""
+    await _create_trades(sqlite_session)
+    repository = TradeRepository(sqlite_session)
+
+    found = await repository.search(query="골든 크로스", cursor=None, limit=10)
+    literal = await repository.search(query="100%", cursor=None, limit=10)
+    wildcard = await repository.search(query="%", cursor=None, limit=10)
+
+    assert [trade.id for trade in found] == [3, 1]
+    assert [trade.id for trade in literal] == [2]
+    assert [trade.id for trade in wildcard] == [2]
+
+
+async def test_get_decision_stats(sqlite_session):
+    """코인/결정/상태/위험 수준/실패 원인별 거래 수와 신뢰도 합계"""
+    coin, _ = await _create_trades(sqlite_session)
+
+    rows = await TradeRepository(sqlite_session).get_decision_stats()
+
+    stats = {
+        (row.trade_type, row.status, row.failure_category): (
+            row.trade_count,
+            row.confidence_count,
+            Decimal(str(row.confidence_sum)),
+        )
+        for row in rows
+    }
+    assert {row.coin_id for row in rows} == {coin.id}
+    assert stats == {
+        ("buy", "success", None): (2, 2, Decimal("1.2")),
+        ("sell", "failed", "no_holdings"): (1, 1, Decimal("0.6")),
+    }
+
+
+async def test_save_order_uuid_after_lease_lost(sqlite_session):
+    """lease를 잃어 접수 결과 기록이 거부되어도 주문 UUID는 따로 저장"""
+    sqlite_session.add(
+        Lease(
+            name="trade", owner="other", fencing_token=2, expires_at=datetime.utcnow()
+        )
+    )
+    await sqlite_session.commit()
+    repository = TradeRepository(
+        sqlite_session, fencing=FencingToken(lock_name="trade", token=1)
+    )
+    trade = Trade(coin_id=1, status=TradeStatus.PENDING)
+    sqlite_session.add(trade)
+    await sqlite_session.commit()
+
+    trade.order_uuid = "order-1"
+    with pytest.raises(LeaseLostError):
+        await repository.update(trade)
+    await repository.save_order_uuid(trade, "order-1")
+
+    saved = await sqlite_session.get(Trade, 1, populate_existing=True)
+    assert saved.order_uuid == "order-1"
+    assert saved.fencing_token is None
+
+
+async def test_reason_created_at_follows_trade(sqlite_session):
+    """거래 사유와 검색 문서는 거래의 created_at으로 기록 (나중에 추가한 사유 포함)"""
+    created_at = datetime(2024, 1, 31, 23, 59, 59)
+    repository = TradeRepository(sqlite_session)
+    with_reason = await repository.create(
+        Trade(
+            coin_id=1,
+            status=TradeStatus.SUCCESS,
+            ai_reason="골든 크로스 발생",
+            created_at=created_at,
+        )
+    )
+    without_reason = await repository.create(
+        Trade(coin_id=1, status=TradeStatus.PENDING)
+    )
+    sqlite_session.expunge_all()
+
+    later = await sqlite_session.get(Trade, without_reason.id)
+    later.execution_reason = "주문 체결"
+    await sqlite_session.commit()
+
+    reasons = await sqlite_session.execute(
+        select(TradeReason.trade_id, TradeReason.created_at)
+    )
+    documents = await sqlite_session.execute(
+        select(TradeSearchDocument.trade_id, TradeSearchDocument.created_at)
+    )
+    expected = {
+        (with_reason.id, created_at),
+        (without_reason.id, without_reason.created_at),
+    }
+    assert set(reasons.all()) == expected
+    assert set(documents.all()) == expected
@@ -0,0 +1,113 @@
+"""
+TradeTaskRepository 테스트 (인메모리 SQLite)
+"""
+
+from sqlalchemy import select
+
+from app.coin.model.coin import Coin
+from app.common.model.base import create_session_maker
+from app.trade.model.enums import TradeTaskStatus
+from app.trade.model.trade_task import TradeTask
+from app.trade.repository.trade_task_repository import TradeTaskRepository
+
+
+async def _enqueue(session, count: int) -> None:
+    coins = [
+        Coin(name=f"KRW-C{i}", is_deleted=False, candle_interval="day")
+        for i in range(count)
+    ]
+    session.add_all(coins)
+    await session.commit()
+    await TradeTaskRepository(session).enqueue(
+        [coin.id for coin in coins], fee_multiplier=1.0005, min_order_amount=5000
+    )
+
+
+async def test_claim_gives_each_worker_a_different_task(sqlite_engine):
+    """두 워커가 차례로 점유하면 서로 다른 작업을 받고, 남은 작업이 없으면 None"""
+    session_maker = create_session_maker(sqlite_engine)
+    async with session_maker() as session:
+        await _enqueue(session, 2)
+
+    async with session_maker() as first, session_maker() as second:
+        task1 = await TradeTaskRepository(first).claim("w1", 60, 3)
+        task2 = await TradeTaskRepository(second).claim("w2", 60, 3)
+        task3 = await TradeTaskRepository(second).claim("w2", 60, 3)
+
+    assert (task1.claimed_by, task1.attempts) == ("w1", 1)
+    assert (task2.claimed_by, task2.attempts) == ("w2", 1)
+    assert task1.id != task2.id
+    assert task3 is None
+
+
+async def test_claim_retakes_expired_task_until_max_attempts(sqlite_session):
+    """점유가 만료된 작업은 다시 점유하고, 시도 횟수를 넘으면 FAILED로 처리"""
+    await _enqueue(sqlite_session, 1)
+    repository = TradeTaskRepository(sqlite_session)
+
+    first = await repository.claim("w1", -1, 2)
+    first_attempts = first.attempts
+    second = await repository.claim("w2", -1, 2)
+
+    assert (first.id, first_attempts) == (second.id, 1)
+    assert (second.claimed_by, second.attempts) == ("w2", 2)
+    assert await repository.claim("w3", -1, 2) is None
+    task = await sqlite_session.get(TradeTask, second.id, populate_existing=True)
+    assert task.status == TradeTaskStatus.FAILED.value
+
+
+async def test_stale_task_is_not_claimed_twice(sqlite_engine):
+    """SKIP LOCKED가 없으면 같은 작업을 조회한 워커 중 먼저 갱신한 워커만 점유"""
+    session_maker = create_session_maker(sqlite_engine)
+    async with session_maker() as session:
+        await _enqueue(session, 1)
+
+    async with session_maker() as first, session_maker() as second:
+        stale = await first.get(TradeTask, 1)
+        claimed = await TradeTaskRepository(second).claim("w2", 60, 3)
+
+        updated = await TradeTaskRepository(first)._update_if_unchanged(
+            stale, status=TradeTaskStatus.RUNNING.value, claimed_by="w1"
+        )
+
+    assert claimed.id == stale.id
+    assert updated is False
+    assert stale.claimed_by is None
+
+
+async def test_enqueue_skips_coins_with_pending_tasks(sqlite_session):
+    """대기/처리 중인 작업이 있는 코인은 다시 추가하지 않음"""
+    await _enqueue(sqlite_session, 2)
+    repository = TradeTaskRepository(sqlite_session)
+    claimed = await repository.claim("w1", 60, 3)
+    await repository.finish(claimed, TradeTaskStatus.DONE)
+
+    added = await repository.enqueue(
+        [1, 2], fee_multiplier=1.0005, min_order_amount=5000
+    )
+
+    assert added == 1
+    tasks = (await sqlite_session.execute(select(TradeTask))).scalars().all()
+    assert sorted((task.coin_id, task.status) for task in tasks) == [
+        (1, TradeTaskStatus.DONE.value),
+        (1, TradeTaskStatus.QUEUED.value),
+        (2, TradeTaskStatus.QUEUED.value),
+    ]
+
+
+async def test_finish_records_result_only_for_current_claim(sqlite_session):
+    """점유가 만료되어 다른 워커가 가져간 작업은 이전 워커의 결과로 덮어쓰지 않음"""
+    await _enqueue(sqlite_session, 1)
+    repository = TradeTaskRepository(sqlite_session)
+    first = await repository.claim("w1", -1, 3)
+    stale = TradeTask(id=first.id, claimed_by=first.claimed_by, attempts=first.attempts)
+    second = await repository.claim("w2", 60, 3)
+
+    assert await repository.finish(stale, TradeTaskStatus.DONE, trade_id=1) is False
+    assert await repository.finish(second, TradeTaskStatus.DONE, trade_id=2) is True
+    task = await sqlite_session.get(TradeTask, second.id, populate_existing=True)
+    assert (task.status, task.trade_id, task.claimed_by) == (
+        TradeTaskStatus.DONE.value,
+        2,
+        "w2",
+    )
@@ -0,0 +1,102 @@
+"""
+DecisionStatsService 테스트
+"""
+
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.coin.model.coin import Coin
+from app.coin.repository.coin_repository import CoinRepository
+from app.trade.repository.trade_repository import TradeRepository
+from app.trade.repository.trade_run_repository import TradeRunRepository
+from app.trade.service.decision_stats_service import (
+    DecisionStatsCache,
+    DecisionStatsService,
+)
+
+
+def _row(
+    trade_type,
+    status,
+    risk_level,
+    count,
+    failure_category=None,
+    confidence_sum=None,
+    coin_id=1,
+):
+    return SimpleNamespace(
+        coin_id=coin_id,
+        trade_type=trade_type,
+        status=status,
+        risk_level=risk_level,
+        failure_category=failure_category,
+        trade_count=count,
+        confidence_count=count if confidence_sum is not None else 0,
+        confidence_sum=confidence_sum,
+    )
+
+
+ROWS = [
+    _row("buy", "success", "low", 2, confidence_sum=Decimal("1.6")),
+    _row("buy", "failed", "low", 1, "insufficient_krw", Decimal("0.7")),
+    _row("hold", "no_action", "medium", 4, confidence_sum=Decimal("2.4")),
+    _row(None, "failed", "none", 1, "ai_quota"),
+    _row("sell", "failed", "high", 2, "no_holdings", Decimal("1.8"), coin_id=2),
+]
+
+
+@pytest.fixture
+def repositories(mocker):
+    trade_repository = mocker.MagicMock(spec=TradeRepository)
+    trade_repository.get_decision_stats = AsyncMock(return_value=ROWS)
+    trade_run_repository = mocker.MagicMock(spec=TradeRunRepository)
+    trade_run_repository.get_latest_finished_version = AsyncMock(return_value=(7, 5))
+    coin_repository = mocker.MagicMock(spec=CoinRepository)
+    coin_repository.get_all_include_deleted = AsyncMock(
+        return_value=[Coin(id=1, name="KRW-BTC"), Coin(id=2, name="KRW-ETH")]
+    )
+    module = "app.trade.service.decision_stats_service"
+    mocker.patch(f"{module}.TradeRepository", return_value=trade_repository)
+    mocker.patch(f"{module}.TradeRunRepository", return_value=trade_run_repository)
+    mocker.patch(f"{module}.CoinRepository", return_value=coin_repository)
+    return trade_repository, trade_run_repository
+
+
+async def test_groups_rows_into_per_coin_stats(repositories):
+    """GROUP BY 결과를 코인별 결정 횟수/평균 신뢰도/실패율/위험 수준으로 합침"""
+    service = DecisionStatsService(MagicMock(spec=AsyncSession), DecisionStatsCache())
+
+    stats = await service.get_stats()
+
+    assert stats.run_id == 7
+    btc, eth = stats.items
+    assert btc.coin_name == "KRW-BTC"
+    assert btc.total_count == 8
+    assert btc.decision_counts == {"buy": 3, "sell": 0, "hold": 4}
+    assert btc.analysis_failure_count == 1
+    assert btc.average_confidence == pytest.approx(4.7 / 7)
+    assert btc.failure_count == 2
+    assert btc.failure_rate == pytest.approx(0.25)
+    assert btc.failure_categories == {"insufficient_krw": 1, "ai_quota": 1}
+    assert btc.risk_levels == {"low": 3, "medium": 4, "none": 1}
+    assert eth.failure_rate == 1.0
+
+
+async def test_reuses_cache_until_run_version_changes(repositories):
+    """끝난 실행의 버전이 같으면 trades를 다시 집계하지 않음"""
+    trade_repository, trade_run_repository = repositories
+    cache = DecisionStatsCache()
+    session = MagicMock(spec=AsyncSession)
+
+    first = await DecisionStatsService(session, cache).get_stats()
+    second = await DecisionStatsService(session, cache).get_stats()
+    trade_run_repository.get_latest_finished_version.return_value = (8, 3)
+    third = await DecisionStatsService(session, cache).get_stats()
+
+    assert second is first
+    assert third.run_id == 8
+    assert trade_repository.get_decision_stats.await_count == 2
@@ -0,0 +1,194 @@
+"""
+OrderReconcileService 테스트
+"""
+
+import threading
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.position.service.position_ledger import PositionLedger
+from app.trade.model.enums import FailureCategory, TradeStatus, TradeType
+from app.trade.model.trade import Trade
+from app.trade.repository.trade_repository import TradeRepository
+from app.trade.service.order_reconcile_service import OrderReconcileService
+from app.upbit.client.upbit_client import UpbitClient
+from app.upbit.dto.order_dto import UpbitOrder
+
+
+def _pending(order_uuid: str, age_seconds: int = 0) -> Trade:
+    return Trade(
+        coin_id=1,
+        trade_type=TradeType.BUY.value,
+        price=Decimal("100"),
+        amount=Decimal("10"),
+        status=TradeStatus.PENDING,
+        order_uuid=order_uuid,
+        execution_reason="매수 주문 접수",
+        created_at=datetime.utcnow() - timedelta(seconds=age_seconds),
+    )
+
+
+def _order(order_uuid: str, state: str, volume: float, funds: float) -> UpbitOrder:
+    return UpbitOrder(
+        uuid=order_uuid,
+        side="bid",
+        ord_type="price",
+        market="KRW-BTC",
+        state=state,
+        price=1000.0,
+        executed_volume=volume,
+        executed_funds=funds,
+        paid_fee=funds * 0.0005,
+    )
+
+
+@pytest.fixture
+def mock_trade_repository(mocker):
+    repo = mocker.MagicMock(spec=TradeRepository)
+    repo.get_open_orders = AsyncMock()
+    repo.update_all = AsyncMock()
+    return repo
+
+
+@pytest.fixture
+def mock_upbit_client(mocker):
+    client = mocker.MagicMock(spec=UpbitClient)
+    client.get_orders = MagicMock()
+    return client
+
+
+@pytest.fixture
+def mock_position_ledger(mocker):
+    ledger = mocker.MagicMock(spec=PositionLedger)
+    ledger.apply = AsyncMock()
+    return ledger
+
+
+@pytest.fixture
+def reconcile_service(
+    mock_trade_repository, mock_upbit_client, mock_position_ledger, mocker
+):
+    mocker.patch(
+        "app.trade.service.order_reconcile_service.TradeRepository",
+        return_value=mock_trade_repository,
+    )
+    mocker.patch(
+        "app.trade.service.order_reconcile_service.PositionLedger",
+        return_value=mock_position_ledger,
+    )
+    return OrderReconcileService(
+        MagicMock(spec=AsyncSession), mock_upbit_client, timeout_seconds=60
+    )
+
+
+class TestReconcile:
+    """reconcile() 테스트"""
+
+    async def test_settles_closed_orders_with_one_query_and_commit(
+        self,
+        reconcile_service,
+        mock_trade_repository,
+        mock_upbit_client,
+        mock_position_ledger,
+    ):
+        """종료된 주문은 체결 정보와 최종 상태를 기록하고, 체결 중인 주문은 PENDING 유지"""
+        done, partial, open_, cancelled = (
+            _pending("done"),
+            _pending("partial"),
+            _pending("open"),
+            _pending("cancelled"),
+        )
+        mock_trade_repository.get_open_orders.return_value = [
+            done,
+            partial,
+            open_,
+            cancelled,
+        ]
+        mock_upbit_client.get_orders.return_value = [
+            _order("done", "done", 10.0, 1000.0),
+            _order("partial", "cancel", 4.0, 400.0),
+            _order("open", "wait", 0.0, 0.0),
+            _order("cancelled", "cancel", 0.0, 0.0),
+        ]
+
+        settled = await reconcile_service.reconcile(limit=100)
+
+        assert settled == 3
+        mock_upbit_client.get_orders.assert_called_once_with(
+            ["done", "partial", "open", "cancelled"]
+        )
+        mock_trade_repository.update_all.assert_awaited_once()
+        assert done.status == TradeStatus.SUCCESS
+        assert done.filled_price == Decimal("100.0")
+        assert done.filled_volume == Decimal("10.0")
+        assert done.paid_fee == Decimal("0.5")
+        assert "체결 완료" in done.execution_reason
+        assert partial.status == TradeStatus.PARTIAL_SUCCESS
+        assert open_.status == TradeStatus.PENDING
+        assert open_.filled_at is None
+        assert cancelled.status == TradeStatus.FAILED
+        assert cancelled.failure_category == FailureCategory.ORDER_CANCELLED.value
+        # 확정된 거래는 커밋 전에 포지션 원장에 반영
+        assert mock_position_ledger.apply.await_args.args[0] == [
+            done,
+            partial,
+            cancelled,
+        ]
+
+    async def test_market_buy_dust_cancel_is_success(
+        self, reconcile_service, mock_trade_repository, mock_upbit_client
+    ):
+        """시장가 매수에서 호가 단위 미만 잔액만 취소된 주문은 전량 체결로 판단"""
+        trade = _pending("dust")
+        mock_trade_repository.get_open_orders.return_value = [trade]
+        mock_upbit_client.get_orders.return_value = [
+            _order("dust", "cancel", 9.9995, 999.95)
+        ]
+
+        await reconcile_service.reconcile()
+
+        assert trade.status == TradeStatus.SUCCESS
+
+    async def test_missing_order_fails_after_timeout(
+        self, reconcile_service, mock_trade_repository, mock_upbit_client
+    ):
+        """거래소에서 찾을 수 없는 주문은 제한 시간이 지난 뒤에만 FAILED"""
+        recent, stale = _pending("recent", age_seconds=10), _pending("stale", 120)
+        mock_trade_repository.get_open_orders.return_value = [recent, stale]
+        mock_upbit_client.get_orders.return_value = []
+
+        settled = await reconcile_service.reconcile()
+
+        assert settled == 1
+        assert recent.status == TradeStatus.PENDING
+        assert stale.status == TradeStatus.FAILED
+        assert stale.failure_category == FailureCategory.ORDER_NOT_FOUND.value
+        assert "주문 조회 실패" in stale.execution_reason
+
+    async def test_no_open_orders_skips_exchange(
+        self, reconcile_service, mock_trade_repository, mock_upbit_client
+    ):
+        """미확정 주문이 없으면 거래소를 호출하지 않음"""
+        mock_trade_repository.get_open_orders.return_value = []
+
+        assert await reconcile_service.reconcile() == 0
+        mock_upbit_client.get_orders.assert_not_called()
+        mock_trade_repository.update_all.assert_not_called()
+
+    async def test_exchange_query_runs_off_event_loop(
+        self, reconcile_service, mock_trade_repository, mock_upbit_client
+    ):
+        """거래소 조회(블로킹 HTTP)는 이벤트 루프 스레드가 아닌 곳에서 실행"""
+        mock_trade_repository.get_open_orders.return_value = [_pending("open")]
+        called_from = []
+        mock_upbit_client.get_orders.side_effect = lambda uuids: (
+            called_from.append(threading.get_ident()) or []
+        )
+
+        await reconcile_service.reconcile()
+
+        assert called_from and called_from[0] != threading.get_ident()
@@ -0,0 +1,204 @@
+"""
+OrderSubmitter 테스트
+"""
+
+import asyncio
+import threading
+import time
+from decimal import Decimal
+from unittest.mock import AsyncMock, call
+
+import pytest
+
+from app.common.lease_lock import LeaseLostError
+from app.common.rate_limiter import RateLimiter
+from app.trade.model.enums import TradeStatus, TradeType
+from app.trade.model.trade import Trade
+from app.trade.repository.trade_repository import TradeRepository
+from app.trade.service.order_submitter import OrderRequest, OrderSubmitter
+from app.upbit.client.upbit_client import UpbitClient
+
+
+def _order(coin_name: str, side: TradeType = TradeType.BUY) -> OrderRequest:
+    trade = Trade(
+        coin_id=1,
+        trade_type=side.value,
+        price=Decimal("100"),
+        amount=Decimal("1"),
+        status=TradeStatus.PENDING,
+        execution_reason="매수 예정",
+    )
+    return OrderRequest(
+        trade=trade,
+        coin_name=coin_name,
+        side=side,
+        amount=10000.0,
+        summary="10,000원",
+        reasons=["매수 예정"],
+    )
+
+
+@pytest.fixture
+def mock_trade_repository(mocker):
+    repo = mocker.MagicMock(spec=TradeRepository)
+    repo.update = AsyncMock(side_effect=lambda trade: trade)
+    repo.check_lease = AsyncMock()
+    repo.save_order_uuid = AsyncMock()
+    return repo
+
+
+@pytest.fixture
+def mock_upbit_client(mocker):
+    return mocker.MagicMock(spec=UpbitClient)
+
+
+class TestSubmit:
+    """submit() 테스트"""
+
+    async def test_sends_orders_concurrently_and_records_outcomes(
+        self, mock_trade_repository, mock_upbit_client
+    ):
+        """주문을 동시에 보내고 응답마다 UUID 또는 실패 사유를 기록"""
+        in_flight, peak = 0, 0
+        lock = threading.Lock()
+
+        def buy(coin_name, amount):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            if coin_name == "KRW-FAIL":
+                raise Exception("주문 거부")
+            return f"{coin_name}-uuid"
+
+        mock_upbit_client.buy.side_effect = buy
+        orders = [_order("KRW-BTC"), _order("KRW-ETH"), _order("KRW-FAIL")]
+        submitter = OrderSubmitter(
+            mock_trade_repository, mock_upbit_client, RateLimiter(rate=10)
+        )
+
+        trades = await submitter.submit(orders)
+
+        assert len(trades) == 3
+        assert peak > 1
+        assert mock_trade_repository.update.await_count == 3
+        btc, eth, failed = (order.trade for order in orders)
+        assert btc.order_uuid == "KRW-BTC-uuid"
+        assert btc.status == TradeStatus.PENDING
+        assert (
+            "매수 주문 접수: 10,000원 (주문 UUID: KRW-BTC-uuid)" in btc.execution_reason
+        )
+        assert eth.order_uuid == "KRW-ETH-uuid"
+        assert failed.order_uuid is None
+        assert failed.status == TradeStatus.FAILED
+        assert "매수 주문 실패: 주문 거부" in failed.execution_reason
+
+    async def test_waits_for_rate_limit(self, mock_trade_repository, mock_upbit_client):
+        """구간당 요청 제한을 넘는 주문은 다음 구간까지 기다렸다가 전송"""
+        sent_at = []
+        mock_upbit_client.sell.side_effect = lambda coin_name, amount: (
+            sent_at.append(time.monotonic()) or f"{coin_name}-uuid"
+        )
+        submitter = OrderSubmitter(
+            mock_trade_repository,
+            mock_upbit_client,
+            RateLimiter(rate=2, period=0.2),
+        )
+
+        started = time.monotonic()
+        await submitter.submit([_order(f"KRW-{i}", TradeType.SELL) for i in range(3)])
+
+        # 세 번째 슬롯은 첫 슬롯(시작 이후) + 구간 길이 이후
+        # (첫 전송이 늦어져도 영향받지 않도록 시작 시각 기준)
+        sent_at.sort()
+        assert sent_at[2] - started >= 0.19
+
+    async def test_does_not_send_after_lease_is_lost(
+        self, mock_trade_repository, mock_upbit_client
+    ):
+        """보내기 직전 확인에서 lease를 잃었으면 남은 주문은 보내지 않음"""
+        mock_trade_repository.check_lease.side_effect = [
+            None,
+            LeaseLostError("lost"),
+            LeaseLostError("lost"),
+        ]
+        mock_upbit_client.buy.side_effect = lambda coin_name, amount: (
+            f"{coin_name}-uuid"
+        )
+        orders = [_order("KRW-BTC"), _order("KRW-ETH"), _order("KRW-XRP")]
+        submitter = OrderSubmitter(
+            mock_trade_repository, mock_upbit_client, RateLimiter(rate=10)
+        )
+
+        with pytest.raises(LeaseLostError):
+            await submitter.submit(orders)
+
+        mock_upbit_client.buy.assert_called_once_with("KRW-BTC", 10000.0)
+        # 보낸 주문은 응답 도착 시점에 따라 접수 결과 또는 UUID만 기록
+        btc = orders[0].trade
+        assert btc.order_uuid == "KRW-BTC-uuid" or (
+            mock_trade_repository.save_order_uuid.await_args
+            == call(btc, "KRW-BTC-uuid")
+        )
+        assert mock_trade_repository.update.await_count <= 1
+
+    async def test_saves_order_uuid_when_lease_is_lost_while_recording(
+        self, mock_trade_repository, mock_upbit_client
+    ):
+        """접수 결과 기록 중 lease를 잃어도 이미 보낸 주문의 UUID는 따로 기록"""
+        mock_trade_repository.update.side_effect = LeaseLostError("lost")
+        mock_upbit_client.sell.return_value = "sell-uuid"
+        order = _order("KRW-BTC", TradeType.SELL)
+        submitter = OrderSubmitter(
+            mock_trade_repository, mock_upbit_client, RateLimiter(rate=10)
+        )
+
+        with pytest.raises(LeaseLostError):
+            await submitter.submit([order])
+
+        mock_trade_repository.save_order_uuid.assert_awaited_once_with(
+            order.trade, "sell-uuid"
+        )
+
+    async def test_saves_uuids_of_sent_orders_when_recording_fails(
+        self, mock_trade_repository, mock_upbit_client
+    ):
+        """기록 중 예외로 중단되어도 이미 보낸 주문은 응답을 기다려 UUID를 남기고, 대기 중인 주문은 보내지 않음"""
+        slow_sent = threading.Event()
+
+        def buy(coin_name, amount):
+            if coin_name == "KRW-ETH":
+                slow_sent.set()
+                time.sleep(0.2)
+            return f"{coin_name}-uuid"
+
+        async def update(trade):
+            # 느린 주문이 거래소로 나간 뒤 첫 기록이 실패
+            await asyncio.to_thread(slow_sent.wait)
+            raise RuntimeError("db down")
+
+        mock_upbit_client.buy.side_effect = buy
+        mock_trade_repository.update.side_effect = update
+        btc, eth, xrp = _order("KRW-BTC"), _order("KRW-ETH"), _order("KRW-XRP")
+        submitter = OrderSubmitter(
+            mock_trade_repository,
+            mock_upbit_client,
+            RateLimiter(rate=2, period=10.0),
+        )
+
+        with pytest.raises(RuntimeError, match="db down"):
+            await submitter.submit([btc, eth, xrp])
+
+        # 기록에 실패한 주문과 응답을 기다린 주문 모두 UUID 기록
+        mock_trade_repository.save_order_uuid.assert_has_awaits(
+            [call(btc.trade, "KRW-BTC-uuid"), call(eth.trade, "KRW-ETH-uuid")],
+            any_order=True,
+        )
+        assert mock_trade_repository.save_order_uuid.await_count == 2
+        assert [c.args[0] for c in mock_upbit_client.buy.call_args_list] == [
+            "KRW-BTC",
+            "KRW-ETH",
+        ]
@@ -0,0 +1,42 @@
+"""
+포트폴리오 배분 테스트
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.ai.dto.ai_analysis_response import AiAnalysisResponse, Decision, RiskLevel
+from app.trade.service.portfolio_allocator import allocate_buy_budgets, decision_weight
+
+
+def test_decision_weight_scales_confidence_by_risk():
+    """가중치 = 신뢰도 × 위험 수준 가중치"""
+    ai_result = AiAnalysisResponse(
+        decision=Decision.BUY,
+        confidence=0.5,
+        reason="상승 추세 예상",
+        risk_level=RiskLevel.MEDIUM,
+        timestamp=datetime.utcnow(),
+    )
+
+    assert decision_weight(ai_result) == pytest.approx(0.3)
+
+
+def test_allocate_splits_by_weight():
+    """가용 KRW를 가중치 비율로 배분"""
+    budgets = allocate_buy_budgets({1: 0.6, 2: 0.3, 3: 0.0}, 90000, 5000)
+
+    assert budgets == {1: pytest.approx(60000), 2: pytest.approx(30000), 3: 0.0}
+
+
+def test_allocate_drops_smallest_below_minimum_and_redistributes():
+    """최소 금액에 못 미치는 코인은 가중치가 작은 순으로 제외하고 나머지에 다시 배분"""
+    budgets = allocate_buy_budgets({1: 0.9, 2: 0.1, 3: 0.5}, 14000, 5000)
+
+    assert budgets == {1: pytest.approx(9000), 2: 0.0, 3: pytest.approx(5000)}
+
+
+def test_allocate_returns_zero_when_nothing_fits():
+    """한 코인에 전부 배분해도 최소 금액에 못 미치면 모두 0"""
+    assert allocate_buy_budgets({1: 1.0, 2: 0.5}, 3000, 5000) == {1: 0.0, 2: 0.0}
@@ -0,0 +1,92 @@
+"""
+TradeRunService 테스트
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.tracing import span
+from app.trade.model.enums import TradeRunStatus
+from app.trade.repository.trade_run_repository import TradeRunRepository
+from app.trade.service.trade_run_service import TradeRunService
+
+
+@pytest.fixture
+def mock_trade_run_repository(mocker):
+    """TradeRunRepository Mock (create 시 ID 부여)"""
+    repo = mocker.MagicMock(spec=TradeRunRepository)
+
+    async def create(run):
+        run.id = 7
+        return run
+
+    repo.create = AsyncMock(side_effect=create)
+    repo.update = AsyncMock(side_effect=lambda run: run)
+    repo.add_stats = AsyncMock()
+    return repo
+
+
+@pytest.fixture
+def trade_run_service(mock_trade_run_repository, mocker):
+    mocker.patch(
+        "app.trade.service.trade_run_service.TradeRunRepository",
+        return_value=mock_trade_run_repository,
+    )
+    return TradeRunService(MagicMock(spec=AsyncSession))
+
+
+class TestRecord:
+    """record() 테스트"""
+
+    async def test_records_stage_breakdown(
+        self, trade_run_service, mock_trade_run_repository
+    ):
+        """span 이름별 누적 시간과 외부 호출 수를 구간 컬럼으로 기록"""
+        async with trade_run_service.record("interval", "inline", 12.5) as run:
+            await trade_run_service.start(run, 3, 2)
+            with span("upbit.get_ohlcv_raw"):
+                pass
+            with span("openai.get_trading_decision"):
+                pass
+            with span("upbit.get_current_price"):
+                pass
+            run.trade_count = 2
+
+        saved = mock_trade_run_repository.update.call_args.args[0]
+        assert saved.status == TradeRunStatus.SUCCESS.value
+        assert saved.lock_wait_ms == 12.5
+        assert (saved.active_coin_count, saved.target_coin_count) == (3, 2)
+        assert saved.finished_at is not None and saved.duration_ms >= 0
+
+        run_id, stats = mock_trade_run_repository.add_stats.call_args.args
+        assert run_id == 7
+        assert stats["upbit_calls"] == 2
+        assert stats["openai_calls"] == 1
+        assert stats["trade_count"] == 2
+        assert set(stats) >= {"ohlcv_ms", "ai_ms", "price_ms", "db_commit_ms"}
+
+    async def test_not_started_run_is_not_recorded(
+        self, trade_run_service, mock_trade_run_repository
+    ):
+        """대상 코인이 없어 start()하지 않은 실행은 저장하지 않음"""
+        async with trade_run_service.record("recheck", "inline"):
+            pass
+
+        mock_trade_run_repository.create.assert_not_called()
+        mock_trade_run_repository.update.assert_not_called()
+
+    async def test_failure_is_recorded_and_reraised(
+        self, trade_run_service, mock_trade_run_repository
+    ):
+        """예외로 끝난 실행은 FAILED로 기록하고 예외를 전파"""
+        with pytest.raises(RuntimeError):
+            async with trade_run_service.record("manual", "inline") as run:
+                await trade_run_service.start(run, 1, 1)
+                raise RuntimeError("upbit down")
+
+        saved = mock_trade_run_repository.update.call_args.args[0]
+        assert saved.status == TradeRunStatus.FAILED.value
+        assert saved.error == "RuntimeError: upbit down"
+        trade_run_service.session.rollback.assert_awaited_once()
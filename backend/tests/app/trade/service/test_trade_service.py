@@ -3,7 +3,6 @@ TradeService 테스트
 모든 메서드와 분기를 테스트합니다.
 """
 
-from datetime import datetime
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 
@@ -17,6 +16,7 @@ from app.trade.dto.transaction_response import (
 )
 from app.trade.model.enums import TradeStatus, TradeType
 from app.trade.model.trade import Trade
+from app.trade.model.trade_task import TradeTask
 
 
 class TestExecute:
@@ -103,7 +103,7 @@ class TestExecute:
         sample_coin,
         sample_ai_result_buy,
     ):
-        """매수 성공 케이스"""
+        """매수 주문 접수 케이스"""
         # Given: 활성 코인, KRW 잔고, AI 매수 결정
         mock_coin_service.get_all_active.return_value = [sample_coin]
         mock_upbit_client.get_krw_balance.return_value = 100000
@@ -111,7 +111,7 @@ class TestExecute:
         mock_upbit_client.get_coin_balance.return_value = 0
         mock_upbit_client.get_ohlcv_raw.return_value = MagicMock()
         mock_ai_client.get_bitcoin_trading_decision.return_value = sample_ai_result_buy
-        mock_upbit_client.buy.return_value = None
+        mock_upbit_client.buy.return_value = "buy-order-uuid"
 
         pending_trade = Trade(
             id=1,
@@ -125,27 +125,29 @@ class TestExecute:
             execution_reason="매수 예정",
         )
 
-        success_trade = Trade(
+        accepted_trade = Trade(
             id=1,
             coin_id=sample_coin.id,
             trade_type=TradeType.BUY.value,
             price=Decimal("50000000"),
             amount=Decimal("0.001"),
             risk_level=RiskLevel.MEDIUM.value,
-            status=TradeStatus.SUCCESS,
+            status=TradeStatus.PENDING,
+            order_uuid="buy-order-uuid",
             ai_reason=sample_ai_result_buy.reason,
-            execution_reason="매수 완료",
+            execution_reason="매수 주문 접수",
         )
 
         mock_trade_repository.create.return_value = pending_trade
-        mock_trade_repository.update.return_value = success_trade
+        mock_trade_repository.update.return_value = accepted_trade
 
         # When: execute 실행
         result = await trade_service.execute()
 
-        # Then: 매수 성공
+        # Then: 매수 주문 접수 (체결 확인 전까지 PENDING)
         assert len(result) == 1
-        assert result[0].status == TradeStatus.SUCCESS
+        assert result[0].status == TradeStatus.PENDING
+        assert result[0].order_uuid == "buy-order-uuid"
         assert result[0].trade_type == TradeType.BUY.value
         mock_upbit_client.buy.assert_called_once()
         mock_balance_repository.create.assert_called_once()
@@ -161,7 +163,7 @@ class TestExecute:
         sample_coin,
         sample_ai_result_sell,
     ):
-        """매도 성공 케이스"""
+        """매도 주문 접수 케이스"""
         # Given: 활성 코인, 코인 잔고, AI 매도 결정
         mock_coin_service.get_all_active.return_value = [sample_coin]
         mock_upbit_client.get_krw_balance.return_value = 100000
@@ -169,7 +171,7 @@ class TestExecute:
         mock_upbit_client.get_coin_balance.return_value = 0.001
         mock_upbit_client.get_ohlcv_raw.return_value = MagicMock()
         mock_ai_client.get_bitcoin_trading_decision.return_value = sample_ai_result_sell
-        mock_upbit_client.sell.return_value = None
+        mock_upbit_client.sell.return_value = "sell-order-uuid"
 
         pending_trade = Trade(
             id=1,
@@ -183,27 +185,29 @@ class TestExecute:
             execution_reason="매도 예정",
         )
 
-        success_trade = Trade(
+        accepted_trade = Trade(
             id=1,
             coin_id=sample_coin.id,
             trade_type=TradeType.SELL.value,
             price=Decimal("50000000"),
             amount=Decimal("0.001"),
             risk_level=RiskLevel.HIGH.value,
-            status=TradeStatus.SUCCESS,
+            status=TradeStatus.PENDING,
+            order_uuid="sell-order-uuid",
             ai_reason=sample_ai_result_sell.reason,
-            execution_reason="매도 완료",
+            execution_reason="매도 주문 접수",
         )
 
         mock_trade_repository.create.return_value = pending_trade
-        mock_trade_repository.update.return_value = success_trade
+        mock_trade_repository.update.return_value = accepted_trade
 
         # When: execute 실행
         result = await trade_service.execute()
 
-        # Then: 매도 성공
+        # Then: 매도 주문 접수 (체결 확인 전까지 PENDING)
         assert len(result) == 1
-        assert result[0].status == TradeStatus.SUCCESS
+        assert result[0].status == TradeStatus.PENDING
+        assert result[0].order_uuid == "sell-order-uuid"
         assert result[0].trade_type == TradeType.SELL.value
         mock_upbit_client.sell.assert_called_once()
         mock_balance_repository.create.assert_called_once()
@@ -368,7 +372,7 @@ class TestProcessCoinTrade:
         mock_ai_client.get_bitcoin_trading_decision.return_value = sample_ai_result_buy
         mock_upbit_client.get_coin_balance.return_value = 0
         mock_upbit_client.get_current_price.return_value = 50000000
-        mock_upbit_client.buy.return_value = None
+        mock_upbit_client.buy.return_value = "buy-order-uuid"
 
         pending_trade = Trade(
             id=1,
@@ -382,20 +386,21 @@ class TestProcessCoinTrade:
             execution_reason="매수 예정",
         )
 
-        success_trade = Trade(
+        accepted_trade = Trade(
             id=1,
             coin_id=sample_coin.id,
             trade_type=TradeType.BUY.value,
             price=Decimal("50000000"),
             amount=Decimal("0.001"),
             risk_level=RiskLevel.MEDIUM.value,
-            status=TradeStatus.SUCCESS,
+            status=TradeStatus.PENDING,
+            order_uuid="buy-order-uuid",
             ai_reason=sample_ai_result_buy.reason,
-            execution_reason="매수 완료",
+            execution_reason="매수 주문 접수",
         )
 
         mock_trade_repository.create.return_value = pending_trade
-        mock_trade_repository.update.return_value = success_trade
+        mock_trade_repository.update.return_value = accepted_trade
 
         # When: _process_coin_trade 실행
         result = await trade_service._process_coin_trade(
@@ -424,7 +429,7 @@ class TestProcessCoinTrade:
         mock_ai_client.get_bitcoin_trading_decision.return_value = sample_ai_result_sell
         mock_upbit_client.get_coin_balance.return_value = 0.001
         mock_upbit_client.get_current_price.return_value = 50000000
-        mock_upbit_client.sell.return_value = None
+        mock_upbit_client.sell.return_value = "sell-order-uuid"
 
         pending_trade = Trade(
             id=1,
@@ -438,20 +443,21 @@ class TestProcessCoinTrade:
             execution_reason="매도 예정",
         )
 
-        success_trade = Trade(
+        accepted_trade = Trade(
             id=1,
             coin_id=sample_coin.id,
             trade_type=TradeType.SELL.value,
             price=Decimal("50000000"),
             amount=Decimal("0.001"),
             risk_level=RiskLevel.HIGH.value,
-            status=TradeStatus.SUCCESS,
+            status=TradeStatus.PENDING,
+            order_uuid="sell-order-uuid",
             ai_reason=sample_ai_result_sell.reason,
-            execution_reason="매도 완료",
+            execution_reason="매도 주문 접수",
         )
 
         mock_trade_repository.create.return_value = pending_trade
-        mock_trade_repository.update.return_value = success_trade
+        mock_trade_repository.update.return_value = accepted_trade
 
         # When: _process_coin_trade 실행
         result = await trade_service._process_coin_trade(
@@ -551,11 +557,11 @@ class TestExecuteBuy:
         sample_coin,
         sample_ai_result_buy,
     ):
-        """매수 성공"""
+        """매수 주문 접수 (체결을 기다리지 않음)"""
         # Given: 충분한 잔고
         krw_balance = 100000
         mock_upbit_client.get_current_price.return_value = 50000000
-        mock_upbit_client.buy.return_value = None
+        mock_upbit_client.buy.return_value = "buy-order-uuid"
 
         pending_trade = Trade(
             id=1,
@@ -569,20 +575,21 @@ class TestExecuteBuy:
             execution_reason="매수 예정",
         )
 
-        success_trade = Trade(
+        accepted_trade = Trade(
             id=1,
             coin_id=sample_coin.id,
             trade_type=TradeType.BUY.value,
             price=Decimal("50000000"),
             amount=Decimal("0.001"),
             risk_level=RiskLevel.MEDIUM.value,
-            status=TradeStatus.SUCCESS,
+            status=TradeStatus.PENDING,
+            order_uuid="buy-order-uuid",
             ai_reason=sample_ai_result_buy.reason,
-            execution_reason="매수 완료",
+            execution_reason="매수 주문 접수",
         )
 
         mock_trade_repository.create.return_value = pending_trade
-        mock_trade_repository.update.return_value = success_trade
+        mock_trade_repository.update.return_value = accepted_trade
 
         # When: _execute_buy 실행
         result = await trade_service._execute_buy(
@@ -594,8 +601,12 @@ class TestExecuteBuy:
             ai_result=sample_ai_result_buy,
         )
 
-        # Then: SUCCESS 상태
-        assert result.status == TradeStatus.SUCCESS
+        # Then: 주문 UUID를 기록하고 체결 확인 전까지 PENDING 유지
+        assert result.status == TradeStatus.PENDING
+        updated = mock_trade_repository.update.call_args.args[0]
+        assert updated.order_uuid == "buy-order-uuid"
+        assert updated.status == TradeStatus.PENDING
+        assert "매수 주문 접수" in updated.execution_reason
         mock_upbit_client.buy.assert_called_once()
 
     async def test_execute_buy_exception(
@@ -738,11 +749,11 @@ class TestExecuteSell:
         sample_coin,
         sample_ai_result_sell,
     ):
-        """매도 성공"""
+        """매도 주문 접수 (체결을 기다리지 않음)"""
         # Given: 충분한 코인 잔고
         coin_balance = 0.001
         mock_upbit_client.get_current_price.return_value = 50000000
-        mock_upbit_client.sell.return_value = None
+        mock_upbit_client.sell.return_value = "sell-order-uuid"
 
         pending_trade = Trade(
             id=1,
@@ -756,20 +767,21 @@ class TestExecuteSell:
             execution_reason="매도 예정",
         )
 
-        success_trade = Trade(
+        accepted_trade = Trade(
             id=1,
             coin_id=sample_coin.id,
             trade_type=TradeType.SELL.value,
             price=Decimal("50000000"),
             amount=Decimal("0.001"),
             risk_level=RiskLevel.HIGH.value,
-            status=TradeStatus.SUCCESS,
+            status=TradeStatus.PENDING,
+            order_uuid="sell-order-uuid",
             ai_reason=sample_ai_result_sell.reason,
-            execution_reason="매도 완료",
+            execution_reason="매도 주문 접수",
         )
 
         mock_trade_repository.create.return_value = pending_trade
-        mock_trade_repository.update.return_value = success_trade
+        mock_trade_repository.update.return_value = accepted_trade
 
         # When: _execute_sell 실행
         result = await trade_service._execute_sell(
@@ -781,8 +793,12 @@ class TestExecuteSell:
             ai_result=sample_ai_result_sell,
         )
 
-        # Then: SUCCESS 상태
-        assert result.status == TradeStatus.SUCCESS
+        # Then: 주문 UUID를 기록하고 체결 확인 전까지 PENDING 유지
+        assert result.status == TradeStatus.PENDING
+        updated = mock_trade_repository.update.call_args.args[0]
+        assert updated.order_uuid == "sell-order-uuid"
+        assert updated.status == TradeStatus.PENDING
+        assert "매도 주문 접수" in updated.execution_reason
         mock_upbit_client.sell.assert_called_once()
 
     async def test_execute_sell_exception(
@@ -873,147 +889,10 @@ class TestRecordBalance:
         assert balance.coin_amount == Decimal("50000")  # 0.001 * 50000000
 
 
-class TestGetTransactions:
-    """get_transactions() 메서드 테스트"""
-
-    async def test_get_transactions_first_page(
-        self, trade_service, mock_trade_repository, sample_coin
-    ):
-        """첫 페이지 조회"""
-        # Given: 15개의 거래 내역 (limit=20이므로 다음 페이지 없음)
-        trades = []
-        for i in range(15):
-            trade = MagicMock()
-            trade.id = i + 1
-            trade.coin_id = sample_coin.id
-            trade.trade_type = TradeType.BUY.value
-            trade.price = Decimal("50000000")
-            trade.amount = Decimal("0.001")
-            trade.risk_level = RiskLevel.MEDIUM.value
-            trade.status = TradeStatus.SUCCESS
-            trade.ai_reason = "매수"
-            trade.execution_reason = "완료"
-            trade.created_at = datetime.utcnow()
-            trade.coin = sample_coin
-            trades.append(trade)
-
-        mock_trade_repository.get_all_with_coin_paginated.return_value = trades
-
-        # When: 첫 페이지 조회
-        result = await trade_service.get_transactions(cursor=None, limit=20)
-
-        # Then: 15개 반환, 다음 페이지 없음
-        assert len(result.items) == 15
-        assert result.has_next is False
-        assert result.next_cursor is None
-
-    async def test_get_transactions_with_cursor(
-        self, trade_service, mock_trade_repository, sample_coin
-    ):
-        """커서로 다음 페이지 조회"""
-        # Given: 21개의 거래 내역 (limit=20이므로 다음 페이지 있음)
-        trades = []
-        for i in range(21):
-            trade = MagicMock()
-            trade.id = i + 21
-            trade.coin_id = sample_coin.id
-            trade.trade_type = TradeType.BUY.value
-            trade.price = Decimal("50000000")
-            trade.amount = Decimal("0.001")
-            trade.risk_level = RiskLevel.MEDIUM.value
-            trade.status = TradeStatus.SUCCESS
-            trade.ai_reason = "매수"
-            trade.execution_reason = "완료"
-            trade.created_at = datetime.utcnow()
-            trade.coin = sample_coin
-            trades.append(trade)
-
-        mock_trade_repository.get_all_with_coin_paginated.return_value = trades
-
-        # When: 커서로 다음 페이지 조회
-        result = await trade_service.get_transactions(cursor=20, limit=20)
-
-        # Then: 20개만 반환, 다음 페이지 있음
-        assert len(result.items) == 20
-        assert result.has_next is True
-        assert result.next_cursor == 40  # 마지막 항목의 ID
-
-    async def test_get_transactions_last_page(
-        self, trade_service, mock_trade_repository, sample_coin
-    ):
-        """마지막 페이지 조회"""
-        # Given: 5개의 거래 내역 (limit=20이므로 다음 페이지 없음)
-        trades = []
-        for i in range(5):
-            trade = MagicMock()
-            trade.id = i + 41
-            trade.coin_id = sample_coin.id
-            trade.trade_type = TradeType.BUY.value
-            trade.price = Decimal("50000000")
-            trade.amount = Decimal("0.001")
-            trade.risk_level = RiskLevel.MEDIUM.value
-            trade.status = TradeStatus.SUCCESS
-            trade.ai_reason = "매수"
-            trade.execution_reason = "완료"
-            trade.created_at = datetime.utcnow()
-            trade.coin = sample_coin
-            trades.append(trade)
-
-        mock_trade_repository.get_all_with_coin_paginated.return_value = trades
-
-        # When: 마지막 페이지 조회
-        result = await trade_service.get_transactions(cursor=40, limit=20)
-
-        # Then: 5개만 반환, 다음 페이지 없음
-        assert len(result.items) == 5
-        assert result.has_next is False
-        assert result.next_cursor is None
-
-    async def test_get_transactions_empty(self, trade_service, mock_trade_repository):
-        """빈 거래 내역 조회"""
-        # Given: 거래 내역 없음
-        mock_trade_repository.get_all_with_coin_paginated.return_value = []
-
-        # When: 조회
-        result = await trade_service.get_transactions(cursor=None, limit=20)
-
-        # Then: 빈 목록 반환
-        assert len(result.items) == 0
-        assert result.has_next is False
-        assert result.next_cursor is None
-
-    async def test_get_transactions_with_null_coin(
-        self, trade_service, mock_trade_repository
-    ):
-        """코인이 없는 거래 내역 조회"""
-        # Given: 코인이 없는 거래 (coin_id=None)
-        trade = MagicMock()
-        trade.id = 1
-        trade.coin_id = None
-        trade.trade_type = None
-        trade.price = Decimal("0")
-        trade.amount = Decimal("0")
-        trade.risk_level = RiskLevel.NONE.value
-        trade.status = TradeStatus.NO_ACTION
-        trade.ai_reason = None
-        trade.execution_reason = "활성화된 코인이 없습니다"
-        trade.created_at = datetime.utcnow()
-        trade.coin = None
-        mock_trade_repository.get_all_with_coin_paginated.return_value = [trade]
-
-        # When: 조회
-        result = await trade_service.get_transactions(cursor=None, limit=20)
-
-        # Then: 코인 이름이 None인 항목 반환
-        assert len(result.items) == 1
-        assert result.items[0].coin_name is None
-        assert result.items[0].coin_id is None
-
-
 class TestExecuteMultipleCoins:
     """여러 코인에 대한 execute() 테스트"""
 
-    async def test_execute_multiple_coins_with_balance_refresh(
+    async def test_execute_multiple_coins_splits_krw_across_buys(
         self,
         trade_service,
         mock_coin_service,
@@ -1023,7 +902,7 @@ class TestExecuteMultipleCoins:
         mock_balance_repository,
         sample_ai_result_buy,
     ):
-        """여러 코인 매수 시 잔고 갱신 확인"""
+        """여러 코인이 BUY로 결정되면 KRW를 나누어 모두 매수"""
         # Given: 2개의 활성 코인
         coin1 = MagicMock()
         coin1.id = 1
@@ -1034,13 +913,12 @@ class TestExecuteMultipleCoins:
         coin2.name = "KRW-ETH"
 
         mock_coin_service.get_all_active.return_value = [coin1, coin2]
-        # 초기, 첫 매수 후, record_balance에서 2번 호출
-        mock_upbit_client.get_krw_balance.side_effect = [100000, 50000, 25000, 25000]
+        mock_upbit_client.get_krw_balance.return_value = 100000
         mock_upbit_client.get_current_price.return_value = 50000000
         mock_upbit_client.get_coin_balance.return_value = 0
         mock_upbit_client.get_ohlcv_raw.return_value = MagicMock()
         mock_ai_client.get_bitcoin_trading_decision.return_value = sample_ai_result_buy
-        mock_upbit_client.buy.return_value = None
+        mock_upbit_client.buy.return_value = "buy-order-uuid"
 
         pending_trade = Trade(
             id=1,
@@ -1054,28 +932,32 @@ class TestExecuteMultipleCoins:
             execution_reason="매수 예정",
         )
 
-        success_trade = Trade(
+        accepted_trade = Trade(
             id=1,
             coin_id=1,
             trade_type=TradeType.BUY.value,
             price=Decimal("50000000"),
             amount=Decimal("0.001"),
             risk_level=RiskLevel.MEDIUM.value,
-            status=TradeStatus.SUCCESS,
+            status=TradeStatus.PENDING,
+            order_uuid="buy-order-uuid",
             ai_reason=sample_ai_result_buy.reason,
-            execution_reason="매수 완료",
+            execution_reason="매수 주문 접수",
         )
 
         mock_trade_repository.create.return_value = pending_trade
-        mock_trade_repository.update.return_value = success_trade
+        mock_trade_repository.update.return_value = accepted_trade
 
         # When: execute 실행
         result = await trade_service.execute()
 
-        # Then: 2개의 거래 실행, 잔고 갱신 호출됨
+        # Then: 같은 가중치이므로 KRW를 절반씩 배분하여 2건 모두 매수 주문 (매수 후 잔고 재조회 없음)
         assert len(result) == 2
-        # 첫 번째 매수 후 잔고 갱신이 호출되어야 함
-        assert mock_upbit_client.get_krw_balance.call_count >= 2
+        assert mock_upbit_client.buy.call_count == 2
+        for call in mock_upbit_client.buy.call_args_list:
+            assert call.args[1] == pytest.approx(50000 * 0.9995)
+        # 거래 전 잔고 기록 1번 + 배분 1번
+        assert mock_upbit_client.get_krw_balance.call_count == 2
 
 
 class TestRecordBalanceEdgeCases:
@@ -1196,3 +1078,80 @@ class TestProcessCoinTradeEdgeCases:
         # Then: FAILED 거래 기록 생성 (quota 초과)
         assert result.status == TradeStatus.FAILED
         assert "quota 초과" in result.execution_reason
+
+
+class TestQueueAllocation:
+    """queue 모드 KRW 배분 테스트"""
+
+    async def test_enqueue_tasks_splits_krw_across_target_coins(
+        self,
+        trade_service,
+        mock_coin_service,
+        mock_upbit_client,
+        mocker,
+    ):
+        """작업 추가 시 KRW 잔고를 대상 코인들에 균등 배분하여 저장"""
+        coins = []
+        for coin_id in (1, 2, 3):
+            coin = MagicMock(spec=Coin)
+            coin.id = coin_id
+            coin.name = f"KRW-C{coin_id}"
+            coins.append(coin)
+        mock_coin_service.get_all_active.return_value = coins
+        mock_upbit_client.get_krw_balance.return_value = 12000
+        mock_upbit_client.get_coin_balance.return_value = 0
+        trade_service.trade_run_service = mocker.MagicMock()
+        trade_service.trade_run_service.record.return_value.__aenter__ = AsyncMock(
+            return_value=MagicMock()
+        )
+        trade_service.trade_run_service.record.return_value.__aexit__ = AsyncMock(
+            return_value=False
+        )
+        trade_service.trade_run_service.start = AsyncMock(return_value=10)
+        trade_service.trade_task_repository = mocker.MagicMock()
+        trade_service.trade_task_repository.enqueue = AsyncMock(return_value=3)
+
+        # When: 최소 주문 금액 5000원 → 12000원은 2개 코인에만 배분 가능
+        added = await trade_service.enqueue_tasks(
+            fee_multiplier=1.0, min_order_amount=5000
+        )
+
+        # Then: 2개 코인에 6000원씩, 나머지 코인은 0원
+        assert added == 3
+        budgets = trade_service.trade_task_repository.enqueue.await_args.kwargs[
+            "krw_budgets"
+        ]
+        assert sorted(budgets.values()) == [0.0, 6000.0, 6000.0]
+
+    async def test_execute_task_caps_buy_at_task_budget(
+        self,
+        trade_service,
+        mock_coin_service,
+        mock_upbit_client,
+        mock_ai_client,
+        mock_trade_repository,
+        sample_coin,
+        sample_ai_result_buy,
+    ):
+        """작업에 배분된 KRW만큼만 매수"""
+        mock_coin_service.get_by_id = AsyncMock(return_value=sample_coin)
+        mock_upbit_client.get_krw_balance.return_value = 100000
+        mock_upbit_client.get_ohlcv_raw.return_value = MagicMock()
+        mock_upbit_client.get_current_price.return_value = 50000000
+        mock_upbit_client.buy.return_value = "order-uuid"
+        mock_ai_client.get_bitcoin_trading_decision.return_value = sample_ai_result_buy
+        mock_trade_repository.create.side_effect = lambda trade: trade
+        mock_trade_repository.update.side_effect = lambda trade: trade
+        task = TradeTask(
+            id=1,
+            coin_id=1,
+            attempts=1,
+            fee_multiplier=0.9995,
+            min_order_amount=5000,
+            krw_budget=30000,
+        )
+
+        result = await trade_service.execute_task(task)
+
+        mock_upbit_client.buy.assert_called_once_with("KRW-BTC", 30000 * 0.9995)
+        assert "KRW 배분: 작업 추가 시 균등 배분 30,000원" in result.execution_reason
@@ -0,0 +1,166 @@
+"""
+TradeTaskWorker 테스트 (인메모리 SQLite)
+"""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.coin.model.coin import Coin
+from app.common.model.base import create_session_maker
+from app.trade.model.enums import TradeStatus, TradeTaskStatus, TradeType
+from app.trade.model.trade import Trade
+from app.trade.model.trade_task import TradeTask
+from app.trade.repository.trade_task_repository import TradeTaskRepository
+from app.trade.service.trade_task_worker import TradeTaskWorker
+
+
+@pytest.fixture
+def session_maker(sqlite_engine, mocker):
+    """워커가 인메모리 SQLite를 사용하도록 설정"""
+    session_maker = create_session_maker(sqlite_engine)
+    mocker.patch(
+        "app.trade.service.trade_task_worker.get_session_maker",
+        return_value=session_maker,
+    )
+    return session_maker
+
+
+@pytest.fixture
+def mock_clients(mock_upbit_client, mock_ai_client, mocker):
+    """워커가 만드는 TradeService에 주입할 클라이언트"""
+    mocker.patch(
+        "app.trade.service.trade_task_worker.get_upbit_client",
+        return_value=mock_upbit_client,
+    )
+    mocker.patch(
+        "app.trade.service.trade_task_worker.get_open_ai_client",
+        return_value=mock_ai_client,
+    )
+    return mock_upbit_client, mock_ai_client
+
+
+async def _enqueue_task(session_maker) -> int:
+    async with session_maker() as session:
+        coin = Coin(name="KRW-BTC", is_deleted=False, candle_interval="day")
+        session.add(coin)
+        await session.commit()
+        await TradeTaskRepository(session).enqueue(
+            [coin.id], fee_multiplier=0.9995, min_order_amount=5000
+        )
+        return coin.id
+
+
+async def _get_task(session_maker, task_id: int) -> TradeTask:
+    async with session_maker() as session:
+        return await session.get(TradeTask, task_id)
+
+
+async def test_run_once_records_trade_on_task(session_maker, mocker):
+    """작업을 처리하면 DONE과 거래 ID를 기록"""
+    await _enqueue_task(session_maker)
+    trade_service = MagicMock()
+    trade_service.execute_task = AsyncMock(return_value=MagicMock(id=7))
+    mocker.patch(
+        "app.trade.service.trade_task_worker.TradeService",
+        return_value=trade_service,
+    )
+    mocker.patch("app.trade.service.trade_task_worker.get_upbit_client")
+    mocker.patch("app.trade.service.trade_task_worker.get_open_ai_client")
+
+    assert await TradeTaskWorker().run_once() is True
+    assert await TradeTaskWorker().run_once() is False
+
+    task = await _get_task(session_maker, 1)
+    assert (task.status, task.trade_id, task.attempts) == (
+        TradeTaskStatus.DONE.value,
+        7,
+        1,
+    )
+
+
+async def test_run_once_records_failure(session_maker, mocker):
+    """처리 중 예외가 발생하면 FAILED와 오류를 기록"""
+    await _enqueue_task(session_maker)
+    trade_service = MagicMock()
+    trade_service.execute_task = AsyncMock(side_effect=RuntimeError("boom"))
+    mocker.patch(
+        "app.trade.service.trade_task_worker.TradeService",
+        return_value=trade_service,
+    )
+    mocker.patch("app.trade.service.trade_task_worker.get_upbit_client")
+    mocker.patch("app.trade.service.trade_task_worker.get_open_ai_client")
+
+    assert await TradeTaskWorker().run_once() is True
+
+    task = await _get_task(session_maker, 1)
+    assert task.status == TradeTaskStatus.FAILED.value
+    assert task.error.startswith("RuntimeError: boom")
+
+
+async def test_expired_claim_is_retried_by_another_worker(session_maker, mocker):
+    """처리 중 점유가 만료되면 다른 워커가 재시도하고, 늦게 끝난 워커의 결과는 버림"""
+    await _enqueue_task(session_maker)
+    slow_worker = TradeTaskWorker(claim_timeout_seconds=-1)
+    other_worker = TradeTaskWorker()
+
+    async def execute_task(task):
+        if task.claimed_by == slow_worker.worker_id:
+            # 처리가 늦어지는 동안 다른 워커가 만료된 작업을 가져감
+            assert await other_worker.run_once() is True
+            return MagicMock(id=1)
+        return MagicMock(id=2)
+
+    trade_service = MagicMock()
+    trade_service.execute_task = AsyncMock(side_effect=execute_task)
+    mocker.patch(
+        "app.trade.service.trade_task_worker.TradeService",
+        return_value=trade_service,
+    )
+    mocker.patch("app.trade.service.trade_task_worker.get_upbit_client")
+    mocker.patch("app.trade.service.trade_task_worker.get_open_ai_client")
+
+    assert await slow_worker.run_once() is True
+
+    task = await _get_task(session_maker, 1)
+    assert (task.status, task.trade_id, task.attempts, task.claimed_by) == (
+        TradeTaskStatus.DONE.value,
+        2,
+        2,
+        other_worker.worker_id,
+    )
+
+
+async def test_retry_does_not_order_again(session_maker, mock_clients):
+    """이전 시도가 거래를 기록한 뒤 멈춘 작업은 재시도해도 분석/주문하지 않음"""
+    mock_upbit_client, mock_ai_client = mock_clients
+    coin_id = await _enqueue_task(session_maker)
+
+    # 이전 시도: 작업을 점유하고 PENDING 거래를 기록한 뒤 워커가 멈춤
+    async with session_maker() as session:
+        task = await TradeTaskRepository(session).claim("crashed", -1, 3)
+        session.add(
+            Trade(
+                coin_id=coin_id,
+                trade_type=TradeType.BUY.value,
+                price=Decimal("50000000"),
+                amount=Decimal("0.001"),
+                status=TradeStatus.PENDING,
+                order_uuid="order-1",
+                task_id=task.id,
+            )
+        )
+        await session.commit()
+
+    assert await TradeTaskWorker().run_once() is True
+
+    task = await _get_task(session_maker, task.id)
+    assert (task.status, task.trade_id, task.attempts) == (
+        TradeTaskStatus.DONE.value,
+        1,
+        2,
+    )
+    mock_ai_client.get_bitcoin_trading_decision.assert_not_called()
+    mock_upbit_client.buy.assert_not_called()
+    mock_upbit_client.sell.assert_not_called()
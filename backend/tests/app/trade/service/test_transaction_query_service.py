@@ -0,0 +1,265 @@
+"""
+TransactionQueryService 테스트
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from app.ai.dto.ai_analysis_response import RiskLevel
+from app.trade.model.enums import TradeStatus, TradeType
+from app.trade.service.transaction_query_service import TransactionQueryService
+
+
+@pytest.fixture
+def query_service(mock_session, mock_trade_repository, mocker):
+    """TransactionQueryService 인스턴스 생성 (Mock 주입)"""
+    mocker.patch(
+        "app.trade.service.transaction_query_service.TradeRepository",
+        return_value=mock_trade_repository,
+    )
+    return TransactionQueryService(mock_session)
+
+
+class TestGetTransactions:
+    """get_transactions() 메서드 테스트"""
+
+    async def test_get_transactions_first_page(
+        self, query_service, mock_trade_repository, sample_coin
+    ):
+        """첫 페이지 조회"""
+        # Given: 15개의 거래 내역 (limit=20이므로 다음 페이지 없음)
+        trades = []
+        for i in range(15):
+            trade = MagicMock()
+            trade.id = i + 1
+            trade.coin_id = sample_coin.id
+            trade.trade_type = TradeType.BUY.value
+            trade.price = Decimal("50000000")
+            trade.amount = Decimal("0.001")
+            trade.risk_level = RiskLevel.MEDIUM.value
+            trade.status = TradeStatus.SUCCESS
+            trade.ai_reason = "매수"
+            trade.execution_reason = "완료"
+            trade.created_at = datetime.utcnow()
+            trade.coin = sample_coin
+            trades.append(trade)
+
+        mock_trade_repository.get_all_with_coin_paginated.return_value = trades
+
+        # When: 첫 페이지 조회
+        result = await query_service.get_transactions(cursor=None, limit=20)
+
+        # Then: 15개 반환, 다음 페이지 없음
+        assert len(result.items) == 15
+        assert result.has_next is False
+        assert result.next_cursor is None
+
+    async def test_get_transactions_with_cursor(
+        self, query_service, mock_trade_repository, sample_coin
+    ):
+        """커서로 다음 페이지 조회"""
+        # Given: 21개의 거래 내역 (limit=20이므로 다음 페이지 있음)
+        trades = []
+        for i in range(21):
+            trade = MagicMock()
+            trade.id = i + 21
+            trade.coin_id = sample_coin.id
+            trade.trade_type = TradeType.BUY.value
+            trade.price = Decimal("50000000")
+            trade.amount = Decimal("0.001")
+            trade.risk_level = RiskLevel.MEDIUM.value
+            trade.status = TradeStatus.SUCCESS
+            trade.ai_reason = "매수"
+            trade.execution_reason = "완료"
+            trade.created_at = datetime.utcnow()
+            trade.coin = sample_coin
+            trades.append(trade)
+
+        mock_trade_repository.get_all_with_coin_paginated.return_value = trades
+
+        # When: 커서로 다음 페이지 조회
+        result = await query_service.get_transactions(cursor=20, limit=20)
+
+        # Then: 20개만 반환, 다음 페이지 있음
+        assert len(result.items) == 20
+        assert result.has_next is True
+        assert result.next_cursor == 40  # 마지막 항목의 ID
+
+    async def test_get_transactions_last_page(
+        self, query_service, mock_trade_repository, sample_coin
+    ):
+        """마지막 페이지 조회"""
+        # Given: 5개의 거래 내역 (limit=20이므로 다음 페이지 없음)
+        trades = []
+        for i in range(5):
+            trade = MagicMock()
+            trade.id = i + 41
+            trade.coin_id = sample_coin.id
+            trade.trade_type = TradeType.BUY.value
+            trade.price = Decimal("50000000")
+            trade.amount = Decimal("0.001")
+            trade.risk_level = RiskLevel.MEDIUM.value
+            trade.status = TradeStatus.SUCCESS
+            trade.ai_reason = "매수"
+            trade.execution_reason = "완료"
+            trade.created_at = datetime.utcnow()
+            trade.coin = sample_coin
+            trades.append(trade)
+
+        mock_trade_repository.get_all_with_coin_paginated.return_value = trades
+
+        # When: 마지막 페이지 조회
+        result = await query_service.get_transactions(cursor=40, limit=20)
+
+        # Then: 5개만 반환, 다음 페이지 없음
+        assert len(result.items) == 5
+        assert result.has_next is False
+        assert result.next_cursor is None
+
+    async def test_get_transactions_empty(self, query_service, mock_trade_repository):
+        """빈 거래 내역 조회"""
+        # Given: 거래 내역 없음
+        mock_trade_repository.get_all_with_coin_paginated.return_value = []
+
+        # When: 조회
+        result = await query_service.get_transactions(cursor=None, limit=20)
+
+        # Then: 빈 목록 반환
+        assert len(result.items) == 0
+        assert result.has_next is False
+        assert result.next_cursor is None
+
+    async def test_get_transactions_with_null_coin(
+        self, query_service, mock_trade_repository
+    ):
+        """코인이 없는 거래 내역 조회"""
+        # Given: 코인이 없는 거래 (coin_id=None)
+        trade = MagicMock()
+        trade.id = 1
+        trade.coin_id = None
+        trade.trade_type = None
+        trade.price = Decimal("0")
+        trade.amount = Decimal("0")
+        trade.risk_level = RiskLevel.NONE.value
+        trade.status = TradeStatus.NO_ACTION
+        trade.ai_reason = None
+        trade.execution_reason = "활성화된 코인이 없습니다"
+        trade.created_at = datetime.utcnow()
+        trade.coin = None
+        mock_trade_repository.get_all_with_coin_paginated.return_value = [trade]
+
+        # When: 조회
+        result = await query_service.get_transactions(cursor=None, limit=20)
+
+        # Then: 코인 이름이 None인 항목 반환
+        assert len(result.items) == 1
+        assert result.items[0].coin_name is None
+        assert result.items[0].coin_id is None
+
+    async def test_get_transactions_excludes_reasons_by_default(
+        self, query_service, mock_trade_repository, sample_coin
+    ):
+        """목록 조회는 기본적으로 사유 없이 로드하고 응답에서도 제외"""
+        trade = MagicMock()
+        trade.id = 1
+        trade.coin_id = sample_coin.id
+        trade.trade_type = TradeType.HOLD.value
+        trade.price = Decimal("0")
+        trade.amount = Decimal("0")
+        trade.risk_level = RiskLevel.LOW.value
+        trade.status = TradeStatus.NO_ACTION
+        trade.created_at = datetime.utcnow()
+        trade.coin = sample_coin
+        mock_trade_repository.get_all_with_coin_paginated.return_value = [trade]
+
+        result = await query_service.get_transactions(cursor=None, limit=20)
+
+        assert (
+            mock_trade_repository.get_all_with_coin_paginated.call_args.kwargs[
+                "include_reasons"
+            ]
+            is False
+        )
+        assert result.items[0].ai_reason is None
+        assert result.items[0].execution_reason is None
+
+
+class TestSearchTransactions:
+    """search_transactions() 메서드 테스트"""
+
+    async def test_search_transactions_paginates_with_reasons(
+        self, query_service, mock_trade_repository, sample_coin
+    ):
+        """검색 결과는 사유를 포함하고, limit + 1개로 다음 페이지 여부 판단"""
+        trades = []
+        for i in range(3):
+            trade = MagicMock()
+            trade.id = 30 - i
+            trade.coin_id = sample_coin.id
+            trade.trade_type = TradeType.SELL.value
+            trade.price = Decimal("50000000")
+            trade.amount = Decimal("0.001")
+            trade.risk_level = RiskLevel.HIGH.value
+            trade.status = TradeStatus.SUCCESS
+            trade.ai_reason = "RSI with bearish divergence."
+            trade.execution_reason = "매도 주문 접수"
+            trade.created_at = datetime.utcnow()
+            trade.coin = sample_coin
+            trades.append(trade)
+        mock_trade_repository.search = AsyncMock(return_value=trades)
+
+        result = await query_service.search_transactions(
+            query="bearish divergence", limit=2, coin_id=sample_coin.id
+        )
+
+        kwargs = mock_trade_repository.search.call_args.kwargs
+        assert kwargs["query"] == "bearish divergence"
+        assert kwargs["limit"] == 3
+        assert kwargs["coin_id"] == sample_coin.id
+        assert [item.id for item in result.items] == [30, 29]
+        assert result.has_next is True
+        assert result.next_cursor == 29
+        assert "bearish divergence" in result.items[0].ai_reason
+
+
+class TestGetTransaction:
+    """get_transaction() 메서드 테스트"""
+
+    async def test_get_transaction_includes_reasons(
+        self, query_service, mock_trade_repository, sample_coin
+    ):
+        """상세 조회는 사유를 포함"""
+        trade = MagicMock()
+        trade.id = 7
+        trade.coin_id = sample_coin.id
+        trade.trade_type = TradeType.BUY.value
+        trade.price = Decimal("50000000")
+        trade.amount = Decimal("0.001")
+        trade.risk_level = RiskLevel.MEDIUM.value
+        trade.status = TradeStatus.SUCCESS
+        trade.ai_reason = "상승 추세"
+        trade.execution_reason = "매수 주문 접수"
+        trade.created_at = datetime.utcnow()
+        trade.coin = sample_coin
+        mock_trade_repository.get_with_coin = AsyncMock(return_value=trade)
+
+        result = await query_service.get_transaction(7)
+
+        mock_trade_repository.get_with_coin.assert_awaited_once_with(7)
+        assert result.ai_reason == "상승 추세"
+        assert result.execution_reason == "매수 주문 접수"
+
+    async def test_get_transaction_not_found(
+        self, query_service, mock_trade_repository
+    ):
+        """없는 거래는 404"""
+        mock_trade_repository.get_with_coin = AsyncMock(return_value=None)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await query_service.get_transaction(999)
+
+        assert exc_info.value.status_code == 404
@@ -0,0 +1,95 @@
+"""
+SimulatedUpbitClient 테스트
+"""
+
+import pytest
+
+from app.upbit.client.simulated_upbit_client import (
+    OHLCV_COUNT,
+    SimulatedExchangeError,
+    SimulatedUpbitClient,
+)
+
+RECORDED_ORDERBOOK = {
+    "orderbook_units": [
+        {"ask_price": 101.0, "bid_price": 99.0, "ask_size": 10.0, "bid_size": 10.0},
+        {"ask_price": 102.0, "bid_price": 98.0, "ask_size": 10.0, "bid_size": 10.0},
+    ]
+}
+
+
+@pytest.fixture
+def client():
+    return SimulatedUpbitClient(
+        initial_krw=1_000_000,
+        recorded_orderbooks={"KRW-BTC": [RECORDED_ORDERBOOK]},
+        seed=1,
+    )
+
+
+class TestOrders:
+    """시장가 주문 체결 테스트"""
+
+    def test_buy_walks_asks_and_charges_fee(self, client):
+        """매수 금액만큼 매도 호가를 소진하고 수수료는 KRW에서 별도 차감"""
+        client.buy("KRW-BTC", 1520.0)  # 101 * 10 + 102 * 5
+
+        assert client.get_coin_balance("KRW-BTC") == pytest.approx(15.0)
+        assert client.get_krw_balance() == pytest.approx(1_000_000 - 1520 * 1.0005)
+        order = next(iter(client.orders.values()))
+        assert order["side"] == "bid"
+        assert order["executed_volume"] == pytest.approx(15.0)
+        assert order["paid_fee"] == pytest.approx(1520 * 0.0005)
+
+    def test_sell_walks_bids(self, client):
+        """매도 수량만큼 매수 호가를 소진하고 수수료를 뺀 금액을 KRW로 받음"""
+        client.balances["KRW-BTC"] = 12.0
+
+        client.sell("KRW-BTC", 12.0)
+
+        funds = 99 * 10 + 98 * 2
+        assert client.get_coin_balance("KRW-BTC") == pytest.approx(0.0)
+        assert client.get_krw_balance() == pytest.approx(1_000_000 + funds * 0.9995)
+
+    def test_partial_fill_is_cancelled_and_queryable(self, client):
+        """호가 잔량보다 큰 주문은 체결된 만큼만 기록되고 cancel 상태로 조회됨"""
+        client.balances["KRW-BTC"] = 30.0
+
+        order_uuid = client.sell("KRW-BTC", 30.0)  # 매수 호가 잔량 20개
+
+        [order] = client.get_orders([order_uuid, "unknown-uuid"])
+        assert order.state == "cancel"
+        assert order.executed_volume == pytest.approx(20.0)
+        assert order.average_price == pytest.approx((99 * 10 + 98 * 10) / 20)
+
+    def test_buy_without_enough_krw_raises(self, client):
+        """수수료 포함 금액이 잔고보다 크면 주문 실패"""
+        with pytest.raises(SimulatedExchangeError):
+            client.buy("KRW-BTC", 1_000_000)
+
+    def test_failure_injection(self):
+        """failure_rate=1이면 모든 호출이 실패"""
+        client = SimulatedUpbitClient(failure_rate=1.0, seed=1)
+
+        with pytest.raises(SimulatedExchangeError):
+            client.get_krw_balance()
+
+
+class TestMarketData:
+    """시세 조회 테스트"""
+
+    def test_current_price_is_best_ask(self, client):
+        """현재가는 최우선 매도 호가"""
+        assert client.get_current_price("KRW-BTC") == 101.0
+
+    def test_synthetic_ohlcv_ends_at_current_price(self):
+        """합성 OHLCV는 pyupbit와 같은 컬럼으로 현재 가격에서 끝남"""
+        client = SimulatedUpbitClient(initial_prices={"KRW-ETH": 5_000_000}, seed=1)
+
+        df = client.get_ohlcv_raw("KRW-ETH", interval="minute60")
+
+        assert len(df) == OHLCV_COUNT
+        assert list(df.columns) == ["open", "high", "low", "close", "volume", "value"]
+        assert df["close"].iloc[-1] == pytest.approx(5_000_000)
+        assert (df["high"] >= df[["open", "close"]].max(axis=1)).all()
+        assert df.index.is_monotonic_increasing
@@ -13,8 +13,15 @@ from app.ai.dto.ai_analysis_response import AiAnalysisResponse, Decision, RiskLe
 from app.ballance.repository.balance_repository import BalanceRepository
 from app.coin.model.coin import Coin
 from app.coin.service.coin_service import CoinService
+from app.common.model.base import Base, create_engine_for_url, create_session_maker
+from app.common.model.lease import Lease  # noqa: F401
+from app.common.model.rate_limit import RateLimit  # noqa: F401
+from app.common.rate_limiter import RateLimiter
+from app.position.model.position import Position, PositionLot  # noqa: F401
 from app.trade.model.enums import TradeStatus, TradeType
 from app.trade.model.trade import Trade
+from app.trade.model.trade_run import TradeRun  # noqa: F401
+from app.trade.model.trade_task import TradeTask  # noqa: F401
 from app.trade.repository.trade_repository import TradeRepository
 from app.trade.service.trade_service import TradeService
 from app.upbit.client.upbit_client import UpbitClient
@@ -27,6 +34,23 @@ def mock_session():
     return session
 
 
+@pytest.fixture
+async def sqlite_engine():
+    """인메모리 SQLite 엔진 (테스트마다 현재 모델로 만든 빈 스키마)"""
+    engine = create_engine_for_url("sqlite+aiosqlite://", pool_size=1, max_overflow=0)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def sqlite_session(sqlite_engine):
+    """실제 리포지토리를 실행할 인메모리 SQLite 세션"""
+    async with create_session_maker(sqlite_engine)() as session:
+        yield session
+
+
 @pytest.fixture
 def mock_trade_repository(mocker):
     """TradeRepository Mock"""
@@ -42,6 +66,7 @@ def mock_balance_repository(mocker):
     """BalanceRepository Mock"""
     repo = mocker.MagicMock(spec=BalanceRepository)
     repo.create = AsyncMock()
+    repo.get_latest = AsyncMock(return_value=None)
     return repo
 
 
@@ -98,16 +123,13 @@ def trade_service(
         "app.trade.service.trade_service.CoinService",
         return_value=mock_coin_service,
     )
-    mocker.patch(
-        "app.trade.service.trade_service.UpbitClient",
-        return_value=mock_upbit_client,
-    )
-    mocker.patch(
-        "app.trade.service.trade_service.OpenAIClient",
-        return_value=mock_ai_client,
-    )
 
-    service = TradeService(mock_session)
+    service = TradeService(
+        mock_session,
+        upbit_client=mock_upbit_client,
+        ai_client=mock_ai_client,
+        order_rate_limiter=RateLimiter(rate=100),
+    )
 
     return service
 
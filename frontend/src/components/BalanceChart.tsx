@@ -23,22 +23,20 @@ export function BalanceChart() {
     const fetchBalanceData = async () => {
       setIsLoading(true);
       try {
-        // 최근 100개 데이터 조회 (차트에 충분한 데이터)
-        const response = await balanceApi.getBalanceHistory(undefined, 100);
+        // 최근 7일 잔고를 1시간 간격으로 조회 (잔고 기록 사이는 서버에서 보간)
+        const response = await balanceApi.getBalanceSeries(24 * 7, 3600);
 
-        // 날짜순으로 정렬 (오래된 것부터)
-        const sortedItems = [...response.items].sort(
-          (a, b) =>
-            new Date(a.created_at).getTime() - new Date(b.created_at).getTime()
-        );
-
-        // 차트 데이터 형식으로 변환
-        const chartData = sortedItems.map((item) => ({
-          date: new Date(item.created_at).toLocaleDateString("ko-KR", {
-            month: "short",
-            day: "numeric",
-          }),
-          balance: item.total_amount, // 총 자산 사용
+        // 차트 데이터 형식으로 변환 (시간순)
+        const chartData = response.points.map((point) => ({
+          date: new Date(point.timestamp.replace(" ", "T")).toLocaleString(
+            "ko-KR",
+            {
+              month: "short",
+              day: "numeric",
+              hour: "2-digit",
+            }
+          ),
+          balance: point.total_amount, // 총 자산 사용
         }));
 
         setData(chartData);
@@ -127,13 +127,23 @@ export function TransactionHistory() {
     return "border-yellow-400 text-yellow-700 hover:bg-yellow-50";
   };
 
-  const handleReasonClick = (
-    type: string | null,
-    reason: string | null
-  ) => {
-    if (!reason) return;
-    const action = getAiAction(type, reason);
-    setSelectedReason({ action, detail: reason });
+  const handleReasonClick = async (transaction: TransactionItem) => {
+    // 사유는 목록에 포함되지 않으므로 펼칠 때 조회
+    try {
+      const detail = await tradeApi.getTransaction(transaction.id);
+      const reason = detail.ai_reason || detail.execution_reason;
+      setSelectedReason({
+        action: getAiAction(detail.type, reason),
+        detail: reason || "기록된 사유가 없습니다.",
+      });
+    } catch (error) {
+      console.error(error);
+      toast({
+        title: "오류",
+        description: "거래 사유를 불러오는데 실패했습니다.",
+        variant: "destructive",
+      });
+    }
   };
 
   return (
@@ -208,32 +218,17 @@ export function TransactionHistory() {
                           {formatPrice(transaction.price)}
                         </TableCell>
                         <TableCell className="text-xs py-2">
-                          {(transaction.ai_reason || transaction.execution_reason) ? (
-                            <Button
-                              variant="outline"
-                              size="sm"
-                              className={`h-6 px-2 capitalize gap-1 hover:underline ${getAiActionColor(
-                                getAiAction(
-                                  transaction.type,
-                                  transaction.ai_reason || transaction.execution_reason
-                                )
-                              )}`}
-                              onClick={() =>
-                                handleReasonClick(
-                                  transaction.type,
-                                  transaction.ai_reason || transaction.execution_reason
-                                )
-                              }
-                            >
-                              {getAiAction(
-                                transaction.type,
-                                transaction.ai_reason || transaction.execution_reason
-                              )}
-                              <Info className="h-3 w-3" />
-                            </Button>
-                          ) : (
-                            <span className="text-muted-foreground">-</span>
-                          )}
+                          <Button
+                            variant="outline"
+                            size="sm"
+                            className={`h-6 px-2 capitalize gap-1 hover:underline ${getAiActionColor(
+                              getAiAction(transaction.type, null)
+                            )}`}
+                            onClick={() => handleReasonClick(transaction)}
+                          >
+                            {getAiAction(transaction.type, null)}
+                            <Info className="h-3 w-3" />
+                          </Button>
                         </TableCell>
                       </TableRow>
                   ))}
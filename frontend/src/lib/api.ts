@@ -4,6 +4,8 @@ const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || "";
 
 const apiClient = axios.create({
   baseURL: API_BASE_URL ? `${API_BASE_URL}/api/v1` : "/api/v1",
+  // VITE_API_BASE_URL로 다른 오리진의 API를 호출해도 read-your-writes 쿠키를 주고받도록 설정
+  withCredentials: true,
   headers: {
     "Content-Type": "application/json",
   },
@@ -47,6 +49,7 @@ export interface TransactionItem {
   risk_level: string;
   status: string;
   timestamp: string;
+  // 목록 조회에서는 null (상세 조회 시 포함)
   ai_reason: string | null;
   execution_reason: string | null;
 }
@@ -71,6 +74,21 @@ export interface BalancesResponse {
   has_next: boolean;
 }
 
+export interface BalanceSeriesPoint {
+  timestamp: string;
+  amount: number;
+  coin_amount: number;
+  total_amount: number;
+  // 잔고 기록 사이를 보간한 값인지 여부
+  interpolated: boolean;
+}
+
+export interface BalanceSeriesResponse {
+  step_seconds: number;
+  snapshot_count: number;
+  points: BalanceSeriesPoint[];
+}
+
 // API functions
 export const coinApi = {
   getMyCoins: async (): Promise<CoinListResponse> => {
@@ -101,29 +119,54 @@ export const tradeApi = {
 
   getTransactions: async (
     cursor?: number,
-    limit: number = 20
+    limit: number = 20,
+    since?: string
   ): Promise<TransactionsResponse> => {
     const params = new URLSearchParams();
     if (cursor) params.append("cursor", cursor.toString());
     params.append("limit", limit.toString());
+    // since(UTC, 예: 2026-10-01T00:00:00)를 지정하면 해당 기간의 파티션만 조회
+    if (since) params.append("since", since);
     const response = await apiClient.get<TransactionsResponse>(
       `/trade/transactions?${params.toString()}`
     );
     return response.data;
   },
+
+  getTransaction: async (tradeId: number): Promise<TransactionItem> => {
+    const response = await apiClient.get<TransactionItem>(
+      `/trade/transactions/${tradeId}`
+    );
+    return response.data;
+  },
 };
 
 export const balanceApi = {
   getBalanceHistory: async (
     cursor?: number,
-    limit: number = 100
+    limit: number = 100,
+    since?: string
   ): Promise<BalancesResponse> => {
     const params = new URLSearchParams();
     if (cursor) params.append("cursor", cursor.toString());
     params.append("limit", limit.toString());
+    if (since) params.append("since", since);
     const response = await apiClient.get<BalancesResponse>(
       `/balance/history?${params.toString()}`
     );
     return response.data;
   },
+
+  getBalanceSeries: async (
+    hours: number = 24,
+    stepSeconds: number = 600
+  ): Promise<BalanceSeriesResponse> => {
+    const params = new URLSearchParams();
+    params.append("hours", hours.toString());
+    params.append("step_seconds", stepSeconds.toString());
+    const response = await apiClient.get<BalanceSeriesResponse>(
+      `/balance/series?${params.toString()}`
+    );
+    return response.data;
+  },
 };